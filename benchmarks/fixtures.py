@@ -0,0 +1,244 @@
+"""Benchmark fixtures: recorded files plus deterministic synthetic documents.
+
+Recorded fixtures are picked up from a directory (``benchmarks/fixtures`` by
+default): ``*.xml`` files are treated as JATS articles, ``*.pdf`` files as
+papers and ``*.json`` files as recorded Europe PMC search responses. Synthetic
+fixtures of several sizes are always generated as well, so the suite runs
+offline on a fresh checkout with the same inputs on every machine.
+"""
+
+import json
+import random
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+_WORDS = (
+    "microbial community genome assembly metabolic pathway expression soil "
+    "sequencing bacterial strain isolate protein culture temperature growth "
+    "analysis significant sample phylogenetic nitrogen carbon enzyme activity"
+).split()
+
+
+class Fixture(BaseModel):
+    """One benchmark input."""
+
+    name: str
+    kind: str  # "jats", "pdf" or "search_json"
+    data: Any
+    size_bytes: int
+
+
+def _sentence(rng: random.Random, n_words: int = 18) -> str:
+    words = [rng.choice(_WORDS) for _ in range(n_words)]
+    return " ".join(words).capitalize() + "."
+
+
+def _paragraph(rng: random.Random, n_sentences: int = 5) -> str:
+    return " ".join(_sentence(rng) for _ in range(n_sentences))
+
+
+def make_jats_xml(n_sections: int, paragraphs_per_section: int = 4) -> str:
+    """Build a JATS article with sections, a table per section and references."""
+    rng = random.Random(n_sections)
+    sections = []
+    for s in range(n_sections):
+        paragraphs = "".join(
+            f'<p>{_paragraph(rng)} <xref ref-type="bibr" rid="r{p}">{p}</xref></p>'
+            for p in range(paragraphs_per_section)
+        )
+        rows = "".join(
+            f"<tr><td>{rng.choice(_WORDS)}</td><td>{rng.random():.3f}</td>"
+            f"<td>{rng.randint(1, 500)}</td></tr>"
+            for _ in range(6)
+        )
+        table = (
+            f'<table-wrap id="t{s}"><label>Table {s + 1}</label>'
+            f"<caption><p>{_sentence(rng, 8)}</p></caption><table>"
+            f"<thead><tr><th>Name</th><th>Value</th><th>Count</th></tr></thead>"
+            f"<tbody>{rows}</tbody></table></table-wrap>"
+        )
+        subsection = (
+            f"<sec><title>Subsection {s + 1}.1</title><p>{_paragraph(rng)}</p></sec>"
+        )
+        sections.append(
+            f"<sec><title>Section {s + 1}</title>{paragraphs}{table}{subsection}</sec>"
+        )
+    refs = "".join(
+        f'<ref id="r{i}"><mixed-citation>{_sentence(rng, 10)} '
+        f"J Benchmarks. 2024;{i}:1-10.</mixed-citation></ref>"
+        for i in range(max(10, n_sections * 3))
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<article xmlns:xlink="http://www.w3.org/1999/xlink">'
+        "<front><article-meta>"
+        '<article-id pub-id-type="pmcid">PMC0000001</article-id>'
+        f"<title-group><article-title>{_sentence(rng, 10)}</article-title>"
+        "</title-group>"
+        f"<abstract><p>{_paragraph(rng, 8)}</p></abstract>"
+        "</article-meta></front>"
+        f"<body>{''.join(sections)}</body>"
+        f"<back><ref-list>{refs}</ref-list></back></article>"
+    )
+
+
+def _pdf_escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def make_pdf(n_pages: int, with_table: bool = True) -> bytes:
+    """Build a text PDF with a ruled table on every page.
+
+    Uses only the built-in Helvetica font, so pdfplumber and MarkItDown can
+    extract text and tables without any embedded resources.
+    """
+    rng = random.Random(1000 + n_pages)
+    objects: list[bytes] = []
+    page_ids: list[int] = []
+
+    # 1: catalog, 2: pages, 3: font; pages and contents follow
+    font_id = 3
+    next_id = 4
+    page_objects: list[tuple[int, int, bytes]] = []
+    for _ in range(n_pages):
+        ops = ["BT", "/F1 10 Tf", "14 TL", "50 760 Td"]
+        for _ in range(28):
+            ops.append(f"({_pdf_escape(_sentence(rng, 12))}) Tj T*")
+        ops.append("ET")
+        if with_table:
+            x0, y0, col_w, row_h, cols, rows = 50, 120, 120, 20, 3, 5
+            for r in range(rows + 1):
+                y = y0 + r * row_h
+                ops.append(f"{x0} {y} m {x0 + cols * col_w} {y} l S")
+            for c in range(cols + 1):
+                x = x0 + c * col_w
+                ops.append(f"{x} {y0} m {x} {y0 + rows * row_h} l S")
+            for r in range(rows):
+                for c in range(cols):
+                    cell = rng.choice(_WORDS) if c == 0 else f"{rng.random():.3f}"
+                    x, y = x0 + c * col_w + 5, y0 + r * row_h + 6
+                    ops.append(f"BT /F1 9 Tf {x} {y} Td ({cell}) Tj ET")
+        stream = "\n".join(ops).encode("latin-1")
+        page_objects.append((next_id, next_id + 1, stream))
+        page_ids.append(next_id)
+        next_id += 2
+
+    objects.append(b"<< /Type /Catalog /Pages 2 0 R >>")
+    kids = " ".join(f"{pid} 0 R" for pid in page_ids)
+    objects.append(f"<< /Type /Pages /Kids [{kids}] /Count {len(page_ids)} >>".encode())
+    objects.append(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+    for _page_id, content_id, stream in page_objects:
+        objects.append(
+            (
+                f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+                f"/Resources << /Font << /F1 {font_id} 0 R >> >> "
+                f"/Contents {content_id} 0 R >>"
+            ).encode()
+        )
+        objects.append(
+            f"<< /Length {len(stream)} >>\nstream\n".encode() + stream + b"\nendstream"
+        )
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for i, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += f"{i} 0 obj\n".encode() + body + b"\nendobj\n"
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    for offset in offsets:
+        out += f"{offset:010d} 00000 n \n".encode()
+    out += (
+        f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\n"
+        f"startxref\n{xref}\n%%EOF\n"
+    ).encode()
+    return bytes(out)
+
+
+def make_search_response(n_results: int) -> dict[str, Any]:
+    """Build a Europe PMC "core" search response with n_results papers."""
+    rng = random.Random(2000 + n_results)
+    results = []
+    for i in range(n_results):
+        pmid = str(30000000 + i)
+        results.append(
+            {
+                "id": pmid,
+                "source": "MED",
+                "pmid": pmid,
+                "pmcid": f"PMC{8000000 + i}" if i % 2 == 0 else None,
+                "doi": f"10.1234/bench.{i}",
+                "title": _sentence(rng, 12),
+                "authorString": ", ".join(
+                    f"{rng.choice(_WORDS).title()} {chr(65 + j)}" for j in range(6)
+                ),
+                "journalTitle": "Journal of Benchmarks",
+                "pubYear": str(2000 + i % 25),
+                "journalVolume": str(i % 60),
+                "issue": str(i % 12),
+                "pageInfo": f"{i}-{i + 9}",
+                "abstractText": _paragraph(rng, 8),
+                "isOpenAccess": "Y" if i % 3 == 0 else "N",
+                "citedByCount": rng.randint(0, 400),
+            }
+        )
+    return {
+        "version": "6.9",
+        "hitCount": n_results,
+        "nextCursorMark": "*",
+        "resultList": {"result": results},
+    }
+
+
+def _fixture(name: str, kind: str, data: Any, size_bytes: int) -> Fixture:
+    return Fixture(name=name, kind=kind, data=data, size_bytes=size_bytes)
+
+
+def synthetic_fixtures() -> list[Fixture]:
+    """Generate the synthetic fixtures (small, medium and large of each kind)."""
+    fixtures = []
+    for label, n_sections in (("small", 4), ("medium", 20), ("large", 80)):
+        xml = make_jats_xml(n_sections)
+        fixtures.append(_fixture(f"jats_{label}", "jats", xml, len(xml.encode())))
+    for label, n_pages in (("small", 1), ("medium", 2), ("large", 5)):
+        pdf = make_pdf(n_pages)
+        fixtures.append(_fixture(f"pdf_{label}", "pdf", pdf, len(pdf)))
+    for label, n_results in (("small", 25), ("medium", 100), ("large", 1000)):
+        response = make_search_response(n_results)
+        size = len(json.dumps(response).encode())
+        fixtures.append(_fixture(f"search_{label}", "search_json", response, size))
+    return fixtures
+
+
+def recorded_fixtures(directory: str | Path | None = None) -> list[Fixture]:
+    """Load recorded fixtures from a directory, if it exists."""
+    directory = Path(directory) if directory else FIXTURES_DIR
+    if not directory.is_dir():
+        return []
+    fixtures = []
+    for path in sorted(directory.iterdir()):
+        if path.suffix == ".xml":
+            text = path.read_text(encoding="utf-8")
+            fixtures.append(
+                _fixture(f"jats_{path.stem}", "jats", text, len(text.encode()))
+            )
+        elif path.suffix == ".pdf":
+            data = path.read_bytes()
+            fixtures.append(_fixture(f"pdf_{path.stem}", "pdf", data, len(data)))
+        elif path.suffix == ".json":
+            data = path.read_bytes()
+            fixtures.append(
+                _fixture(
+                    f"search_{path.stem}", "search_json", json.loads(data), len(data)
+                )
+            )
+    return fixtures
+
+
+def load_fixtures(directory: str | Path | None = None) -> list[Fixture]:
+    """Return synthetic fixtures followed by any recorded ones."""
+    return synthetic_fixtures() + recorded_fixtures(directory)
@@ -0,0 +1,313 @@
+"""Offline benchmark suite for the core conversion and lookup paths.
+
+Runs JATS XML conversion, PDF processing (pdfplumber and hybrid), content
+windowing, identifier normalization and search-result projection against the
+fixtures in ``benchmarks.fixtures``. Every case reports latency percentiles,
+throughput and peak Python memory (tracemalloc), and can be compared against
+a stored baseline. Timings depend on the machine, so record the baseline on
+the machine you compare on (``make benchmark-baseline``).
+
+Usage:
+    uv run python -m benchmarks.run                          # run and print
+    uv run python -m benchmarks.run --output benchmarks/baseline.json
+    uv run python -m benchmarks.run --baseline benchmarks/baseline.json
+"""
+
+import io
+import json
+import logging
+import platform
+import sys
+import time
+import tracemalloc
+import warnings
+from collections.abc import Callable
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+from unittest.mock import Mock, patch
+
+import click
+
+from artl_mcp import tools
+from artl_mcp.utils.identifier_utils import IdentifierUtils
+from benchmarks.fixtures import Fixture, load_fixtures
+
+Case = tuple[str, Callable[[], Any], int]
+
+
+def percentile(samples: list[float], q: float) -> float:
+    """Linearly interpolated percentile (q in 0-100) of a non-empty list."""
+    ordered = sorted(samples)
+    if len(ordered) == 1:
+        return ordered[0]
+    rank = (len(ordered) - 1) * q / 100
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def measure(
+    fn: Callable[[], Any],
+    input_bytes: int = 0,
+    min_iterations: int = 3,
+    max_iterations: int = 200,
+    min_time: float = 1.0,
+) -> dict[str, Any]:
+    """Time fn repeatedly and measure its peak memory in one extra run.
+
+    Iterations continue until both min_iterations and min_time are reached, or
+    max_iterations is hit. Memory is measured separately because tracemalloc
+    slows allocation-heavy code down.
+    """
+    fn()  # warm up imports and caches
+    samples: list[float] = []
+    started = time.perf_counter()
+    while len(samples) < max_iterations and (
+        len(samples) < min_iterations or time.perf_counter() - started < min_time
+    ):
+        t0 = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - t0)
+
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    mean = sum(samples) / len(samples)
+    result = {
+        "iterations": len(samples),
+        "mean_ms": round(mean * 1000, 3),
+        "p50_ms": round(percentile(samples, 50) * 1000, 3),
+        "p95_ms": round(percentile(samples, 95) * 1000, 3),
+        "p99_ms": round(percentile(samples, 99) * 1000, 3),
+        "ops_per_s": round(1 / mean, 2) if mean else None,
+        "peak_kib": round(peak / 1024, 1),
+        "input_bytes": input_bytes,
+    }
+    if input_bytes and mean:
+        result["mb_per_s"] = round(input_bytes / mean / 1_000_000, 3)
+    return result
+
+
+def _search_case(fixture: Fixture) -> Callable[[], Any]:
+    response = Mock(status_code=200, headers={})
+    response.raise_for_status.return_value = None
+    response.json.return_value = fixture.data
+    n_results = len(fixture.data["resultList"]["result"])
+
+    # Service probes use HEAD; answer them too so the case stays offline
+    probe = Mock(status_code=200, headers={})
+
+    def run() -> Any:
+        tools._search_page_cache.clear()
+        with (
+            patch("requests.get", return_value=response),
+            patch("requests.head", return_value=probe),
+        ):
+            return tools.search_europepmc_papers(
+                "benchmark", max_results=n_results, fields="citation"
+            )
+
+    return run
+
+
+_IDENTIFIERS = [
+    "10.1038/nature12373",
+    "doi:10.1128/mSystems.00045-18",
+    "https://doi.org/10.1099/ijsem.0.005153",
+    "PMID:23851394",
+    "23851394",
+    "pmid:31653696",
+    "PMC3737249",
+]
+
+
+def _normalize_batch() -> None:
+    for identifier in _IDENTIFIERS * 100:
+        IdentifierUtils.normalize_identifier(identifier)
+
+
+def build_cases(fixtures: list[Fixture]) -> list[Case]:
+    """Return (name, callable, input_bytes) for every benchmark case."""
+    cases: list[Case] = []
+    large_markdown = ""
+    for fixture in fixtures:
+        if fixture.kind == "jats":
+            xml = fixture.data
+            cases.append(
+                (
+                    f"jats_to_markdown[{fixture.name}]",
+                    lambda xml=xml: tools._convert_jats_xml_to_markdown(xml),
+                    fixture.size_bytes,
+                )
+            )
+            markdown, _ = tools._convert_jats_xml_to_markdown(xml)
+            if len(markdown) > len(large_markdown):
+                large_markdown = markdown
+        elif fixture.kind == "pdf":
+            pdf = fixture.data
+            cases.append(
+                (
+                    f"pdfplumber[{fixture.name}]",
+                    lambda pdf=pdf: tools._process_with_pdfplumber(io.BytesIO(pdf)),
+                    fixture.size_bytes,
+                )
+            )
+            cases.append(
+                (
+                    f"hybrid[{fixture.name}]",
+                    lambda pdf=pdf: tools._process_with_hybrid(io.BytesIO(pdf)),
+                    fixture.size_bytes,
+                )
+            )
+        elif fixture.kind == "search_json":
+            cases.append(
+                (
+                    f"search_projection[{fixture.name}]",
+                    _search_case(fixture),
+                    fixture.size_bytes,
+                )
+            )
+
+    if large_markdown:
+        # ~2 MB document read in 20 consecutive 10k-character windows
+        content = large_markdown * max(1, 2_000_000 // len(large_markdown))
+
+        def windowing() -> None:
+            for offset in range(0, 200_000, 10_000):
+                tools._apply_content_windowing(content, "/tmp/x.md", offset, 10_000)
+
+        cases.append(("content_windowing[2mb_x20]", windowing, len(content)))
+
+    cases.append(
+        ("normalize_identifier[x700]", _normalize_batch, 0),
+    )
+    return cases
+
+
+def run_benchmarks(
+    fixtures_dir: str | Path | None = None,
+    selected: str | None = None,
+    quick: bool = False,
+) -> dict[str, Any]:
+    """Run every case (or those whose name contains selected)."""
+    cases = build_cases(load_fixtures(fixtures_dir))
+    if selected:
+        cases = [case for case in cases if selected in case[0]]
+    settings = (
+        {"min_iterations": 1, "max_iterations": 1, "min_time": 0} if quick else {}
+    )
+    results = {
+        name: measure(fn, input_bytes, **settings) for name, fn, input_bytes in cases
+    }
+    return {
+        "meta": {
+            "created": datetime.now(UTC).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "quick": quick,
+        },
+        "results": results,
+    }
+
+
+def compare_to_baseline(
+    results: dict[str, Any], baseline: dict[str, Any], threshold: float = 1.5
+) -> list[dict[str, Any]]:
+    """Compare p50 latency and peak memory of each case with a baseline.
+
+    Returns:
+        One row per case present in both runs, with ratios and a
+        "regression" flag when either ratio exceeds threshold
+    """
+    rows = []
+    for name, current in results["results"].items():
+        previous = baseline.get("results", {}).get(name)
+        if not previous:
+            continue
+        time_ratio = current["p50_ms"] / previous["p50_ms"] if previous["p50_ms"] else 1
+        mem_ratio = (
+            current["peak_kib"] / previous["peak_kib"] if previous["peak_kib"] else 1
+        )
+        rows.append(
+            {
+                "case": name,
+                "p50_ratio": round(time_ratio, 2),
+                "peak_ratio": round(mem_ratio, 2),
+                "regression": time_ratio > threshold or mem_ratio > threshold,
+            }
+        )
+    return rows
+
+
+def format_results(results: dict[str, Any]) -> str:
+    """Render results as a fixed-width table."""
+    header = (
+        f"{'case':<40} {'iters':>5} {'p50 ms':>10} {'p95 ms':>10} {'p99 ms':>10} "
+        f"{'ops/s':>9} {'MB/s':>8} {'peak KiB':>10}"
+    )
+    lines = [header, "-" * len(header)]
+    for name, r in results["results"].items():
+        lines.append(
+            f"{name:<40} {r['iterations']:>5} {r['p50_ms']:>10.2f} "
+            f"{r['p95_ms']:>10.2f} {r['p99_ms']:>10.2f} {r['ops_per_s'] or 0:>9.1f} "
+            f"{r.get('mb_per_s', 0):>8.2f} {r['peak_kib']:>10.1f}"
+        )
+    return "\n".join(lines)
+
+
+@click.command()
+@click.option("--filter", "selected", help="Only run cases whose name contains this")
+@click.option(
+    "--fixtures",
+    "fixtures_dir",
+    type=click.Path(file_okay=False),
+    help="Directory of recorded fixtures (default: benchmarks/fixtures)",
+)
+@click.option("--output", type=click.Path(dir_okay=False), help="Write results JSON")
+@click.option(
+    "--baseline",
+    type=click.Path(exists=True, dir_okay=False),
+    help="Compare against a stored results JSON",
+)
+@click.option(
+    "--threshold",
+    type=float,
+    default=1.5,
+    show_default=True,
+    help="Flag cases slower or larger than baseline by this factor",
+)
+@click.option("--quick", is_flag=True, help="Single iteration per case (smoke run)")
+def cli(selected, fixtures_dir, output, baseline, threshold, quick):
+    """Run the offline benchmark suite."""
+    logging.disable(logging.WARNING)
+    warnings.simplefilter("ignore")
+
+    results = run_benchmarks(fixtures_dir, selected, quick)
+    click.echo(format_results(results))
+
+    if output:
+        Path(output).write_text(json.dumps(results, indent=2) + "\n")
+        click.echo(f"\nResults written to {output}")
+
+    if baseline:
+        rows = compare_to_baseline(
+            results, json.loads(Path(baseline).read_text()), threshold
+        )
+        click.echo(f"\nCompared with {baseline} (threshold {threshold}x):")
+        for row in rows:
+            flag = "REGRESSION" if row["regression"] else "ok"
+            click.echo(
+                f"  {row['case']:<40} p50 x{row['p50_ratio']:<6} "
+                f"peak x{row['peak_ratio']:<6} {flag}"
+            )
+        if any(row["regression"] for row in rows):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    cli()
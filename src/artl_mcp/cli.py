@@ -1,13 +1,23 @@
 """Command-line interface wrappers for artl_mcp tools."""
 
 import json
+from collections.abc import Iterable, Iterator
+from pathlib import Path
 from typing import Any
 
 import click
+import requests
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 
 from artl_mcp._version import __version__
 from artl_mcp.tools import (
+    FULL_TEXT_SOURCES,
     clean_text,
+    crawl_citation_graph,
     doi_to_pmid,
     # PDF download tools
     extract_doi_from_url,
@@ -28,28 +38,97 @@ from artl_mcp.tools import (
     get_pmid_text,
     get_text_from_pdf_url,
     get_unpaywall_info,
+    iter_europepmc_search,
     pmid_to_doi,
+    resolve_full_text,
     search_europepmc_papers,
+    search_local_corpus,
     # Search tools
     search_papers_by_keyword,
     search_pubmed_for_pmids,
     search_recent_papers,
 )
+from artl_mcp.utils.tracing import configure_tracing
+
+OUTPUT_FORMATS = ["json", "ndjson"]
+
+# List-valued result keys streamed one element per line in NDJSON mode,
+# checked in order
+_RECORD_KEYS = ("papers", "records", "pmids")
+
+
+def _dumps(obj: Any, indent: bool = False) -> str:
+    """Serialize to JSON, using orjson when it is installed."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        try:
+            return orjson.dumps(obj, option=option).decode()
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits; the stdlib handles them
+    return json.dumps(obj, indent=2 if indent else None)
+
+
+def _iter_records(result: Any) -> Iterator[Any]:
+    """Yield the individual records of a result for line-by-line output."""
+    if isinstance(result, list):
+        yield from result
+        return
+    if isinstance(result, dict):
+        for key in _RECORD_KEYS:
+            if isinstance(result.get(key), list):
+                yield from result[key]
+                return
+        message = result.get("message")
+        if isinstance(message, dict) and isinstance(message.get("items"), list):
+            yield from message["items"]
+            return
+    yield result
+
+
+def get_output_format() -> str:
+    """Return the output format selected on the command group."""
+    ctx = click.get_current_context(silent=True)
+    if ctx is not None:
+        obj = ctx.find_object(dict)
+        if obj:
+            return obj.get("format", "json")
+    return "json"
+
+
+def output_records(records: Iterable[Any]) -> None:
+    """Write records to stdout one compact JSON document per line as they arrive."""
+    for record in records:
+        click.echo(_dumps(record))
 
 
 def output_result(result: Any) -> None:
-    """Output result as JSON to stdout."""
+    """Output result as JSON to stdout.
+
+    In NDJSON mode, search hits and other record lists are written one per line
+    and any other result is written as a single compact line.
+    """
     if result is None:
-        click.echo(json.dumps({"error": "No result returned"}))
+        click.echo(_dumps({"error": "No result returned"}))
+    elif get_output_format() == "ndjson":
+        output_records(_iter_records(result))
     else:
-        click.echo(json.dumps(result, indent=2))
+        click.echo(_dumps(result, indent=True))
 
 
 @click.group()
 @click.version_option(version=__version__)
-def cli():
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(OUTPUT_FORMATS),
+    default="json",
+    help="Output format: json (pretty-printed) or ndjson (one record per line)",
+)
+@click.pass_context
+def cli(ctx: click.Context, output_format: str):
     """All Roads to Literature - CLI tools for scientific literature access."""
-    pass
+    ctx.ensure_object(dict)["format"] = output_format
+    configure_tracing()
 
 
 # Core Europe PMC tools that work reliably
@@ -64,11 +143,29 @@ def cli():
     type=click.Choice(["lite", "core"]),
     help="Result detail level: lite (basic) or core (full metadata with abstracts)",
 )
+@click.option(
+    "--fields",
+    help="Field preset (ids, citation, abstract) or comma-separated field names",
+)
 def search_europepmc_papers_cmd(
-    keywords: str, max_results: int, result_type: str
+    keywords: str, max_results: int, result_type: str, fields: str | None
 ) -> None:
     """Search Europe PMC for papers and return identifiers, links, and access info."""
-    result = search_europepmc_papers(keywords, max_results, result_type)
+    if get_output_format() == "ndjson":
+        # Stream hits page by page instead of collecting the whole result first
+        try:
+            output_records(
+                iter_europepmc_search(
+                    keywords,
+                    result_type=result_type,
+                    max_results=max_results,
+                    fields=fields,
+                )
+            )
+        except requests.exceptions.RequestException as e:
+            click.echo(_dumps({"error": f"Search failed: {e}"}))
+        return
+    result = search_europepmc_papers(keywords, max_results, result_type, fields=fields)
     output_result(result)
 
 
@@ -88,6 +185,262 @@ def get_all_identifiers_from_europepmc_cmd(identifier: str) -> None:
     output_result(result)
 
 
+@cli.command("resolve-full-text")
+@click.option("--identifier", required=True, help="Any identifier: DOI, PMID, or PMCID")
+@click.option(
+    "--source",
+    "sources",
+    multiple=True,
+    type=click.Choice(FULL_TEXT_SOURCES),
+    help="Full text source in preference order (repeatable, default: all)",
+)
+@click.option(
+    "--deadline", default=30.0, help="Maximum seconds to wait for sources (default 30)"
+)
+def resolve_full_text_cmd(
+    identifier: str, sources: tuple[str, ...], deadline: float
+) -> None:
+    """Race all full text sources and return the best result in time."""
+    result = resolve_full_text(
+        identifier, sources=list(sources) or None, deadline=deadline
+    )
+    output_result(result)
+
+
+@cli.command("harvest")
+@click.option(
+    "--input",
+    "input_file",
+    type=click.File("r"),
+    default="-",
+    help="File with one identifier per line (default: stdin)",
+)
+@click.option(
+    "--output",
+    "output_file",
+    type=click.File("a"),
+    default="-",
+    help="NDJSON file to append result records to (default: stdout)",
+)
+@click.option(
+    "--output-dir",
+    type=click.Path(file_okay=False, path_type=Path),
+    help="Directory for converted full texts (default: embed content in records)",
+)
+@click.option(
+    "--queue",
+    "queue_path",
+    default="artl_harvest.sqlite",
+    help="SQLite checkpoint file used to resume interrupted runs",
+)
+@click.option("--workers", default=4, help="Papers processed concurrently (default 4)")
+@click.option(
+    "--source",
+    "sources",
+    multiple=True,
+    type=click.Choice(FULL_TEXT_SOURCES),
+    help="Full text source in preference order (repeatable, default: all)",
+)
+@click.option("--deadline", default=60.0, help="Maximum seconds per paper (default 60)")
+@click.option(
+    "--retry-failed", is_flag=True, help="Reprocess items that failed in earlier runs"
+)
+def harvest_cmd(
+    input_file,
+    output_file,
+    output_dir: Path | None,
+    queue_path: str,
+    workers: int,
+    sources: tuple[str, ...],
+    deadline: float,
+    retry_failed: bool,
+) -> None:
+    """Harvest full texts for many identifiers in one resumable run."""
+    from artl_mcp.harvest import read_identifiers, run_harvest
+    from artl_mcp.utils.harvest_queue import HarvestQueue
+
+    with HarvestQueue(queue_path) as queue:
+        added = queue.add(read_identifiers(input_file))
+        click.echo(f"Queued {added} new identifiers", err=True)
+
+        for record in run_harvest(
+            queue,
+            sources=list(sources) or None,
+            deadline=deadline,
+            output_dir=output_dir,
+            workers=max(1, workers),
+            retry_failed=retry_failed,
+        ):
+            output_file.write(_dumps(record) + "\n")
+            output_file.flush()
+
+        click.echo(_dumps(queue.counts()), err=True)
+
+
+@cli.command("search-local-corpus")
+@click.option("--query", required=True, help="Search terms (AND/OR/NOT, prefix*)")
+@click.option("--limit", default=10, help="Maximum number of results (default 10)")
+def search_local_corpus_cmd(query: str, limit: int) -> None:
+    """Search papers already fetched into the local corpus (no network)."""
+    result = search_local_corpus(query, limit)
+    output_result(result)
+
+
+@cli.command("ingest-oa-archive")
+@click.option(
+    "--archive",
+    "archives",
+    required=True,
+    multiple=True,
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    help="Bulk JATS XML archive (.tar.gz or .xml.gz); repeatable",
+)
+@click.option(
+    "--mirror",
+    required=True,
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="SQLite mirror database to create or extend",
+)
+@click.option(
+    "--workers",
+    type=int,
+    default=None,
+    help="Conversion processes (default: CPU count, 0 = in-process)",
+)
+def ingest_oa_archive_cmd(
+    archives: tuple[Path, ...], mirror: Path, workers: int | None
+) -> None:
+    """Convert Open Access bulk archives into a local full text mirror."""
+    from artl_mcp.utils.oa_mirror import OAMirror, ingest_archive
+
+    with OAMirror(mirror) as store:
+        results = [ingest_archive(path, store, workers=workers) for path in archives]
+        output_result({"archives": results, "total_articles": store.count()})
+
+
+@cli.command("crawl-citation-graph")
+@click.option("--doi", required=True, help="DOI of the seed paper")
+@click.option("--depth", default=2, help="Number of hops to expand (default 2)")
+@click.option(
+    "--direction",
+    type=click.Choice(["references", "citations", "both"]),
+    default="references",
+    help="Which edges to follow (default references)",
+)
+@click.option(
+    "--max-neighbors", default=25, help="Neighbours followed per paper (default 25)"
+)
+@click.option("--max-nodes", default=500, help="Maximum papers crawled (default 500)")
+def crawl_citation_graph_cmd(
+    doi: str, depth: int, direction: str, max_neighbors: int, max_nodes: int
+) -> None:
+    """Crawl the citation graph around a paper into the local graph store."""
+    result = crawl_citation_graph(doi, depth, direction, max_neighbors, max_nodes)
+    output_result(result["data"] if result else None)
+
+
+@cli.command("load-test")
+@click.option("--clients", default=4, help="Concurrent client sessions (default 4)")
+@click.option("--requests", "n_requests", default=100, help="Total tool calls")
+@click.option("--duration", type=float, help="Stop after this many seconds")
+@click.option(
+    "--mix",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    help="JSON workload mix (default: built-in search/metadata/full text mix)",
+)
+@click.option(
+    "--transport",
+    type=click.Choice(["memory", "stdio"]),
+    default="memory",
+    help="In-process server or one artl-mcp subprocess per client",
+)
+@click.option("--command", default="artl-mcp", help="Server command for stdio")
+@click.option(
+    "--replay",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    help="Serve HTTP from this cassette (offline, reproducible)",
+)
+@click.option(
+    "--record",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Record live HTTP traffic to this cassette",
+)
+@click.option("--seed", default=0, help="Seed for call selection (default 0)")
+def load_test_cmd(
+    clients: int,
+    n_requests: int,
+    duration: float | None,
+    mix: Path | None,
+    transport: str,
+    command: str,
+    replay: Path | None,
+    record: Path | None,
+    seed: int,
+) -> None:
+    """Drive the MCP server with concurrent clients and report latency."""
+    import asyncio
+    import functools
+    import os
+
+    from artl_mcp import loadgen
+
+    if replay and record:
+        raise click.UsageError("--replay and --record are mutually exclusive")
+    cassette = replay or record
+    if cassette:
+        # Set in the environment so stdio server processes inherit it
+        os.environ["ARTL_HTTP_MODE"] = "replay" if replay else "record"
+        os.environ["ARTL_HTTP_CASSETTE"] = str(cassette)
+
+    target: Any
+    if transport == "stdio":
+        # One server process per client session
+        target = functools.partial(loadgen.stdio_transport, command)
+    else:
+        from artl_mcp.main import mcp
+
+        target = mcp
+
+    report = asyncio.run(
+        loadgen.run_load(
+            target,
+            clients=clients,
+            requests=n_requests,
+            duration=duration,
+            mix=loadgen.load_mix(mix),
+            seed=seed,
+        )
+    )
+    output_result(report)
+
+
+@cli.command("profile-summary")
+@click.option(
+    "--dir",
+    "directory",
+    type=click.Path(file_okay=False, path_type=Path),
+    help="Profile directory (default: ARTL_PROFILE_DIR or output dir/profiles)",
+)
+@click.option("--match", default="", help="Only profiles whose name contains this")
+@click.option("--limit", default=20, help="Number of functions to show (default 20)")
+@click.option(
+    "--sort",
+    type=click.Choice(["cumulative", "tottime", "calls"]),
+    default="cumulative",
+    help="Rank by time including callees, own time, or call count",
+)
+def profile_summary_cmd(
+    directory: Path | None, match: str, limit: int, sort: str
+) -> None:
+    """Summarize the slowest functions across collected conversion profiles."""
+    from artl_mcp.utils.profiling import find_profiles, summarize_profiles
+
+    paths = find_profiles(directory, match)
+    result = summarize_profiles(paths, limit=limit, sort=sort)
+    result["files"] = [str(path) for path in paths]
+    output_result(result)
+
+
 @cli.command("search-pubmed-for-pmids")
 @click.option("--query", required=True, help="Search terms/keywords")
 @click.option(
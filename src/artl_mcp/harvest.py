@@ -0,0 +1,148 @@
+"""Bulk full text harvesting pipeline.
+
+Processes many identifiers through a bounded concurrent pipeline (resolve the
+identifier, fetch XML or PDF, convert, save) and checkpoints each outcome in a
+HarvestQueue so interrupted runs can resume.
+"""
+
+import logging
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Any
+
+from artl_mcp.tools import resolve_full_text
+from artl_mcp.utils.harvest_queue import HarvestQueue
+from artl_mcp.utils.identifier_utils import IdentifierError, IdentifierUtils
+
+logger = logging.getLogger(__name__)
+
+
+def read_identifiers(lines: Iterable[str]) -> Iterator[str]:
+    """Yield identifiers from text lines, skipping blanks and # comments."""
+    for line in lines:
+        identifier = line.strip()
+        if identifier and not identifier.startswith("#"):
+            yield identifier
+
+
+def harvest_one(
+    identifier: str,
+    sources: list[str] | None = None,
+    deadline: float = 60.0,
+    output_dir: Path | None = None,
+) -> dict[str, Any]:
+    """Fetch, convert and optionally save the full text of one paper.
+
+    Args:
+        identifier: DOI, PMID, or PMCID in any supported format
+        sources: Full text sources in preference order (default: all)
+        deadline: Maximum seconds to wait for sources
+        output_dir: Directory for the converted text; when None the content is
+            embedded in the returned record instead
+
+    Returns:
+        Result record with "identifier" and "status" ("done" or "failed") keys
+    """
+    start = time.monotonic()
+    record: dict[str, Any] = {"identifier": identifier}
+
+    try:
+        id_info = IdentifierUtils.normalize_identifier(identifier)
+    except IdentifierError as e:
+        record.update(status="failed", error=str(e))
+        return record
+    record["id_type"] = id_info["type"]
+
+    save_to = None
+    if output_dir is not None:
+        clean_id = id_info["value"].replace("/", "_").replace(":", "_")
+        save_to = str(output_dir / clean_id)
+
+    try:
+        result = resolve_full_text(
+            id_info["value"], sources=sources, deadline=deadline, save_to=save_to
+        )
+    except Exception as e:
+        logger.warning(f"Harvest failed for {identifier}: {e}")
+        result = None
+        record["error"] = str(e)
+
+    if result:
+        record.update(
+            status="done",
+            source=result["source"],
+            format=result["format"],
+            content_length=result["content_length"],
+        )
+        if save_to:
+            record["saved_to"] = result["saved_to"]
+        else:
+            record["content"] = result["content"]
+    else:
+        record["status"] = "failed"
+        record.setdefault("error", "No full text source returned content")
+
+    record["elapsed"] = round(time.monotonic() - start, 3)
+    return record
+
+
+def run_harvest(
+    queue: HarvestQueue,
+    sources: list[str] | None = None,
+    deadline: float = 60.0,
+    output_dir: Path | None = None,
+    workers: int = 4,
+    retry_failed: bool = False,
+) -> Iterator[dict[str, Any]]:
+    """Process every pending queue item and yield result records as they finish.
+
+    At most ``2 * workers`` items are in flight at once, so memory stays bounded
+    regardless of queue size. Each record is checkpointed in the queue before it
+    is yielded; the checkpoint leaves out embedded ``content``, which only the
+    yielded record carries.
+
+    Args:
+        queue: Queue holding the identifiers to process
+        sources: Full text sources in preference order (default: all)
+        deadline: Maximum seconds to wait for sources per item
+        output_dir: Directory for converted texts (None embeds content in records)
+        workers: Number of items processed concurrently
+        retry_failed: Also reprocess items that failed in an earlier run
+
+    Yields:
+        Result records in completion order
+    """
+    if output_dir is not None:
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="artl-harv")
+    in_flight: dict[Future, str] = {}
+
+    def _finish(done: set[Future]) -> Iterator[dict[str, Any]]:
+        for future in done:
+            identifier = in_flight.pop(future)
+            try:
+                record = future.result()
+            except Exception as e:
+                record = {"identifier": identifier, "status": "failed", "error": str(e)}
+            checkpoint = {k: v for k, v in record.items() if k != "content"}
+            queue.mark(identifier, record["status"], checkpoint)
+            yield record
+
+    try:
+        for identifier in queue.iter_pending(include_failed=retry_failed):
+            future = executor.submit(
+                harvest_one, identifier, sources, deadline, output_dir
+            )
+            in_flight[future] = identifier
+            if len(in_flight) >= workers * 2:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                yield from _finish(done)
+
+        while in_flight:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            yield from _finish(done)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
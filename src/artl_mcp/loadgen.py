@@ -0,0 +1,229 @@
+"""Load generator that drives the MCP server with concurrent clients.
+
+Each virtual client opens its own FastMCP client session, either in-memory
+against a server object or over stdio against a spawned ``artl-mcp`` process,
+and issues tool calls drawn from a weighted mix until the request budget or the
+time limit is reached. The report gives throughput, latency percentiles and
+outcome counts overall and per tool.
+
+Combine with the replay transport (ARTL_HTTP_MODE=replay, see
+``artl_mcp.utils.http_replay``) for reproducible runs on an offline machine.
+"""
+
+import asyncio
+import json
+import os
+import random
+import time
+from pathlib import Path
+from typing import Any
+
+from fastmcp import Client
+from fastmcp.client.transports import StdioTransport
+from pydantic import BaseModel, Field
+
+# Tool calls issued when no mix file is given: weighted toward the cheap
+# metadata calls, like interactive use
+DEFAULT_MIX: list[dict[str, Any]] = [
+    {
+        "tool": "search_europepmc_papers",
+        "weight": 4,
+        "arguments": [
+            {"keywords": "rhizosphere microbiome", "max_results": 10},
+            {"keywords": "CRISPR bacterial immunity", "max_results": 10},
+            {"keywords": "nitrogen fixation soil", "max_results": 25},
+        ],
+    },
+    {
+        "tool": "get_europepmc_paper_by_id",
+        "weight": 3,
+        "arguments": [
+            {"identifier": "PMC3737249"},
+            {"identifier": "10.1038/nature12373"},
+            {"identifier": "23851394"},
+        ],
+    },
+    {
+        "tool": "get_europepmc_full_text",
+        "weight": 2,
+        "arguments": [
+            {"identifier": "PMC3737249", "limit": 20000},
+            {"identifier": "PMC7294781", "query": "methods", "top_k": 3},
+        ],
+    },
+    {
+        "tool": "get_europepmc_pdf_as_markdown",
+        "weight": 1,
+        "arguments": [{"identifier": "PMC3737249", "limit": 20000}],
+    },
+    {
+        "tool": "get_pmc_supplemental_material",
+        "weight": 1,
+        "arguments": [{"pmcid": "PMC7294781", "idx": 1, "limit": 20000}],
+    },
+]
+
+
+class ToolCall(BaseModel):
+    """One entry of a workload mix."""
+
+    tool: str
+    weight: float = 1.0
+    arguments: list[dict[str, Any]] = Field(default_factory=lambda: [{}])
+
+
+def load_mix(path: str | Path | None = None) -> list[ToolCall]:
+    """Read a workload mix from a JSON file, or return the default mix.
+
+    The file holds a list of {"tool", "weight", "arguments"} objects, where
+    "arguments" is a list of argument dicts picked from at random.
+    """
+    entries = json.loads(Path(path).read_text()) if path else DEFAULT_MIX
+    return [ToolCall(**entry) for entry in entries]
+
+
+def percentile(samples: list[float], q: float) -> float:
+    """Linearly interpolated percentile (q in 0-100); 0.0 for no samples."""
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    rank = (len(ordered) - 1) * q / 100
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def _outcome(result: Any) -> str:
+    """Classify a tool result as ok, empty (tool returned None), busy or error.
+
+    Mirrors the outcome labels recorded server-side by ``main._metered``.
+    """
+    if result.is_error:
+        return "error"
+    structured = result.structured_content
+    if isinstance(structured, dict) and set(structured) == {"result"}:
+        structured = structured["result"]
+    if not result.content or structured is None and result.data is None:
+        return "empty"
+    if isinstance(structured, dict) and structured.get("status") == "busy":
+        return "busy"
+    return "ok"
+
+
+def summarize(
+    samples: list[tuple[str, float, str]], elapsed: float, clients: int
+) -> dict[str, Any]:
+    """Build the report from (tool, latency_seconds, outcome) samples."""
+
+    def stats(rows: list[tuple[str, float, str]]) -> dict[str, Any]:
+        latencies = [latency for _, latency, _ in rows]
+        outcomes = {"ok": 0, "empty": 0, "busy": 0, "error": 0}
+        for _, _, outcome in rows:
+            outcomes[outcome] += 1
+        n = len(rows)
+        return {
+            "requests": n,
+            **outcomes,
+            "error_rate": round(outcomes["error"] / n, 4) if n else 0.0,
+            "mean_ms": round(sum(latencies) / n * 1000, 3) if n else 0.0,
+            "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+            "p95_ms": round(percentile(latencies, 95) * 1000, 3),
+            "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+            "max_ms": round(max(latencies, default=0.0) * 1000, 3),
+        }
+
+    by_tool: dict[str, list[tuple[str, float, str]]] = {}
+    for row in samples:
+        by_tool.setdefault(row[0], []).append(row)
+    return {
+        "clients": clients,
+        "elapsed_s": round(elapsed, 3),
+        "throughput_rps": round(len(samples) / elapsed, 2) if elapsed else 0.0,
+        "overall": stats(samples),
+        "tools": {tool: stats(rows) for tool, rows in sorted(by_tool.items())},
+    }
+
+
+async def _client_worker(
+    target: Any,
+    mix: list[ToolCall],
+    rng: random.Random,
+    budget: list[int],
+    deadline: float | None,
+    timeout: float,
+    samples: list[tuple[str, float, str]],
+) -> None:
+    weights = [call.weight for call in mix]
+    async with Client(target() if callable(target) else target) as client:
+        while True:
+            if deadline is not None and time.monotonic() >= deadline:
+                return
+            if budget[0] <= 0:
+                return
+            budget[0] -= 1
+            call = rng.choices(mix, weights)[0]
+            arguments = rng.choice(call.arguments)
+            start = time.perf_counter()
+            try:
+                result = await client.call_tool(
+                    call.tool, arguments, timeout=timeout, raise_on_error=False
+                )
+                outcome = _outcome(result)
+            except Exception:
+                outcome = "error"
+            samples.append((call.tool, time.perf_counter() - start, outcome))
+
+
+async def run_load(
+    target: Any,
+    clients: int = 4,
+    requests: int = 100,
+    duration: float | None = None,
+    mix: list[ToolCall] | None = None,
+    seed: int = 0,
+    timeout: float = 120.0,
+) -> dict[str, Any]:
+    """Drive a server with concurrent clients and report latency statistics.
+
+    Args:
+        target: FastMCP server (in-memory), a client transport, or a callable
+            returning a fresh transport for each client (e.g. stdio_transport)
+        clients: Number of concurrent client sessions
+        requests: Total number of tool calls across all clients
+        duration: Optional time limit in seconds
+        mix: Workload mix (defaults to DEFAULT_MIX)
+        seed: Seed for reproducible call selection
+        timeout: Per-call timeout in seconds
+
+    Returns:
+        Report with throughput, overall and per-tool latency percentiles and
+        ok/empty/busy/error counts
+    """
+    mix = mix or load_mix()
+    samples: list[tuple[str, float, str]] = []
+    budget = [requests]
+    deadline = time.monotonic() + duration if duration else None
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(
+            _client_worker(
+                target,
+                mix,
+                random.Random(seed * 1000 + i),
+                budget,
+                deadline,
+                timeout,
+                samples,
+            )
+            for i in range(clients)
+        )
+    )
+    return summarize(samples, time.perf_counter() - start, clients)
+
+
+def stdio_transport(command: str = "artl-mcp", args: list[str] | None = None):
+    """Transport that spawns a server process per client session.
+
+    The child inherits the environment, so ARTL_HTTP_MODE and friends apply.
+    """
+    return StdioTransport(command=command, args=args or [], env=dict(os.environ))
@@ -1,11 +1,14 @@
 import asyncio
+import functools
 import sys
+import time
 from importlib import metadata
 
 import click
 from fastmcp import FastMCP
 
 from artl_mcp.client import run_client
+from artl_mcp.server import DeadlineMiddleware
 from artl_mcp.tools import (
     get_all_identifiers_from_europepmc as _get_all_identifiers_from_europepmc,
 )
@@ -22,9 +25,14 @@ from artl_mcp.tools import (
     search_europepmc_papers as _search_europepmc_papers,
 )
 from artl_mcp.tools import (
+    search_local_corpus,
     search_pubmed_for_pmids,
 )
+from artl_mcp.utils.deadline import deadline_scope
+from artl_mcp.utils.instrumentation import metrics
+from artl_mcp.utils.metrics_export import start_metrics_exporter
 from artl_mcp.utils.pubmed_utils import get_pmc_supplemental_material
+from artl_mcp.utils.tracing import configure_tracing
 
 try:
     __version__ = metadata.version("artl-mcp")
@@ -32,9 +40,43 @@ except metadata.PackageNotFoundError:
     __version__ = "unknown"
 
 
+def _metered(fn):
+    """Record call counts, outcomes and latency of a registered MCP tool.
+
+    Tools log failures and return None, so a None result counts as "empty"
+    rather than "ok"; exceptions count as "error" and CPU-heavy calls turned
+    away by admission control count as "busy".
+    """
+    labels = {"tool": fn.__name__}
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        outcome = "error"
+        start = time.perf_counter()
+        try:
+            result = fn(*args, **kwargs)
+            if result is None:
+                outcome = "empty"
+            elif isinstance(result, dict) and result.get("status") == "busy":
+                outcome = "busy"
+            else:
+                outcome = "ok"
+            return result
+        finally:
+            metrics.observe("mcp.tool", (time.perf_counter() - start) * 1000, labels)
+            metrics.increment("mcp.tool_calls", labels={**labels, "outcome": outcome})
+
+    return wrapper
+
+
 # MCP wrapper functions that disable file saving
 def search_europepmc_papers(
-    keywords: str, max_results: int = 10, result_type: str = "lite"
+    keywords: str,
+    max_results: int = 10,
+    result_type: str = "lite",
+    fields: str | None = None,
+    include_id_lists: bool = True,
+    deadline: float | None = None,
 ):
     """
     Search Europe PMC for papers without saving results to a file.
@@ -49,6 +91,13 @@ def search_europepmc_papers(
         result_type (str, optional): The type of results to retrieve.
             Options include "lite" (basic metadata)
             and "core" (detailed metadata). Defaults to "lite".
+        fields (str, optional): Trim each paper to a preset ("ids", "citation",
+            "abstract") or a comma-separated list of field names, e.g.
+            "pmid,title,pubYear". Greatly reduces response size.
+        include_id_lists (bool, optional): Include the "pmids", "pmcids" and
+            "dois" lists that duplicate identifiers in "papers". Defaults to True.
+        deadline (float, optional): Seconds the whole call may take; requests
+            still outstanding when it passes are abandoned. Defaults to None.
 
     Returns:
         list[dict]: A list of dictionaries, where each dictionary contains metadata
@@ -59,42 +108,71 @@ def search_europepmc_papers(
         >>> for paper in results:
         ...     print(paper["title"])
     """
-    return _search_europepmc_papers(
-        keywords=keywords,
-        max_results=max_results,
-        result_type=result_type,
-        save_file=False,
-        save_to=None,
-    )
+    with deadline_scope(deadline):
+        return _search_europepmc_papers(
+            keywords=keywords,
+            max_results=max_results,
+            result_type=result_type,
+            save_file=False,
+            save_to=None,
+            fields=fields,
+            include_id_lists=include_id_lists,
+        )
 
 
-def get_europepmc_paper_by_id(identifier: str):
-    """MCP wrapper - Get Europe PMC paper metadata without file saving."""
-    return _get_europepmc_paper_by_id(
-        identifier=identifier,
-        save_file=False,
-        save_to=None,
-    )
+def get_europepmc_paper_by_id(identifier: str, deadline: float | None = None):
+    """MCP wrapper - Get Europe PMC paper metadata without file saving.
 
+    Set deadline to bound the whole call in seconds.
+    """
+    with deadline_scope(deadline):
+        return _get_europepmc_paper_by_id(
+            identifier=identifier,
+            save_file=False,
+            save_to=None,
+        )
 
-def get_all_identifiers_from_europepmc(identifier: str):
-    """MCP wrapper - Get all identifiers without file saving."""
-    return _get_all_identifiers_from_europepmc(
-        identifier=identifier,
-        save_file=False,
-        save_to=None,
-    )
 
+def get_all_identifiers_from_europepmc(identifier: str, deadline: float | None = None):
+    """MCP wrapper - Get all identifiers without file saving.
 
-def get_europepmc_full_text(identifier: str, offset: int = 0, limit: int | None = None):
-    """MCP wrapper - Get full text without file saving."""
-    return _get_europepmc_full_text(
-        identifier=identifier,
-        save_file=False,
-        save_to=None,
-        offset=offset,
-        limit=limit,
-    )
+    Set deadline to bound the whole call in seconds.
+    """
+    with deadline_scope(deadline):
+        return _get_all_identifiers_from_europepmc(
+            identifier=identifier,
+            save_file=False,
+            save_to=None,
+        )
+
+
+def get_europepmc_full_text(
+    identifier: str,
+    offset: int = 0,
+    limit: int | None = None,
+    query: str | None = None,
+    top_k: int = 5,
+    profile: bool = False,
+    deadline: float | None = None,
+):
+    """MCP wrapper - Get full text without file saving.
+
+    Pass query (a question or keywords) to receive only the top_k most relevant
+    passages, with their section paths and character offsets, instead of the
+    whole document. Set profile to write a cProfile dump of the conversion, and
+    deadline to bound the whole call (download and conversion) in seconds.
+    """
+    with deadline_scope(deadline):
+        return _get_europepmc_full_text(
+            identifier=identifier,
+            save_file=False,
+            save_to=None,
+            offset=offset,
+            limit=limit,
+            query=query,
+            top_k=top_k,
+            profile=profile,
+        )
 
 
 def get_europepmc_pdf_as_markdown(
@@ -103,17 +181,25 @@ def get_europepmc_pdf_as_markdown(
     processing_method: str = "auto",
     offset: int = 0,
     limit: int | None = None,
+    profile: bool = False,
+    deadline: float | None = None,
 ):
-    """MCP wrapper - Convert PDF to Markdown without file saving."""
-    return _get_europepmc_pdf_as_markdown(
-        identifier=identifier,
-        save_file=False,
-        save_to=None,
-        extract_tables=extract_tables,
-        processing_method=processing_method,
-        offset=offset,
-        limit=limit,
-    )
+    """MCP wrapper - Convert PDF to Markdown without file saving.
+
+    Set profile to write a cProfile dump of the conversion, and deadline to
+    bound the whole call (download, queueing and conversion) in seconds.
+    """
+    with deadline_scope(deadline):
+        return _get_europepmc_pdf_as_markdown(
+            identifier=identifier,
+            save_file=False,
+            save_to=None,
+            extract_tables=extract_tables,
+            processing_method=processing_method,
+            offset=offset,
+            limit=limit,
+            profile=profile,
+        )
 
 
 def create_mcp():
@@ -123,7 +209,7 @@ def create_mcp():
         instructions="""
 Europe PMC Literature Discovery and ID Translation Tools
 
-This MCP server provides SIX TOOLS for scientific literature discovery and
+This MCP server provides SEVEN TOOLS for scientific literature discovery and
 identifier translation using Europe PMC exclusively. No NCBI/PubMed APIs are accessed.
 
 ## Tool Selection Guide
@@ -133,6 +219,7 @@ identifier translation using Europe PMC exclusively. No NCBI/PubMed APIs are acc
 **For ID TRANSLATION/LINKS** → Use `get_all_identifiers_from_europepmc`
 **For FULL TEXT CONTENT** → Use `get_europepmc_full_text`
 **For PDF-TO-MARKDOWN CONVERSION** → Use `get_europepmc_pdf_as_markdown`
+**For REPEAT QUESTIONS about papers already fetched** → Use `search_local_corpus`
 
 ## Available Tools
 
@@ -155,6 +242,7 @@ identifier translation using Europe PMC exclusively. No NCBI/PubMed APIs are acc
 - **INPUT**: ONE specific identifier (DOI, PMID, or PMCID)
 - **OUTPUT**: Clean Markdown with preserved structure, tables, and figures
 - Use this for: Getting complete paper content for LLM analysis
+- **TIP**: Pass `query="your question"` to get only the most relevant passages
 
 **5. get_europepmc_pdf_as_markdown** - Convert Europe PMC PDF to Markdown in-memory
 - **INPUT**: ONE specific identifier (DOI, PMID, or PMCID)
@@ -163,6 +251,12 @@ identifier translation using Europe PMC exclusively. No NCBI/PubMed APIs are acc
   (most successful with PMC papers)
 - Use this for: Getting PDF content as LLM-friendly Markdown without disk I/O
 
+**6. search_local_corpus** - Search papers already fetched by this server
+- **INPUT**: Keywords (AND/OR/NOT and trailing * supported)
+- **OUTPUT**: Ranked papers with identifiers and highlighted snippets
+- **AVAILABILITY**: Only when the local corpus is enabled (ARTL_LOCAL_CORPUS=true)
+- Use this for: Answering follow-up questions without new Europe PMC calls
+
 Key Features:
 - Automatic identifier detection and normalization
 - Comprehensive Europe PMC metadata retrieval
@@ -260,22 +354,29 @@ get_pmc_supplemental_material("PMC:7294781", 1)
     # mcp.tool(get_paper_references)
     # mcp.tool(get_paper_citations)
     # mcp.tool(get_citation_network)
+    # mcp.tool(crawl_citation_graph)
     # mcp.tool(find_related_papers)
     # mcp.tool(get_comprehensive_citation_info)
 
     # Europe PMC tools - Search and ID translation
-    mcp.tool(search_europepmc_papers)  # Europe PMC search tool
-    mcp.tool(get_europepmc_paper_by_id)  # Get full metadata from any ID
-    mcp.tool(get_all_identifiers_from_europepmc)  # Get all IDs and links
-    mcp.tool(get_europepmc_full_text)  # Get full text content as Markdown
-    mcp.tool(get_europepmc_pdf_as_markdown)  # Convert PDF to Markdown in-memory
+    mcp.tool(_metered(search_europepmc_papers))  # Europe PMC search tool
+    mcp.tool(_metered(get_europepmc_paper_by_id))  # Get full metadata from any ID
+    mcp.tool(_metered(get_all_identifiers_from_europepmc))  # Get all IDs and links
+    mcp.tool(_metered(get_europepmc_full_text))  # Get full text content as Markdown
+    mcp.tool(
+        _metered(get_europepmc_pdf_as_markdown)
+    )  # Convert PDF to Markdown in-memory
+    mcp.tool(_metered(search_local_corpus))  # Search papers fetched earlier, offline
 
     # Other tools commented out to avoid NCBI API calls
     # mcp.tool(search_papers_by_keyword)
     # mcp.tool(search_recent_papers)
     # The PubMed Central Supplemental Material API supports retrieval as text
     # (more immediately useful than Europe PMC which uses binary files).
-    mcp.tool(get_pmc_supplemental_material)
+    mcp.tool(_metered(get_pmc_supplemental_material))
+
+    # Cancel abandoned calls and apply ARTL_TOOL_DEADLINE
+    mcp.add_middleware(DeadlineMiddleware())
 
     return mcp
 
@@ -293,7 +394,47 @@ mcp = create_mcp()
     default=20,
     help="Maximum number of results to return (default: 20).",
 )
-def cli(doi_query, pmid_search, max_results):
+@click.option(
+    "--transport",
+    type=click.Choice(["stdio", "http", "sse"]),
+    default="stdio",
+    help="Serve over stdio (default), streamable HTTP, or SSE.",
+)
+@click.option("--host", default="127.0.0.1", help="HTTP bind address.")
+@click.option("--port", type=int, default=8000, help="HTTP port (default: 8000).")
+@click.option(
+    "--workers",
+    type=int,
+    default=1,
+    help=(
+        "HTTP worker processes sharing an on-disk cache (default: 1). "
+        "Metrics export (ARTL_METRICS_PORT/ARTL_METRICS_TEXTFILE) is only "
+        "available with a single worker."
+    ),
+)
+@click.option(
+    "--max-concurrency",
+    type=int,
+    default=None,
+    help="Tool calls run at once per worker; others wait (default: no limit).",
+)
+@click.option(
+    "--shutdown-timeout",
+    type=float,
+    default=30.0,
+    help="Seconds in-flight calls get to finish on shutdown (default: 30).",
+)
+def cli(
+    doi_query,
+    pmid_search,
+    max_results,
+    transport,
+    host,
+    port,
+    workers,
+    max_concurrency,
+    shutdown_timeout,
+):
     """
     Run All Roads to Literature MCP server (default) or CLI tools.
 
@@ -302,6 +443,14 @@ def cli(doi_query, pmid_search, max_results):
         --pmid-search: Search PubMed for PMIDs using keywords.
         --max-results: Maximum number of results to return (default: 20).
 
+    Server Options:
+        --transport: stdio (default), http (streamable HTTP) or sse.
+        --host/--port: Address to serve HTTP on.
+        --workers: HTTP worker processes (http transport only for more than 1;
+            metrics are only exported with one).
+        --max-concurrency: Concurrent tool calls per worker.
+        --shutdown-timeout: Grace period for in-flight calls on shutdown.
+
     Default Behavior:
         If no options are provided, the MCP server runs over stdio.
     """
@@ -332,8 +481,29 @@ def cli(doi_query, pmid_search, max_results):
             print(f"No PMIDs found for query '{pmid_search}'")
         else:
             print(f"Error searching for query '{pmid_search}'")
+    elif transport != "stdio":
+        from artl_mcp.server import serve
+
+        if workers > 1 and transport == "sse":
+            raise click.ClickException(
+                "Error: --workers greater than 1 requires --transport http."
+            )
+        serve(
+            transport=transport,
+            host=host,
+            port=port,
+            workers=workers,
+            max_concurrency=max_concurrency,
+            shutdown_timeout=shutdown_timeout,
+        )
     else:
         # Default behavior: Run the MCP server over stdio
+        if max_concurrency:
+            from artl_mcp.server import ConcurrencyLimitMiddleware
+
+            mcp.add_middleware(ConcurrencyLimitMiddleware(max_concurrency))
+        start_metrics_exporter()
+        configure_tracing()
         mcp.run()
 
 
@@ -0,0 +1,201 @@
+"""HTTP serving for one shared, long-running ARTL-MCP service.
+
+``artl-mcp --transport http`` serves the MCP tools over FastMCP's streamable
+HTTP transport (or ``sse``) with uvicorn instead of a stdio process per agent:
+
+- ``--workers N`` runs N worker processes. Streamable HTTP is served
+  stateless, so any worker can answer any request, and the workers share the
+  upstream result caches through a SQLite file (ARTL_SHARED_CACHE, default
+  ``artl_shared_cache.sqlite`` in the output directory).
+- ``--max-concurrency`` limits tool calls running at once in each worker;
+  further calls wait their turn.
+- On SIGTERM/SIGINT, uvicorn stops accepting connections and in-flight tool
+  calls (e.g. long PDF conversions) get up to ``--shutdown-timeout`` seconds to
+  finish. Calls still running then are cancelled, which cancels their deadlines
+  so the worker threads stop too.
+
+Worker processes are configured through the environment (ARTL_SERVER_TRANSPORT,
+ARTL_MAX_CONCURRENCY, ARTL_SERVER_WORKERS), which
+``serve`` sets before starting uvicorn.
+"""
+
+import asyncio
+import logging
+import math
+import os
+import time
+from typing import Any
+
+from fastmcp.server.middleware import Middleware
+
+from artl_mcp.utils.config_manager import get_config_value
+from artl_mcp.utils.deadline import deadline_scope, default_tool_deadline
+from artl_mcp.utils.instrumentation import metrics
+
+logger = logging.getLogger(__name__)
+
+TRANSPORTS = ("http", "sse")
+
+
+class ConcurrencyLimitMiddleware(Middleware):
+    """Limit the tool calls running at once."""
+
+    def __init__(self, limit: int | None = None):
+        """Create the middleware.
+
+        Args:
+            limit: Maximum tool calls running at once; None or 0 means no limit
+        """
+        self.limit = limit if limit and limit > 0 else None
+        self._semaphore: asyncio.Semaphore | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def _get_semaphore(self) -> asyncio.Semaphore | None:
+        if self.limit is None:
+            return None
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.limit)
+            self._loop = loop
+        return self._semaphore
+
+    async def on_call_tool(self, context, call_next):
+        semaphore = self._get_semaphore()
+        if semaphore is None:
+            return await call_next(context)
+        start = time.perf_counter()
+        async with semaphore:
+            metrics.observe("server.queue_wait", (time.perf_counter() - start) * 1000)
+            return await call_next(context)
+
+
+class DeadlineMiddleware(Middleware):
+    """Run each tool call under a deadline and cancel it when it is abandoned.
+
+    Tools run in worker threads that asyncio cannot interrupt. When the client
+    disconnects or cancels the request, the call's deadline is cancelled instead,
+    so the thread stops at its next HTTP request or checkpoint rather than
+    running to completion. ARTL_TOOL_DEADLINE sets a deadline for every call;
+    tools taking a ``deadline`` argument nest theirs inside it.
+    """
+
+    async def on_call_tool(self, context, call_next):
+        # The task copies the context here, and worker threads copy the task's
+        with deadline_scope(default_tool_deadline()) as deadline:
+            call = asyncio.ensure_future(call_next(context))
+        try:
+            return await asyncio.shield(call)
+        except asyncio.CancelledError:
+            deadline.cancel()
+            # Nobody awaits the call any more; collect its outcome quietly
+            call.add_done_callback(lambda task: task.cancelled() or task.exception())
+            raise
+
+
+def _int_config(key: str) -> int | None:
+    value = get_config_value(key)
+    try:
+        return int(value) if value not in (None, "") else None
+    except ValueError:
+        logger.warning(f"Ignoring invalid {key} value: {value}")
+        return None
+
+
+def create_http_app(transport: str = "http", max_concurrency: int | None = None) -> Any:
+    """Build the ASGI app serving the MCP tools.
+
+    Graceful shutdown is left to uvicorn's ``timeout_graceful_shutdown``, which
+    waits for open requests before the app's lifespan shutdown runs.
+
+    Args:
+        transport: "http" (streamable HTTP, stateless) or "sse"
+        max_concurrency: Tool calls allowed to run at once
+
+    Returns:
+        Starlette app with the MCP endpoint at /mcp (or /sse)
+    """
+    from artl_mcp.main import create_mcp
+
+    if transport not in TRANSPORTS:
+        raise ValueError(f"transport must be one of {', '.join(TRANSPORTS)}")
+    limiter = ConcurrencyLimitMiddleware(max_concurrency)
+    server = create_mcp()
+    server.add_middleware(limiter)
+    app = server.http_app(transport=transport, stateless_http=transport == "http")
+    app.state.limiter = limiter
+    return app
+
+
+def app_factory() -> Any:
+    """Build the app in a uvicorn worker from the environment set by serve()."""
+    from artl_mcp.utils.metrics_export import start_metrics_exporter
+    from artl_mcp.utils.tracing import configure_tracing
+
+    # Each worker only sees its own counters; serve() warns when this drops
+    # configured exporters
+    if (_int_config("ARTL_SERVER_WORKERS") or 1) == 1:
+        start_metrics_exporter()
+    configure_tracing()
+    return create_http_app(
+        transport=str(get_config_value("ARTL_SERVER_TRANSPORT", "http")),
+        max_concurrency=_int_config("ARTL_MAX_CONCURRENCY"),
+    )
+
+
+def serve(
+    transport: str = "http",
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    workers: int = 1,
+    max_concurrency: int | None = None,
+    shutdown_timeout: float = 30.0,
+) -> None:
+    """Run the HTTP server until interrupted.
+
+    Args:
+        transport: "http" (streamable HTTP) or "sse"
+        host: Interface to bind
+        port: Port to bind
+        workers: Worker processes; more than one requires the http transport
+        max_concurrency: Tool calls allowed to run at once per worker
+        shutdown_timeout: Seconds in-flight calls get to finish on shutdown
+    """
+    import uvicorn
+
+    if transport not in TRANSPORTS:
+        raise ValueError(f"transport must be one of {', '.join(TRANSPORTS)}")
+    if workers > 1 and transport == "sse":
+        # SSE sessions live in one process; requests routed to another fail
+        raise ValueError("sse transport supports a single worker only")
+
+    if workers > 1 and (
+        get_config_value("ARTL_METRICS_PORT")
+        or get_config_value("ARTL_METRICS_TEXTFILE")
+    ):
+        logger.warning(
+            f"Metrics export is disabled with {workers} workers: each worker only "
+            "counts its own calls, so ARTL_METRICS_PORT and ARTL_METRICS_TEXTFILE "
+            "are ignored. Run with --workers 1 to export metrics."
+        )
+
+    os.environ["ARTL_SERVER_TRANSPORT"] = transport
+    os.environ["ARTL_SERVER_WORKERS"] = str(workers)
+    if max_concurrency:
+        os.environ["ARTL_MAX_CONCURRENCY"] = str(max_concurrency)
+    if workers > 1 and not get_config_value("ARTL_SHARED_CACHE"):
+        from artl_mcp.utils.file_manager import file_manager
+
+        os.environ["ARTL_SHARED_CACHE"] = str(
+            file_manager.output_dir / "artl_shared_cache.sqlite"
+        )
+
+    uvicorn.run(
+        "artl_mcp.server:app_factory",
+        factory=True,
+        host=host,
+        port=port,
+        workers=workers,
+        # Open requests get this long after the listener closes; then they are
+        # cancelled, and the app's lifespan shutdown only runs after that
+        timeout_graceful_shutdown=math.ceil(shutdown_timeout),
+    )
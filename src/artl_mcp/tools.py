@@ -1,5 +1,9 @@
 import io
 import logging
+import threading
+import time
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
@@ -8,16 +12,30 @@ from urllib.parse import urlparse
 import requests
 
 import artl_mcp.utils.pubmed_utils as aupu
+from artl_mcp.utils import http
+from artl_mcp.utils.cache import make_cache
+from artl_mcp.utils.chunk_export import export_chunks
+from artl_mcp.utils.citation_graph import crawl_citation_graph as _crawl_graph
+from artl_mcp.utils.citation_graph import get_citation_graph_store
 from artl_mcp.utils.citation_utils import CitationUtils
 from artl_mcp.utils.config_manager import (
     get_email_manager,
+    get_float_config,
     should_use_alternative_sources,
 )
 from artl_mcp.utils.conversion_utils import IdentifierConverter
+from artl_mcp.utils.deadline import DeadlineExceeded, check_deadline
 from artl_mcp.utils.doi_fetcher import DOIFetcher
 from artl_mcp.utils.file_manager import FileFormat, file_manager
 from artl_mcp.utils.identifier_utils import IdentifierError, IdentifierUtils, IDType
+from artl_mcp.utils.instrumentation import bind_context, count, instrumented, span
+from artl_mcp.utils.local_corpus import get_local_corpus
+from artl_mcp.utils.oa_mirror import get_oa_mirror
+from artl_mcp.utils.passages import rank_passages
 from artl_mcp.utils.pdf_fetcher import extract_text_from_pdf
+from artl_mcp.utils.profiling import get_profile_dir, profiled, profiling_enabled
+from artl_mcp.utils.racing import race_by_preference
+from artl_mcp.utils.scheduler import SchedulerBusy, cpu_heavy, run_cpu
 
 # Optional PDF processing dependencies - moved from try/except blocks
 try:
@@ -157,7 +175,7 @@ def get_doi_metadata(
         if email:
             headers["mailto"] = email
 
-        response = requests.get(url, headers=headers, timeout=30)
+        response = http.get(url, headers=headers, timeout=30)
         response.raise_for_status()
 
         data = response.json()
@@ -273,7 +291,7 @@ def search_papers_by_keyword(
 
         # Replace with your email
 
-        response = requests.get(url, headers=headers, params=params, timeout=30)
+        response = http.get(url, headers=headers, params=params, timeout=30)
         response.raise_for_status()
 
         data = response.json()
@@ -1344,7 +1362,7 @@ def search_pubmed_for_pmids(
     }
 
     try:
-        response = requests.get(esearch_url, params=params)
+        response = http.get(esearch_url, params=params)
         response.raise_for_status()
 
         data = response.json()
@@ -1575,6 +1593,7 @@ def validate_identifier(identifier: str, expected_type: str | None = None) -> bo
 
 
 # Citation and reference tools
+@instrumented()
 def get_paper_references(
     doi: str, save_file: bool = False, save_to: str | None = None
 ) -> dict[str, list | str | None] | None:
@@ -1631,21 +1650,34 @@ def get_paper_references(
         return None
 
 
+@instrumented()
 def get_paper_citations(
-    doi: str, save_file: bool = False, save_to: str | None = None
-) -> dict[str, list | str | None] | None:
+    doi: str,
+    save_file: bool = False,
+    save_to: str | None = None,
+    max_items: int | None = None,
+    deadline: float | None = None,
+) -> dict[str, list | str | bool | None] | None:
     """Get list of papers that cite a given paper.
 
+    Citing works come from OpenAlex's citation index (CrossRef does not publish
+    "cited by" lists), most cited first. Pages are collected until max_items
+    papers have been found, the citing works run out or the deadline passes.
+
     Args:
         doi: The DOI of the paper (supports all DOI formats)
         save_file: Whether to save citations to temp directory with
             auto-generated filename
         save_to: Specific path to save citations (overrides save_file if provided)
+        max_items: Maximum citing papers to return (default: None = all)
+        deadline: Maximum seconds to spend paging (default: no limit)
 
     Returns:
-        Dictionary with 'data' and 'saved_to' keys if successful, None if fails.
+        Dictionary with 'data', 'saved_to' and 'truncated' keys if successful,
+        None if fails.
         - data: List of citing paper dictionaries with DOI, title, authors, etc.
         - saved_to: Path where file was saved (None if not saved)
+        - truncated: True if more citing papers exist beyond max_items
 
     Examples:
         >>> result = get_paper_citations("10.1038/nature12373")
@@ -1655,7 +1687,17 @@ def get_paper_citations(
         150
     """
     try:
-        citations = CitationUtils.get_citations_crossref(doi)
+        # One extra item tells whether the cap cut the list short
+        citations = CitationUtils.get_citations_crossref(
+            doi,
+            max_items=max_items + 1 if max_items is not None else None,
+            deadline=deadline,
+        )
+        truncated = bool(
+            citations and max_items is not None and len(citations) > max_items
+        )
+        if truncated:
+            citations = citations[:max_items]
 
         # Save to file if requested
         saved_path = None
@@ -1678,7 +1720,11 @@ def get_paper_citations(
                 logger.info(f"Paper citations saved to: {saved_path}")
 
         return (
-            {"data": citations, "saved_to": str(saved_path) if saved_path else None}
+            {
+                "data": citations,
+                "saved_to": str(saved_path) if saved_path else None,
+                "truncated": truncated,
+            }
             if citations
             else None
         )
@@ -1687,6 +1733,7 @@ def get_paper_citations(
         return None
 
 
+@instrumented()
 def get_citation_network(
     doi: str, save_file: bool = False, save_to: str | None = None
 ) -> dict[str, Any] | None:
@@ -1745,6 +1792,88 @@ def get_citation_network(
         return None
 
 
+@instrumented()
+def crawl_citation_graph(
+    doi: str,
+    depth: int = 2,
+    direction: str = "references",
+    max_neighbors: int = 25,
+    max_nodes: int = 500,
+    save_file: bool = False,
+    save_to: str | None = None,
+) -> dict[str, Any] | None:
+    """Crawl the citation graph around a paper to a given depth.
+
+    Unlike get_citation_network, which returns one hop truncated to 20 works,
+    this expands the graph breadth-first with concurrent OpenAlex requests
+    (CrossRef as a fallback for references). Papers are deduplicated by DOI and
+    stored in a local SQLite graph, so repeated crawls only fetch new papers.
+
+    Args:
+        doi: The DOI of the seed paper (supports all DOI formats)
+        depth: Number of hops to expand (default: 2)
+        direction: "references", "citations" or "both" (default: "references")
+        max_neighbors: Maximum neighbours followed per paper (default: 25)
+        max_nodes: Maximum papers in the crawled graph (default: 500)
+        save_file: Whether to save the graph to the output directory
+        save_to: Specific path to save the graph (overrides save_file if provided)
+
+    Returns:
+        Dictionary with 'data' and 'saved_to' keys, or None if the crawl fails.
+        - data: Seeds, nodes, citing -> cited edges and crawl statistics
+        - saved_to: Path where file was saved (None if not saved)
+
+    Examples:
+        >>> result = crawl_citation_graph("10.1038/nature12373", depth=2)
+        >>> len(result['data']['nodes'])
+        312
+        >>> result['data']['stats']['reused']  # Papers served from the store
+        0
+    """
+    if direction not in ("references", "citations", "both"):
+        logger.warning(f"Invalid citation graph direction: {direction}")
+        return None
+    try:
+        store = get_citation_graph_store()
+        if store is None:
+            return None
+        graph = _crawl_graph(
+            [doi],
+            store,
+            depth=depth,
+            direction=direction,  # type: ignore[arg-type]
+            max_neighbors=max_neighbors,
+            max_nodes=max_nodes,
+        )
+        if not graph["nodes"]:
+            return None
+
+        saved_path = None
+        if save_file or save_to:
+            try:
+                clean_doi = IdentifierUtils.normalize_doi(doi, "raw")  # type: ignore[arg-type]
+            except IdentifierError:
+                clean_doi = doi.replace("/", "_").replace(":", "_")
+
+            saved_path = file_manager.handle_file_save(
+                content=graph,
+                base_name="citation_graph",
+                identifier=clean_doi,
+                file_format="json",
+                save_file=save_file,
+                save_to=save_to,
+                use_temp_dir=False,
+            )
+            if saved_path:
+                logger.info(f"Citation graph saved to: {saved_path}")
+
+        return {"data": graph, "saved_to": str(saved_path) if saved_path else None}
+    except Exception as e:
+        logger.warning(f"Error crawling citation graph for DOI: {doi} - {e}")
+        return None
+
+
+@instrumented()
 def find_related_papers(
     doi: str, max_results: int = 10, save_file: bool = False, save_to: str | None = None
 ) -> dict[str, list | str | None] | None:
@@ -2181,6 +2310,257 @@ def download_pdf_from_doi(
 
 
 # Europe PMC search functions
+# Fields returned by Europe PMC for resultType=idlist
+_IDLIST_FIELDS = frozenset({"id", "source", "pmid", "pmcid", "doi"})
+
+# Fields only returned by Europe PMC for resultType=core
+_CORE_ONLY_FIELDS = frozenset(
+    {
+        "abstractText",
+        "authorList",
+        "affiliation",
+        "keywordList",
+        "meshHeadingList",
+        "grantsList",
+        "fullTextUrlList",
+        "journalInfo",
+    }
+)
+
+SEARCH_FIELD_PRESETS: dict[str, list[str]] = {
+    "ids": ["id", "source", "pmid", "pmcid", "doi"],
+    "citation": [
+        "pmid",
+        "pmcid",
+        "doi",
+        "title",
+        "authorString",
+        "journalTitle",
+        "pubYear",
+        "journalVolume",
+        "issue",
+        "pageInfo",
+    ],
+    "abstract": ["pmid", "pmcid", "doi", "title", "pubYear", "abstractText"],
+}
+
+
+def _resolve_search_fields(fields: str | list[str] | None) -> list[str] | None:
+    """Expand a preset name, comma-separated string or list into field names."""
+    if not fields:
+        return None
+    if isinstance(fields, str):
+        if fields in SEARCH_FIELD_PRESETS:
+            return SEARCH_FIELD_PRESETS[fields]
+        fields = fields.split(",")
+    resolved: list[str] = []
+    for field in fields:
+        field = field.strip()
+        for name in SEARCH_FIELD_PRESETS.get(field, [field]):
+            if name and name not in resolved:
+                resolved.append(name)
+    return resolved or None
+
+
+def _upstream_result_type(result_type: str, fields: list[str] | None) -> str:
+    """Pick the cheapest Europe PMC result type that still covers the fields."""
+    if not fields:
+        return result_type
+    if _IDLIST_FIELDS.issuperset(fields):
+        return "idlist"
+    if _CORE_ONLY_FIELDS.intersection(fields):
+        return "core"
+    return result_type
+
+
+_EUROPEPMC_SEARCH_URL = "https://www.ebi.ac.uk/europepmc/webservices/rest/search"
+_EUROPEPMC_HEADERS = {
+    "Accept": "application/json",
+    "User-Agent": "ARTL-MCP/1.0 (https://github.com/contextualizer-ai/artl-mcp)",
+}
+
+
+def iter_europepmc_search_pages(
+    query: str,
+    page_size: int = 1000,
+    synonym: bool = True,
+    sort: str = "RELEVANCE",
+    result_type: str = "lite",
+    source_filters: list[str] | None = None,
+    max_results: int | None = None,
+    cursor_mark: str = "*",
+    prefetch: bool = True,
+) -> Iterator[dict[str, Any]]:
+    """Stream Europe PMC search results page by page using cursorMark paging.
+
+    Each yielded page is the raw Europe PMC response for one request. While the
+    caller consumes a page, the next one is already being fetched in a background
+    thread, and at most two pages are held in memory at once, so walking a
+    100k-hit query costs the same memory as reading a single page.
+
+    Args:
+        query: Search query using Europe PMC syntax
+        page_size: Results per request (API max is 1000)
+        synonym: Include synonyms in search
+        sort: Sort order - RELEVANCE, DATE, CITED
+        result_type: core (full metadata), lite (minimal), idlist (IDs only)
+        source_filters: List of sources to include (e.g., ["med", "pmc"])
+        max_results: Stop after this many results (None = all hits)
+        cursor_mark: Cursor to start from ("*" for the first page); pass a page's
+            "nextCursorMark" to resume a previous walk
+        prefetch: Fetch the next page while the current one is being consumed
+
+    Yields:
+        Europe PMC response dictionaries with "hitCount", "nextCursorMark" and
+        "resultList" keys. The last page is trimmed to respect max_results.
+
+    Raises:
+        requests.exceptions.RequestException: If a page request fails
+
+    Examples:
+        >>> for page in iter_europepmc_search_pages("CRISPR", max_results=2000):
+        ...     print(len(page["resultList"]["result"]))
+        1000
+        1000
+    """
+    params: dict[str, str] = {
+        "query": query,
+        "format": "json",
+        "synonym": "true" if synonym else "false",
+        "resultType": result_type,
+    }
+    if sort and sort != "RELEVANCE":
+        params["sort"] = sort
+    if source_filters:
+        source_query = " OR ".join([f"src:{src}" for src in source_filters])
+        params["query"] = f"({query}) AND ({source_query})"
+
+    page_size = max(1, min(page_size, 1000))
+
+    def _fetch(cursor: str, size: int) -> dict[str, Any]:
+        response = http.get(
+            _EUROPEPMC_SEARCH_URL,
+            params={**params, "cursorMark": cursor, "pageSize": str(size)},
+            headers=_EUROPEPMC_HEADERS,
+            timeout=30,
+        )
+        response.raise_for_status()
+        return response.json()
+
+    def _next_size(fetched: int) -> int:
+        if max_results is None:
+            return page_size
+        return min(page_size, max_results - fetched)
+
+    executor = (
+        ThreadPoolExecutor(max_workers=1, thread_name_prefix="artl-page")
+        if prefetch
+        else None
+    )
+    yielded = 0
+    cursor = cursor_mark
+    try:
+        size = _next_size(0)
+        if size <= 0:
+            return
+        pending: Future | dict[str, Any] = (
+            executor.submit(bind_context(_fetch), cursor, size)
+            if executor
+            else _fetch(cursor, size)
+        )
+        while pending is not None:
+            page = pending.result() if isinstance(pending, Future) else pending
+            pending = None
+
+            results = page.get("resultList", {}).get("result", [])
+            if max_results is not None and yielded + len(results) > max_results:
+                results = results[: max_results - yielded]
+                page.setdefault("resultList", {})["result"] = results
+            if not results and cursor != cursor_mark:
+                return  # The first page is always yielded so hitCount is visible
+            yielded += len(results)
+
+            next_cursor = page.get("nextCursorMark")
+            size = _next_size(yielded)
+            more = bool(
+                results
+                and next_cursor
+                and next_cursor != cursor
+                and size > 0
+                and yielded < page.get("hitCount", 0)
+            )
+            if more:
+                cursor = next_cursor
+                if executor:
+                    pending = executor.submit(bind_context(_fetch), cursor, size)
+
+            yield page
+
+            if more and executor is None:
+                pending = _fetch(cursor, size)
+    finally:
+        if executor:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+def iter_europepmc_search(
+    query: str,
+    page_size: int = 1000,
+    synonym: bool = True,
+    sort: str = "RELEVANCE",
+    result_type: str = "lite",
+    source_filters: list[str] | None = None,
+    max_results: int | None = None,
+    prefetch: bool = True,
+    fields: str | list[str] | None = None,
+) -> Iterator[dict[str, Any]]:
+    """Stream individual Europe PMC search results across all pages.
+
+    Record-level companion to iter_europepmc_search_pages(); see it for the
+    paging, prefetching and memory behaviour.
+
+    Args:
+        query: Search query using Europe PMC syntax
+        page_size: Results per request (API max is 1000)
+        synonym: Include synonyms in search
+        sort: Sort order - RELEVANCE, DATE, CITED
+        result_type: core (full metadata), lite (minimal), idlist (IDs only)
+        source_filters: List of sources to include (e.g., ["med", "pmc"])
+        max_results: Stop after this many results (None = all hits)
+        prefetch: Fetch the next page while the current one is being consumed
+        fields: Trim each record to a preset or field list, as in
+            search_europepmc_papers()
+
+    Yields:
+        Europe PMC result records (for "idlist", records with id, source, pmid,
+        pmcid and doi keys)
+
+    Raises:
+        requests.exceptions.RequestException: If a page request fails
+
+    Examples:
+        >>> pmids = [
+        ...     r.get("pmid")
+        ...     for r in iter_europepmc_search("CRISPR", result_type="idlist")
+        ... ]
+    """
+    field_list = _resolve_search_fields(fields)
+    for page in iter_europepmc_search_pages(
+        query,
+        page_size=page_size,
+        synonym=synonym,
+        sort=sort,
+        result_type=_upstream_result_type(result_type, field_list),
+        source_filters=source_filters,
+        max_results=max_results,
+        prefetch=prefetch,
+    ):
+        for record in page.get("resultList", {}).get("result", []):
+            if field_list:
+                record = {f: record[f] for f in field_list if f in record}
+            yield record
+
+
 def _search_europepmc_flexible(
     query: str,
     page_size: int = 25,
@@ -2196,7 +2576,8 @@ def _search_europepmc_flexible(
     Flexible Europe PMC search with comprehensive parameter support.
 
     This is an internal function that provides full access to Europe PMC API parameters.
-    For simple keyword searches, use search_keywords_for_ids() instead.
+    For simple keyword searches, use search_keywords_for_ids() instead. To walk large
+    result sets without holding them in memory, use iter_europepmc_search().
 
     Args:
         query: Search query/keywords
@@ -2228,77 +2609,30 @@ def _search_europepmc_flexible(
                 "instead"
             )
 
-        # Build URL and parameters
-        base_url = "https://www.ebi.ac.uk/europepmc/webservices/rest/search"
-
-        params: dict[str, str] = {
-            "query": query,
-            "format": "json",
-            "pageSize": str(min(page_size, 1000)),  # API max is 1000
-            "synonym": "true" if synonym else "false",
-            "resultType": result_type,
-            "cursorMark": cursor_mark,
-        }
-
-        # Add sort if specified
-        if sort and sort != "RELEVANCE":
-            params["sort"] = sort
-
-        # Add source filters
-        if source_filters:
-            source_query = " OR ".join([f"src:{src}" for src in source_filters])
-            params["query"] = f"({query}) AND ({source_query})"
-
-        # Set headers
-        headers = {
-            "Accept": "application/json",
-            "User-Agent": "ARTL-MCP/1.0 (https://github.com/contextualizer-ai/artl-mcp)",
-        }
-
-        # Make request
-        response = requests.get(base_url, params=params, headers=headers, timeout=30)
-        response.raise_for_status()
-
-        data = response.json()
-
-        # Handle auto-pagination
-        if auto_paginate and result_type == "core":
-            all_results = data.get("resultList", {}).get("result", [])
-            next_cursor = data.get("nextCursorMark")
-
-            while (
-                next_cursor
-                and len(all_results) < max_results
-                and len(all_results) < data.get("hitCount", 0)
-            ):
-                # Get next page
-                params["cursorMark"] = next_cursor
-                params["pageSize"] = str(
-                    min(page_size, max_results - len(all_results), 1000)
-                )
-
-                response = requests.get(
-                    base_url, params=params, headers=headers, timeout=30
-                )
-                response.raise_for_status()
-
-                page_data = response.json()
-                page_results = page_data.get("resultList", {}).get("result", [])
-
-                if not page_results:
-                    break
-
-                all_results.extend(page_results)
-                next_cursor = page_data.get("nextCursorMark")
-
-                # Prevent infinite loops
-                if next_cursor == params["cursorMark"]:
-                    break
+        data: dict[str, Any] | None = None
+        all_results: list[dict[str, Any]] = []
+        for page in iter_europepmc_search_pages(
+            query,
+            page_size=page_size,
+            synonym=synonym,
+            sort=sort,
+            result_type=result_type,
+            source_filters=source_filters,
+            max_results=max_results if auto_paginate else min(page_size, 1000),
+            cursor_mark=cursor_mark,
+            prefetch=auto_paginate,
+        ):
+            all_results.extend(page.get("resultList", {}).get("result", []))
+            if data is None:
+                data = page
+            else:
+                data["nextCursorMark"] = page.get("nextCursorMark")
 
-            # Update data with all results
-            if "resultList" in data:
-                data["resultList"]["result"] = all_results[:max_results]
-                data["returnedCount"] = len(data["resultList"]["result"])
+        if data is None:
+            data = {"hitCount": 0, "resultList": {"result": []}}
+        elif auto_paginate:
+            data["resultList"]["result"] = all_results
+            data["returnedCount"] = len(all_results)
 
         logger.info(
             f"Europe PMC search returned {data.get('hitCount', 0)} total matches, "
@@ -2315,12 +2649,86 @@ def _search_europepmc_flexible(
         return None
 
 
+# Search result pages keyed by normalized query. Each entry holds the results
+# fetched so far plus the cursor to continue from, so a later request for more
+# results only fetches the missing tail. ARTL_SEARCH_CACHE_TTL=0 disables it.
+_search_page_cache = make_cache(
+    "search_pages",
+    maxsize=128,
+    ttl=get_float_config("ARTL_SEARCH_CACHE_TTL", 300),
+)
+
+
+def _search_cache_key(query: str, result_type: str) -> tuple[str, str]:
+    """Normalize a search into a cache key (whitespace-insensitive query)."""
+    return " ".join(query.split()), result_type
+
+
+def _search_europepmc_cached(
+    query: str, max_results: int, result_type: str
+) -> tuple[dict[str, Any] | None, dict[str, Any]]:
+    """Run a Europe PMC search, serving and extending cached result pages.
+
+    Returns:
+        Tuple of (Europe PMC style response or None on failure, cache info)
+    """
+    key = _search_cache_key(query, result_type)
+    entry = _search_page_cache.get(key)
+    status = "hit"
+    if entry is None:
+        status = "miss"
+        entry = {"hit_count": 0, "results": [], "cursor": "*", "exhausted": False}
+
+    needed = max_results - len(entry["results"])
+    if needed > 0 and not entry["exhausted"]:
+        if status == "hit":
+            status = "extended"
+        data = _search_europepmc_flexible(
+            query=query,
+            page_size=min(needed, 1000),
+            synonym=True,
+            sort="RELEVANCE",
+            result_type=result_type,
+            auto_paginate=needed > 1000,  # One API page holds at most 1000
+            max_results=needed,
+            cursor_mark=entry["cursor"],
+        )
+        if data is None:
+            return None, {"status": "error", **_search_page_cache.stats()}
+
+        fetched = data.get("resultList", {}).get("result", [])
+        results = entry["results"] + fetched
+        next_cursor = data.get("nextCursorMark")
+        entry = {
+            "hit_count": data.get("hitCount", 0),
+            "results": results,
+            "cursor": next_cursor,
+            "exhausted": (
+                len(fetched) < needed
+                or not next_cursor
+                or next_cursor == entry["cursor"]
+                or len(results) >= data.get("hitCount", 0)
+            ),
+        }
+        _search_page_cache.set(key, entry)
+
+    count(f"cache.search.{status}")
+    response = {
+        "hitCount": entry["hit_count"],
+        "resultList": {"result": entry["results"][:max_results]},
+    }
+    return response, {"status": status, **_search_page_cache.stats()}
+
+
+@instrumented()
 def search_europepmc_papers(
     keywords: str,
     max_results: int = 10,
     result_type: str = "lite",
     save_file: bool = False,
     save_to: str | None = None,
+    fields: str | list[str] | None = None,
+    include_id_lists: bool = True,
 ) -> dict[str, Any]:
     """
     Search Europe PMC for papers and return comprehensive paper information.
@@ -2366,6 +2774,15 @@ def search_europepmc_papers(
             - "lite": Basic metadata, titles, authors, access flags (faster, smaller)
             - "core": Full metadata including abstracts, keywords, affiliations,
                      MeSH terms, grants, full text URLs (richer, larger)
+        fields: Trim each paper to these fields. Either a preset name, a
+            comma-separated string, or a list; presets may be mixed with names:
+            - "ids": id, source, pmid, pmcid, doi
+            - "citation": identifiers, title, authors, journal, year, volume, pages
+            - "abstract": identifiers, title, year, abstractText
+            The cheapest Europe PMC result type covering the fields is requested,
+            so "ids" uses "idlist" and abstract fields use "core".
+        include_id_lists: Include the "pmids", "pmcids" and "dois" summary lists,
+            which duplicate identifiers already present in "papers"
 
     Result Type Comparison:
         "lite" mode returns:
@@ -2467,15 +2884,12 @@ def search_europepmc_papers(
     - Research planning with author and affiliation information
     """
     try:
+        field_list = _resolve_search_fields(fields)
+        result_type = _upstream_result_type(result_type, field_list)
+
         # Use Europe PMC exclusively - no PubMed fallback
-        europepmc_result = _search_europepmc_flexible(
-            query=keywords,
-            page_size=max_results,
-            synonym=True,
-            sort="RELEVANCE",
-            result_type=result_type,
-            auto_paginate=False,
-            max_results=max_results,
+        europepmc_result, cache_info = _search_europepmc_cached(
+            keywords, max_results, result_type
         )
 
         if not europepmc_result:
@@ -2506,8 +2920,11 @@ def search_europepmc_papers(
             pmcid = paper.get("pmcid")
             doi = paper.get("doi")
 
-            # Start with the complete paper object from Europe PMC
-            paper_info = dict(paper)  # Copy all fields from Europe PMC response
+            if field_list:
+                paper_info = {f: paper[f] for f in field_list if f in paper}
+            else:
+                # Start with the complete paper object from Europe PMC
+                paper_info = dict(paper)
 
             # Collect identifiers for summary lists
             if pmid:
@@ -2519,17 +2936,20 @@ def search_europepmc_papers(
 
             papers.append(paper_info)
 
-        search_results = {
-            "pmids": pmids,
-            "pmcids": pmcids,
-            "dois": dois,
-            "papers": papers,
-            "total_count": europepmc_result.get("hitCount", 0),
-            "returned_count": len(results),
-            "result_type": result_type,
-            "source": "europepmc",
-            "query": keywords,
-        }
+        search_results: dict[str, Any] = {}
+        if include_id_lists:
+            search_results.update(pmids=pmids, pmcids=pmcids, dois=dois)
+        search_results.update(
+            papers=papers,
+            total_count=europepmc_result.get("hitCount", 0),
+            returned_count=len(results),
+            result_type=result_type,
+            source="europepmc",
+            query=keywords,
+        )
+        if field_list:
+            search_results["fields"] = field_list
+        search_results["cache"] = cache_info
 
         # Save to file if requested
         saved_path = None
@@ -2571,6 +2991,103 @@ def search_europepmc_papers(
         }
 
 
+def _index_in_local_corpus(**fields: Any) -> None:
+    """Add fetched paper content to the local search index when it is enabled."""
+    corpus = get_local_corpus()
+    if corpus is None:
+        return
+    try:
+        corpus.add(**fields)
+    except Exception as e:
+        logger.warning(f"Failed to index paper in local corpus: {e}")
+
+
+def _export_chunks_for(
+    saved_path: Any,
+    content: str,
+    identifiers: dict[str, str | None],
+    source: str,
+) -> str | None:
+    """Write retrieval chunks next to saved Markdown when chunk export is enabled."""
+    if not saved_path:
+        return None
+    try:
+        chunks_path = export_chunks(content, saved_path, identifiers, source=source)
+    except Exception as e:
+        logger.warning(f"Failed to export chunks for {saved_path}: {e}")
+        return None
+    return str(chunks_path) if chunks_path else None
+
+
+@instrumented()
+def search_local_corpus(query: str, limit: int = 10) -> dict[str, Any]:
+    """Search papers previously fetched by artl-mcp, without any network calls.
+
+    Every paper retrieved with get_europepmc_paper_by_id, get_europepmc_full_text
+    or get_europepmc_pdf_as_markdown is indexed locally (titles, abstracts and
+    converted full text) when the local corpus is enabled with
+    ARTL_LOCAL_CORPUS=true. Results are ranked with BM25, weighting title matches
+    above abstract and body matches.
+
+    Args:
+        query: Free text query. Upper-case AND, OR and NOT combine terms and a
+            trailing * matches prefixes (e.g. "microbio* AND rhizosphere").
+        limit: Maximum number of results (default: 10)
+
+    Returns:
+        Dictionary with ranked hits:
+        {
+            "query": "rhizosphere microbiome",
+            "results": [
+                {
+                    "key": "PMC12241448",
+                    "pmid": "40603217",
+                    "pmcid": "PMC12241448",
+                    "doi": "10.1016/j.tplants.2025.06.001",
+                    "title": "The chemical interaction...",
+                    "has_full_text": True,
+                    "snippet": "... shaping the [rhizosphere] [microbiome] ...",
+                    "score": -7.21,            # BM25; lower is more relevant
+                }
+            ],
+            "returned_count": 1,
+            "total_documents": 154,        # Papers in the local index
+            "elapsed": 0.002,
+        }
+        If the local corpus is disabled, "results" is empty and "error" explains
+        how to enable it.
+
+    Examples:
+        >>> result = search_local_corpus("CRISPR off-target")
+        >>> [hit["pmid"] for hit in result["results"]]
+        ['23851394']
+    """
+    start = time.monotonic()
+    corpus = get_local_corpus()
+    if corpus is None:
+        return {
+            "query": query,
+            "results": [],
+            "returned_count": 0,
+            "error": "Local corpus is disabled; set ARTL_LOCAL_CORPUS=true",
+        }
+
+    try:
+        results = corpus.search(query, limit=limit)
+    except Exception as e:
+        logger.error(f"Error searching local corpus for '{query}': {e}")
+        return {"query": query, "results": [], "returned_count": 0, "error": str(e)}
+
+    return {
+        "query": query,
+        "results": results,
+        "returned_count": len(results),
+        "total_documents": corpus.count(),
+        "elapsed": round(time.monotonic() - start, 3),
+    }
+
+
+@instrumented()
 def get_europepmc_paper_by_id(
     identifier: str, save_file: bool = False, save_to: str | None = None
 ) -> dict[str, Any] | None:
@@ -2673,6 +3190,16 @@ def get_europepmc_paper_by_id(
         # Get the first (and should be only) paper
         paper_data = papers[0]
 
+        _index_in_local_corpus(
+            pmid=paper_data.get("pmid"),
+            pmcid=paper_data.get("pmcid"),
+            doi=paper_data.get("doi"),
+            title=paper_data.get("title"),
+            abstract=paper_data.get("abstractText"),
+            journal=paper_data.get("journalInfo", {}).get("journal", {}).get("title"),
+            year=paper_data.get("pubYear"),
+        )
+
         # Save to file if requested
         saved_path = None
         if save_file or save_to:
@@ -2716,6 +3243,7 @@ def get_europepmc_paper_by_id(
         return None
 
 
+@instrumented()
 def get_all_identifiers_from_europepmc(
     identifier: str, save_file: bool = False, save_to: str | None = None
 ) -> dict[str, Any] | None:
@@ -2966,12 +3494,16 @@ def get_all_identifiers_from_europepmc(
         return None
 
 
+@instrumented()
 def get_europepmc_full_text(
     identifier: str,
     save_file: bool = False,
     save_to: str | None = None,
     offset: int = 0,
     limit: int | None = None,
+    query: str | None = None,
+    top_k: int = 5,
+    profile: bool = False,
 ) -> dict[str, Any] | None:
     """Get LLM-friendly full text content from Europe PMC in Markdown format.
 
@@ -2998,6 +3530,15 @@ def get_europepmc_full_text(
             When combined with offset, enables windowing through large content.
             Full content is always saved to file
             when save_file=True or save_to is provided.
+        query: Optional question or keywords. When given, the document is split
+            on section and paragraph boundaries, the chunks are ranked with BM25,
+            and only the top_k passages are returned in "content". "passages"
+            gives each one's section path, offsets and score, and "retrieval"
+            describes the search (offset/limit are ignored, "windowed" is False
+            and "sections" is left empty). Chunk indexes are cached per document.
+        top_k: Number of passages to return when query is given (default: 5)
+        profile: Profile the XML conversion with cProfile and report the
+            profile path in source_info (also enabled by ARTL_PROFILE)
 
     Returns:
         Dictionary with clean Markdown content and metadata:
@@ -3053,8 +3594,24 @@ def get_europepmc_full_text(
     - Research requiring full paper content with preserved formatting
     """
     try:
+        # Serve from the local Open Access mirror when one is configured
+        with span("mirror_lookup"):
+            mirrored = _full_text_from_oa_mirror(identifier)
+        if mirrored is not None:
+            return _build_full_text_result(
+                identifier,
+                *mirrored,
+                save_file=save_file,
+                save_to=save_to,
+                offset=offset,
+                limit=limit,
+                query=query,
+                top_k=top_k,
+            )
+
         # First, get paper metadata to find the Europe PMC ID
-        paper_data = get_europepmc_paper_by_id(identifier)
+        with span("resolve_id"):
+            paper_data = get_europepmc_paper_by_id(identifier)
         if not paper_data:
             logger.warning(f"No paper found in Europe PMC for identifier: {identifier}")
             return None
@@ -3084,7 +3641,7 @@ def get_europepmc_full_text(
         }
 
         # Fetch XML content
-        response = requests.get(xml_url, headers=headers, timeout=30)
+        response = http.get(xml_url, headers=headers, timeout=30)
 
         if response.status_code == 404:
             logger.info(
@@ -3101,7 +3658,12 @@ def get_europepmc_full_text(
             return None
 
         # Convert XML to Markdown using lxml
-        markdown_content, sections = _convert_jats_xml_to_markdown(xml_content)
+        with span(
+            "convert", labels={"input": "xml"}, xml_chars=len(xml_content)
+        ) as attrs:
+            with profiled(identifier, "xml", profile) as profile_info:
+                markdown_content, sections = _convert_jats_xml_to_markdown(xml_content)
+            attrs.update(profile_info)
 
         if not markdown_content:
             logger.warning(f"Failed to convert XML to Markdown for {identifier}")
@@ -3129,11 +3691,112 @@ def get_europepmc_full_text(
             "xml_url": xml_url,
             "europepmc_id": pmcid,
             "source_database": "PMC",
+            **profile_info,
         }
 
-        # Save to file if requested
-        saved_path = None
-        if save_file or save_to:
+        return _build_full_text_result(
+            identifier,
+            markdown_content,
+            sections,
+            metadata,
+            source_info,
+            save_file=save_file,
+            save_to=save_to,
+            offset=offset,
+            limit=limit,
+            query=query,
+            top_k=top_k,
+        )
+
+    except DeadlineExceeded as e:
+        logger.warning(f"Gave up on full text for {identifier}: {e}")
+        return None
+    except requests.exceptions.RequestException as e:
+        logger.error(f"Error fetching full text XML for {identifier}: {e}")
+        return None
+    except Exception as e:
+        logger.error(f"Error getting Europe PMC full text for '{identifier}': {e}")
+        return None
+
+
+def _full_text_from_oa_mirror(
+    identifier: str,
+) -> tuple[str, dict[str, str], dict[str, str], dict[str, Any]] | None:
+    """Look up converted full text in the local Open Access mirror, if configured.
+
+    Returns:
+        Tuple of (markdown, sections, metadata, source_info), or None when no
+        mirror is configured or the article is not in it
+    """
+    mirror = get_oa_mirror()
+    if mirror is None:
+        return None
+    try:
+        id_info = IdentifierUtils.normalize_identifier(identifier)
+        article = mirror.get(id_info["type"], id_info["value"])
+    except Exception as e:
+        logger.warning(f"Local mirror lookup failed for {identifier}: {e}")
+        return None
+    if article is None:
+        return None
+
+    logger.info(f"Serving full text for {identifier} from local mirror")
+    metadata = {
+        k: v
+        for k, v in {
+            "title": article["title"],
+            "doi": article["doi"],
+            "pmid": article["pmid"],
+            "pmcid": article["pmcid"],
+        }.items()
+        if v
+    }
+    source_info = {
+        "xml_source": "local_mirror",
+        "conversion_method": "jats_to_markdown",
+        "original_format": "xml",
+        "mirror_path": str(mirror.db_path),
+        "archive": article["archive"],
+        "europepmc_id": article["pmcid"],
+        "source_database": "PMC",
+    }
+    return article["markdown"], article["sections"], metadata, source_info
+
+
+def _build_full_text_result(
+    identifier: str,
+    markdown_content: str,
+    sections: dict[str, str],
+    metadata: dict[str, str],
+    source_info: dict[str, Any],
+    save_file: bool = False,
+    save_to: str | None = None,
+    offset: int = 0,
+    limit: int | None = None,
+    query: str | None = None,
+    top_k: int = 5,
+) -> dict[str, Any]:
+    """Index, save and window converted full text into the tool's result shape."""
+    # Where the text came from: the local mirror or Europe PMC's XML service
+    text_source = (
+        "local_mirror"
+        if source_info.get("xml_source") == "local_mirror"
+        else "europepmc_xml"
+    )
+    with span("index"):
+        _index_in_local_corpus(
+            pmid=metadata.get("pmid"),
+            pmcid=metadata.get("pmcid"),
+            doi=metadata.get("doi"),
+            title=metadata.get("title"),
+            body=markdown_content,
+            body_source=text_source,
+        )
+
+    # Save to file if requested
+    saved_path = None
+    if save_file or save_to:
+        with span("save"):
             try:
                 clean_id = str(identifier).replace("/", "_").replace(":", "_")
                 saved_path = file_manager.handle_file_save(
@@ -3150,29 +3813,54 @@ def get_europepmc_full_text(
             except Exception as e:
                 logger.warning(f"Failed to save full text: {e}")
 
-        # Apply content windowing for return to LLM if requested
-        windowed_content, was_windowed = _apply_content_windowing(
-            markdown_content, str(saved_path) if saved_path else None, offset, limit
-        )
+    result_data = {
+        "content": "",
+        "sections": sections,
+        "metadata": metadata,
+        "source_info": source_info,
+        "saved_to": str(saved_path) if saved_path else None,
+        "content_length": len(markdown_content),
+        "windowed": False,
+    }
 
-        result_data = {
-            "content": windowed_content,
-            "sections": sections,
-            "metadata": metadata,
-            "source_info": source_info,
-            "saved_to": str(saved_path) if saved_path else None,
-            "content_length": len(markdown_content),
-            "windowed": was_windowed,
+    chunks_path = _export_chunks_for(
+        saved_path, markdown_content, metadata, source=text_source
+    )
+    if chunks_path:
+        result_data["chunks_saved_to"] = chunks_path
+
+    if query:
+        # Ship only the passages relevant to the question; their text appears
+        # once, in content, and "passages" locates each one in the document
+        with span("retrieve"):
+            retrieval = rank_passages(markdown_content, query, top_k=top_k)
+        count(
+            "cache.passages.hit" if retrieval["index_cached"] else "cache.passages.miss"
+        )
+        passages = retrieval["passages"]
+        result_data["content"] = "\n\n".join(
+            f"[{' > '.join(p['section_path']) or 'Document'}]\n{p['text']}"
+            for p in passages
+        )
+        result_data["sections"] = {}
+        result_data["passages"] = [
+            {k: v for k, v in p.items() if k != "text"} for p in passages
+        ]
+        result_data["retrieval"] = {
+            "query": query,
+            "top_k": top_k,
+            "chunks_total": retrieval["chunks_total"],
+            "index_cached": retrieval["index_cached"],
         }
-
         return result_data
 
-    except requests.exceptions.RequestException as e:
-        logger.error(f"Error fetching full text XML for {identifier}: {e}")
-        return None
-    except Exception as e:
-        logger.error(f"Error getting Europe PMC full text for '{identifier}': {e}")
-        return None
+    # Apply content windowing for return to LLM if requested
+    with span("window"):
+        result_data["content"], result_data["windowed"] = _apply_content_windowing(
+            markdown_content, str(saved_path) if saved_path else None, offset, limit
+        )
+
+    return result_data
 
 
 def _convert_jats_xml_to_markdown(xml_content: str) -> tuple[str, dict[str, str]]:
@@ -3195,7 +3883,8 @@ def _convert_jats_xml_to_markdown(xml_content: str) -> tuple[str, dict[str, str]
 
     try:
         # Parse XML with lxml
-        root = etree.fromstring(xml_content.encode("utf-8"))
+        with span("parse"):
+            root = etree.fromstring(xml_content.encode("utf-8"))
 
         markdown_parts = []
         sections = {}
@@ -3235,6 +3924,7 @@ def _convert_jats_xml_to_markdown(xml_content: str) -> tuple[str, dict[str, str]
         body_elem = root.find(".//body")
         if body_elem is not None:
             for sec in body_elem.findall(".//sec"):
+                check_deadline()
                 section_md = _convert_section_to_markdown(sec, level=2)
                 if section_md.strip():
                     markdown_parts.append(f"{section_md}\n")
@@ -3272,6 +3962,8 @@ def _convert_jats_xml_to_markdown(xml_content: str) -> tuple[str, dict[str, str]
     except etree.XMLSyntaxError as e:
         logger.error(f"XML parsing error: {e}")
         return "", {}
+    except DeadlineExceeded:
+        raise
     except Exception as e:
         logger.error(f"Error converting XML to Markdown: {e}")
         return "", {}
@@ -3630,7 +4322,7 @@ def get_europepmc_pdf(
 
             # Test if the PDF endpoint exists
             try:
-                test_response = requests.head(potential_pdf_url, timeout=10)
+                test_response = http.head(potential_pdf_url, timeout=10)
                 if test_response.status_code == 200:
                     pdf_url = potential_pdf_url
             except requests.exceptions.RequestException:
@@ -3684,6 +4376,8 @@ def get_europepmc_pdf(
         }
 
 
+@instrumented()
+@cpu_heavy
 def get_europepmc_pdf_as_markdown(
     identifier: str,
     save_file: bool = False,
@@ -3692,6 +4386,7 @@ def get_europepmc_pdf_as_markdown(
     processing_method: str = "auto",
     offset: int = 0,
     limit: int | None = None,
+    profile: bool = False,
 ) -> dict[str, Any] | None:
     """Download PDF from Europe PMC and convert to LLM-friendly Markdown in memory.
 
@@ -3699,6 +4394,10 @@ def get_europepmc_pdf_as_markdown(
     using advanced PDF processing libraries (MarkItDown + pdfplumber), with no
     temporary disk files. Optimized for academic papers with tables and structure.
 
+    For PMCIDs the PDF download starts speculatively while the metadata lookup is
+    still running; it is used if the metadata points at the same Europe PMC PDF
+    and discarded otherwise.
+
     **BEST FOR**: Getting PDF content as structured Markdown for LLM analysis
     **INPUT**: ONE specific identifier (DOI, PMID, or PMCID)
     **OUTPUT**: Clean Markdown content with preserved structure, tables, and metadata
@@ -3722,6 +4421,10 @@ def get_europepmc_pdf_as_markdown(
             When combined with offset, enables windowing through large content.
             Full content is always saved to file when save_file=True
             or save_to is provided.
+        profile: Profile the PDF conversion with cProfile and report the
+            profile path in processing (also enabled by ARTL_PROFILE). The
+            profile is taken wherever the conversion runs, including a
+            worker process.
 
     Returns:
         Dictionary with Markdown content and metadata:
@@ -3732,7 +4435,16 @@ def get_europepmc_pdf_as_markdown(
                 "method": "hybrid_in_memory",          # Processing approach used
                 "tables_extracted": 3,               # Number of tables found
                 "in_memory": True,                    # No disk I/O performed
-                "processing_time": 2.45              # Seconds taken
+                "processing_time": 2.45,             # Seconds taken
+                "stage_timings": {                   # Seconds per stage
+                    "metadata": 0.41,
+                    "pdf_download": 0.12,
+                    "conversion": 1.87,
+                    "save": 0.0,
+                    "total": 2.45
+                },
+                "speculative_download": "used"       # Or "cancelled", "missed",
+                                                     # "not_attempted"
             },
             "paper_info": {                          # Basic paper metadata
                 "title": "...",
@@ -3750,7 +4462,9 @@ def get_europepmc_pdf_as_markdown(
             "content_length": 45000                  # Character count
         }
 
-        Returns None if no PDF found or identifier invalid.
+        Returns None if no PDF found or identifier invalid. When too many PDF
+        conversions are already running or queued, returns at once with
+        {"status": "busy", "retry_after": seconds, "message": ...}.
 
     Examples:
         # Quick Markdown conversion
@@ -3781,13 +4495,28 @@ def get_europepmc_pdf_as_markdown(
     - Research workflows requiring structured paper content
     - High-throughput PDF processing with memory efficiency
     """
-    import time
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="artl-pdf")
+    speculation_cancelled = threading.Event()
+    speculative_download: Future[bytes | None] | None = None
+    speculation_status = "not_attempted"
 
     try:
         start_time = time.time()
+        stage_timings: dict[str, float] = {}
+
+        # Step 1: Speculatively start the PDF download for PMC papers while the
+        # metadata lookup is still in flight
+        speculative_url = _speculative_pdf_url(identifier)
+        if speculative_url:
+            speculative_download = executor.submit(
+                bind_context(_fetch_pdf_bytes), speculative_url, speculation_cancelled
+            )
 
-        # Step 1: Get PDF URL from Europe PMC (reuse existing logic)
-        paper_data = get_europepmc_paper_by_id(identifier)
+        # Step 2: Get paper metadata from Europe PMC
+        stage_start = time.time()
+        with span("resolve_id"):
+            paper_data = get_europepmc_paper_by_id(identifier)
+        stage_timings["metadata"] = round(time.time() - stage_start, 3)
         if not paper_data:
             logger.warning(f"No paper found in Europe PMC for identifier: {identifier}")
             return None
@@ -3804,7 +4533,7 @@ def get_europepmc_pdf_as_markdown(
         }
         paper_info = {k: v for k, v in paper_info.items() if v}
 
-        # Step 2: Find PDF URL using existing logic from get_europepmc_pdf
+        # Step 3: Find PDF URL using existing logic from get_europepmc_pdf
         pdf_url = None
         full_text_urls = []
 
@@ -3826,40 +4555,95 @@ def get_europepmc_pdf_as_markdown(
                     elif availability.lower() == "open access":
                         pdf_url = url
 
-        # Fallback: try Europe PMC PDF endpoint
-        if not pdf_url and paper_data.get("inPMC") == "Y" and paper_data.get("pmcid"):
-            pmcid = paper_data.get("pmcid")
-            potential_pdf_url = (
+        # Fallback: Europe PMC PDF endpoint. No HEAD probe - the GET below
+        # confirms availability through its status code.
+        pmcid = paper_data.get("pmcid")
+        fallback_url = None
+        if not pdf_url and paper_data.get("inPMC") == "Y" and pmcid:
+            fallback_url = (
                 f"https://www.ebi.ac.uk/europepmc/webservices/rest/{pmcid}/pdf"
             )
-            try:
-                test_response = requests.head(potential_pdf_url, timeout=10)
-                if test_response.status_code == 200:
-                    pdf_url = potential_pdf_url
-            except requests.exceptions.RequestException:
-                pass
 
-        if not pdf_url:
+        if not pdf_url and not fallback_url:
             logger.info(f"No PDF URL found for {identifier} in Europe PMC")
             return None
 
-        logger.info(f"Found PDF URL for {identifier}: {pdf_url}")
-
-        # Step 3: Download PDF to memory (streaming)
-        response = requests.get(pdf_url, timeout=60)
-        response.raise_for_status()
-
-        pdf_size = len(response.content)
-        pdf_bytes = io.BytesIO(response.content)
+        # Step 4: Download PDF to memory, reusing the speculative download when it
+        # targets the same Europe PMC document
+        stage_start = time.time()
+        pdf_content = None
+        if speculative_download is not None:
+            if _is_europepmc_pdf_for(pdf_url or fallback_url, pmcid) and (
+                speculative_url and pmcid and pmcid.upper() in speculative_url.upper()
+            ):
+                try:
+                    pdf_content = speculative_download.result()
+                except requests.exceptions.RequestException as e:
+                    logger.debug(f"Speculative PDF download failed: {e}")
+                if pdf_content is not None:
+                    pdf_url = speculative_url
+                    speculation_status = "used"
+                else:
+                    speculation_status = "missed"
+            else:
+                speculation_status = "cancelled"
+            if speculation_status != "used":
+                speculation_cancelled.set()
+                speculative_download.cancel()
+
+        if pdf_content is None:
+            for candidate_url in (pdf_url, fallback_url):
+                if candidate_url and candidate_url != speculative_url:
+                    pdf_content = _fetch_pdf_bytes(candidate_url)
+                    if pdf_content is not None:
+                        pdf_url = candidate_url
+                        break
+
+        stage_timings["pdf_download"] = round(time.time() - stage_start, 3)
+
+        if pdf_content is None:
+            logger.info(f"No PDF could be downloaded for {identifier}")
+            return None
 
-        # Step 4: Process PDF in memory using the selected method
-        processing_result = _process_pdf_in_memory(
-            pdf_bytes, processing_method, extract_tables
+        logger.info(f"Downloaded PDF for {identifier}: {pdf_url}")
+
+        pdf_size = len(pdf_content)
+        pdf_bytes = io.BytesIO(pdf_content)
+
+        # Step 5: Process PDF in memory using the selected method
+        stage_start = time.time()
+        with span(
+            "convert",
+            labels={"input": "pdf"},
+            pdf_bytes=pdf_size,
+            method=processing_method,
+        ) as attrs:
+            profile = profiling_enabled(profile)
+            processing_result, profile_info = run_cpu(
+                _convert_pdf_stage,
+                pdf_bytes,
+                processing_method,
+                extract_tables,
+                identifier,
+                profile,
+                str(get_profile_dir()) if profile else None,
+            )
+            attrs.update(profile_info)
+        stage_timings["conversion"] = round(time.time() - stage_start, 3)
+
+        _index_in_local_corpus(
+            pmid=paper_info.get("pmid"),
+            pmcid=paper_info.get("pmcid"),
+            doi=paper_info.get("doi"),
+            title=paper_info.get("title"),
+            body=processing_result["content"],
+            body_source="europepmc_pdf",
         )
 
         processing_time = time.time() - start_time
 
-        # Step 5: Save to file if requested
+        # Step 6: Save to file if requested
+        stage_start = time.time()
         saved_path = None
         if save_file or save_to:
             try:
@@ -3877,17 +4661,22 @@ def get_europepmc_pdf_as_markdown(
                     logger.info(f"PDF Markdown saved to: {saved_path}")
             except Exception as e:
                 logger.warning(f"Failed to save PDF Markdown: {e}")
+        chunks_path = _export_chunks_for(
+            saved_path, processing_result["content"], paper_info, "europepmc_pdf"
+        )
+        stage_timings["save"] = round(time.time() - stage_start, 3)
 
-        # Step 6: Apply content windowing if requested
+        # Step 7: Apply content windowing if requested
         windowed_content, was_windowed = _apply_content_windowing(
             processing_result["content"],
             str(saved_path) if saved_path else None,
             offset,
             limit,
         )
+        stage_timings["total"] = round(time.time() - start_time, 3)
 
-        # Step 7: Compile comprehensive result
-        return {
+        # Step 8: Compile comprehensive result
+        result = {
             "content": windowed_content,
             "format": "markdown",
             "processing": {
@@ -3895,6 +4684,9 @@ def get_europepmc_pdf_as_markdown(
                 "tables_extracted": processing_result.get("tables_extracted", 0),
                 "in_memory": True,
                 "processing_time": round(processing_time, 2),
+                "stage_timings": stage_timings,
+                "speculative_download": speculation_status,
+                **profile_info,
             },
             "paper_info": paper_info,
             "pdf_info": {
@@ -3908,13 +4700,312 @@ def get_europepmc_pdf_as_markdown(
             "windowed": was_windowed,
             "source": "europe_pmc_pdf_streaming",
         }
+        if chunks_path:
+            result["chunks_saved_to"] = chunks_path
+        return result
 
+    except SchedulerBusy:
+        raise  # answered as busy by @cpu_heavy
+    except DeadlineExceeded as e:
+        logger.warning(f"Gave up on PDF for {identifier}: {e}")
+        return None
     except requests.exceptions.RequestException as e:
         logger.error(f"Error downloading PDF for {identifier}: {e}")
         return None
     except Exception as e:
         logger.error(f"Error processing PDF as Markdown for '{identifier}': {e}")
         return None
+    finally:
+        # Drop any losing branch without waiting for it
+        speculation_cancelled.set()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _speculative_pdf_url(identifier: str) -> str | None:
+    """Return the Europe PMC PDF render URL when the identifier is a PMCID.
+
+    PMCIDs map directly onto the render endpoint, so the download can start before
+    the metadata lookup confirms which PDF URL Europe PMC lists for the paper.
+    """
+    try:
+        id_info = IdentifierUtils.normalize_identifier(identifier)
+    except IdentifierError:
+        return None
+    if id_info["type"] != "pmcid":
+        return None
+    return f"https://europepmc.org/articles/{id_info['value']}?pdf=render"
+
+
+def _is_europepmc_pdf_for(url: str | None, pmcid: str | None) -> bool:
+    """Check whether a PDF URL is served by Europe PMC for the given PMCID."""
+    if not url or not pmcid:
+        return False
+    host = urlparse(url).netloc.lower()
+    return (
+        host.endswith("europepmc.org") or host.endswith("ebi.ac.uk")
+    ) and pmcid.upper() in url.upper()
+
+
+def _fetch_pdf_bytes(
+    pdf_url: str, cancelled: threading.Event | None = None, timeout: int = 60
+) -> bytes | None:
+    """Download a PDF into memory, confirming availability from the GET itself.
+
+    Args:
+        pdf_url: URL of the PDF
+        cancelled: Optional event; when set before the body is read, the
+            connection is closed without downloading the body
+        timeout: Request timeout in seconds
+
+    Returns:
+        PDF bytes, or None if the server did not return the PDF
+    """
+    response = http.get(pdf_url, timeout=timeout, stream=True)
+    try:
+        if response.status_code != 200:
+            logger.info(f"PDF not available at {pdf_url} ({response.status_code})")
+            return None
+        if cancelled is not None and cancelled.is_set():
+            return None
+        check_deadline()
+        return response.content
+    finally:
+        response.close()
+
+
+# Full text sources in default preference order (best quality first)
+FULL_TEXT_SOURCES = ["europepmc_xml", "bioc", "europepmc_pdf", "unpaywall_pdf"]
+
+
+@instrumented()
+def resolve_full_text(
+    identifier: str,
+    sources: list[str] | None = None,
+    deadline: float = 30.0,
+    save_file: bool = False,
+    save_to: str | None = None,
+    offset: int = 0,
+    limit: int | None = None,
+) -> dict[str, Any] | None:
+    """Race all full text sources for a paper and return the best timely result.
+
+    Queries the available full text sources concurrently instead of one after
+    another. A result is returned as soon as every source preferred over it has
+    finished without text; otherwise the best result received before the deadline
+    wins. Sources still running at that point are cancelled.
+
+    Available sources (default preference order):
+    - "europepmc_xml": Europe PMC JATS XML converted to Markdown
+    - "bioc": PMC Open Access BioC text (needs a PMID, converted if necessary)
+    - "europepmc_pdf": Europe PMC PDF converted to Markdown
+    - "unpaywall_pdf": Unpaywall open access PDF text (requires an email address)
+
+    Args:
+        identifier: Any scientific identifier - DOI, PMID, or PMCID in any format
+        sources: Source names in preference order (default: FULL_TEXT_SOURCES)
+        deadline: Maximum seconds to wait for sources (default: 30)
+        save_file: Whether to save full text to the output directory with
+            auto-generated filename
+        save_to: Specific path to save full text (overrides save_file if provided)
+        offset: Starting character position for content windowing (0-based)
+        limit: Maximum number of characters to return (None = no limit)
+
+    Returns:
+        Dictionary with the winning content and per-source outcomes:
+        {
+            "content": "...",                  # Text from the winning source
+            "source": "europepmc_xml",         # Winning source
+            "format": "markdown",              # "markdown" or "text"
+            "sources": {                       # Outcome per source
+                "europepmc_xml": "won",
+                "bioc": "cancelled",
+                "europepmc_pdf": "cancelled",   # "busy" if PDF conversion is full
+                "unpaywall_pdf": "skipped"
+            },
+            "source_durations": {"europepmc_xml": 1.2},
+            "elapsed": 1.21,
+            "deadline_exceeded": False,
+            "saved_to": None,
+            "content_length": 45000,
+            "windowed": False
+        }
+
+        Returns None if the identifier is invalid or no source returned text.
+
+    Examples:
+        >>> result = resolve_full_text("10.1371/journal.pone.0000217")
+        >>> result["source"]
+        'europepmc_xml'
+        >>> result = resolve_full_text(
+        ...     "PMC1790863", sources=["bioc", "europepmc_xml"], deadline=10
+        ... )
+    """
+    try:
+        id_info = IdentifierUtils.normalize_identifier(identifier)
+    except IdentifierError as e:
+        logger.warning(f"Invalid identifier for full text resolution: {e}")
+        return None
+
+    requested = sources or FULL_TEXT_SOURCES
+    unknown = [name for name in requested if name not in FULL_TEXT_SOURCES]
+    if unknown:
+        logger.warning(f"Ignoring unknown full text sources: {unknown}")
+
+    email = get_email_manager().get_email()
+    statuses: dict[str, str] = {}
+    fetchers = {}
+    for name in requested:
+        if name not in FULL_TEXT_SOURCES:
+            continue
+        if name == "unpaywall_pdf" and not email:
+            statuses[name] = "skipped"
+            continue
+        fetchers[name] = _full_text_fetcher(name, identifier, id_info, email)
+
+    race = race_by_preference(
+        fetchers,
+        preference=list(fetchers),
+        deadline=deadline,
+        is_usable=lambda result: bool(result and result.get("content")),
+    )
+    statuses.update(race["statuses"])
+
+    if race["source"] is None:
+        logger.info(f"No full text source returned content for {identifier}")
+        return None
+
+    winner = race["result"]
+    content = winner["content"]
+
+    saved_path = None
+    if save_file or save_to:
+        try:
+            clean_id = str(identifier).replace("/", "_").replace(":", "_")
+            saved_path = file_manager.handle_file_save(
+                content=content,
+                base_name="fulltext",
+                identifier=clean_id,
+                file_format="md" if winner["format"] == "markdown" else "txt",
+                save_file=save_file,
+                save_to=save_to,
+                use_temp_dir=False,
+            )
+            if saved_path:
+                logger.info(f"Resolved full text saved to: {saved_path}")
+        except Exception as e:
+            logger.warning(f"Failed to save resolved full text: {e}")
+
+    chunks_path = _export_chunks_for(
+        saved_path, content, {id_info["type"]: id_info["value"]}, race["source"]
+    )
+
+    windowed_content, was_windowed = _apply_content_windowing(
+        content, str(saved_path) if saved_path else None, offset, limit
+    )
+
+    result = {
+        "content": windowed_content,
+        "source": race["source"],
+        "format": winner["format"],
+        "sources": {name: statuses[name] for name in requested if name in statuses},
+        "source_durations": race["durations"],
+        "elapsed": race["elapsed"],
+        "deadline_exceeded": race["deadline_exceeded"],
+        "identifier": identifier,
+        "saved_to": str(saved_path) if saved_path else None,
+        "content_length": len(content),
+        "windowed": was_windowed,
+    }
+    if chunks_path:
+        result["chunks_saved_to"] = chunks_path
+    return result
+
+
+def _full_text_fetcher(
+    source: str, identifier: str, id_info: dict[str, str], email: str | None
+):
+    """Build the zero-argument fetch function for one full text source."""
+    if source == "europepmc_xml":
+        return lambda: _full_text_from_europepmc_xml(identifier)
+    if source == "bioc":
+        return lambda: _full_text_from_bioc(id_info)
+    if source == "europepmc_pdf":
+        return lambda: _full_text_from_europepmc_pdf(identifier)
+    return lambda: _full_text_from_unpaywall(id_info, email or "")
+
+
+def _full_text_from_europepmc_xml(identifier: str) -> dict[str, str] | None:
+    """Fetch full text as Markdown from Europe PMC JATS XML."""
+    result = get_europepmc_full_text(identifier)
+    if not result:
+        return None
+    return {"content": result["content"], "format": "markdown"}
+
+
+def _full_text_from_europepmc_pdf(identifier: str) -> dict[str, str] | None:
+    """Fetch full text as Markdown from the Europe PMC PDF."""
+    result = get_europepmc_pdf_as_markdown(identifier)
+    if not result:
+        return None
+    if result.get("status") == "busy":
+        raise SchedulerBusy(result["retry_after"])
+    return {"content": result["content"], "format": "markdown"}
+
+
+def _full_text_from_bioc(id_info: dict[str, str]) -> dict[str, str] | None:
+    """Fetch full text from the PMC BioC endpoint, converting the ID to a PMID."""
+    if id_info["type"] == "pmid":
+        pmid = id_info["value"]
+    elif id_info["type"] == "doi":
+        pmid = IdentifierConverter.doi_to_pmid(id_info["value"])
+    else:
+        pmid = IdentifierConverter.pmcid_to_pmid(id_info["value"])
+    if not pmid:
+        return None
+    text = aupu.get_full_text_from_bioc(pmid)
+    return {"content": text, "format": "text"} if text else None
+
+
+def _full_text_from_unpaywall(
+    id_info: dict[str, str], email: str
+) -> dict[str, str] | None:
+    """Fetch full text from the Unpaywall open access PDF for the paper's DOI."""
+    if id_info["type"] == "doi":
+        doi = id_info["value"]
+    elif id_info["type"] == "pmid":
+        doi = IdentifierConverter.pmid_to_doi(id_info["value"])
+    else:
+        doi = IdentifierConverter.pmcid_to_doi(id_info["value"])
+    if not doi:
+        return None
+    dfr = DOIFetcher(email=email)
+    info = dfr.get_full_text_info(doi)
+    if not info or not info.pdf_url:
+        return None
+    text = dfr.text_from_pdf_url(info.pdf_url)
+    return {"content": text, "format": "text"} if text else None
+
+
+def _convert_pdf_stage(
+    pdf_bytes: io.BytesIO,
+    method: str,
+    extract_tables: bool,
+    identifier: str,
+    profile: bool,
+    profile_dir: str | None,
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Conversion stage handed to run_cpu, profiled where it runs.
+
+    Profiling is resolved by the caller, since a worker process may not share
+    its configuration.
+
+    Returns:
+        The _process_pdf_in_memory result and the profile info ({"profile":
+        path} when a profile was written)
+    """
+    with profiled(identifier, "pdf", profile, profile_dir) as profile_info:
+        result = _process_pdf_in_memory(pdf_bytes, method, extract_tables)
+    return result, profile_info
 
 
 def _process_pdf_in_memory(
@@ -3958,7 +5049,8 @@ def _process_with_markitdown(pdf_bytes: io.BytesIO) -> dict[str, Any]:
         pdf_bytes.seek(0)
 
         md = MarkItDown()
-        result = md.convert(pdf_bytes)
+        with span("pdf.markitdown"):
+            result = md.convert(pdf_bytes)
 
         return {
             "content": result.text_content,
@@ -3984,11 +5076,13 @@ def _process_with_pdfplumber(pdf_bytes: io.BytesIO) -> dict[str, Any]:
         # Reset stream position
         pdf_bytes.seek(0)
 
-        with pdfplumber.open(pdf_bytes) as pdf:
+        with span("pdf.pdfplumber") as attrs, pdfplumber.open(pdf_bytes) as pdf:
+            attrs["pages"] = len(pdf.pages)
             markdown_parts = []
             tables_found = 0
 
             for page_num, page in enumerate(pdf.pages):
+                check_deadline()
                 # Extract text
                 page_text = page.extract_text() or ""
 
@@ -4022,6 +5116,8 @@ def _process_with_pdfplumber(pdf_bytes: io.BytesIO) -> dict[str, Any]:
                 "page_count": len(pdf.pages),
             }
 
+    except DeadlineExceeded:
+        raise
     except Exception as e:
         logger.error(f"Error with pdfplumber processing: {e}")
         return _fallback_text_extraction(pdf_bytes)
@@ -4041,13 +5137,16 @@ def _process_with_hybrid(pdf_bytes: io.BytesIO) -> dict[str, Any]:
         markitdown_result = _process_with_markitdown(pdf_bytes)
 
         # Then extract tables separately with pdfplumber
+        check_deadline()
         pdf_bytes.seek(0)  # Reset stream
 
-        with pdfplumber.open(pdf_bytes) as pdf:
+        with span("pdf.tables") as attrs, pdfplumber.open(pdf_bytes) as pdf:
+            attrs["pages"] = len(pdf.pages)
             tables_found = 0
             table_sections = []
 
             for _page_num, page in enumerate(pdf.pages):
+                check_deadline()
                 page_tables = page.extract_tables()
 
                 for table in page_tables:
@@ -4071,6 +5170,8 @@ def _process_with_hybrid(pdf_bytes: io.BytesIO) -> dict[str, Any]:
                 "page_count": len(pdf.pages),
             }
 
+    except DeadlineExceeded:
+        raise
     except Exception as e:
         logger.error(f"Error with hybrid processing: {e}")
         return _fallback_text_extraction(pdf_bytes)
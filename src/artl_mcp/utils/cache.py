@@ -0,0 +1,270 @@
+"""Caching utilities.
+
+Provides a small thread-safe LRU cache with per-entry expiry and hit/miss
+statistics, used to avoid repeating identical upstream API calls, and a
+SQLite-backed cache with the same interface that several server processes can
+share. ``make_cache`` picks the shared one when ARTL_SHARED_CACHE names a file.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from pathlib import Path
+from typing import Any
+
+from artl_mcp.utils.config_manager import get_config_value
+
+logger = logging.getLogger(__name__)
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries expire after a fixed time-to-live."""
+
+    def __init__(self, maxsize: int = 128, ttl: float = 300.0):
+        """Create a cache.
+
+        Args:
+            maxsize: Maximum number of entries; least recently used entries are
+                evicted first. 0 disables the cache.
+            ttl: Seconds an entry stays valid. 0 or less disables the cache.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache stores anything at all."""
+        return self.maxsize > 0 and self.ttl > 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for key, or default if missing or expired."""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None or item[0] <= time.monotonic():
+                if item is not None:
+                    del self._data[key]
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return item[1]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value under key, evicting the least recently used entry if full."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove key and return its value (default if missing)."""
+        with self._lock:
+            item = self._data.pop(key, None)
+            return default if item is None else item[1]
+
+    def clear(self) -> None:
+        """Remove all entries and reset statistics."""
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> dict[str, Any]:
+        """Return hit/miss counters and current size."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            }
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    expires REAL NOT NULL,
+    PRIMARY KEY (namespace, key)
+);
+CREATE INDEX IF NOT EXISTS cache_expiry ON cache (namespace, expires);
+"""
+
+
+class SQLiteCache:
+    """Expiring cache stored in a SQLite file shared between processes.
+
+    Has the TTLCache interface. Keys and values must be JSON-serializable
+    (tuples come back as lists). When full, the entries closest to expiry are
+    evicted first. Statistics count this process's lookups only. Database
+    errors are logged and treated as misses, so a broken cache file never
+    fails a call.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        namespace: str,
+        maxsize: int = 128,
+        ttl: float = 300.0,
+    ):
+        """Create a cache.
+
+        Args:
+            path: SQLite file; created if missing
+            namespace: Name separating this cache's entries from others in the
+                same file
+            maxsize: Maximum number of entries in the namespace
+            ttl: Seconds an entry stays valid. 0 or less disables the cache.
+        """
+        self.path = Path(path).expanduser()
+        self.namespace = namespace
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, timeout=10, check_same_thread=False)
+        # WAL lets readers in other processes proceed while one process writes
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache stores anything at all."""
+        return self.maxsize > 0 and self.ttl > 0
+
+    @staticmethod
+    def _key(key: Hashable) -> str:
+        return json.dumps(key, sort_keys=True)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for key, or default if missing or expired."""
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT value FROM cache"
+                    " WHERE namespace = ? AND key = ? AND expires > ?",
+                    (self.namespace, self._key(key), time.time()),
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Shared cache read failed: {e}")
+            row = None
+        with self._lock:
+            if row is None:
+                self.misses += 1
+                return default
+            self.hits += 1
+        return json.loads(row[0])
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value under key, evicting the entries closest to expiry if full."""
+        if not self.enabled:
+            return
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO cache VALUES (?, ?, ?, ?)",
+                    (
+                        self.namespace,
+                        self._key(key),
+                        json.dumps(value),
+                        time.time() + self.ttl,
+                    ),
+                )
+                evicted = self._conn.execute(
+                    "DELETE FROM cache WHERE namespace = ? AND key IN ("
+                    " SELECT key FROM cache WHERE namespace = ?"
+                    " ORDER BY expires DESC LIMIT -1 OFFSET ?)",
+                    (self.namespace, self.namespace, self.maxsize),
+                ).rowcount
+                self.evictions += max(evicted, 0)
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logger.warning(f"Shared cache write failed: {e}")
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove key and return its value (default if missing)."""
+        value = self.get(key, default)
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "DELETE FROM cache WHERE namespace = ? AND key = ?",
+                    (self.namespace, self._key(key)),
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Shared cache delete failed: {e}")
+        return value
+
+    def clear(self) -> None:
+        """Remove all entries of this namespace and reset statistics."""
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "DELETE FROM cache WHERE namespace = ?", (self.namespace,)
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Shared cache clear failed: {e}")
+        with self._lock:
+            self.hits = self.misses = self.evictions = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM cache WHERE namespace = ? AND expires > ?",
+                (self.namespace, time.time()),
+            ).fetchone()[0]
+
+    def stats(self) -> dict[str, Any]:
+        """Return hit/miss counters and current size."""
+        size = len(self)
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": size,
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+                "shared": True,
+            }
+
+
+def make_cache(
+    namespace: str, maxsize: int = 128, ttl: float = 300.0
+) -> TTLCache | SQLiteCache:
+    """Return a cache shared through ARTL_SHARED_CACHE, or an in-memory one.
+
+    Server workers started by ``artl-mcp --workers N`` set ARTL_SHARED_CACHE,
+    so upstream results fetched by one worker are reused by all of them.
+    """
+    path = get_config_value("ARTL_SHARED_CACHE")
+    if path:
+        try:
+            return SQLiteCache(path, namespace, maxsize=maxsize, ttl=ttl)
+        except sqlite3.Error as e:
+            logger.warning(f"Could not open shared cache {path}: {e}")
+    return TTLCache(maxsize=maxsize, ttl=ttl)
@@ -0,0 +1,133 @@
+"""Export of retrieval-ready chunks next to saved Markdown.
+
+When ARTL_CHUNK_EXPORT is set to "ndjson" or "parquet", every Markdown file
+saved by the full text and PDF pipelines gets a companion ``.chunks.ndjson`` or
+``.chunks.parquet`` file. Each row is one structure-aware chunk with its section
+path, character span, token count and the paper's identifiers, so downstream
+RAG systems do not have to re-chunk. Parquet output requires the optional
+pyarrow package and falls back to NDJSON without it.
+"""
+
+import json
+import logging
+from pathlib import Path
+from typing import Any, Literal
+
+from artl_mcp.utils.config_manager import get_config_value
+from artl_mcp.utils.passages import get_passage_index
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None  # type: ignore[assignment]
+    pq = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+ChunkFormat = Literal["ndjson", "parquet"]
+
+PARQUET_AVAILABLE = pa is not None
+
+
+def build_chunk_records(
+    markdown: str,
+    identifiers: dict[str, str | None],
+    source: str | None = None,
+    max_chars: int = 1500,
+) -> list[dict[str, Any]]:
+    """Chunk a document and attach paper identifiers to every chunk.
+
+    Chunks come from the shared passage index, so a later query= on the same
+    document reuses them.
+
+    Args:
+        markdown: Converted document
+        identifiers: Paper identifiers ("pmid", "pmcid", "doi")
+        source: Where the text came from (e.g. "europepmc_xml")
+        max_chars: Target maximum chunk size in characters
+
+    Returns:
+        One record per chunk
+    """
+    index, _ = get_passage_index(markdown, max_chars=max_chars)
+    paper_key = (
+        identifiers.get("pmcid")
+        or identifiers.get("pmid")
+        or identifiers.get("doi")
+        or "document"
+    )
+    return [
+        {
+            "chunk_id": f"{paper_key}#{chunk.index}",
+            "chunk_index": chunk.index,
+            "text": chunk.text,
+            "section_path": chunk.section_path,
+            "char_start": chunk.start,
+            "char_end": chunk.end,
+            "token_count": chunk.token_count,
+            "pmid": identifiers.get("pmid") or None,
+            "pmcid": identifiers.get("pmcid") or None,
+            "doi": identifiers.get("doi") or None,
+            "source": source,
+        }
+        for chunk in index.chunks
+    ]
+
+
+def write_chunk_records(
+    records: list[dict[str, Any]], markdown_path: str | Path, fmt: ChunkFormat
+) -> Path:
+    """Write chunk records next to a Markdown file.
+
+    Args:
+        records: Records from build_chunk_records()
+        markdown_path: Path of the saved Markdown file
+        fmt: "ndjson" or "parquet" (NDJSON is used if pyarrow is missing)
+
+    Returns:
+        Path of the written chunk file
+    """
+    markdown_path = Path(markdown_path)
+    if fmt == "parquet" and not PARQUET_AVAILABLE:
+        logger.warning("pyarrow is not installed; writing chunks as NDJSON instead")
+        fmt = "ndjson"
+
+    out_path = markdown_path.with_suffix(f".chunks.{fmt}")
+    if fmt == "parquet":
+        pq.write_table(pa.Table.from_pylist(records), out_path)
+    else:
+        with open(out_path, "w", encoding="utf-8") as f:
+            for record in records:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+    return out_path
+
+
+def get_chunk_export_format() -> ChunkFormat | None:
+    """Return the configured export format, or None when export is disabled."""
+    value = str(get_config_value("ARTL_CHUNK_EXPORT", "") or "").lower()
+    if value in ("ndjson", "parquet"):
+        return value  # type: ignore[return-value]
+    if value:
+        logger.warning(f"Ignoring unknown ARTL_CHUNK_EXPORT value: {value}")
+    return None
+
+
+def export_chunks(
+    markdown: str,
+    markdown_path: str | Path,
+    identifiers: dict[str, str | None],
+    source: str | None = None,
+) -> Path | None:
+    """Write chunks for a saved Markdown file if chunk export is enabled.
+
+    Returns:
+        Path of the chunk file, or None when export is disabled
+    """
+    fmt = get_chunk_export_format()
+    if fmt is None:
+        return None
+    records = build_chunk_records(markdown, identifiers, source=source)
+    path = write_chunk_records(records, markdown_path, fmt)
+    logger.info(f"Wrote {len(records)} chunks to {path}")
+    return path
@@ -0,0 +1,480 @@
+"""Multi-hop citation graph crawling with a persistent SQLite store.
+
+Expands the citation graph around one or more seed DOIs breadth-first, fetching
+each frontier level concurrently from OpenAlex (with CrossRef as a fallback for
+references). Nodes are deduplicated by normalized DOI and persisted together
+with their citing -> cited edges, so a later crawl only fetches papers that
+have not been expanded before.
+
+The store lives at ARTL_CITATION_GRAPH_DB (default:
+<ARTL_OUTPUT_DIR>/artl_citation_graph.sqlite).
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Literal
+
+from artl_mcp.utils.citation_utils import OPENALEX_API_URL, CitationUtils
+from artl_mcp.utils.config_manager import get_config_value
+from artl_mcp.utils.email_manager import get_email
+from artl_mcp.utils.identifier_utils import IdentifierError, IdentifierUtils
+from artl_mcp.utils.instrumentation import bind_context
+
+logger = logging.getLogger(__name__)
+
+Direction = Literal["references", "citations", "both"]
+
+_SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS nodes (
+        doi TEXT PRIMARY KEY,
+        openalex_id TEXT,
+        title TEXT,
+        year INTEGER,
+        cited_by_count INTEGER,
+        references_expanded_at REAL,
+        citations_expanded_at REAL,
+        updated_at REAL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS edges (
+        citing TEXT NOT NULL,
+        cited TEXT NOT NULL,
+        source TEXT,
+        PRIMARY KEY (citing, cited)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS edges_cited ON edges (cited)",
+]
+
+_NODE_COLUMNS = "doi, openalex_id, title, year, cited_by_count"
+
+# Fields requested from OpenAlex for neighbour nodes
+_OPENALEX_SELECT = "id,doi,title,publication_year,cited_by_count"
+
+
+def normalize_doi(doi: str | None) -> str | None:
+    """Return the lower-case raw form of a DOI, or None if it is not a DOI."""
+    if not doi:
+        return None
+    try:
+        return IdentifierUtils.normalize_doi(doi, "raw").lower()
+    except IdentifierError:
+        return None
+
+
+class CitationGraphStore:
+    """SQLite store of citation graph nodes (keyed by DOI) and edges."""
+
+    def __init__(self, db_path: str | Path):
+        """Open (or create) the graph database.
+
+        Args:
+            db_path: Path to the SQLite database file
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        for statement in _SCHEMA:
+            self._conn.execute(statement)
+        self._conn.commit()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> "CitationGraphStore":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def upsert_nodes(self, nodes: list[dict[str, Any]]) -> None:
+        """Insert nodes or fill in metadata missing from stored copies."""
+        rows = [
+            (
+                node["doi"],
+                node.get("openalex_id"),
+                node.get("title"),
+                node.get("year"),
+                node.get("cited_by_count"),
+                time.time(),
+            )
+            for node in nodes
+        ]
+        with self._lock:
+            self._conn.executemany(
+                "INSERT INTO nodes (doi, openalex_id, title, year, cited_by_count, "
+                "updated_at) VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT (doi) DO UPDATE "
+                "SET openalex_id = coalesce(excluded.openalex_id, openalex_id), "
+                "title = coalesce(excluded.title, title), "
+                "year = coalesce(excluded.year, year), "
+                "cited_by_count = coalesce(excluded.cited_by_count, cited_by_count), "
+                "updated_at = excluded.updated_at",
+                rows,
+            )
+            self._conn.commit()
+
+    def add_edges(self, edges: list[tuple[str, str]], source: str) -> None:
+        """Store citing -> cited edges; duplicates are ignored."""
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO edges (citing, cited, source) VALUES (?, ?, ?)",
+                [(citing, cited, source) for citing, cited in edges if citing != cited],
+            )
+            self._conn.commit()
+
+    def mark_expanded(self, doi: str, direction: Direction) -> None:
+        """Record that a node's references and/or citations have been fetched."""
+        columns = {
+            "references": ["references_expanded_at"],
+            "citations": ["citations_expanded_at"],
+            "both": ["references_expanded_at", "citations_expanded_at"],
+        }[direction]
+        assignments = ", ".join(f"{column} = ?" for column in columns)
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                f"UPDATE nodes SET {assignments} WHERE doi = ?",
+                (*[now] * len(columns), doi),
+            )
+            self._conn.commit()
+
+    def is_expanded(self, doi: str, direction: Direction) -> bool:
+        """Check whether a node was already expanded in the given direction."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT references_expanded_at, citations_expanded_at "
+                "FROM nodes WHERE doi = ?",
+                (doi,),
+            ).fetchone()
+        if row is None:
+            return False
+        if direction == "references":
+            return row[0] is not None
+        if direction == "citations":
+            return row[1] is not None
+        return row[0] is not None and row[1] is not None
+
+    def neighbors(self, doi: str, direction: Direction, limit: int) -> list[str]:
+        """Return up to limit stored neighbour DOIs per direction, most cited first."""
+        queries = []
+        if direction in ("references", "both"):
+            queries.append(
+                "SELECT e.cited FROM edges e LEFT JOIN nodes n ON n.doi = e.cited "
+                "WHERE e.citing = ?"
+            )
+        if direction in ("citations", "both"):
+            queries.append(
+                "SELECT e.citing FROM edges e LEFT JOIN nodes n ON n.doi = e.citing "
+                "WHERE e.cited = ?"
+            )
+        found: list[str] = []
+        with self._lock:
+            for query in queries:
+                rows = self._conn.execute(
+                    f"{query} ORDER BY coalesce(n.cited_by_count, 0) DESC LIMIT ?",
+                    (doi, limit),
+                ).fetchall()
+                found.extend(row[0] for row in rows)
+        return found
+
+    def get_nodes(self, dois: list[str]) -> list[dict[str, Any]]:
+        """Return stored metadata for the given DOIs."""
+        nodes = []
+        with self._lock:
+            for doi in dois:
+                row = self._conn.execute(
+                    f"SELECT {_NODE_COLUMNS} FROM nodes WHERE doi = ?", (doi,)
+                ).fetchone()
+                if row:
+                    nodes.append(dict(zip(_NODE_COLUMNS.split(", "), row, strict=True)))
+        return nodes
+
+    def get_edges(self, dois: set[str]) -> list[dict[str, str]]:
+        """Return stored edges whose endpoints are both in dois."""
+        edges = []
+        with self._lock:
+            for doi in sorted(dois):
+                rows = self._conn.execute(
+                    "SELECT cited FROM edges WHERE citing = ?", (doi,)
+                ).fetchall()
+                edges.extend(
+                    {"citing": doi, "cited": row[0]} for row in rows if row[0] in dois
+                )
+        return edges
+
+    def counts(self) -> dict[str, int]:
+        """Return the number of stored nodes and edges."""
+        with self._lock:
+            return {
+                "nodes": self._conn.execute("SELECT COUNT(*) FROM nodes").fetchone()[0],
+                "edges": self._conn.execute("SELECT COUNT(*) FROM edges").fetchone()[0],
+            }
+
+
+def _openalex_params(params: dict[str, Any]) -> dict[str, Any]:
+    """Add the polite-pool mailto parameter when an email is configured."""
+    email = get_email()
+    return {**params, "mailto": email} if email else params
+
+
+def _short_openalex_id(value: str | None) -> str | None:
+    """Turn https://openalex.org/W123 into W123."""
+    return value.rsplit("/", 1)[-1] if value else None
+
+
+def _openalex_node(work: dict[str, Any]) -> dict[str, Any] | None:
+    """Convert an OpenAlex work into a graph node; works without a DOI are dropped."""
+    doi = normalize_doi(work.get("doi"))
+    if not doi:
+        return None
+    return {
+        "doi": doi,
+        "openalex_id": _short_openalex_id(work.get("id")),
+        "title": work.get("title"),
+        "year": work.get("publication_year"),
+        "cited_by_count": work.get("cited_by_count"),
+    }
+
+
+def _fetch_openalex_works(
+    openalex_ids: list[str], timeout: int
+) -> list[dict[str, Any]]:
+    """Resolve OpenAlex work IDs to nodes, 50 IDs per request."""
+    works = CitationUtils.get_works_openalex_batch(
+        openalex_ids, select=_OPENALEX_SELECT.split(","), timeout=timeout
+    )
+    nodes = [_openalex_node(work) for work in works.values() if work]
+    return [node for node in nodes if node]
+
+
+def _fetch_openalex_citing(
+    openalex_id: str, limit: int, timeout: int
+) -> list[dict[str, Any]]:
+    """Return the most cited works that cite openalex_id."""
+    data = CitationUtils._make_api_request(
+        OPENALEX_API_URL,
+        params=_openalex_params(
+            {
+                "filter": f"cites:{openalex_id}",
+                "select": _OPENALEX_SELECT,
+                "sort": "cited_by_count:desc",
+                "per-page": min(max(limit, 1), 200),
+            }
+        ),
+        timeout=timeout,
+    )
+    nodes = [_openalex_node(work) for work in (data or {}).get("results", [])]
+    return [node for node in nodes if node]
+
+
+def expand_node(
+    doi: str, direction: Direction, max_neighbors: int, timeout: int = 10
+) -> dict[str, Any] | None:
+    """Fetch a paper and its neighbours in the citation graph.
+
+    OpenAlex is tried first; if it does not know the DOI, references are taken
+    from CrossRef instead (CrossRef has no reliable "cited by" listing).
+
+    Args:
+        doi: Normalized DOI of the paper
+        direction: "references", "citations" or "both"
+        max_neighbors: Maximum neighbours kept per direction, most cited first
+        timeout: Request timeout in seconds
+
+    Returns:
+        Dictionary with "node", "references", "citations", "source" and
+        "expanded" (the direction actually fetched, or None), or None if the
+        paper could not be found anywhere
+    """
+    references: list[dict[str, Any]] = []
+    citations: list[dict[str, Any]] = []
+
+    work = CitationUtils._make_api_request(
+        f"{OPENALEX_API_URL}/https://doi.org/{doi}",
+        params=_openalex_params({"select": _OPENALEX_SELECT + ",referenced_works"}),
+        timeout=timeout,
+    )
+    if work:
+        node = {**(_openalex_node(work) or {}), "doi": doi}
+        if direction in ("references", "both"):
+            ref_ids = [
+                short_id
+                for short_id in map(
+                    _short_openalex_id, work.get("referenced_works", [])
+                )
+                if short_id
+            ]
+            references = sorted(
+                _fetch_openalex_works(ref_ids, timeout),
+                key=lambda n: n.get("cited_by_count") or 0,
+                reverse=True,
+            )[:max_neighbors]
+        expanded: Direction | None = direction
+        if direction in ("citations", "both"):
+            if node.get("openalex_id"):
+                citations = _fetch_openalex_citing(
+                    node["openalex_id"], max_neighbors, timeout
+                )
+            else:
+                expanded = "references" if direction == "both" else None
+        return {
+            "node": node,
+            "references": references,
+            "citations": citations,
+            "source": "openalex",
+            "expanded": expanded,
+        }
+
+    if direction == "citations":
+        return None
+    crossref_refs = CitationUtils.get_references_crossref(doi, timeout=timeout)
+    if crossref_refs is None:
+        return None
+    for ref in crossref_refs:
+        ref_doi = normalize_doi(ref.get("doi"))
+        if ref_doi:
+            references.append(
+                {"doi": ref_doi, "title": ref.get("title"), "year": ref.get("year")}
+            )
+    return {
+        "node": {"doi": doi},
+        "references": references[:max_neighbors],
+        "citations": [],
+        "source": "crossref",
+        # Citations were not fetched, so a later crawl must still try OpenAlex
+        "expanded": "references",
+    }
+
+
+def _safe_expand(
+    doi: str, direction: Direction, max_neighbors: int, timeout: int
+) -> dict[str, Any] | None:
+    """expand_node() that logs and returns None instead of raising."""
+    try:
+        return expand_node(doi, direction, max_neighbors, timeout)
+    except Exception as e:
+        logger.warning(f"Failed to expand {doi} in citation graph: {e}")
+        return None
+
+
+def crawl_citation_graph(
+    seeds: list[str],
+    store: CitationGraphStore,
+    depth: int = 2,
+    direction: Direction = "references",
+    max_neighbors: int = 25,
+    max_nodes: int = 500,
+    workers: int = 8,
+    timeout: int = 10,
+) -> dict[str, Any]:
+    """Expand the citation graph around seed DOIs breadth-first.
+
+    Each BFS level is fetched concurrently with at most ``workers`` papers in
+    flight. Papers already expanded in an earlier crawl are not fetched again;
+    their stored edges are followed instead.
+
+    Args:
+        seeds: Seed DOIs (any DOI format)
+        store: Graph store to read from and write to
+        depth: Number of hops to expand from the seeds
+        direction: Follow "references", "citations" or "both"
+        max_neighbors: Maximum neighbours followed per paper and direction
+        max_nodes: Stop adding new papers once the crawl reaches this many
+        workers: Maximum concurrent paper fetches
+        timeout: Request timeout in seconds
+
+    Returns:
+        {
+            "seeds": ["10.1038/nature12373"],
+            "nodes": [{"doi": ..., "title": ..., "year": ..., ...}],
+            "edges": [{"citing": "10.1038/nature12373", "cited": "10.1/x"}],
+            "stats": {"fetched": 12, "reused": 3, "failed": 0, "elapsed": 2.1},
+        }
+    """
+    start = time.monotonic()
+    stats = {"fetched": 0, "reused": 0, "failed": 0}
+    frontier = list(dict.fromkeys(d for d in map(normalize_doi, seeds) if d))
+    visited = dict.fromkeys(frontier)
+
+    with ThreadPoolExecutor(max_workers=max(workers, 1)) as executor:
+        for _level in range(depth):
+            to_fetch = [
+                doi for doi in frontier if not store.is_expanded(doi, direction)
+            ]
+            stats["reused"] += len(frontier) - len(to_fetch)
+            results = executor.map(
+                bind_context(
+                    lambda doi: _safe_expand(doi, direction, max_neighbors, timeout)
+                ),
+                to_fetch,
+            )
+            for doi, result in zip(to_fetch, results, strict=True):
+                if result is None:
+                    stats["failed"] += 1
+                    continue
+                store.upsert_nodes(
+                    [result["node"], *result["references"], *result["citations"]]
+                )
+                store.add_edges(
+                    [(doi, ref["doi"]) for ref in result["references"]]
+                    + [(cit["doi"], doi) for cit in result["citations"]],
+                    source=result["source"],
+                )
+                if result["expanded"]:
+                    store.mark_expanded(doi, result["expanded"])
+                stats["fetched"] += 1
+
+            next_frontier = []
+            for doi in frontier:
+                for neighbor in store.neighbors(doi, direction, max_neighbors):
+                    if neighbor not in visited and len(visited) < max_nodes:
+                        visited[neighbor] = None
+                        next_frontier.append(neighbor)
+            frontier = next_frontier
+            if not frontier:
+                break
+
+    stats["elapsed"] = round(time.monotonic() - start, 3)
+    dois = list(visited)
+    return {
+        "seeds": [d for d in map(normalize_doi, seeds) if d],
+        "depth": depth,
+        "direction": direction,
+        "nodes": store.get_nodes(dois),
+        "edges": store.get_edges(set(dois)),
+        "stats": stats,
+    }
+
+
+_store: CitationGraphStore | None = None
+_store_lock = threading.Lock()
+
+
+def get_citation_graph_store() -> CitationGraphStore | None:
+    """Return the graph store at ARTL_CITATION_GRAPH_DB (or the output dir)."""
+    global _store
+    db_path = get_config_value("ARTL_CITATION_GRAPH_DB")
+    if not db_path:
+        from artl_mcp.utils.file_manager import file_manager
+
+        db_path = file_manager.output_dir / "artl_citation_graph.sqlite"
+    db_path = Path(db_path).expanduser()
+
+    with _store_lock:
+        if _store is None or _store.db_path != db_path:
+            try:
+                _store = CitationGraphStore(db_path)
+            except sqlite3.Error as e:
+                logger.warning(f"Citation graph store unavailable at {db_path}: {e}")
+                return None
+        return _store
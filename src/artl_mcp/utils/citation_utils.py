@@ -6,11 +6,23 @@ using CrossRef, OpenAlex, and other APIs.
 
 import json
 import logging
+import re
+import time
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any
 
 import requests
 
+from . import http
+from .cache import make_cache
+from .config_manager import get_config_value, get_float_config
+from .deadline import sleep
 from .email_manager import get_email
 from .identifier_utils import IdentifierError, IdentifierUtils
+from .instrumentation import bind_context, count
+from .rate_limit import RateLimiter, retry_after_seconds
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +36,56 @@ CROSSREF_API_URL = "https://api.crossref.org/works"
 OPENALEX_API_URL = "https://api.openalex.org/works"
 SEMANTIC_SCHOLAR_API_URL = "https://api.semanticscholar.org/graph/v1/paper"
 
+# OpenAlex accepts at most 50 values in one pipe-separated filter
+OPENALEX_BATCH_SIZE = 50
+
+# Fields returned by batch work lookups unless the caller asks for others
+OPENALEX_DEFAULT_SELECT = (
+    "id",
+    "doi",
+    "title",
+    "publication_year",
+    "cited_by_count",
+    "primary_location",
+    "authorships",
+)
+
+# Semantic Scholar's /paper/batch endpoint accepts at most 500 IDs per POST
+SEMANTIC_SCHOLAR_BATCH_SIZE = 500
+
+# Fields requested by batch enrichment; nested citation lists are left out
+# because they make batch responses very large
+SEMANTIC_SCHOLAR_BATCH_FIELDS = (
+    "externalIds,title,authors,year,citationCount,referenceCount,"
+    "influentialCitationCount,abstract,tldr"
+)
+
+# Unauthenticated clients share a global pool; keyed clients get 1 request/s.
+# ARTL_S2_MIN_INTERVAL overrides the spacing between requests.
+_semantic_scholar_limiter = RateLimiter(get_float_config("ARTL_S2_MIN_INTERVAL", 1.0))
+
+_OPENALEX_ID = re.compile(r"^(?:https?://openalex\.org/)?(W\d+)$", re.IGNORECASE)
+
+# OpenAlex work records shared by every lookup, keyed by (identifier, select).
+# Entries are stored under both the DOI and the OpenAlex ID of each work.
+# ARTL_METADATA_CACHE_TTL=0 disables it.
+openalex_work_cache = make_cache(
+    "openalex_works",
+    maxsize=4096,
+    ttl=get_float_config("ARTL_METADATA_CACHE_TTL", 3600),
+)
+
+
+def _openalex_key(identifier: str) -> tuple[str, str] | None:
+    """Classify an identifier as ("openalex", "W123") or ("doi", "10.x/y")."""
+    match = _OPENALEX_ID.match(identifier.strip())
+    if match:
+        return "openalex", match.group(1).upper()
+    try:
+        return "doi", IdentifierUtils.normalize_doi(identifier, "raw").lower()
+    except IdentifierError:
+        return None
+
 
 class CitationError(Exception):
     """Exception raised for citation retrieval errors."""
@@ -55,15 +117,13 @@ class CitationUtils:
         if headers is None:
             headers = DEFAULT_HEADERS.copy()
 
-        # Add email if available for CrossRef
+        # CrossRef's polite pool identifies clients by a mailto query parameter
         email = get_email()
         if email and "crossref.org" in url:
-            headers["mailto"] = email
+            params = {**(params or {}), "mailto": email}
 
         try:
-            response = requests.get(
-                url, params=params, headers=headers, timeout=timeout
-            )
+            response = http.get(url, params=params, headers=headers, timeout=timeout)
             response.raise_for_status()
             return response.json()
         except requests.RequestException as e:
@@ -73,6 +133,39 @@ class CitationUtils:
             logger.warning(f"Invalid JSON response from {url}: {e}")
             return None
 
+    @staticmethod
+    def _crossref_reference(ref: dict) -> dict:
+        """Convert an entry of a CrossRef work's reference list."""
+        return {
+            "key": ref.get("key"),
+            "doi": ref.get("DOI"),
+            "title": ref.get("article-title"),
+            "journal": ref.get("journal-title"),
+            "year": ref.get("year"),
+            "volume": ref.get("volume"),
+            "page": ref.get("first-page"),
+            "author": ref.get("author"),
+            "unstructured": ref.get("unstructured"),
+        }
+
+    @staticmethod
+    def _openalex_citation(work: dict) -> dict:
+        """Convert an OpenAlex work into a citing paper record."""
+        doi = work.get("doi") or None
+        if doi:
+            doi = doi.removeprefix("https://doi.org/")
+        return {
+            "doi": doi,
+            "title": work.get("title"),
+            "authors": [
+                (authorship.get("author") or {}).get("display_name") or ""
+                for authorship in work.get("authorships") or []
+            ],
+            "published_date": work.get("publication_date"),
+            "citation_count": work.get("cited_by_count", 0),
+            "openalex_id": work.get("id"),
+        }
+
     @classmethod
     def get_references_crossref(cls, doi: str, timeout: int = 10) -> list[dict] | None:
         """Get references cited by a paper using CrossRef API.
@@ -102,96 +195,336 @@ class CitationUtils:
             return None
 
         try:
-            work = data["message"]
-            references = work.get("reference", [])
-
-            # Process references to extract useful information
-            processed_refs = []
-            for ref in references:
-                ref_info = {
-                    "key": ref.get("key"),
-                    "doi": ref.get("DOI"),
-                    "title": ref.get("article-title"),
-                    "journal": ref.get("journal-title"),
-                    "year": ref.get("year"),
-                    "volume": ref.get("volume"),
-                    "page": ref.get("first-page"),
-                    "author": ref.get("author"),
-                    "unstructured": ref.get("unstructured"),
-                }
-                processed_refs.append(ref_info)
-
-            return processed_refs
+            # The work record carries the complete deposited reference list
+            references = data["message"].get("reference", [])
+            return [cls._crossref_reference(ref) for ref in references]
 
-        except (KeyError, TypeError) as e:
+        except (KeyError, TypeError, AttributeError) as e:
             logger.warning(f"Error processing references for DOI {doi}: {e}")
             return None
 
     @classmethod
-    def get_citations_crossref(cls, doi: str, timeout: int = 10) -> list[dict] | None:
-        """Get papers that cite a given paper using CrossRef API.
+    def iter_references_crossref(
+        cls,
+        doi: str,
+        max_items: int | None = None,
+        timeout: int = 10,
+    ) -> Iterator[dict]:
+        """Yield the references of a paper from CrossRef.
+
+        CrossRef has no paging for references: the work record holds the whole
+        deposited list, so this costs one request however long the list is.
+        It exists so references and citations can be consumed the same way.
 
         Args:
             doi: DOI of the paper
+            max_items: Stop after this many references (None = all)
             timeout: Request timeout in seconds
+        """
+        references = cls.get_references_crossref(doi, timeout=timeout) or []
+        yield from references[:max_items] if max_items is not None else references
 
-        Returns:
-            List of citing paper dictionaries or None on error
+    @classmethod
+    def iter_citations_openalex(
+        cls,
+        doi: str,
+        max_items: int | None = None,
+        deadline: float | None = None,
+        rows: int = 200,
+        timeout: int = 10,
+        prefetch: bool = True,
+    ) -> Iterator[dict]:
+        """Stream the papers citing a given paper, page by page.
+
+        CrossRef only exposes "cited by" links to the publisher of the cited
+        work, so citing works come from OpenAlex's ``cites:`` filter, walked
+        with its cursor. While one page is being consumed the next is already
+        requested, so network time overlaps with processing. Most cited works
+        come first.
+
+        Args:
+            doi: DOI of the paper
+            max_items: Stop after this many citing papers (None = all)
+            deadline: Stop after this many seconds, keeping what was yielded
+            rows: Page size (OpenAlex allows up to 200)
+            timeout: Per-request timeout in seconds
+            prefetch: Request the next page while the current one is consumed
+
+        Yields:
+            Citing paper dictionaries (same shape as get_citations_crossref)
+
+        Raises:
+            requests.RequestException: If a page cannot be fetched; papers
+                yielded before the failure are valid
 
         Examples:
-            >>> citations = CitationUtils.get_citations_crossref("10.1038/nature12373")
-            >>> len(citations) if citations else 0
-            150
+            >>> for paper in CitationUtils.iter_citations_openalex(
+            ...     "10.1038/nature12373", max_items=500, deadline=30
+            ... ):
+            ...     print(paper["doi"])
         """
         try:
             normalized_doi = IdentifierUtils.normalize_doi(doi, "raw")
         except IdentifierError as e:
             logger.warning(f"Invalid DOI for citations: {doi} - {e}")
-            return None
+            return
+
+        email = get_email()
+        stop_at = time.monotonic() + deadline if deadline is not None else None
+
+        def _remaining() -> float | None:
+            return None if stop_at is None else stop_at - time.monotonic()
+
+        def _get(url: str, params: dict[str, Any]) -> dict | None:
+            """GET an OpenAlex resource; None when it is unknown or out of time."""
+            remaining = _remaining()
+            request_timeout = timeout if remaining is None else min(timeout, remaining)
+            if request_timeout <= 0:
+                return None
+            if email:
+                params = {**params, "mailto": email}
+            response = http.get(
+                url, params=params, headers=DEFAULT_HEADERS, timeout=request_timeout
+            )
+            if response.status_code == 404:
+                return None
+            response.raise_for_status()
+            return response.json()
+
+        work = _get(
+            f"{OPENALEX_API_URL}/https://doi.org/{normalized_doi}", {"select": "id"}
+        )
+        key = _openalex_key((work or {}).get("id") or "")
+        if not key or key[0] != "openalex":
+            logger.info(f"OpenAlex does not know {normalized_doi}; no citing works")
+            return
 
-        # Search for papers that reference this DOI
         params = {
-            "query.bibliographic": normalized_doi,
-            "rows": 100,  # Limit to first 100 citations
-            "select": "DOI,title,author,published-print,is-referenced-by-count",
+            "filter": f"cites:{key[1]}",
+            "select": "id,doi,title,authorships,publication_date,cited_by_count",
+            "sort": "cited_by_count:desc",
+            "per-page": max(1, min(rows, 200)),
         }
 
-        data = cls._make_api_request(CROSSREF_API_URL, params=params, timeout=timeout)
-
-        if not data:
-            return None
+        def _fetch(cursor: str) -> dict | None:
+            return _get(OPENALEX_API_URL, {**params, "cursor": cursor})
 
+        executor = (
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix="artl-citing")
+            if prefetch
+            else None
+        )
+        yielded = 0
+        cursor = "*"
         try:
-            items = data["message"]["items"]
-
-            # Process citing papers
-            citations = []
-            for item in items:
-                citation_info = {
-                    "doi": item.get("DOI"),
-                    "title": item.get("title", [None])[0],
-                    "authors": [
-                        f"{author.get('given', '')} {author.get('family', '')}"
-                        for author in item.get("author", [])
-                    ],
-                    "published_date": item.get("published-print"),
-                    "citation_count": item.get("is-referenced-by-count", 0),
-                }
-                citations.append(citation_info)
+            pending: Future | dict | None = (
+                executor.submit(bind_context(_fetch), cursor)
+                if executor
+                else _fetch(cursor)
+            )
+            while pending is not None:
+                if isinstance(pending, Future):
+                    try:
+                        data = pending.result(timeout=_remaining())
+                    except FutureTimeoutError:
+                        logger.info(f"Deadline reached streaming citations for {doi}")
+                        return
+                else:
+                    data = pending
+                pending = None
+                if not data:
+                    return
+
+                items = data.get("results") or []
+                meta = data.get("meta") or {}
+                next_cursor = meta.get("next_cursor")
+                total = meta.get("count")
+                seen = yielded + len(items)
+                more = (
+                    items
+                    and next_cursor
+                    and next_cursor != cursor
+                    and (total is None or seen < total)
+                    and (max_items is None or seen < max_items)
+                )
+                if more:
+                    cursor = next_cursor
+                    pending = (
+                        executor.submit(bind_context(_fetch), cursor)
+                        if executor
+                        else None
+                    )
 
-            return citations
+                for item in items:
+                    if max_items is not None and yielded >= max_items:
+                        return
+                    remaining = _remaining()
+                    if remaining is not None and remaining <= 0:
+                        logger.info(f"Deadline reached streaming citations for {doi}")
+                        return
+                    yield cls._openalex_citation(item)
+                    yielded += 1
+
+                if more and executor is None:
+                    pending = _fetch(cursor)
+        finally:
+            if executor:
+                executor.shutdown(wait=False, cancel_futures=True)
 
-        except (KeyError, TypeError) as e:
-            logger.warning(f"Error processing citations for DOI {doi}: {e}")
+    @classmethod
+    def get_citations_crossref(
+        cls,
+        doi: str,
+        timeout: int = 10,
+        max_items: int | None = None,
+        deadline: float | None = None,
+    ) -> list[dict] | None:
+        """Get papers that cite a given paper.
+
+        Kept under its original name; the citing works come from OpenAlex (see
+        iter_citations_openalex), since CrossRef has no public "cited by" list.
+
+        Args:
+            doi: DOI of the paper
+            timeout: Request timeout in seconds
+            max_items: Maximum citing papers to collect across pages
+                (default: None = all)
+            deadline: Stop paging after this many seconds
+
+        Returns:
+            List of citing paper dictionaries (empty if none are known), or None
+            on error
+
+        Examples:
+            >>> citations = CitationUtils.get_citations_crossref(
+            ...     "10.1038/nature12373", max_items=100
+            ... )
+            >>> len(citations) if citations else 0
+            100
+        """
+        try:
+            IdentifierUtils.normalize_doi(doi, "raw")
+        except IdentifierError as e:
+            logger.warning(f"Invalid DOI for citations: {doi} - {e}")
             return None
+        try:
+            return list(
+                cls.iter_citations_openalex(
+                    doi,
+                    max_items=max_items,
+                    deadline=deadline,
+                    rows=min(max_items or 200, 200),
+                    timeout=timeout,
+                )
+            )
+        except (requests.RequestException, ValueError) as e:
+            logger.warning(f"Failed to fetch citing works for {doi}: {e}")
+            return None
+
+    @classmethod
+    def _iter_openalex_results(cls, params: dict[str, Any], timeout: int = 10) -> Any:
+        """Yield works from an OpenAlex list query, following cursor pages."""
+        params = {**params, "cursor": "*"}
+        email = get_email()
+        if email:
+            params["mailto"] = email
+        while True:
+            data = cls._make_api_request(
+                OPENALEX_API_URL, params=params, timeout=timeout
+            )
+            if not data:
+                return
+            results = data.get("results") or []
+            yield from results
+            next_cursor = (data.get("meta") or {}).get("next_cursor")
+            if not results or not next_cursor or next_cursor == params["cursor"]:
+                return
+            params["cursor"] = next_cursor
 
     @classmethod
-    def get_citation_network_openalex(cls, doi: str, timeout: int = 10) -> dict | None:
+    def get_works_openalex_batch(
+        cls,
+        identifiers: list[str],
+        select: list[str] | tuple[str, ...] | None = OPENALEX_DEFAULT_SELECT,
+        timeout: int = 10,
+    ) -> dict[str, dict | None]:
+        """Look up many works with as few OpenAlex requests as possible.
+
+        DOIs and OpenAlex IDs are packed up to 50 per request into
+        ``filter=doi:a|b|c`` / ``filter=openalex:W1|W2`` queries with ``select=``
+        projection. Works already in the shared metadata cache are not
+        requested again.
+
+        Args:
+            identifiers: DOIs (any format) and/or OpenAlex work IDs
+                (W123 or https://openalex.org/W123), mixed freely
+            select: OpenAlex fields to return ("id" and "doi" are always
+                included); None returns full records
+            timeout: Request timeout in seconds
+
+        Returns:
+            Mapping of each input identifier to its work, or None if it is not
+            a DOI/OpenAlex ID or OpenAlex does not know it
+
+        Examples:
+            >>> works = CitationUtils.get_works_openalex_batch(
+            ...     ["10.1038/nature12373", "W2100837269"]
+            ... )
+            >>> works["10.1038/nature12373"]["title"]
+            'Nanometre-scale thermometry in a living cell'
+        """
+        fields = None
+        if select is not None:
+            fields = ",".join(dict.fromkeys(["id", "doi", *select]))
+
+        keys = {identifier: _openalex_key(identifier) for identifier in identifiers}
+        found: dict[tuple[str, str], dict] = {}
+        missing: dict[str, list[str]] = {"doi": [], "openalex": []}
+        for key in dict.fromkeys(k for k in keys.values() if k):
+            cached = openalex_work_cache.get((key, fields))
+            if cached is not None:
+                found[key] = cached
+                count("cache.openalex.hit")
+            else:
+                missing[key[0]].append(key[1])
+                count("cache.openalex.miss")
+
+        for kind, values in missing.items():
+            for i in range(0, len(values), OPENALEX_BATCH_SIZE):
+                params: dict[str, Any] = {
+                    "filter": f"{kind}:"
+                    + "|".join(values[i : i + OPENALEX_BATCH_SIZE]),
+                    "per-page": OPENALEX_BATCH_SIZE,
+                }
+                if fields:
+                    params["select"] = fields
+                for work in cls._iter_openalex_results(params, timeout=timeout):
+                    work_keys = []
+                    if work.get("doi"):
+                        work_keys.append(_openalex_key(work["doi"]))
+                    if work.get("id"):
+                        work_keys.append(_openalex_key(work["id"]))
+                    for work_key in work_keys:
+                        if work_key:
+                            found.setdefault(work_key, work)
+                            openalex_work_cache.set((work_key, fields), work)
+
+        return {
+            identifier: found.get(key) if key else None
+            for identifier, key in keys.items()
+        }
+
+    @classmethod
+    def get_citation_network_openalex(
+        cls, doi: str, timeout: int = 10, resolve_references: bool = False
+    ) -> dict | None:
         """Get comprehensive citation network using OpenAlex API.
 
         Args:
             doi: DOI of the paper
             timeout: Request timeout in seconds
+            resolve_references: Also resolve every referenced work to its DOI,
+                title and year, using batch lookups (50 works per request)
 
         Returns:
             Dictionary with citation network information or None on error
@@ -209,14 +542,19 @@ class CitationUtils:
             logger.warning(f"Invalid DOI for citation network: {doi} - {e}")
             return None
 
-        # OpenAlex uses DOI URLs
-        openalex_id = f"https://doi.org/{normalized_doi}"
-        url = f"{OPENALEX_API_URL}/{openalex_id}"
+        # Full work records share the metadata cache with batch lookups
+        cache_key = (("doi", normalized_doi.lower()), None)
+        data = openalex_work_cache.get(cache_key)
+        if data is None:
+            # OpenAlex uses DOI URLs
+            openalex_id = f"https://doi.org/{normalized_doi}"
+            url = f"{OPENALEX_API_URL}/{openalex_id}"
 
-        data = cls._make_api_request(url, timeout=timeout)
+            data = cls._make_api_request(url, timeout=timeout)
 
-        if not data:
-            return None
+            if not data:
+                return None
+            openalex_work_cache.set(cache_key, data)
 
         try:
             work = data
@@ -245,6 +583,25 @@ class CitationUtils:
                 "open_access": work.get("open_access", {}),
             }
 
+            if resolve_references:
+                resolved = cls.get_works_openalex_batch(
+                    work.get("referenced_works", []),
+                    select=("title", "publication_year", "cited_by_count"),
+                    timeout=timeout,
+                )
+                network["referenced_works_resolved"] = [
+                    {
+                        "openalex_id": ref_id,
+                        "doi": ref.get("doi") if ref else None,
+                        "title": ref.get("title") if ref else None,
+                        "publication_year": (
+                            ref.get("publication_year") if ref else None
+                        ),
+                        "cited_by_count": ref.get("cited_by_count") if ref else None,
+                    }
+                    for ref_id, ref in resolved.items()
+                ]
+
             return network
 
         except (KeyError, TypeError) as e:
@@ -276,46 +633,177 @@ class CitationUtils:
             )
         }
 
-        data = cls._make_api_request(url, params=params, timeout=timeout)
+        _semantic_scholar_limiter.wait()
+        data = cls._make_api_request(
+            url, params=params, headers=cls._semantic_scholar_headers(), timeout=timeout
+        )
 
         if not data:
             return None
 
         try:
-            # Process the response
-            paper_info = {
-                "doi": normalized_doi,
-                "title": data.get("title"),
-                "authors": [author.get("name") for author in data.get("authors", [])],
-                "year": data.get("year"),
-                "citation_count": data.get("citationCount", 0),
-                "reference_count": data.get("referenceCount", 0),
-                "abstract": data.get("abstract"),
-                "tldr": data.get("tldr", {}).get("text") if data.get("tldr") else None,
-                "citations": [
-                    {
-                        "title": citation.get("title"),
-                        "doi": citation.get("externalIds", {}).get("DOI"),
-                        "year": citation.get("year"),
-                    }
-                    for citation in data.get("citations", [])[:10]  # First 10 citations
-                ],
-                "references": [
-                    {
-                        "title": ref.get("title"),
-                        "doi": ref.get("externalIds", {}).get("DOI"),
-                        "year": ref.get("year"),
-                    }
-                    for ref in data.get("references", [])[:10]  # First 10 references
-                ],
-            }
-
-            return paper_info
-
-        except (KeyError, TypeError) as e:
+            return cls._semantic_scholar_paper(data, normalized_doi)
+        except (KeyError, TypeError, AttributeError) as e:
             logger.warning(f"Error processing Semantic Scholar data for DOI {doi}: {e}")
             return None
 
+    @staticmethod
+    def _semantic_scholar_paper(data: dict, doi: str) -> dict:
+        """Convert a Semantic Scholar paper record into ARTL's shape."""
+        return {
+            "doi": doi,
+            "title": data.get("title"),
+            "authors": [author.get("name") for author in data.get("authors") or []],
+            "year": data.get("year"),
+            "citation_count": data.get("citationCount", 0),
+            "reference_count": data.get("referenceCount", 0),
+            "influential_citation_count": data.get("influentialCitationCount"),
+            "abstract": data.get("abstract"),
+            "tldr": data.get("tldr", {}).get("text") if data.get("tldr") else None,
+            "citations": [
+                {
+                    "title": citation.get("title"),
+                    "doi": (citation.get("externalIds") or {}).get("DOI"),
+                    "year": citation.get("year"),
+                }
+                for citation in (data.get("citations") or [])[:10]  # First 10
+            ],
+            "references": [
+                {
+                    "title": ref.get("title"),
+                    "doi": (ref.get("externalIds") or {}).get("DOI"),
+                    "year": ref.get("year"),
+                }
+                for ref in (data.get("references") or [])[:10]  # First 10
+            ],
+        }
+
+    @staticmethod
+    def _semantic_scholar_headers() -> dict[str, str]:
+        """Default headers plus the Semantic Scholar API key, if configured."""
+        headers = DEFAULT_HEADERS.copy()
+        api_key = get_config_value("ARTL_S2_API_KEY")
+        if api_key:
+            headers["x-api-key"] = api_key
+        return headers
+
+    @classmethod
+    def _post_semantic_scholar_batch(
+        cls, ids: list[str], fields: str, timeout: int, max_retries: int = 3
+    ) -> list | None:
+        """POST one batch of IDs, waiting for rate limit slots and Retry-After."""
+        url = f"{SEMANTIC_SCHOLAR_API_URL}/batch"
+        for attempt in range(max_retries + 1):
+            _semantic_scholar_limiter.wait()
+            try:
+                response = http.post(
+                    url,
+                    params={"fields": fields},
+                    json={"ids": ids},
+                    headers=cls._semantic_scholar_headers(),
+                    timeout=timeout,
+                )
+                if response.status_code == 429 and attempt < max_retries:
+                    delay = retry_after_seconds(response, default=2.0**attempt)
+                    count("http.retries")
+                    logger.info(f"Semantic Scholar rate limited; retrying in {delay}s")
+                    _semantic_scholar_limiter.backoff(delay)
+                    sleep(delay)
+                    continue
+                response.raise_for_status()
+                return response.json()
+            except requests.RequestException as e:
+                logger.warning(f"Semantic Scholar batch request failed: {e}")
+                return None
+            except json.JSONDecodeError as e:
+                logger.warning(f"Invalid JSON response from {url}: {e}")
+                return None
+        return None
+
+    @classmethod
+    def get_semantic_scholar_batch(
+        cls,
+        dois: list[str],
+        fields: str = SEMANTIC_SCHOLAR_BATCH_FIELDS,
+        timeout: int = 30,
+    ) -> dict[str, dict | None]:
+        """Get Semantic Scholar information for many papers in few requests.
+
+        Uses the /paper/batch POST endpoint with up to 500 DOIs per request,
+        spacing requests per the configured rate limit and honouring
+        Retry-After on HTTP 429. Set ARTL_S2_API_KEY to use a personal key.
+
+        Args:
+            dois: DOIs of the papers (any DOI format)
+            fields: Comma-separated Semantic Scholar fields to return
+            timeout: Request timeout in seconds
+
+        Returns:
+            Mapping of each input DOI to its information (same shape as
+            get_semantic_scholar_info), or None if it is invalid or unknown
+
+        Examples:
+            >>> info = CitationUtils.get_semantic_scholar_batch(
+            ...     ["10.1038/nature12373", "10.1126/science.1225829"]
+            ... )
+            >>> info["10.1038/nature12373"]["citation_count"]
+            1200
+        """
+        normalized: dict[str, str | None] = {}
+        for doi in dois:
+            try:
+                normalized[doi] = IdentifierUtils.normalize_doi(doi, "raw")
+            except IdentifierError:
+                logger.warning(f"Invalid DOI for Semantic Scholar: {doi}")
+                normalized[doi] = None
+
+        unique = list(dict.fromkeys(d for d in normalized.values() if d))
+        found: dict[str, dict] = {}
+        for i in range(0, len(unique), SEMANTIC_SCHOLAR_BATCH_SIZE):
+            batch = unique[i : i + SEMANTIC_SCHOLAR_BATCH_SIZE]
+            data = cls._post_semantic_scholar_batch(
+                [f"DOI:{doi}" for doi in batch], fields, timeout
+            )
+            if not isinstance(data, list):
+                continue
+            # Results are positional; unknown papers come back as null
+            for doi, paper in zip(batch, data, strict=False):
+                if paper:
+                    try:
+                        found[doi] = cls._semantic_scholar_paper(paper, doi)
+                    except (KeyError, TypeError, AttributeError) as e:
+                        logger.warning(f"Error processing Semantic Scholar data: {e}")
+
+        return {
+            doi: found.get(norm) if norm else None for doi, norm in normalized.items()
+        }
+
+    @classmethod
+    def enrich_with_semantic_scholar(
+        cls, papers: list[dict], timeout: int = 30
+    ) -> list[dict]:
+        """Fill in citation counts, years and TL;DRs for papers with a DOI.
+
+        Looks all papers up with get_semantic_scholar_batch() and only sets
+        fields that are missing, so values from other sources are kept.
+
+        Returns:
+            The same list, updated in place
+        """
+        dois = [paper["doi"] for paper in papers if paper.get("doi")]
+        if not dois:
+            return papers
+        info = cls.get_semantic_scholar_batch(dois, timeout=timeout)
+        for paper in papers:
+            s2 = info.get(paper.get("doi") or "")
+            if not s2:
+                continue
+            for field in ("title", "year", "citation_count", "tldr"):
+                if paper.get(field) in (None, "", 0) and s2.get(field) is not None:
+                    paper[field] = s2[field]
+            paper["influential_citation_count"] = s2.get("influential_citation_count")
+        return papers
+
     @classmethod
     def get_comprehensive_citation_info(
         cls, doi: str, timeout: int = 10
@@ -384,7 +872,7 @@ class CitationUtils:
 
     @classmethod
     def find_related_papers(
-        cls, doi: str, max_results: int = 10, timeout: int = 10
+        cls, doi: str, max_results: int = 10, timeout: int = 10, enrich: bool = True
     ) -> list[dict] | None:
         """Find papers related to a given paper based on citations and concepts.
 
@@ -392,6 +880,8 @@ class CitationUtils:
             doi: DOI of the reference paper
             max_results: Maximum number of related papers to return
             timeout: Request timeout in seconds
+            enrich: Fill in missing citation counts, years and TL;DRs with one
+                Semantic Scholar batch request
 
         Returns:
             List of related paper dictionaries or None on error
@@ -441,6 +931,12 @@ class CitationUtils:
                 if len(unique_papers) >= max_results:
                     break
 
+        if enrich and unique_papers:
+            try:
+                cls.enrich_with_semantic_scholar(unique_papers, timeout=timeout)
+            except Exception as e:
+                logger.warning(f"Error enriching related papers: {e}")
+
         return unique_papers if unique_papers else None
 
 
@@ -460,6 +956,13 @@ def get_citation_network(doi: str, timeout: int = 10) -> dict | None:
     return CitationUtils.get_citation_network_openalex(doi, timeout)
 
 
+def get_works_batch(
+    identifiers: list[str], timeout: int = 10
+) -> dict[str, dict | None]:
+    """Look up many works by DOI or OpenAlex ID in batched requests."""
+    return CitationUtils.get_works_openalex_batch(identifiers, timeout=timeout)
+
+
 def find_related_papers(
     doi: str, max_results: int = 10, timeout: int = 10
 ) -> list[dict] | None:
@@ -103,6 +103,29 @@ def get_config_value(key: str, default: Any = None) -> Any:
     return global_config_manager.get_config_value(key, default)
 
 
+def get_float_config(key: str, default: float) -> float:
+    """Get a numeric configuration value, falling back to default if invalid.
+
+    Settings read at import time go through this, so a malformed value is
+    logged instead of stopping the server from starting.
+
+    Args:
+        key: Configuration key
+        default: Value used when the key is unset or not a number
+
+    Returns:
+        Configured value or default
+    """
+    value = get_config_value(key)
+    if value in (None, ""):
+        return default
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        logger.warning(f"Ignoring invalid {key} value {value!r}; using {default}")
+        return default
+
+
 # Service availability testing functions
 def test_ncbi_service_availability(timeout: int = 10) -> dict[str, bool]:
     """Test availability of key NCBI/NLM services.
@@ -128,11 +151,14 @@ def test_ncbi_service_availability(timeout: int = 10) -> dict[str, bool]:
         "pmc": "https://www.ncbi.nlm.nih.gov/pmc/",
     }
 
+    # Imported here: the HTTP layer itself reads configuration from this module
+    from artl_mcp.utils import http
+
     results = {}
 
     for service_name, url in services.items():
         try:
-            response = requests.head(url, timeout=timeout)
+            response = http.head(url, timeout=timeout)
             # Consider 2xx and 3xx as available (redirects are common)
             results[service_name] = 200 <= response.status_code < 400
             logger.debug(f"NCBI {service_name} status: {response.status_code}")
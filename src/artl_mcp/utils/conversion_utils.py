@@ -10,6 +10,7 @@ import logging
 
 import requests
 
+from . import http
 from .identifier_utils import IdentifierError, IdentifierUtils
 
 logger = logging.getLogger(__name__)
@@ -46,7 +47,7 @@ class IdentifierConverter:
             JSON response data or None on error
         """
         try:
-            response = requests.get(
+            response = http.get(
                 url, params=params, headers=DEFAULT_HEADERS, timeout=timeout
             )
             response.raise_for_status()
@@ -0,0 +1,213 @@
+"""Per-call deadlines and cancellation.
+
+A tool call can be given an overall deadline: the ``deadline`` argument of the
+MCP tools, or ARTL_TOOL_DEADLINE for every call. The active Deadline is held in
+a context variable, like the instrumentation trace, so it reaches every helper
+without plumbing and follows work into thread pools wrapped with
+``bind_context``:
+
+- Every request sent through ``artl_mcp.utils.http`` has its timeout capped at
+  the time left. Requests without a timeout get ARTL_HTTP_TIMEOUT (default 30
+  seconds), so no request can wait forever.
+- Long stages (waiting for a CPU slot, PDF pages, XML sections, rate-limit
+  sleeps) call ``check_deadline()`` between steps.
+- ``Deadline.cancel()`` stops the call and every scope nested in it at the next
+  checkpoint, e.g. when the MCP client disconnects or a raced source loses.
+
+Expiry and cancellation raise DeadlineExceeded. It is a ``requests`` Timeout,
+so tools handle it like any other timed-out request: log and return None.
+"""
+
+import contextvars
+import logging
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+import requests
+
+from artl_mcp.utils.config_manager import get_config_value
+from artl_mcp.utils.instrumentation import count
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HTTP_TIMEOUT = 30.0
+
+# How often sleeps and waits look for cancellation of an enclosing scope
+POLL_INTERVAL = 0.1
+
+Timeout = float | tuple[float | None, float | None] | None
+
+
+class DeadlineExceeded(requests.exceptions.Timeout):
+    """Raised when a call's deadline has passed or the call was cancelled."""
+
+
+class Deadline:
+    """Point in time a call must finish by, plus a cancellation flag.
+
+    A deadline nested in a parent never outlives it and is cancelled with it.
+    """
+
+    def __init__(self, seconds: float | None = None, parent: "Deadline | None" = None):
+        """Create a deadline.
+
+        Args:
+            seconds: Time allowed from now; None means no limit of its own
+            parent: Enclosing deadline, if any
+        """
+        self.parent = parent
+        expires = None if seconds is None else time.monotonic() + max(seconds, 0.0)
+        if parent is not None and parent.expires is not None:
+            expires = (
+                parent.expires if expires is None else min(expires, parent.expires)
+            )
+        self.expires = expires
+        self._cancelled = threading.Event()
+
+    def cancel(self) -> None:
+        """Cancel this scope and everything nested in it."""
+        self._cancelled.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set() or (
+            self.parent is not None and self.parent.cancelled
+        )
+
+    def remaining(self) -> float | None:
+        """Seconds left, or None without a time limit."""
+        if self.expires is None:
+            return None
+        return max(self.expires - time.monotonic(), 0.0)
+
+    @property
+    def expired(self) -> bool:
+        left = self.remaining()
+        return left is not None and left <= 0
+
+    def check(self) -> None:
+        """Raise DeadlineExceeded if the call was cancelled or is out of time."""
+        if self.cancelled:
+            count("deadline.cancelled")
+            raise DeadlineExceeded("Call cancelled")
+        if self.expired:
+            count("deadline.exceeded")
+            raise DeadlineExceeded("Deadline exceeded")
+
+    def sleep(self, seconds: float) -> None:
+        """Sleep, but raise as soon as the call is cancelled or out of time."""
+        end = time.monotonic() + seconds
+        while (left := end - time.monotonic()) > 0:
+            self.check()
+            self._cancelled.wait(min(left, POLL_INTERVAL))
+        self.check()
+
+
+_current: contextvars.ContextVar[Deadline | None] = contextvars.ContextVar(
+    "artl_deadline", default=None
+)
+
+
+def current_deadline() -> Deadline | None:
+    """Return the deadline of the running call, if any."""
+    return _current.get()
+
+
+@contextmanager
+def use_deadline(deadline: Deadline) -> Iterator[Deadline]:
+    """Make deadline the active one inside the block."""
+    token = _current.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current.reset(token)
+
+
+@contextmanager
+def deadline_scope(seconds: float | None = None) -> Iterator[Deadline]:
+    """Run the block under a deadline nested in the current one.
+
+    Args:
+        seconds: Time allowed for the block; None only inherits the enclosing
+            deadline (the block can still be cancelled on its own)
+
+    Examples:
+        >>> with deadline_scope(0):
+        ...     remaining()
+        0.0
+    """
+    with use_deadline(Deadline(seconds, parent=current_deadline())) as deadline:
+        yield deadline
+
+
+def remaining() -> float | None:
+    """Seconds left for the running call, or None without a deadline."""
+    deadline = current_deadline()
+    return deadline.remaining() if deadline is not None else None
+
+
+def check_deadline() -> None:
+    """Raise DeadlineExceeded if the running call was cancelled or is out of time."""
+    deadline = current_deadline()
+    if deadline is not None:
+        deadline.check()
+
+
+def sleep(seconds: float) -> None:
+    """time.sleep that gives up when the running call's deadline passes."""
+    deadline = current_deadline()
+    if deadline is None:
+        time.sleep(seconds)
+    else:
+        deadline.sleep(seconds)
+
+
+def _float_config(key: str) -> float | None:
+    value = get_config_value(key)
+    if value in (None, ""):
+        return None
+    try:
+        seconds = float(value)
+    except (TypeError, ValueError):
+        logger.warning(f"Ignoring invalid {key} value: {value}")
+        return None
+    return seconds if seconds > 0 else None
+
+
+def default_tool_deadline() -> float | None:
+    """Deadline applied to every MCP tool call (ARTL_TOOL_DEADLINE), if set."""
+    return _float_config("ARTL_TOOL_DEADLINE")
+
+
+def default_http_timeout() -> float:
+    """Timeout for requests that do not set one (ARTL_HTTP_TIMEOUT)."""
+    return _float_config("ARTL_HTTP_TIMEOUT") or DEFAULT_HTTP_TIMEOUT
+
+
+def clamp_timeout(timeout: Timeout) -> Timeout:
+    """Timeout for one HTTP request, capped at the time left for the call.
+
+    Args:
+        timeout: The caller's timeout in seconds, a (connect, read) tuple, or None
+            for the default
+
+    Returns:
+        The timeout to pass to requests
+
+    Raises:
+        DeadlineExceeded: If the call is already cancelled or out of time
+    """
+    if timeout is None:
+        timeout = default_http_timeout()
+    deadline = current_deadline()
+    if deadline is None:
+        return timeout
+    deadline.check()
+    left = deadline.remaining()
+    if left is None:
+        return timeout
+    if isinstance(timeout, tuple):
+        return tuple(left if t is None else min(t, left) for t in timeout)
+    return min(timeout, left)
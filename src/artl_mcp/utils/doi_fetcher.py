@@ -2,9 +2,10 @@ import os
 import re
 from typing import Any
 
-import requests
 from pydantic import BaseModel, Field
 
+from artl_mcp.utils import http
+
 
 class FullTextInfo(BaseModel):
     """Data model for full text information."""
@@ -66,7 +67,7 @@ class DOIFetcher:
         """
         base_url = "https://api.crossref.org/works/"
         try:
-            response = requests.get(f"{base_url}{doi}", headers=self.headers)
+            response = http.get(f"{base_url}{doi}", headers=self.headers)
             response.raise_for_status()
             return response.json()["message"]
         except Exception as e:
@@ -96,7 +97,7 @@ class DOIFetcher:
         """
         base_url = f"https://api.unpaywall.org/v2/{doi}"
         try:
-            response = requests.get(f"{base_url}?email={self.email}")
+            response = http.get(f"{base_url}?email={self.email}")
             response.raise_for_status()
             return response.json()
         except Exception as e:
@@ -218,7 +219,7 @@ class DOIFetcher:
 
         """
         # Download the PDF
-        response = requests.get(pdf_url)
+        response = http.get(pdf_url)
         if raise_for_status:
             response.raise_for_status()
         if response.status_code != 200:
@@ -361,7 +361,7 @@ class FileManager:
         Raises:
             FileManagerError: If download or saving fails
         """
-        import requests
+        from artl_mcp.utils import http
 
         target_dir = output_dir or self.output_dir
         target_dir.mkdir(parents=True, exist_ok=True)
@@ -374,7 +374,7 @@ class FileManager:
         encoding = None if file_format == "pdf" else "utf-8"
 
         try:
-            with requests.get(
+            with http.get(
                 url, headers=headers or {}, stream=True, timeout=60
             ) as response:
                 response.raise_for_status()
@@ -0,0 +1,126 @@
+"""Persistent work queue for bulk full text harvesting.
+
+Tracks the state of every identifier in a local SQLite database so that an
+interrupted harvest can resume without redoing finished items.
+"""
+
+import json
+import sqlite3
+import time
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any, Literal
+
+ItemStatus = Literal["pending", "done", "failed"]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    identifier TEXT PRIMARY KEY,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    record TEXT,
+    updated_at REAL
+)
+"""
+
+
+class HarvestQueue:
+    """SQLite-backed queue of identifiers with per-item status checkpoints."""
+
+    def __init__(self, db_path: str | Path):
+        """Open (or create) the queue database.
+
+        Args:
+            db_path: Path to the SQLite database file
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path))
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+    def __enter__(self) -> "HarvestQueue":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def add(self, identifiers: Iterable[str]) -> int:
+        """Add identifiers to the queue, ignoring ones already present.
+
+        Args:
+            identifiers: Identifiers to enqueue
+
+        Returns:
+            Number of newly added identifiers
+        """
+        before = self._conn.total_changes
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO items (identifier, updated_at) VALUES (?, ?)",
+            ((identifier, time.time()) for identifier in identifiers),
+        )
+        self._conn.commit()
+        return self._conn.total_changes - before
+
+    def iter_pending(
+        self, include_failed: bool = False, batch_size: int = 1000
+    ) -> Iterator[str]:
+        """Yield identifiers that still need processing, in insertion order.
+
+        Rows are read in batches so items can be marked done while iterating.
+
+        Args:
+            include_failed: Also yield items whose previous attempt failed
+            batch_size: Number of rows fetched per query
+        """
+        statuses = ("pending", "failed") if include_failed else ("pending",)
+        placeholders = ", ".join("?" for _ in statuses)
+        last_rowid = 0
+        while True:
+            rows = self._conn.execute(
+                f"SELECT rowid, identifier FROM items "
+                f"WHERE rowid > ? AND status IN ({placeholders}) "
+                f"ORDER BY rowid LIMIT ?",
+                (last_rowid, *statuses, batch_size),
+            ).fetchall()
+            if not rows:
+                return
+            for rowid, identifier in rows:
+                last_rowid = rowid
+                yield identifier
+
+    def mark(self, identifier: str, status: ItemStatus, record: dict[str, Any]) -> None:
+        """Checkpoint the outcome of one item.
+
+        Args:
+            identifier: Identifier that was processed
+            status: New status ("done" or "failed")
+            record: Result record stored alongside the status
+        """
+        self._conn.execute(
+            "UPDATE items SET status = ?, attempts = attempts + 1, record = ?, "
+            "updated_at = ? WHERE identifier = ?",
+            (status, json.dumps(record, default=str), time.time(), identifier),
+        )
+        self._conn.commit()
+
+    def get_record(self, identifier: str) -> dict[str, Any] | None:
+        """Return the stored result record for an identifier, if any."""
+        row = self._conn.execute(
+            "SELECT record FROM items WHERE identifier = ?", (identifier,)
+        ).fetchone()
+        return json.loads(row[0]) if row and row[0] else None
+
+    def counts(self) -> dict[str, int]:
+        """Return the number of items per status."""
+        counts = {"pending": 0, "done": 0, "failed": 0}
+        for status, count in self._conn.execute(
+            "SELECT status, COUNT(*) FROM items GROUP BY status"
+        ):
+            counts[status] = count
+        return counts
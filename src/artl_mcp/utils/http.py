@@ -0,0 +1,148 @@
+"""Shared entry point for outbound HTTP requests.
+
+Thin wrappers around ``requests.get``/``head``/``post`` that record an
+``http`` span per request (host, status, time to first byte, bytes) and feed
+per-host request, response-class, error and byte counters. The wrapped
+functions are looked up on the ``requests`` module at call time, so patching
+``requests.get`` in tests keeps working. ARTL_HTTP_MODE=record/replay routes
+requests through the cassette in ``artl_mcp.utils.http_replay``.
+
+Every request gets a timeout: the caller's, or ARTL_HTTP_TIMEOUT when none is
+given, capped at the time left before the running call's deadline (see
+``artl_mcp.utils.deadline``).
+"""
+
+import datetime
+import logging
+import sqlite3
+import time
+from typing import Any
+from urllib.parse import urlsplit
+
+import requests
+
+from artl_mcp.utils.deadline import clamp_timeout
+from artl_mcp.utils.http_replay import (
+    get_cassette,
+    get_http_mode,
+    get_replay_settings,
+    replay,
+    request_key,
+)
+from artl_mcp.utils.instrumentation import count, metrics, span
+
+logger = logging.getLogger(__name__)
+
+
+def _record_response(response: Any, attrs: dict[str, Any], stream: bool) -> None:
+    """Copy what is known about a response onto the span attributes."""
+    status = getattr(response, "status_code", None)
+    if isinstance(status, int):
+        attrs["status"] = status
+    # requests measures send -> response headers parsed, i.e. time to first byte
+    elapsed = getattr(response, "elapsed", None)
+    if isinstance(elapsed, datetime.timedelta):
+        attrs["ttfb_ms"] = round(elapsed.total_seconds() * 1000, 3)
+
+    size = None
+    if not stream:
+        content = getattr(response, "_content", None)
+        if isinstance(content, bytes):
+            size = len(content)
+    if size is None:
+        headers = getattr(response, "headers", None)
+        length = headers.get("Content-Length") if hasattr(headers, "get") else None
+        if isinstance(length, str) and length.isdigit():
+            size = int(length)
+    if size is not None:
+        attrs["bytes"] = size
+        count("http.bytes", size, labels={"host": attrs["host"]})
+
+
+def _request_kwargs(
+    method: str, args: tuple[Any, ...], kwargs: dict[str, Any]
+) -> dict[str, Any]:
+    """Merge positional arguments into kwargs, as requests.<method> names them."""
+    names = {"get": ("params",), "post": ("data", "json")}.get(method, ())
+    return {**dict(zip(names, args, strict=False)), **kwargs}
+
+
+def _record(
+    method: str,
+    url: str,
+    kwargs: dict[str, Any],
+    response: requests.Response,
+    start: float,
+) -> None:
+    """Save a live response to the cassette; recording never fails a request."""
+    try:
+        # Read streamed bodies first so the latency covers the download
+        body = response.content
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        get_cassette().record(
+            request_key(method, url, kwargs), method, response, elapsed_ms, body
+        )
+    except (sqlite3.Error, OSError, requests.RequestException) as e:
+        logger.warning(f"Could not record response for {url}: {e}")
+
+
+def request(method: str, url: str, *args: Any, **kwargs: Any) -> requests.Response:
+    """Send a request through requests.<method> inside an ``http`` span.
+
+    Raises:
+        DeadlineExceeded: If the running call is cancelled or out of time
+            before the request is sent
+    """
+    kwargs["timeout"] = clamp_timeout(kwargs.get("timeout"))
+    labels = {"host": urlsplit(url).netloc}
+    mode = get_http_mode()
+    count("http.requests", labels=labels)
+    with span("http", labels=labels, method=method.upper()) as attrs:
+        try:
+            if mode == "replay":
+                attrs["replayed"] = True
+                response = replay(
+                    get_cassette(),
+                    method,
+                    url,
+                    _request_kwargs(method, args, kwargs),
+                    get_replay_settings(),
+                )
+            else:
+                start = time.perf_counter()
+                response = getattr(requests, method)(url, *args, **kwargs)
+                if mode == "record":
+                    _record(
+                        method,
+                        url,
+                        _request_kwargs(method, args, kwargs),
+                        response,
+                        start,
+                    )
+        except requests.RequestException as e:
+            attrs["error"] = type(e).__name__
+            count("http.errors", labels=labels)
+            raise
+        _record_response(response, attrs, bool(kwargs.get("stream")))
+        if isinstance(attrs.get("status"), int):
+            # Registry only: status classes are for dashboards, not call traces
+            metrics.increment(
+                "http.responses",
+                labels={**labels, "code": f"{attrs['status'] // 100}xx"},
+            )
+        return response
+
+
+def get(url: str, *args: Any, **kwargs: Any) -> requests.Response:
+    """requests.get with instrumentation."""
+    return request("get", url, *args, **kwargs)
+
+
+def head(url: str, *args: Any, **kwargs: Any) -> requests.Response:
+    """requests.head with instrumentation."""
+    return request("head", url, *args, **kwargs)
+
+
+def post(url: str, *args: Any, **kwargs: Any) -> requests.Response:
+    """requests.post with instrumentation."""
+    return request("post", url, *args, **kwargs)
@@ -0,0 +1,323 @@
+"""Record/replay transport for the shared HTTP layer.
+
+ARTL_HTTP_MODE switches every request made through ``artl_mcp.utils.http``:
+
+- ``record``: requests go to the network as usual and each response (status,
+  headers, body and wall-clock latency) is appended to a cassette.
+- ``replay``: requests never reach the network. Responses are served from the
+  cassette, optionally after sleeping for the recorded latency and with
+  injected failures; a request with no recording raises ConnectionError.
+  Recorded latency beyond a request's read timeout raises ReadTimeout.
+
+The cassette (ARTL_HTTP_CASSETTE, default ``artl_http_cassette.sqlite`` in the
+output directory) is a SQLite file with zlib-compressed bodies. Requests are
+matched on method, URL and sorted query parameters (contact parameters such as
+``email`` and ``mailto`` are ignored, so cassettes are portable between users)
+and, for POST, a hash of the body. Repeated recordings of the same request are
+replayed in order and then cycled.
+
+Replay tuning:
+    ARTL_HTTP_REPLAY_LATENCY: multiplier for recorded latency (default 1.0,
+        0 serves instantly)
+    ARTL_HTTP_ERROR_RATE: probability (0-1) of failing a replayed request
+    ARTL_HTTP_ERROR_STATUS: status code of injected failures, or
+        "connection" to raise ConnectionError instead (default 503)
+    ARTL_HTTP_REPLAY_SEED: seed for reproducible error injection
+"""
+
+import datetime
+import hashlib
+import json
+import logging
+import random
+import sqlite3
+import threading
+import zlib
+from pathlib import Path
+from typing import Any, Literal
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from artl_mcp.utils.config_manager import get_config_value
+from artl_mcp.utils.deadline import sleep
+
+logger = logging.getLogger(__name__)
+
+HttpMode = Literal["off", "record", "replay"]
+
+# Query parameters that identify the caller rather than the request
+IGNORED_PARAMS = frozenset({"email", "mailto", "tool", "api_key"})
+
+# Response headers that are never stored
+_DROPPED_HEADERS = frozenset({"set-cookie", "date", "connection", "keep-alive"})
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS interactions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    request_key TEXT NOT NULL,
+    method TEXT NOT NULL,
+    url TEXT NOT NULL,
+    status INTEGER NOT NULL,
+    reason TEXT,
+    headers TEXT NOT NULL,
+    body BLOB NOT NULL,
+    elapsed_ms REAL NOT NULL,
+    recorded_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS interactions_key ON interactions (request_key, id);
+"""
+
+
+def request_key(method: str, url: str, kwargs: dict[str, Any]) -> str:
+    """Build the key a request is recorded and replayed under."""
+    parts = urlsplit(url)
+    query = parse_qsl(parts.query, keep_blank_values=True)
+    params = kwargs.get("params") or {}
+    items = params.items() if isinstance(params, dict) else params
+    query += [(str(k), str(v)) for k, v in items if v is not None]
+    query = sorted((k, v) for k, v in query if k.lower() not in IGNORED_PARAMS)
+    canonical = urlunsplit(
+        (parts.scheme, parts.netloc.lower(), parts.path, urlencode(query), "")
+    )
+    key = f"{method.upper()} {canonical}"
+
+    body = kwargs.get("json")
+    if body is not None:
+        body = json.dumps(body, sort_keys=True)
+    else:
+        body = kwargs.get("data")
+    if body:
+        if isinstance(body, str):
+            body = body.encode()
+        if isinstance(body, bytes):
+            key += " " + hashlib.sha1(body).hexdigest()
+    return key
+
+
+class Cassette:
+    """SQLite store of recorded HTTP interactions."""
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+        self._positions: dict[str, int] = {}
+
+    def record(
+        self,
+        key: str,
+        method: str,
+        response: requests.Response,
+        elapsed_ms: float,
+        body: bytes | None = None,
+    ) -> None:
+        """Append a response to the cassette.
+
+        Args:
+            key: Key from request_key()
+            method: HTTP method
+            response: The live response
+            elapsed_ms: Wall-clock latency including the body download
+            body: Response body (defaults to response.content)
+        """
+        if body is None:
+            body = response.content
+        headers = {
+            k: v
+            for k, v in response.headers.items()
+            if k.lower() not in _DROPPED_HEADERS
+        }
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO interactions (request_key, method, url, status, reason,"
+                " headers, body, elapsed_ms, recorded_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    method.upper(),
+                    response.url,
+                    response.status_code,
+                    response.reason,
+                    json.dumps(headers),
+                    zlib.compress(body or b""),
+                    round(elapsed_ms, 3),
+                    datetime.datetime.now(datetime.UTC).isoformat(),
+                ),
+            )
+
+    def next_interaction(self, key: str) -> dict[str, Any] | None:
+        """Return the next recording for key, cycling through repeats."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT url, status, reason, headers, body, elapsed_ms"
+                " FROM interactions WHERE request_key = ? ORDER BY id",
+                (key,),
+            ).fetchall()
+            if not rows:
+                return None
+            position = self._positions.get(key, 0)
+            self._positions[key] = position + 1
+        url, status, reason, headers, body, elapsed_ms = rows[position % len(rows)]
+        return {
+            "url": url,
+            "status": status,
+            "reason": reason,
+            "headers": json.loads(headers),
+            "body": zlib.decompress(body),
+            "elapsed_ms": elapsed_ms,
+        }
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM interactions").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def build_response(interaction: dict[str, Any], method: str) -> requests.Response:
+    """Turn a recorded interaction into a requests.Response."""
+    response = requests.Response()
+    response.status_code = interaction["status"]
+    response.reason = interaction["reason"]
+    response.url = interaction["url"]
+    response.headers = CaseInsensitiveDict(interaction["headers"])
+    response.encoding = get_encoding_from_headers(response.headers)
+    response._content = interaction["body"]
+    response._content_consumed = True
+    response.elapsed = datetime.timedelta(milliseconds=interaction["elapsed_ms"])
+    response.request = requests.Request(method.upper(), interaction["url"]).prepare()
+    return response
+
+
+def _float_config(key: str, default: float) -> float:
+    try:
+        return float(get_config_value(key, default))
+    except (TypeError, ValueError):
+        logger.warning(f"Ignoring invalid {key} value")
+        return default
+
+
+class ReplaySettings:
+    """Latency and error injection applied to replayed responses."""
+
+    def __init__(
+        self,
+        latency: float = 1.0,
+        error_rate: float = 0.0,
+        error_status: int | None = 503,
+        seed: int | None = None,
+    ):
+        self.latency = max(latency, 0.0)
+        self.error_rate = min(max(error_rate, 0.0), 1.0)
+        self.error_status = error_status  # None raises ConnectionError
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def should_fail(self) -> bool:
+        if self.error_rate <= 0:
+            return False
+        with self._lock:
+            return self._random.random() < self.error_rate
+
+
+def replay(
+    cassette: Cassette,
+    method: str,
+    url: str,
+    kwargs: dict[str, Any],
+    settings: ReplaySettings,
+) -> requests.Response:
+    """Serve a request from the cassette."""
+    key = request_key(method, url, kwargs)
+    interaction = cassette.next_interaction(key)
+    if interaction is None:
+        raise requests.exceptions.ConnectionError(
+            f"No recorded response for {key} in {cassette.path}"
+        )
+    if settings.latency:
+        delay = interaction["elapsed_ms"] / 1000 * settings.latency
+        timeout = kwargs.get("timeout")
+        if isinstance(timeout, tuple):
+            timeout = timeout[1]
+        if timeout is not None and delay > timeout:
+            # Behave like a live server that is slower than the read timeout
+            sleep(timeout)
+            raise requests.exceptions.ReadTimeout(
+                f"Recorded response for {key} took longer than {timeout}s"
+            )
+        sleep(delay)
+    if settings.should_fail():
+        if settings.error_status is None:
+            raise requests.exceptions.ConnectionError(f"Injected failure for {key}")
+        interaction = {
+            **interaction,
+            "status": settings.error_status,
+            "reason": "Injected failure",
+            "headers": {"Content-Type": "text/plain"},
+            "body": b"injected failure",
+        }
+    return build_response(interaction, method)
+
+
+def get_http_mode() -> HttpMode:
+    """Return the configured transport mode."""
+    mode = str(get_config_value("ARTL_HTTP_MODE", "off") or "off").lower()
+    if mode in ("record", "replay"):
+        return mode  # type: ignore[return-value]
+    if mode != "off":
+        logger.warning(f"Ignoring unknown ARTL_HTTP_MODE value: {mode}")
+    return "off"
+
+
+_cassette: Cassette | None = None
+_cassette_lock = threading.Lock()
+_settings: tuple[tuple[Any, ...], ReplaySettings] | None = None
+
+
+def get_replay_settings() -> ReplaySettings:
+    """Return replay settings from configuration.
+
+    The instance is kept while the configuration is unchanged, so a seeded
+    error sequence continues across requests instead of restarting.
+    """
+    global _settings
+    status = str(get_config_value("ARTL_HTTP_ERROR_STATUS", "503")).lower()
+    error_status = None
+    if status != "connection":
+        error_status = int(_float_config("ARTL_HTTP_ERROR_STATUS", 503))
+    seed = None
+    if get_config_value("ARTL_HTTP_REPLAY_SEED") not in (None, ""):
+        seed = int(_float_config("ARTL_HTTP_REPLAY_SEED", 0))
+    config = (
+        _float_config("ARTL_HTTP_REPLAY_LATENCY", 1.0),
+        _float_config("ARTL_HTTP_ERROR_RATE", 0.0),
+        error_status,
+        seed,
+    )
+    with _cassette_lock:
+        if _settings is None or _settings[0] != config:
+            _settings = (config, ReplaySettings(*config))
+        return _settings[1]
+
+
+def get_cassette() -> Cassette:
+    """Return the cassette at ARTL_HTTP_CASSETTE (or the output dir)."""
+    global _cassette
+    path = get_config_value("ARTL_HTTP_CASSETTE")
+    if not path:
+        from artl_mcp.utils.file_manager import file_manager
+
+        path = file_manager.output_dir / "artl_http_cassette.sqlite"
+    path = Path(path).expanduser()
+
+    with _cassette_lock:
+        if _cassette is None or _cassette.path != path:
+            _cassette = Cassette(path)
+        return _cassette
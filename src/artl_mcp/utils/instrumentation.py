@@ -0,0 +1,403 @@
+"""Lightweight per-call instrumentation.
+
+Tool calls run inside a Trace that collects timed spans (identifier
+resolution, HTTP requests, parsing, conversion, windowing, saving) and counters
+(cache hits, retries, bytes downloaded). The active trace is held in a context
+variable, so nested helpers add to it without any plumbing; work submitted to
+thread pools keeps it when wrapped with ``bind_context``; work run in another
+process records into ``collect_trace`` and the caller merges the result back
+with ``merge_trace_record`` and ``metrics.merge``.
+
+Every span and counter also feeds the process-wide ``metrics`` registry. Set
+ARTL_INCLUDE_TIMINGS=true to attach each call's trace to dict results as a
+``_timings`` block. Spans carry ids and parent ids, and finished traces are
+handed to listeners registered with ``add_trace_listener`` (see
+``artl_mcp.utils.tracing`` for the exporters).
+"""
+
+import contextvars
+import functools
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import Any, TypeVar
+
+from artl_mcp.utils.config_manager import get_config_value
+
+logger = logging.getLogger(__name__)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Upper bounds (milliseconds) of the duration histogram buckets
+DURATION_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+
+
+Labels = tuple[tuple[str, str], ...]
+
+
+def _label_key(labels: dict[str, Any] | None) -> Labels:
+    return tuple(sorted((k, str(v)) for k, v in (labels or {}).items()))
+
+
+class MetricsRegistry:
+    """Thread-safe process-wide counters and duration histograms.
+
+    Each metric may have several labelled series (e.g. one per upstream host);
+    snapshot() aggregates them per name, series() returns them individually.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counters: dict[tuple[str, Labels], float] = {}
+        self._timings: dict[tuple[str, Labels], dict[str, Any]] = {}
+
+    def increment(
+        self, name: str, value: float = 1, labels: dict[str, Any] | None = None
+    ) -> None:
+        """Add value to a counter."""
+        key = (name, _label_key(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(
+        self, name: str, duration_ms: float, labels: dict[str, Any] | None = None
+    ) -> None:
+        """Record one duration for a span name."""
+        key = (name, _label_key(labels))
+        with self._lock:
+            timing = self._timings.get(key)
+            if timing is None:
+                timing = self._timings[key] = _empty_timing()
+            _add_timing(timing, duration_ms)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return a copy of all counters and timings, summed over labels.
+
+        Histogram buckets are per-bucket counts (not cumulative); durations
+        above the last bound are only reflected in count and total_ms.
+        """
+        counters: dict[str, float] = {}
+        timings: dict[str, dict[str, Any]] = {}
+        with self._lock:
+            for (name, _), value in self._counters.items():
+                counters[name] = counters.get(name, 0) + value
+            for (name, _), timing in self._timings.items():
+                merged = timings.setdefault(name, _empty_timing())
+                merged["count"] += timing["count"]
+                merged["total_ms"] += timing["total_ms"]
+                merged["max_ms"] = max(merged["max_ms"], timing["max_ms"])
+                for i, n in enumerate(timing["buckets"]):
+                    merged["buckets"][i] += n
+        for timing in timings.values():
+            timing["total_ms"] = round(timing["total_ms"], 3)
+            timing["max_ms"] = round(timing["max_ms"], 3)
+        return {"counters": counters, "timings": timings}
+
+    def series(self) -> dict[str, list[tuple[dict[str, str], Any]]]:
+        """Return every labelled series, for exporters.
+
+        Returns:
+            {"counters": [(name, labels, value)], "timings": [(name, labels, timing)]}
+        """
+        with self._lock:
+            return {
+                "counters": [
+                    (name, dict(labels), value)
+                    for (name, labels), value in sorted(self._counters.items())
+                ],
+                "timings": [
+                    (name, dict(labels), {**t, "buckets": list(t["buckets"])})
+                    for (name, labels), t in sorted(self._timings.items())
+                ],
+            }
+
+    def merge(self, series: dict[str, list[tuple[dict[str, str], Any]]]) -> None:
+        """Add the output of another registry's series(), e.g. a worker's."""
+        with self._lock:
+            for name, labels, value in series["counters"]:
+                key = (name, _label_key(labels))
+                self._counters[key] = self._counters.get(key, 0) + value
+            for name, labels, other in series["timings"]:
+                key = (name, _label_key(labels))
+                timing = self._timings.get(key)
+                if timing is None:
+                    timing = self._timings[key] = _empty_timing()
+                timing["count"] += other["count"]
+                timing["total_ms"] += other["total_ms"]
+                timing["max_ms"] = max(timing["max_ms"], other["max_ms"])
+                for i, n in enumerate(other["buckets"]):
+                    timing["buckets"][i] += n
+
+    def reset(self) -> None:
+        """Clear all counters and timings."""
+        with self._lock:
+            self._counters.clear()
+            self._timings.clear()
+
+
+def _empty_timing() -> dict[str, Any]:
+    return {
+        "count": 0,
+        "total_ms": 0.0,
+        "max_ms": 0.0,
+        "buckets": [0] * len(DURATION_BUCKETS_MS),
+    }
+
+
+def _add_timing(timing: dict[str, Any], duration_ms: float) -> None:
+    timing["count"] += 1
+    timing["total_ms"] += duration_ms
+    timing["max_ms"] = max(timing["max_ms"], duration_ms)
+    for i, bound in enumerate(DURATION_BUCKETS_MS):
+        if duration_ms <= bound:
+            timing["buckets"][i] += 1
+            break
+
+
+metrics = MetricsRegistry()
+
+
+def _new_id(n_bytes: int) -> str:
+    return os.urandom(n_bytes).hex()
+
+
+class Trace:
+    """Spans and counters collected during one tool call."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.trace_id = _new_id(16)
+        self.start = time.perf_counter()
+        self.start_unix_ns = time.time_ns()
+        self.spans: list[dict[str, Any]] = []
+        self.counters: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def add_span(self, span: dict[str, Any]) -> None:
+        with self._lock:
+            self.spans.append(span)
+
+    def add_count(self, name: str, value: float) -> None:
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def to_dict(self) -> dict[str, Any]:
+        """Summarize the trace for a ``_timings`` block."""
+        with self._lock:
+            spans = [
+                {k: v for k, v in span.items() if k not in _SPAN_IDS}
+                for span in sorted(self.spans, key=lambda s: s["start_ms"])
+            ]
+            counters = dict(self.counters)
+        stages: dict[str, float] = {}
+        for span in spans:
+            stages[span["name"]] = round(
+                stages.get(span["name"], 0.0) + span["duration_ms"], 3
+            )
+        return {
+            "tool": self.name,
+            "total_ms": round((time.perf_counter() - self.start) * 1000, 3),
+            "stages_ms": stages,
+            "spans": spans,
+            "counters": counters,
+        }
+
+
+# Span record keys used for tracing but left out of ``_timings`` blocks
+_SPAN_IDS = ("span_id", "parent_id")
+
+_current_trace: contextvars.ContextVar[Trace | None] = contextvars.ContextVar(
+    "artl_trace", default=None
+)
+_current_span_id: contextvars.ContextVar[str | None] = contextvars.ContextVar(
+    "artl_span", default=None
+)
+_trace_listeners: list[Callable[[Trace], None]] = []
+
+
+def add_trace_listener(listener: Callable[[Trace], None]) -> None:
+    """Call listener with every finished top-level trace."""
+    if listener not in _trace_listeners:
+        _trace_listeners.append(listener)
+
+
+def remove_trace_listener(listener: Callable[[Trace], None]) -> None:
+    """Stop calling a listener added with add_trace_listener()."""
+    if listener in _trace_listeners:
+        _trace_listeners.remove(listener)
+
+
+def current_trace() -> Trace | None:
+    """Return the trace of the tool call in progress, if any."""
+    return _current_trace.get()
+
+
+@contextmanager
+def span(
+    name: str, labels: dict[str, Any] | None = None, **attrs: Any
+) -> Iterator[dict[str, Any]]:
+    """Time a block as a named span.
+
+    The yielded dict holds the span's attributes; code inside the block may add
+    to it (e.g. status codes or byte counts). Labels select the metrics series
+    the duration is recorded in and are also reported as attributes.
+
+    Examples:
+        >>> with span("parse", source="europepmc_xml") as attrs:
+        ...     attrs["sections"] = 12
+    """
+    attrs = {**(labels or {}), **attrs}
+    trace = _current_trace.get()
+    span_id = parent_id = token = None
+    if trace is not None:
+        span_id = _new_id(8)
+        parent_id = _current_span_id.get()
+        token = _current_span_id.set(span_id)
+    start = time.perf_counter()
+    try:
+        yield attrs
+    except Exception as e:
+        attrs.setdefault("error", type(e).__name__)
+        raise
+    finally:
+        end = time.perf_counter()
+        duration_ms = (end - start) * 1000
+        metrics.observe(name, duration_ms, labels)
+        if trace is not None:
+            _current_span_id.reset(token)
+            record = {
+                "name": name,
+                "start_ms": round((start - trace.start) * 1000, 3),
+                "duration_ms": round(duration_ms, 3),
+                "span_id": span_id,
+                "parent_id": parent_id,
+            }
+            if attrs:
+                record["attrs"] = attrs
+            trace.add_span(record)
+
+
+def count(name: str, value: float = 1, labels: dict[str, Any] | None = None) -> None:
+    """Increment a counter on the current trace and in the registry."""
+    metrics.increment(name, value, labels)
+    trace = _current_trace.get()
+    if trace is not None:
+        trace.add_count(name, value)
+
+
+def bind_context(fn: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap fn so it runs with the caller's context (and trace) in any thread."""
+    ctx = contextvars.copy_context()
+
+    @functools.wraps(fn)
+    def _run(*args: Any, **kwargs: Any) -> Any:
+        # Each call gets its own copy: a Context cannot be entered twice at once
+        return ctx.copy().run(fn, *args, **kwargs)
+
+    return _run
+
+
+@contextmanager
+def collect_trace(name: str) -> Iterator[Trace]:
+    """Record spans and counters into a fresh trace that is never exported.
+
+    Used in worker processes; hand ``trace_record()`` of it back to the caller.
+    """
+    trace = Trace(name)
+    token = _current_trace.set(trace)
+    span_token = _current_span_id.set(None)
+    try:
+        yield trace
+    finally:
+        _current_span_id.reset(span_token)
+        _current_trace.reset(token)
+
+
+def trace_record(trace: Trace) -> dict[str, Any]:
+    """Picklable copy of a trace's spans and counters."""
+    with trace._lock:
+        return {
+            "start_unix_ns": trace.start_unix_ns,
+            "spans": list(trace.spans),
+            "counters": dict(trace.counters),
+        }
+
+
+def merge_trace_record(record: dict[str, Any]) -> None:
+    """Add spans and counters recorded elsewhere to the current trace.
+
+    Span start times are shifted onto the current trace's clock by wall-clock
+    start, and top-level spans become children of the current span.
+    """
+    trace = _current_trace.get()
+    if trace is None:
+        return
+    offset_ms = (record["start_unix_ns"] - trace.start_unix_ns) / 1e6
+    parent_id = _current_span_id.get()
+    for span_record in record["spans"]:
+        trace.add_span(
+            {
+                **span_record,
+                "start_ms": round(span_record["start_ms"] + offset_ms, 3),
+                "parent_id": span_record["parent_id"] or parent_id,
+            }
+        )
+    for name, value in record["counters"].items():
+        trace.add_count(name, value)
+
+
+def _notify_listeners(trace: Trace) -> None:
+    for listener in list(_trace_listeners):
+        try:
+            listener(trace)
+        except Exception as e:  # exporters must never fail a tool call
+            logger.warning(f"Trace listener {listener!r} failed: {e}")
+
+
+def timings_enabled() -> bool:
+    """Whether tool results should carry a ``_timings`` block."""
+    value = str(get_config_value("ARTL_INCLUDE_TIMINGS", "false")).lower()
+    return value in ("1", "true", "yes")
+
+
+def instrumented(name: str | None = None) -> Callable[[F], F]:
+    """Decorate a tool so each call is traced and timed.
+
+    The outermost instrumented call owns the trace; nested instrumented calls
+    appear as ``tool.<name>`` spans inside it. When timings are enabled, dict
+    results of the outermost call get a ``_timings`` block.
+    """
+
+    def decorator(fn: F) -> F:
+        tool_name = name or fn.__name__
+
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if _current_trace.get() is not None:
+                with span(f"tool.{tool_name}"):
+                    return fn(*args, **kwargs)
+
+            trace = Trace(tool_name)
+            token = _current_trace.set(trace)
+            span_token = _current_span_id.set(None)
+            try:
+                with span(f"tool.{tool_name}"):
+                    result = fn(*args, **kwargs)
+            except Exception:
+                count(f"tool.{tool_name}.errors")
+                raise
+            finally:
+                _current_span_id.reset(span_token)
+                _current_trace.reset(token)
+                _notify_listeners(trace)
+            count(f"tool.{tool_name}.calls")
+            if isinstance(result, dict) and timings_enabled():
+                result = {**result, "_timings": trace.to_dict()}
+            return result
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
@@ -0,0 +1,252 @@
+"""Local full text search index over fetched papers.
+
+Keeps an embedded SQLite FTS5 index of paper metadata, abstracts and converted
+full text so that repeat literature questions can be answered locally with BM25
+ranking and highlighted snippets, without calling Europe PMC again.
+
+The index is opt-in: set ARTL_LOCAL_CORPUS=true to enable ingestion, and
+optionally ARTL_CORPUS_DB to choose the database path (default:
+<ARTL_OUTPUT_DIR>/artl_corpus.sqlite).
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from artl_mcp.utils.config_manager import get_config_value
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS papers (
+        id INTEGER PRIMARY KEY,
+        key TEXT NOT NULL UNIQUE,
+        pmid TEXT,
+        pmcid TEXT,
+        doi TEXT,
+        title TEXT,
+        journal TEXT,
+        year TEXT,
+        body_source TEXT,
+        updated_at REAL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS papers_pmid ON papers (pmid)",
+    "CREATE INDEX IF NOT EXISTS papers_pmcid ON papers (pmcid)",
+    "CREATE INDEX IF NOT EXISTS papers_doi ON papers (doi)",
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS papers_fts USING fts5(
+        title, abstract, body, tokenize = 'porter unicode61'
+    )
+    """,
+]
+
+# bm25() column weights for (title, abstract, body)
+_BM25_WEIGHTS = (10.0, 4.0, 1.0)
+
+_FTS_OPERATORS = {"AND", "OR", "NOT"}
+
+
+def build_match_query(query: str) -> str:
+    """Turn free text into a safe FTS5 MATCH expression.
+
+    Every term is quoted so punctuation such as hyphens or colons cannot be
+    misread as FTS5 syntax; upper-case AND/OR/NOT are kept as operators and a
+    trailing * keeps prefix matching.
+
+    Examples:
+        >>> build_match_query("CRISPR-Cas9 OR base edit*")
+        '"CRISPR-Cas9" OR "base" "edit"*'
+    """
+    parts = []
+    for term in query.split():
+        if term in _FTS_OPERATORS:
+            parts.append(term)
+            continue
+        prefix = term.endswith("*")
+        term = term.rstrip("*").replace('"', '""')
+        if term:
+            parts.append(f'"{term}"' + ("*" if prefix else ""))
+    # Operators are only valid between terms
+    while parts and parts[0] in _FTS_OPERATORS:
+        parts.pop(0)
+    while parts and parts[-1] in _FTS_OPERATORS:
+        parts.pop()
+    return " ".join(parts)
+
+
+class LocalCorpus:
+    """SQLite FTS5 index of papers keyed by their identifiers."""
+
+    def __init__(self, db_path: str | Path):
+        """Open (or create) the corpus database.
+
+        Args:
+            db_path: Path to the SQLite database file
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        for statement in _SCHEMA:
+            self._conn.execute(statement)
+        self._conn.commit()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def _find_key(self, pmid: str | None, pmcid: str | None, doi: str | None) -> str:
+        """Return the key of an existing paper sharing any identifier, or a new one."""
+        for column, value in (("pmcid", pmcid), ("pmid", pmid), ("doi", doi)):
+            if value:
+                row = self._conn.execute(
+                    f"SELECT key FROM papers WHERE {column} = ?", (value,)
+                ).fetchone()
+                if row:
+                    return row[0]
+        return pmcid or pmid or str(doi)
+
+    def add(
+        self,
+        pmid: str | None = None,
+        pmcid: str | None = None,
+        doi: str | None = None,
+        title: str | None = None,
+        abstract: str | None = None,
+        body: str | None = None,
+        journal: str | None = None,
+        year: str | None = None,
+        body_source: str | None = None,
+    ) -> str | None:
+        """Insert or update a paper, merging with what is already indexed.
+
+        Fields left as None keep their stored values, so metadata and full text
+        fetched by different calls end up in the same document.
+
+        Returns:
+            Key of the indexed document, or None if no identifier was given
+        """
+        if not (pmid or pmcid or doi):
+            return None
+        doi = doi.lower() if doi else None
+
+        with self._lock:
+            key = self._find_key(pmid, pmcid, doi)
+            stored = (
+                self._conn.execute(
+                    "SELECT p.pmid, p.pmcid, p.doi, p.title, p.journal, p.year, "
+                    "p.body_source, f.abstract, f.body FROM papers p "
+                    "LEFT JOIN papers_fts f ON f.rowid = p.id WHERE p.key = ?",
+                    (key,),
+                ).fetchone()
+                or (None,) * 9
+            )
+
+            merged = [
+                new if new else old
+                for new, old in zip(
+                    (pmid, pmcid, doi, title, journal, year, body_source, abstract),
+                    stored[:8],
+                    strict=True,
+                )
+            ]
+            body = body or stored[8]
+
+            row_id = self._conn.execute(
+                "INSERT INTO papers (key, pmid, pmcid, doi, title, journal, year, "
+                "body_source, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (key) DO UPDATE SET pmid = excluded.pmid, "
+                "pmcid = excluded.pmcid, doi = excluded.doi, title = excluded.title, "
+                "journal = excluded.journal, year = excluded.year, "
+                "body_source = excluded.body_source, updated_at = excluded.updated_at "
+                "RETURNING id",
+                (key, *merged[:7], time.time()),
+            ).fetchone()[0]
+            self._conn.execute("DELETE FROM papers_fts WHERE rowid = ?", (row_id,))
+            self._conn.execute(
+                "INSERT INTO papers_fts (rowid, title, abstract, body) "
+                "VALUES (?, ?, ?, ?)",
+                (row_id, merged[3] or "", merged[7] or "", body or ""),
+            )
+            self._conn.commit()
+        return key
+
+    def search(self, query: str, limit: int = 10) -> list[dict[str, Any]]:
+        """Rank indexed papers against a query with BM25.
+
+        Args:
+            query: Free text query; upper-case AND/OR/NOT and trailing * work
+            limit: Maximum number of hits
+
+        Returns:
+            Hits ordered best first, each with identifiers, title, a highlighted
+            snippet ([...] marks matches) and its BM25 score (lower is better)
+        """
+        match = build_match_query(query)
+        if not match:
+            return []
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT p.key, p.pmid, p.pmcid, p.doi, p.title, p.journal, p.year, "
+                "p.body_source, snippet(papers_fts, -1, '[', ']', ' ... ', 24), "
+                "bm25(papers_fts, ?, ?, ?) AS score "
+                "FROM papers_fts JOIN papers p ON p.id = papers_fts.rowid "
+                "WHERE papers_fts MATCH ? ORDER BY score LIMIT ?",
+                (*_BM25_WEIGHTS, match, limit),
+            ).fetchall()
+        return [
+            {
+                "key": row[0],
+                "pmid": row[1],
+                "pmcid": row[2],
+                "doi": row[3],
+                "title": row[4],
+                "journal": row[5],
+                "year": row[6],
+                "has_full_text": bool(row[7]),
+                "full_text_source": row[7],
+                "snippet": row[8],
+                "score": round(row[9], 4),
+            }
+            for row in rows
+        ]
+
+    def count(self) -> int:
+        """Return the number of indexed papers."""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM papers").fetchone()[0]
+
+
+_corpus: LocalCorpus | None = None
+_corpus_lock = threading.Lock()
+
+
+def get_local_corpus() -> LocalCorpus | None:
+    """Return the configured corpus, or None when the local index is disabled."""
+    global _corpus
+    enabled = str(get_config_value("ARTL_LOCAL_CORPUS", "false")).lower()
+    if enabled not in ("1", "true", "yes"):
+        return None
+
+    db_path = get_config_value("ARTL_CORPUS_DB")
+    if not db_path:
+        from artl_mcp.utils.file_manager import file_manager
+
+        db_path = file_manager.output_dir / "artl_corpus.sqlite"
+    db_path = Path(db_path).expanduser()
+
+    with _corpus_lock:
+        if _corpus is None or _corpus.db_path != db_path:
+            try:
+                _corpus = LocalCorpus(db_path)
+            except sqlite3.Error as e:
+                logger.warning(f"Local corpus unavailable at {db_path}: {e}")
+                return None
+        return _corpus
@@ -0,0 +1,251 @@
+"""Prometheus/OpenMetrics export of the process-wide metrics registry.
+
+Long-running servers can expose the counters and duration histograms collected
+by ``artl_mcp.utils.instrumentation`` in two ways, both optional and both
+without third-party dependencies:
+
+- ARTL_METRICS_PORT: serve ``/metrics`` over HTTP on a side port (bound to
+  ARTL_METRICS_HOST, default 127.0.0.1) from a daemon thread.
+- ARTL_METRICS_TEXTFILE: rewrite a ``.prom`` file every ARTL_METRICS_INTERVAL
+  seconds (default 15) and at exit, for node_exporter's textfile collector.
+
+Counters are exported as ``artl_<name>_total`` and span durations as the
+``artl_span_duration_seconds`` histogram labelled by span name.
+"""
+
+import atexit
+import logging
+import os
+import re
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+from artl_mcp.utils.config_manager import get_config_value
+from artl_mcp.utils.instrumentation import (
+    DURATION_BUCKETS_MS,
+    MetricsRegistry,
+    metrics,
+)
+
+logger = logging.getLogger(__name__)
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+OPENMETRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+_INVALID_NAME_CHARS = re.compile(r"[^a-zA-Z0-9_]")
+
+
+def _metric_name(name: str) -> str:
+    return "artl_" + _INVALID_NAME_CHARS.sub("_", name)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(
+        f'{_INVALID_NAME_CHARS.sub("_", k)}="{_escape(v)}"'
+        for k, v in sorted(labels.items())
+    )
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def render_metrics(
+    registry: MetricsRegistry | None = None, openmetrics: bool = False
+) -> str:
+    """Render all metrics in the Prometheus text format.
+
+    Args:
+        registry: Registry to render (defaults to the process-wide one)
+        openmetrics: Produce OpenMetrics 1.0 output (counter family names
+            without ``_total`` and a trailing ``# EOF``) instead of the classic
+            Prometheus 0.0.4 text format
+
+    Returns:
+        The exposition text
+    """
+    series = (registry or metrics).series()
+    lines: list[str] = []
+
+    counters: dict[str, list[tuple[dict[str, str], float]]] = {}
+    for name, labels, value in series["counters"]:
+        counters.setdefault(_metric_name(name), []).append((labels, value))
+    for family, samples in counters.items():
+        lines.append(f"# TYPE {family if openmetrics else family + '_total'} counter")
+        for labels, value in samples:
+            lines.append(
+                f"{family}_total{_format_labels(labels)} {_format_value(value)}"
+            )
+
+    if series["timings"]:
+        family = "artl_span_duration_seconds"
+        lines.append(f"# HELP {family} Duration of instrumented spans.")
+        lines.append(f"# TYPE {family} histogram")
+        if openmetrics:
+            lines.append(f"# UNIT {family} seconds")
+        for name, labels, timing in series["timings"]:
+            labels = {**labels, "span": name}
+            cumulative = 0
+            for bound, n in zip(DURATION_BUCKETS_MS, timing["buckets"], strict=True):
+                cumulative += n
+                le = _format_value(bound / 1000)
+                lines.append(
+                    f"{family}_bucket{_format_labels({**labels, 'le': le})} "
+                    f"{cumulative}"
+                )
+            lines.append(
+                f"{family}_bucket{_format_labels({**labels, 'le': '+Inf'})} "
+                f"{timing['count']}"
+            )
+            lines.append(
+                f"{family}_sum{_format_labels(labels)} "
+                f"{_format_value(round(timing['total_ms'] / 1000, 6))}"
+            )
+            lines.append(f"{family}_count{_format_labels(labels)} {timing['count']}")
+
+    if openmetrics:
+        lines.append("# EOF")
+    return "\n".join(lines) + "\n"
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    registry: MetricsRegistry | None = None
+
+    def do_GET(self) -> None:  # noqa: N802 (http.server naming)
+        if self.path.split("?", 1)[0] not in ("/metrics", "/"):
+            self.send_error(404)
+            return
+        openmetrics = "application/openmetrics-text" in self.headers.get("Accept", "")
+        body = render_metrics(self.registry, openmetrics=openmetrics).encode()
+        self.send_response(200)
+        self.send_header(
+            "Content-Type",
+            OPENMETRICS_CONTENT_TYPE if openmetrics else PROMETHEUS_CONTENT_TYPE,
+        )
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.debug("metrics endpoint: " + format, *args)
+
+
+def start_metrics_server(
+    port: int, host: str = "127.0.0.1", registry: MetricsRegistry | None = None
+) -> ThreadingHTTPServer:
+    """Serve ``/metrics`` from a daemon thread.
+
+    Args:
+        port: Port to listen on (0 picks a free port, see server.server_port)
+        host: Interface to bind
+        registry: Registry to expose (defaults to the process-wide one)
+
+    Returns:
+        The running server; call shutdown() to stop it
+    """
+    handler = type("MetricsHandler", (_MetricsHandler,), {"registry": registry})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    thread = threading.Thread(
+        target=server.serve_forever, name="artl-metrics", daemon=True
+    )
+    thread.start()
+    logger.info(f"Serving metrics on http://{host}:{server.server_port}/metrics")
+    return server
+
+
+def write_metrics_textfile(
+    path: str | Path, registry: MetricsRegistry | None = None
+) -> Path:
+    """Atomically write the current metrics to a textfile.
+
+    The file is written next to its destination and renamed into place, so a
+    collector never reads a partial file.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(render_metrics(registry))
+        os.replace(tmp, path)
+    except OSError:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+    return path
+
+
+class TextfileWriter:
+    """Periodically dump metrics to a textfile from a daemon thread."""
+
+    def __init__(
+        self,
+        path: str | Path,
+        interval: float = 15.0,
+        registry: MetricsRegistry | None = None,
+    ):
+        self.path = Path(path)
+        self.interval = interval
+        self.registry = registry
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="artl-metrics-textfile", daemon=True
+        )
+
+    def start(self) -> "TextfileWriter":
+        self._thread.start()
+        return self
+
+    def write(self) -> None:
+        try:
+            write_metrics_textfile(self.path, self.registry)
+        except OSError as e:
+            logger.warning(f"Could not write metrics to {self.path}: {e}")
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.write()
+
+    def stop(self) -> None:
+        """Stop the thread and write a final dump."""
+        self._stop.set()
+        self.write()
+
+
+def start_metrics_exporter() -> dict[str, Any]:
+    """Start the exporters enabled by configuration.
+
+    Returns:
+        {"server": ThreadingHTTPServer | None, "textfile": TextfileWriter | None}
+    """
+    started: dict[str, Any] = {"server": None, "textfile": None}
+
+    port = get_config_value("ARTL_METRICS_PORT")
+    if port:
+        host = get_config_value("ARTL_METRICS_HOST", "127.0.0.1")
+        try:
+            started["server"] = start_metrics_server(int(port), host)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not start metrics endpoint on port {port}: {e}")
+
+    textfile = get_config_value("ARTL_METRICS_TEXTFILE")
+    if textfile:
+        try:
+            interval = float(get_config_value("ARTL_METRICS_INTERVAL", "15"))
+        except ValueError:
+            interval = 15.0
+        writer = TextfileWriter(textfile, interval).start()
+        atexit.register(writer.stop)
+        started["textfile"] = writer
+
+    return started
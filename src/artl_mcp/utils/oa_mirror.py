@@ -0,0 +1,322 @@
+"""Offline mirror of Europe PMC / PMC Open Access full text.
+
+Ingests bulk JATS XML archives (tar.gz packages of .xml/.nxml files, or
+gzipped <articles> bundles as distributed by Europe PMC) in a streaming
+fashion, converts every article to Markdown in worker processes with the same
+converter used by get_europepmc_full_text, and stores the result in a
+compressed SQLite database indexed by PMCID, PMID and DOI.
+
+Set ARTL_OA_MIRROR to the database path to make get_europepmc_full_text serve
+articles from the mirror before calling the live API.
+"""
+
+import gzip
+import json
+import logging
+import os
+import sqlite3
+import tarfile
+import threading
+import time
+import zlib
+from collections.abc import Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from pathlib import Path
+from typing import Any
+
+from artl_mcp.utils.config_manager import get_config_value
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS articles (
+        pmcid TEXT PRIMARY KEY,
+        pmid TEXT,
+        doi TEXT,
+        title TEXT,
+        markdown BLOB NOT NULL,
+        sections BLOB,
+        archive TEXT,
+        ingested_at REAL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS articles_pmid ON articles (pmid)",
+    "CREATE INDEX IF NOT EXISTS articles_doi ON articles (doi)",
+]
+
+_XML_SUFFIXES = (".xml", ".nxml", ".xml.gz", ".nxml.gz")
+
+
+class OAMirror:
+    """Compressed SQLite store of converted Open Access articles."""
+
+    def __init__(self, db_path: str | Path):
+        """Open (or create) the mirror database.
+
+        Args:
+            db_path: Path to the SQLite database file
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        for statement in _SCHEMA:
+            self._conn.execute(statement)
+        self._conn.commit()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> "OAMirror":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def add_many(self, articles: list[dict[str, Any]], archive: str) -> None:
+        """Store converted articles, replacing earlier copies of the same PMCID."""
+        rows = [
+            (
+                article["pmcid"],
+                article.get("pmid"),
+                article.get("doi"),
+                article.get("title"),
+                zlib.compress(article["markdown"].encode("utf-8")),
+                zlib.compress(json.dumps(article.get("sections", {})).encode("utf-8")),
+                archive,
+                time.time(),
+            )
+            for article in articles
+        ]
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO articles VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows
+            )
+            self._conn.commit()
+
+    def get(self, id_type: str, value: str) -> dict[str, Any] | None:
+        """Return a stored article by pmcid, pmid or doi, decompressed."""
+        if id_type not in ("pmcid", "pmid", "doi"):
+            return None
+        if id_type == "doi":
+            value = value.lower()
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT pmcid, pmid, doi, title, markdown, sections, archive "
+                f"FROM articles WHERE {id_type} = ?",
+                (value,),
+            ).fetchone()
+        if row is None:
+            return None
+        return {
+            "pmcid": row[0],
+            "pmid": row[1],
+            "doi": row[2],
+            "title": row[3],
+            "markdown": zlib.decompress(row[4]).decode("utf-8"),
+            "sections": json.loads(zlib.decompress(row[5])) if row[5] else {},
+            "archive": row[6],
+        }
+
+    def has(self, pmcid: str) -> bool:
+        """Check whether an article is already stored."""
+        with self._lock:
+            return (
+                self._conn.execute(
+                    "SELECT 1 FROM articles WHERE pmcid = ?", (pmcid,)
+                ).fetchone()
+                is not None
+            )
+
+    def count(self) -> int:
+        """Return the number of stored articles."""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+
+
+def _article_ids(article: Any) -> dict[str, str | None]:
+    """Extract PMCID, PMID and DOI from a JATS <article> element."""
+    ids: dict[str, str | None] = {"pmcid": None, "pmid": None, "doi": None}
+    for elem in article.iterfind(".//article-meta/article-id"):
+        id_type = elem.get("pub-id-type")
+        value = (elem.text or "").strip()
+        if not value:
+            continue
+        if id_type in ("pmc", "pmcid"):
+            ids["pmcid"] = value if value.upper().startswith("PMC") else f"PMC{value}"
+        elif id_type == "pmid":
+            ids["pmid"] = value
+        elif id_type == "doi":
+            ids["doi"] = value.lower()
+    return ids
+
+
+def convert_xml_document(xml_bytes: bytes) -> list[dict[str, Any]]:
+    """Convert one JATS document (an <article> or an <articles> bundle) to Markdown.
+
+    Runs in worker processes, so the heavy converter is imported lazily.
+
+    Returns:
+        One dict per article with identifiers, title, markdown and sections;
+        articles without a PMCID or without convertible content are skipped
+    """
+    from lxml import etree
+
+    from artl_mcp.tools import _convert_jats_xml_to_markdown
+
+    parser = etree.XMLParser(recover=True, huge_tree=True, resolve_entities=False)
+    root = etree.fromstring(xml_bytes, parser)
+    if root is None:
+        return []
+    articles = root.findall("article") if root.tag == "articles" else [root]
+
+    converted = []
+    for article in articles:
+        ids = _article_ids(article)
+        if not ids["pmcid"]:
+            continue
+        markdown, sections = _convert_jats_xml_to_markdown(
+            etree.tostring(article, encoding="unicode")
+        )
+        if not markdown:
+            continue
+        converted.append(
+            {
+                **ids,
+                "title": sections.get("title"),
+                "markdown": markdown,
+                "sections": sections,
+            }
+        )
+    return converted
+
+
+def iter_archive_documents(archive_path: str | Path) -> Iterator[tuple[str, bytes]]:
+    """Stream (member name, XML bytes) pairs from a bulk archive.
+
+    Tar archives are read sequentially without extracting to disk; a bare
+    .xml.gz file is yielded as a single document.
+    """
+    archive_path = Path(archive_path)
+    if tarfile.is_tarfile(archive_path):
+        with tarfile.open(archive_path, mode="r|*") as tar:
+            for member in tar:
+                if not member.isfile() or not member.name.endswith(_XML_SUFFIXES):
+                    continue
+                handle = tar.extractfile(member)
+                if handle is None:
+                    continue
+                data = handle.read()
+                if member.name.endswith(".gz"):
+                    data = gzip.decompress(data)
+                yield member.name, data
+    else:
+        with gzip.open(archive_path, "rb") as handle:
+            yield archive_path.name, handle.read()
+
+
+def ingest_archive(
+    archive_path: str | Path,
+    mirror: OAMirror,
+    workers: int | None = None,
+    max_pending: int | None = None,
+) -> dict[str, Any]:
+    """Convert every article in a bulk archive and store it in the mirror.
+
+    Documents are read one at a time and converted in a process pool; at most
+    ``max_pending`` documents are in flight, so memory use does not grow with
+    archive size.
+
+    Args:
+        archive_path: Path to a .tar.gz package or a gzipped <articles> bundle
+        mirror: Destination mirror
+        workers: Worker processes (None = CPU count, 0 = convert in-process)
+        max_pending: Maximum documents queued for conversion (default 4 per worker)
+
+    Returns:
+        Ingestion statistics:
+        {
+            "archive": "oa_comm_xml.PMC000xxxxxx.baseline.2024-06-18.tar.gz",
+            "documents": 1200,       # XML documents read
+            "articles": 1200,        # Articles converted and stored
+            "failed": 0,             # Documents that could not be converted
+            "elapsed": 42.1,
+        }
+    """
+    archive_name = Path(archive_path).name
+    start = time.monotonic()
+    stats = {"archive": archive_name, "documents": 0, "articles": 0, "failed": 0}
+
+    def _store(articles: list[dict[str, Any]]) -> None:
+        if articles:
+            mirror.add_many(articles, archive_name)
+            stats["articles"] += len(articles)
+
+    if workers == 0:
+        for name, data in iter_archive_documents(archive_path):
+            stats["documents"] += 1
+            try:
+                _store(convert_xml_document(data))
+            except Exception as e:
+                logger.warning(f"Failed to convert {name}: {e}")
+                stats["failed"] += 1
+    else:
+        workers = workers or os.cpu_count() or 1
+        limit = max_pending or 4 * workers
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            in_flight: dict[Future, str] = {}
+
+            def _drain(done: set[Future]) -> None:
+                for future in done:
+                    name = in_flight.pop(future)
+                    try:
+                        _store(future.result())
+                    except Exception as e:
+                        logger.warning(f"Failed to convert {name}: {e}")
+                        stats["failed"] += 1
+
+            for name, data in iter_archive_documents(archive_path):
+                stats["documents"] += 1
+                in_flight[executor.submit(convert_xml_document, data)] = name
+                if len(in_flight) >= limit:
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    _drain(done)
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                _drain(done)
+
+    stats["elapsed"] = round(time.monotonic() - start, 3)
+    logger.info(
+        f"Ingested {stats['articles']} articles from {archive_name} "
+        f"in {stats['elapsed']}s"
+    )
+    return stats
+
+
+_mirror: OAMirror | None = None
+_mirror_lock = threading.Lock()
+
+
+def get_oa_mirror() -> OAMirror | None:
+    """Return the mirror configured with ARTL_OA_MIRROR, or None."""
+    global _mirror
+    db_path = get_config_value("ARTL_OA_MIRROR")
+    if not db_path:
+        return None
+    db_path = Path(db_path).expanduser()
+    if not db_path.exists():
+        logger.warning(f"ARTL_OA_MIRROR points to a missing database: {db_path}")
+        return None
+
+    with _mirror_lock:
+        if _mirror is None or _mirror.db_path != db_path:
+            try:
+                _mirror = OAMirror(db_path)
+            except sqlite3.Error as e:
+                logger.warning(f"Local mirror unavailable at {db_path}: {e}")
+                return None
+        return _mirror
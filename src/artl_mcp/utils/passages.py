@@ -0,0 +1,257 @@
+"""Structure-aware chunking and in-document passage retrieval.
+
+Splits converted Markdown into chunks on section and paragraph boundaries,
+keeping each chunk's heading path and character span, and ranks chunks against
+a question with a small pure-Python BM25 implementation. Chunk indexes are
+cached per document so repeated questions about the same paper are cheap.
+"""
+
+import hashlib
+import math
+import re
+from collections import Counter
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+from artl_mcp.utils.cache import TTLCache
+
+_HEADING = re.compile(r"^(#{1,6})\s+(.*?)\s*#*\s*$")
+_TOKEN = re.compile(r"\w+", re.UNICODE)
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+# Very common English words that carry no ranking signal
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or that the "
+    "these this to was were what when which with".split()
+)
+
+
+class Chunk(BaseModel):
+    """A contiguous span of a Markdown document."""
+
+    index: int = Field(..., description="Position of the chunk in the document")
+    text: str = Field(..., description="Chunk text without headings")
+    section_path: list[str] = Field(..., description="Enclosing section headings")
+    start: int = Field(..., description="Start character offset in the document")
+    end: int = Field(..., description="End character offset in the document")
+
+    @property
+    def token_count(self) -> int:
+        """Approximate token count (word and punctuation pieces)."""
+        return len(re.findall(r"\w+|[^\w\s]", self.text))
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "chunk_index": self.index,
+            "text": self.text,
+            "section_path": self.section_path,
+            "start": self.start,
+            "end": self.end,
+        }
+
+
+def tokenize(text: str) -> list[str]:
+    """Lower-case word tokens without stopwords."""
+    return [
+        token
+        for token in _TOKEN.findall(text.lower())
+        if token not in _STOPWORDS and len(token) > 1
+    ]
+
+
+def _split_long(text: str, start: int, max_chars: int) -> list[tuple[int, int]]:
+    """Split an oversized paragraph into spans at sentence boundaries."""
+    spans = []
+    span_start = 0
+    last_break = 0
+    for match in _SENTENCE_END.finditer(text):
+        if match.start() - span_start > max_chars and last_break > span_start:
+            spans.append((start + span_start, start + last_break))
+            span_start = last_break
+        last_break = match.end()
+    while len(text) - span_start > max_chars:
+        cut = text.rfind(" ", span_start, span_start + max_chars)
+        cut = cut if cut > span_start else span_start + max_chars
+        spans.append((start + span_start, start + cut))
+        span_start = cut
+    spans.append((start + span_start, start + len(text)))
+    return spans
+
+
+def chunk_markdown(markdown: str, max_chars: int = 1500) -> list[Chunk]:
+    """Split Markdown into chunks that never cross a section boundary.
+
+    Consecutive paragraphs of one section are packed together up to max_chars;
+    paragraphs longer than that are split at sentence boundaries. Headings are
+    not part of chunk text; they are recorded in each chunk's section_path.
+
+    Args:
+        markdown: Markdown document
+        max_chars: Target maximum chunk size in characters
+
+    Returns:
+        Chunks in document order; ``markdown[chunk.start:chunk.end]`` is the
+        chunk's exact source text
+    """
+    headings: list[str] = []
+    spans: list[tuple[list[str], int, int]] = []
+    pos = 0
+    para_start: int | None = None
+
+    def close_paragraph(end: int) -> None:
+        nonlocal para_start
+        if para_start is not None:
+            spans.append((list(headings), para_start, end))
+            para_start = None
+
+    for line in markdown.splitlines(keepends=True):
+        stripped = line.strip()
+        heading = _HEADING.match(stripped)
+        if heading:
+            close_paragraph(pos)
+            level = len(heading.group(1))
+            del headings[level - 1 :]
+            headings.extend([""] * (level - 1 - len(headings)))
+            headings.append(heading.group(2))
+        elif not stripped:
+            close_paragraph(pos)
+        elif para_start is None:
+            para_start = pos + (len(line) - len(line.lstrip()))
+        pos += len(line)
+    close_paragraph(len(markdown.rstrip()))
+
+    chunks: list[Chunk] = []
+    current: tuple[list[str], int, int] | None = None
+
+    def emit(path: list[str], start: int, end: int) -> None:
+        segment = markdown[start:end]
+        text = segment.strip()
+        if text:
+            start += len(segment) - len(segment.lstrip())
+            end = start + len(text)
+            section_path = [h for h in path if h]
+            chunks.append(
+                Chunk(
+                    index=len(chunks),
+                    text=text,
+                    section_path=section_path,
+                    start=start,
+                    end=end,
+                )
+            )
+
+    for path, start, end in spans:
+        end = start + len(markdown[start:end].rstrip())
+        if end - start > max_chars:
+            if current:
+                emit(*current)
+                current = None
+            for piece_start, piece_end in _split_long(
+                markdown[start:end], start, max_chars
+            ):
+                emit(path, piece_start, piece_end)
+            continue
+        if current and current[0] == path and end - current[1] <= max_chars:
+            current = (path, current[1], end)
+        else:
+            if current:
+                emit(*current)
+            current = (path, start, end)
+    if current:
+        emit(*current)
+    return chunks
+
+
+class BM25Index:
+    """Okapi BM25 ranking over a fixed list of chunks."""
+
+    def __init__(self, chunks: list[Chunk], k1: float = 1.5, b: float = 0.75):
+        """Build term statistics for the chunks.
+
+        Args:
+            chunks: Chunks to rank
+            k1: Term frequency saturation
+            b: Length normalization strength
+        """
+        self.chunks = chunks
+        self.k1 = k1
+        self.b = b
+        self._term_freqs: list[Counter] = []
+        self._doc_freq: Counter = Counter()
+        for chunk in chunks:
+            # Section headings count toward a chunk's terms
+            freqs = Counter(tokenize(" ".join(chunk.section_path) + " " + chunk.text))
+            self._term_freqs.append(freqs)
+            self._doc_freq.update(freqs.keys())
+        total = sum(sum(freqs.values()) for freqs in self._term_freqs)
+        self._avg_len = total / len(chunks) if chunks else 0.0
+
+    def search(self, query: str, top_k: int = 5) -> list[tuple[Chunk, float]]:
+        """Return the top_k chunks with positive scores, best first."""
+        terms = tokenize(query)
+        if not terms or not self.chunks:
+            return []
+        n = len(self.chunks)
+        scored = []
+        for chunk, freqs in zip(self.chunks, self._term_freqs, strict=True):
+            length = sum(freqs.values())
+            score = 0.0
+            for term in terms:
+                tf = freqs.get(term, 0)
+                if not tf:
+                    continue
+                df = self._doc_freq[term]
+                idf = math.log(1 + (n - df + 0.5) / (df + 0.5))
+                norm = self.k1 * (1 - self.b + self.b * length / (self._avg_len or 1))
+                score += idf * tf * (self.k1 + 1) / (tf + norm)
+            if score > 0:
+                scored.append((chunk, score))
+        scored.sort(key=lambda item: item[1], reverse=True)
+        return scored[:top_k]
+
+
+# Chunk indexes keyed by document content hash and chunk size
+_index_cache = TTLCache(maxsize=64, ttl=3600)
+
+
+def get_passage_index(markdown: str, max_chars: int = 1500) -> tuple[BM25Index, bool]:
+    """Return the BM25 index for a document, building it on first use.
+
+    Returns:
+        Tuple of (index, whether it came from the cache)
+    """
+    key = (hashlib.sha1(markdown.encode("utf-8")).hexdigest(), max_chars)
+    index = _index_cache.get(key)
+    if index is not None:
+        return index, True
+    index = BM25Index(chunk_markdown(markdown, max_chars=max_chars))
+    _index_cache.set(key, index)
+    return index, False
+
+
+def rank_passages(
+    markdown: str, query: str, top_k: int = 5, max_chars: int = 1500
+) -> dict[str, Any]:
+    """Find the passages of a document most relevant to a question.
+
+    Args:
+        markdown: Converted document
+        query: Question or keywords
+        top_k: Number of passages to return
+        max_chars: Target maximum passage size in characters
+
+    Returns:
+        Dictionary with "passages" (best first, each with text, section_path,
+        start, end, chunk_index and score), "chunks_total" and "index_cached"
+    """
+    index, cached = get_passage_index(markdown, max_chars=max_chars)
+    passages = [
+        {**chunk.to_dict(), "score": round(score, 4)}
+        for chunk, score in index.search(query, top_k=top_k)
+    ]
+    return {
+        "passages": passages,
+        "chunks_total": len(index.chunks),
+        "index_cached": cached,
+    }
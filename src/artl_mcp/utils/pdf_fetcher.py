@@ -2,6 +2,7 @@ import requests
 from pdfminer.high_level import extract_text
 from pdfminer.pdfparser import PDFSyntaxError
 
+from artl_mcp.utils import http
 from artl_mcp.utils.file_manager import file_manager
 
 
@@ -10,7 +11,7 @@ def extract_text_from_pdf(pdf_url: str) -> str:
     Download and extract text from a PDF given its URL, using FileManager temp files.
     """
     try:
-        response = requests.get(pdf_url)
+        response = http.get(pdf_url)
         if response.status_code != 200:
             return "Error: Unable to retrieve PDF."
     except (
@@ -0,0 +1,171 @@
+"""Opt-in cProfile capture for expensive conversion stages.
+
+With ARTL_PROFILE=true (or ``profile=True`` on the full text and PDF tools),
+the XML and PDF conversion stages run under cProfile and each call's profile
+is written to ARTL_PROFILE_DIR (default ``profiles`` in the output directory)
+as ``<identifier>_<stage>_<timestamp>.prof``. The path is added to the stage's
+span attributes, so a slow call in a trace leads straight to its profile.
+
+Profiles load with the standard tools (``python -m pstats``, snakeviz), and
+``summarize_profiles`` / ``artl-cli profile-summary`` aggregate many of them
+into the slowest functions overall.
+"""
+
+import cProfile
+import logging
+import pstats
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+from artl_mcp.utils.config_manager import get_config_value
+
+logger = logging.getLogger(__name__)
+
+SORT_KEYS = ("cumulative", "tottime", "calls")
+
+
+def profiling_enabled(override: bool | None = None) -> bool:
+    """Whether conversion stages should be profiled.
+
+    Args:
+        override: Per-call setting (e.g. a tool's profile parameter); True
+            forces profiling on, None defers to ARTL_PROFILE
+    """
+    if override:
+        return True
+    value = str(get_config_value("ARTL_PROFILE", "false")).lower()
+    return value in ("1", "true", "yes")
+
+
+def get_profile_dir() -> Path:
+    """Return the directory profiles are written to."""
+    path = get_config_value("ARTL_PROFILE_DIR")
+    if path:
+        return Path(path).expanduser()
+    from artl_mcp.utils.file_manager import file_manager
+
+    return file_manager.output_dir / "profiles"
+
+
+def profile_path(
+    identifier: str, stage: str, directory: str | Path | None = None
+) -> Path:
+    """Build a unique, filesystem-safe path for one call's profile.
+
+    Args:
+        identifier: Paper the profile belongs to
+        stage: Conversion stage, e.g. "pdf"
+        directory: Directory to write to; defaults to get_profile_dir()
+    """
+    from artl_mcp.utils.file_manager import file_manager
+
+    stamp = time.strftime("%Y%m%d_%H%M%S") + f"_{time.time_ns() % 1_000_000:06d}"
+    name = file_manager.sanitize_filename(f"{identifier}_{stage}_{stamp}.prof")
+    return (Path(directory) if directory else get_profile_dir()) / name
+
+
+@contextmanager
+def profiled(
+    identifier: str,
+    stage: str,
+    enabled: bool | None = None,
+    directory: str | Path | None = None,
+) -> Iterator[dict[str, Any]]:
+    """Profile a block with cProfile when profiling is enabled.
+
+    The yielded dict gets a "profile" key with the written path once the block
+    finishes. Profiling problems are logged and never fail the call. Only
+    this thread is profiled, so a stage handed to a worker process by run_cpu
+    must be profiled inside the stage; resolve the setting and directory in
+    the caller and pass them along.
+
+    Examples:
+        >>> with span("convert") as attrs, profiled("PMC123", "pdf") as info:
+        ...     convert()
+    """
+    info: dict[str, Any] = {}
+    if not profiling_enabled(enabled):
+        yield info
+        return
+
+    profiler = cProfile.Profile()
+    try:
+        profiler.enable()
+    except ValueError as e:  # another profiler is already active in this thread
+        logger.warning(f"Not profiling {stage} for {identifier}: {e}")
+        yield info
+        return
+
+    try:
+        yield info
+    finally:
+        profiler.disable()
+        path = profile_path(identifier, stage, directory)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            profiler.dump_stats(path)
+            info["profile"] = str(path)
+            logger.info(f"Wrote {stage} profile for {identifier} to {path}")
+        except OSError as e:
+            logger.warning(f"Could not write profile {path}: {e}")
+
+
+def find_profiles(directory: str | Path | None = None, match: str = "") -> list[Path]:
+    """Return the .prof files in a directory whose names contain match."""
+    directory = Path(directory) if directory else get_profile_dir()
+    if not directory.is_dir():
+        return []
+    return sorted(p for p in directory.glob("*.prof") if match in p.name)
+
+
+def summarize_profiles(
+    paths: list[Path], limit: int = 20, sort: str = "cumulative"
+) -> dict[str, Any]:
+    """Aggregate profiles and return the slowest functions.
+
+    Args:
+        paths: Profile files to combine
+        limit: Number of functions to return
+        sort: "cumulative" (time including callees), "tottime" (own time) or
+            "calls"
+
+    Returns:
+        {"profiles": n, "total_s": ..., "functions": [...]} with one entry per
+        function: location, call count, own and cumulative seconds, and the
+        number of profiles it appears in
+    """
+    if sort not in SORT_KEYS:
+        raise ValueError(f"sort must be one of {', '.join(SORT_KEYS)}")
+    if not paths:
+        return {"profiles": 0, "total_s": 0.0, "functions": []}
+
+    stats = pstats.Stats(str(paths[0]))
+    appearances: dict[tuple[str, int, str], int] = {}
+    for path in paths[1:]:
+        stats.add(str(path))
+    for path in paths:
+        for func in pstats.Stats(str(path)).stats:  # type: ignore[attr-defined]
+            appearances[func] = appearances.get(func, 0) + 1
+
+    functions = []
+    for func, (_, ncalls, tottime, cumtime, _) in stats.stats.items():  # type: ignore[attr-defined]
+        filename, line, name = func
+        functions.append(
+            {
+                "function": f"{filename}:{line}({name})",
+                "calls": ncalls,
+                "tottime_s": round(tottime, 6),
+                "cumtime_s": round(cumtime, 6),
+                "profiles": appearances.get(func, 0),
+            }
+        )
+    key = {"cumulative": "cumtime_s", "tottime": "tottime_s", "calls": "calls"}[sort]
+    functions.sort(key=lambda row: row[key], reverse=True)
+    return {
+        "profiles": len(paths),
+        "total_s": round(stats.total_tt, 6),  # type: ignore[attr-defined]
+        "functions": functions[:limit],
+    }
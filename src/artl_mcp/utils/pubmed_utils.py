@@ -6,6 +6,7 @@ import re
 import requests
 from bs4 import BeautifulSoup
 
+from artl_mcp.utils import http
 from artl_mcp.utils.conversion_utils import IdentifierConverter
 from artl_mcp.utils.doi_fetcher import DOIFetcher
 from artl_mcp.utils.email_manager import get_email
@@ -271,7 +272,7 @@ def get_full_text_from_bioc(pmid: str) -> str:
         The full text of the article if available, otherwise an empty string.
 
     """
-    response = requests.get(BIOC_URL.format(pmid=pmid))
+    response = http.get(BIOC_URL.format(pmid=pmid))
 
     if response.status_code != 200:
         return ""  # Return empty string if request fails
@@ -311,7 +312,7 @@ def get_abstract_from_pubmed(pmid: str) -> str:
         string if the article cannot be retrieved.
 
     """
-    response = requests.get(EFETCH_URL.format(pmid=pmid))
+    response = http.get(EFETCH_URL.format(pmid=pmid))
 
     if response.status_code != 200:
         return ""
@@ -372,7 +373,7 @@ def list_pmcid_supplemental_material(pmcid: str | int) -> str:
 
     try:
         url = SUPPMAT_JSON_URL.format(pmcid=normalized_pmcid, idx="list")
-        response = requests.get(url)
+        response = http.get(url)
         if response.status_code != 200:
             return "Error: Unable to list Supplemental Material."
     except (
@@ -431,7 +432,7 @@ def get_pmc_supplemental_material(
     try:
         idx_or_all = idx if idx is not None else "all"
         url = SUPPMAT_JSON_URL.format(pmcid=normalized_pmcid, idx=idx_or_all)
-        response = requests.get(url)
+        response = http.get(url)
         if response.status_code != 200:
             return "Error: Unable to retrieve file."
     except (
@@ -0,0 +1,171 @@
+"""Concurrent racing of interchangeable data sources.
+
+Provides a small engine that runs several fetchers for the same piece of data at
+once and returns the most preferred result that arrives before a deadline.
+Each fetcher runs in its own deadline scope, so losing and timed-out fetchers
+are cancelled at their next HTTP request or checkpoint.
+"""
+
+import logging
+import time
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any
+
+from artl_mcp.utils.deadline import Deadline, current_deadline, use_deadline
+from artl_mcp.utils.instrumentation import bind_context
+from artl_mcp.utils.scheduler import SchedulerBusy
+
+logger = logging.getLogger(__name__)
+
+
+def race_by_preference(
+    fetchers: dict[str, Callable[[], Any]],
+    preference: list[str],
+    deadline: float,
+    is_usable: Callable[[Any], bool] = bool,
+) -> dict[str, Any]:
+    """Run fetchers concurrently and return the best result available in time.
+
+    A result from a source is returned as soon as every source ranked above it in
+    ``preference`` has finished without a usable result. When the deadline passes,
+    the best usable result received so far is returned. Sources still pending are
+    cancelled: their deadline scopes are cancelled, so they stop before their
+    next request, and requests already in flight are abandoned. The race never
+    outlasts the deadline of the calling tool.
+
+    Args:
+        fetchers: Mapping of source name to a zero-argument fetch function
+        preference: Source names from best to worst quality
+        deadline: Maximum seconds to wait for results
+        is_usable: Predicate deciding whether a fetcher result counts as a hit.
+            A fetcher raising SchedulerBusy is reported as "busy", not "failed".
+
+    Returns:
+        Dictionary with the winning source and its result:
+        {
+            "source": "europepmc_xml",      # Winning source (None if no hit)
+            "result": {...},                # Winning fetcher's return value
+            "statuses": {                   # Outcome per source
+                "europepmc_xml": "won",
+                "bioc": "cancelled",
+            },
+            "durations": {"europepmc_xml": 0.84},  # Seconds for finished sources
+            "elapsed": 0.85,
+            "deadline_exceeded": False,
+        }
+
+    Examples:
+        >>> race_by_preference(
+        ...     {"slow": lambda: "a", "fast": lambda: "b"},
+        ...     preference=["slow", "fast"],
+        ...     deadline=5,
+        ... )["source"]
+        'slow'
+    """
+    ranked = [name for name in preference if name in fetchers]
+    start = time.monotonic()
+    outer = current_deadline()
+    if outer is not None and (left := outer.remaining()) is not None:
+        deadline = min(deadline, left)
+    statuses: dict[str, str] = {}
+    durations: dict[str, float] = {}
+    results: dict[str, Any] = {}
+
+    if not ranked:
+        return {
+            "source": None,
+            "result": None,
+            "statuses": statuses,
+            "durations": durations,
+            "elapsed": 0.0,
+            "deadline_exceeded": False,
+        }
+
+    scopes = {name: Deadline(deadline, parent=outer) for name in ranked}
+
+    # Written by the workers; only read for futures already done, so sources
+    # still running after the race never change what was returned
+    finished: dict[str, float] = {}
+
+    def _timed(name: str) -> Any:
+        try:
+            with use_deadline(scopes[name]):
+                return fetchers[name]()
+        finally:
+            finished[name] = round(time.monotonic() - start, 3)
+
+    executor = ThreadPoolExecutor(
+        max_workers=len(ranked), thread_name_prefix="artl-race"
+    )
+    futures: dict[Future, str] = {
+        executor.submit(bind_context(_timed), name): name for name in ranked
+    }
+    pending = set(futures)
+    winner: str | None = None
+    deadline_exceeded = False
+
+    try:
+        while pending:
+            remaining = deadline - (time.monotonic() - start)
+            if remaining <= 0:
+                deadline_exceeded = True
+                break
+
+            done, pending = wait(
+                pending, timeout=remaining, return_when=FIRST_COMPLETED
+            )
+            for future in done:
+                name = futures[future]
+                durations[name] = finished[name]
+                try:
+                    result = future.result()
+                except SchedulerBusy as e:
+                    logger.info(f"Source {name} busy: {e}")
+                    statuses[name] = "busy"
+                    continue
+                except Exception as e:
+                    logger.info(f"Source {name} failed: {e}")
+                    statuses[name] = "failed"
+                    continue
+                if is_usable(result):
+                    results[name] = result
+                    statuses[name] = "ok"
+                else:
+                    statuses[name] = "empty"
+
+            # Stop once the best finished source outranks everything still running
+            for name in ranked:
+                if name in results:
+                    winner = name
+                    break
+                if name not in statuses:
+                    break
+            if winner:
+                break
+
+        if winner is None and results:
+            winner = next(name for name in ranked if name in results)
+    finally:
+        for future in pending:
+            future.cancel()
+            scopes[futures[future]].cancel()
+            statuses.setdefault(
+                futures[future], "timeout" if deadline_exceeded else "cancelled"
+            )
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    for name in results:
+        if name != winner:
+            statuses[name] = "outranked"
+    if winner:
+        statuses[winner] = "won"
+
+    return {
+        "source": winner,
+        "result": results.get(winner) if winner else None,
+        "statuses": {name: statuses[name] for name in ranked},
+        "durations": durations,
+        "elapsed": round(time.monotonic() - start, 3),
+        "deadline_exceeded": deadline_exceeded,
+    }
@@ -0,0 +1,68 @@
+"""Client-side rate limiting for upstream APIs.
+
+Some services (Semantic Scholar in particular) throttle by request rate rather
+than by volume. A RateLimiter spaces requests from all threads of the process
+at least ``min_interval`` seconds apart, and ``retry_after_seconds`` reads the
+server's Retry-After header when a request is throttled anyway.
+"""
+
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+from artl_mcp.utils.deadline import sleep
+
+
+class RateLimiter:
+    """Thread-safe minimum spacing between consecutive requests."""
+
+    def __init__(self, min_interval: float):
+        """Create a limiter.
+
+        Args:
+            min_interval: Minimum seconds between requests; 0 disables limiting
+        """
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def wait(self) -> float:
+        """Block until the next request may be sent.
+
+        Returns:
+            Seconds spent waiting
+
+        Raises:
+            DeadlineExceeded: If the calling tool runs out of time while waiting
+        """
+        if self.min_interval <= 0:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.min_interval
+        delay = slot - now
+        if delay > 0:
+            sleep(delay)
+        return delay
+
+    def backoff(self, seconds: float) -> None:
+        """Push the next free slot back, e.g. after a 429 response."""
+        with self._lock:
+            self._next_slot = max(self._next_slot, time.monotonic() + seconds)
+
+
+def retry_after_seconds(response: Any, default: float) -> float:
+    """Return the delay requested by a Retry-After header, or default."""
+    value = response.headers.get("Retry-After") if response is not None else None
+    if not value:
+        return default
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return default
@@ -0,0 +1,341 @@
+"""Admission control for CPU-heavy tools.
+
+PDF conversion burns a core for seconds to minutes, while metadata lookups
+mostly wait on the network. Left alone, a handful of concurrent conversions
+saturate the machine and every cheap lookup slows down with them. Tools marked
+with ``@cpu_heavy`` therefore go through one scheduler:
+
+- At most ARTL_CPU_WORKERS conversions run at once (default: CPU count - 1,
+  at most 4). The conversion stage itself is submitted with ``run_cpu``.
+- Up to ARTL_CPU_QUEUE_DEPTH further conversion stages wait for a slot
+  (default: twice the workers). Only calls that have reached ``run_cpu`` count;
+  calls still downloading their input do not hold a place.
+- Beyond that, calls are rejected with a ``busy`` result carrying a
+  ``retry_after`` estimate in seconds, instead of piling up. A call arriving
+  while the queue is already full is rejected before it downloads anything.
+
+By default (ARTL_CPU_EXECUTOR=process) the conversion stage runs in a pool of
+worker processes, so it does not compete with request handling for the GIL.
+``inline`` runs it in the calling thread and only bounds concurrency. A stage
+in a worker process records its spans and metrics there and the caller merges
+them into its own trace, so both executors report the same spans. Stages that
+want a cProfile profile must start it themselves, inside the stage, since only
+that process sees the work.
+
+Waiting for a slot or for a worker process gives up when the calling tool's
+deadline passes or the call is cancelled. The stage itself runs under the time
+that was left when it started and stops at its own ``check_deadline()``
+checkpoints; a worker process does not see later cancellation, so a cancelled
+stage is left to finish and its result discarded. It keeps its slot and its
+place in the queue until then, so abandoned stages still count against the
+limits.
+"""
+
+import atexit
+import functools
+import logging
+import math
+import multiprocessing
+import os
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, TypeVar
+
+from artl_mcp.utils.config_manager import get_config_value
+from artl_mcp.utils.deadline import (
+    POLL_INTERVAL,
+    DeadlineExceeded,
+    check_deadline,
+    deadline_scope,
+    remaining,
+)
+from artl_mcp.utils.instrumentation import (
+    collect_trace,
+    count,
+    merge_trace_record,
+    metrics,
+    trace_record,
+)
+
+logger = logging.getLogger(__name__)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+EXECUTORS = ("inline", "process")
+
+# Names of tools decorated with @cpu_heavy; everything else is I/O-light
+CPU_HEAVY_TOOLS: set[str] = set()
+
+
+class SchedulerBusy(Exception):
+    """Raised when the CPU queue is full."""
+
+    def __init__(self, retry_after: int):
+        super().__init__(f"CPU queue full; retry after {retry_after}s")
+        self.retry_after = retry_after
+
+
+def _run_in_worker(
+    fn: Callable[..., Any], args: tuple[Any, ...], time_left: float | None
+) -> dict[str, Any]:
+    """Run a stage in a worker process and return what it recorded.
+
+    The stage runs under the caller's remaining time. Its spans, counters and
+    metrics come back with the result (or the exception it raised) for the
+    caller to merge.
+    """
+    metrics.reset()
+    with collect_trace(fn.__name__) as trace, deadline_scope(time_left):
+        try:
+            outcome: dict[str, Any] = {"result": fn(*args)}
+        except Exception as e:
+            outcome = {"error": e}
+    return {**outcome, "trace": trace_record(trace), "metrics": metrics.series()}
+
+
+class CpuScheduler:
+    """Bounded admission and execution of CPU-heavy work."""
+
+    def __init__(
+        self, workers: int = 2, queue_depth: int = 4, executor: str = "process"
+    ):
+        """Create a scheduler.
+
+        Args:
+            workers: CPU stages running at once
+            queue_depth: Admitted calls allowed to wait for a worker
+            executor: "inline" (calling thread) or "process" (process pool)
+        """
+        self.workers = max(workers, 1)
+        self.queue_depth = max(queue_depth, 0)
+        self.executor = executor if executor in EXECUTORS else "inline"
+        self._admitted = 0
+        self._admission_lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(self.workers)
+        self._pool: ProcessPoolExecutor | None = None
+        self._pool_lock = threading.Lock()
+        # Running average of CPU stage durations, for retry_after estimates
+        self._avg_seconds = 5.0
+
+    @property
+    def capacity(self) -> int:
+        """Calls that can be admitted at once (running plus queued)."""
+        return self.workers + self.queue_depth
+
+    def retry_after(self) -> int:
+        """Estimate seconds until a slot frees up."""
+        with self._admission_lock:
+            waiting = max(self._admitted - self.workers + 1, 1)
+        seconds = self._avg_seconds * waiting / self.workers
+        return min(max(math.ceil(seconds), 1), 300)
+
+    def check_capacity(self) -> None:
+        """Raise SchedulerBusy if admit() would fail now, without reserving."""
+        with self._admission_lock:
+            if self._admitted < self.capacity:
+                return
+        count("scheduler.rejected")
+        raise SchedulerBusy(self.retry_after())
+
+    def admit(self) -> None:
+        """Reserve a place for one call; raise SchedulerBusy when full."""
+        with self._admission_lock:
+            if self._admitted < self.capacity:
+                self._admitted += 1
+                return
+        count("scheduler.rejected")
+        raise SchedulerBusy(self.retry_after())
+
+    def release(self) -> None:
+        """Give back a place reserved with admit()."""
+        with self._admission_lock:
+            self._admitted = max(self._admitted - 1, 0)
+
+    def stats(self) -> dict[str, Any]:
+        with self._admission_lock:
+            admitted = self._admitted
+        return {
+            "workers": self.workers,
+            "queue_depth": self.queue_depth,
+            "executor": self.executor,
+            "admitted": admitted,
+            "avg_seconds": round(self._avg_seconds, 3),
+        }
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._pool_lock:
+            if self._pool is None:
+                # spawn: forking a process that runs threads can deadlock
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._pool
+
+    def _acquire_slot(self) -> None:
+        """Wait for a worker slot unless the calling tool runs out of time."""
+        while not self._slots.acquire(timeout=POLL_INTERVAL):
+            check_deadline()
+        try:
+            check_deadline()
+        except DeadlineExceeded:
+            self._slots.release()
+            raise
+
+    @staticmethod
+    def _result(future: Future) -> Any:
+        """Wait for a worker process unless the calling tool runs out of time."""
+        while True:
+            try:
+                return future.result(timeout=POLL_INTERVAL)
+            except TimeoutError:
+                try:
+                    check_deadline()
+                except DeadlineExceeded:
+                    future.cancel()
+                    raise
+
+    def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Admit a CPU stage and run it once a worker slot is free.
+
+        In process mode, fn and its arguments must be picklable (module-level
+        function, plain data). A broken pool is replaced and the stage is run
+        in the calling thread instead.
+
+        Raises:
+            SchedulerBusy: If the running and queued stages are at capacity
+            DeadlineExceeded: If the call is cancelled or out of time while
+                waiting for a slot or a worker process
+        """
+        self.admit()
+        wait_start = time.perf_counter()
+        try:
+            self._acquire_slot()
+        except BaseException:
+            self.release()
+            raise
+        metrics.observe(
+            "scheduler.queue_wait", (time.perf_counter() - wait_start) * 1000
+        )
+        start = time.perf_counter()
+        future: Future | None = None
+        try:
+            if self.executor == "process":
+                try:
+                    future = self._get_pool().submit(
+                        _run_in_worker, fn, args, remaining()
+                    )
+                    outcome = self._result(future)
+                    metrics.merge(outcome["metrics"])
+                    merge_trace_record(outcome["trace"])
+                    if "error" in outcome:
+                        raise outcome["error"]
+                    return outcome["result"]
+                except BrokenProcessPool as e:
+                    future = None
+                    logger.warning(f"CPU worker pool failed, running inline: {e}")
+                    with self._pool_lock:
+                        self._pool = None
+            return fn(*args)
+        finally:
+            elapsed = time.perf_counter() - start
+            self._avg_seconds = 0.8 * self._avg_seconds + 0.2 * elapsed
+            if future is not None and not future.done():
+                # Abandoned while a worker process is still on it: the slot and
+                # the admission stay taken until that worker is free again
+                future.add_done_callback(lambda _: self._free_slot())
+            else:
+                self._free_slot()
+
+    def _free_slot(self) -> None:
+        self._slots.release()
+        self.release()
+
+    def shutdown(self) -> None:
+        """Stop the worker processes, if any were started."""
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+                self._pool = None
+
+
+def _int_config(key: str, default: int) -> int:
+    try:
+        return int(get_config_value(key, default))
+    except (TypeError, ValueError):
+        logger.warning(f"Ignoring invalid {key} value")
+        return default
+
+
+_scheduler: tuple[tuple[Any, ...], CpuScheduler] | None = None
+_scheduler_lock = threading.Lock()
+
+
+def get_cpu_scheduler() -> CpuScheduler:
+    """Return the process-wide scheduler for the current configuration."""
+    global _scheduler
+    default_workers = max(1, min(4, (os.cpu_count() or 2) - 1))
+    workers = _int_config("ARTL_CPU_WORKERS", default_workers)
+    config = (
+        workers,
+        _int_config("ARTL_CPU_QUEUE_DEPTH", workers * 2),
+        str(get_config_value("ARTL_CPU_EXECUTOR", "process")).lower(),
+    )
+    with _scheduler_lock:
+        if _scheduler is None or _scheduler[0] != config:
+            if _scheduler is not None:
+                _scheduler[1].shutdown()
+            _scheduler = (config, CpuScheduler(*config))
+        return _scheduler[1]
+
+
+def run_cpu(fn: Callable[..., Any], *args: Any) -> Any:
+    """Run a CPU-bound stage on the shared scheduler."""
+    return get_cpu_scheduler().run(fn, *args)
+
+
+def busy_response(tool: str, retry_after: int) -> dict[str, Any]:
+    """Result returned instead of queueing when the CPU queue is full."""
+    return {
+        "status": "busy",
+        "retry_after": retry_after,
+        "message": (
+            f"{tool} is at capacity; retry in about {retry_after} seconds. "
+            "Metadata and search tools are not affected."
+        ),
+    }
+
+
+def cpu_heavy(fn: F) -> F:
+    """Mark a tool as CPU-heavy and answer busy_response() when it is over capacity.
+
+    A call is turned away on entry if the queue is already full, and again if
+    its ``run_cpu`` stage is not admitted. The tool must let SchedulerBusy
+    propagate for the latter.
+    """
+    CPU_HEAVY_TOOLS.add(fn.__name__)
+
+    @functools.wraps(fn)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        try:
+            get_cpu_scheduler().check_capacity()
+            return fn(*args, **kwargs)
+        except SchedulerBusy as e:
+            logger.info(f"Rejected {fn.__name__} call: {e}")
+            return busy_response(fn.__name__, e.retry_after)
+
+    return wrapper  # type: ignore[return-value]
+
+
+def is_cpu_heavy(tool: str) -> bool:
+    """Whether a tool was marked with @cpu_heavy."""
+    return tool in CPU_HEAVY_TOOLS
+
+
+@atexit.register
+def _shutdown() -> None:
+    if _scheduler is not None:
+        _scheduler[1].shutdown()
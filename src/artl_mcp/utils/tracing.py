@@ -0,0 +1,204 @@
+"""Optional export of per-call traces.
+
+Every instrumented tool call already builds a span tree: a root
+``tool.<name>`` span with children for identifier resolution, each HTTP request,
+XML parsing, PDF conversion and saving. ARTL_TRACE_EXPORT chooses where
+finished traces go; when it is unset nothing is registered and tracing costs
+nothing beyond the existing spans.
+
+- ``console``: an indented tree per call on stderr (stdout carries the MCP
+  stdio transport), showing offsets so serial round trips stand out.
+- ``file``: one JSON line per span in the OpenTelemetry span layout
+  (trace_id, span_id, parent_span_id, start/end in Unix nanoseconds,
+  attributes, status) appended to ARTL_TRACE_FILE, default
+  ``artl_traces.jsonl`` in the output directory.
+- ``otel``: spans are replayed into the OpenTelemetry tracer provider configured
+  for the process (requires the optional opentelemetry-api package).
+
+Several exporters can be combined, e.g. ``ARTL_TRACE_EXPORT=console,file``.
+"""
+
+import json
+import logging
+import sys
+import threading
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, TextIO
+
+from artl_mcp.utils.config_manager import get_config_value
+from artl_mcp.utils.instrumentation import (
+    Trace,
+    add_trace_listener,
+    remove_trace_listener,
+)
+
+try:
+    from opentelemetry import trace as otel_trace
+except ImportError:
+    otel_trace = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+OTEL_AVAILABLE = otel_trace is not None
+
+
+def trace_to_spans(trace: Trace) -> list[dict[str, Any]]:
+    """Convert a finished trace to OpenTelemetry-style span records.
+
+    Returns:
+        Spans ordered by start time, root first
+    """
+    with trace._lock:
+        records = sorted(trace.spans, key=lambda s: s["start_ms"])
+    spans = []
+    for record in records:
+        start_ns = trace.start_unix_ns + int(record["start_ms"] * 1_000_000)
+        attrs = record.get("attrs", {})
+        spans.append(
+            {
+                "trace_id": trace.trace_id,
+                "span_id": record["span_id"],
+                "parent_span_id": record["parent_id"],
+                "name": record["name"],
+                "start_time_unix_nano": start_ns,
+                "end_time_unix_nano": start_ns + int(record["duration_ms"] * 1_000_000),
+                "attributes": attrs,
+                "status": "ERROR" if "error" in attrs else "OK",
+            }
+        )
+    return spans
+
+
+def format_trace_tree(trace: Trace) -> str:
+    """Render a trace as an indented tree of spans with offsets and durations."""
+    spans = trace_to_spans(trace)
+    children: dict[str | None, list[dict[str, Any]]] = {}
+    for span in spans:
+        children.setdefault(span["parent_span_id"], []).append(span)
+
+    lines = [f"trace {trace.trace_id} {trace.name}"]
+
+    def walk(parent: str | None, depth: int) -> None:
+        for span in children.get(parent, []):
+            offset_ms = (span["start_time_unix_nano"] - trace.start_unix_ns) / 1e6
+            duration_ms = (
+                span["end_time_unix_nano"] - span["start_time_unix_nano"]
+            ) / 1e6
+            attrs = " ".join(f"{k}={v}" for k, v in span["attributes"].items())
+            lines.append(
+                f"{'  ' * (depth + 1)}{span['name']} "
+                f"+{offset_ms:.1f}ms {duration_ms:.1f}ms {attrs}".rstrip()
+            )
+            walk(span["span_id"], depth + 1)
+
+    walk(None, 0)
+    return "\n".join(lines)
+
+
+class ConsoleTraceExporter:
+    """Print each trace as a tree."""
+
+    def __init__(self, stream: TextIO | None = None):
+        self.stream = stream
+
+    def __call__(self, trace: Trace) -> None:
+        stream = self.stream or sys.stderr
+        print(format_trace_tree(trace), file=stream, flush=True)
+
+
+class FileTraceExporter:
+    """Append spans as JSON lines to a file."""
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path).expanduser()
+        self._lock = threading.Lock()
+
+    def __call__(self, trace: Trace) -> None:
+        lines = [json.dumps(span, default=str) for span in trace_to_spans(trace)]
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write("\n".join(lines) + "\n")
+
+
+class OpenTelemetryTraceExporter:
+    """Replay spans into the process's OpenTelemetry tracer provider."""
+
+    def __init__(self) -> None:
+        if otel_trace is None:
+            raise RuntimeError("opentelemetry-api is not installed")
+        self.tracer = otel_trace.get_tracer("artl_mcp")
+
+    def __call__(self, trace: Trace) -> None:
+        started: dict[str, Any] = {}
+        ends: list[tuple[Any, int]] = []
+        for span in trace_to_spans(trace):
+            parent = started.get(span["parent_span_id"])
+            context = otel_trace.set_span_in_context(parent) if parent else None
+            otel_span = self.tracer.start_span(
+                span["name"],
+                context=context,
+                start_time=span["start_time_unix_nano"],
+                attributes={
+                    k: v
+                    for k, v in span["attributes"].items()
+                    if isinstance(v, str | bool | int | float)
+                },
+            )
+            if span["status"] == "ERROR":
+                otel_span.set_status(otel_trace.Status(otel_trace.StatusCode.ERROR))
+            started[span["span_id"]] = otel_span
+            ends.append((otel_span, span["end_time_unix_nano"]))
+        # End children before parents, as a live tracer would
+        for otel_span, end_ns in reversed(ends):
+            otel_span.end(end_time=end_ns)
+
+
+_active: list[Callable[[Trace], None]] = []
+_configure_lock = threading.Lock()
+
+
+def _default_trace_file() -> Path:
+    from artl_mcp.utils.file_manager import file_manager
+
+    return file_manager.output_dir / "artl_traces.jsonl"
+
+
+def configure_tracing(export: str | None = None) -> list[Callable[[Trace], None]]:
+    """Register the trace exporters named in ARTL_TRACE_EXPORT.
+
+    Calling it again replaces the previously configured exporters.
+
+    Args:
+        export: Comma-separated exporter names; defaults to ARTL_TRACE_EXPORT
+
+    Returns:
+        The active exporters (empty when tracing is disabled)
+    """
+    if export is None:
+        export = get_config_value("ARTL_TRACE_EXPORT", "") or ""
+    names = [n.strip().lower() for n in str(export).split(",") if n.strip()]
+
+    exporters: list[Callable[[Trace], None]] = []
+    for name in names:
+        if name == "console":
+            exporters.append(ConsoleTraceExporter())
+        elif name == "file":
+            path = get_config_value("ARTL_TRACE_FILE") or _default_trace_file()
+            exporters.append(FileTraceExporter(path))
+        elif name == "otel":
+            if OTEL_AVAILABLE:
+                exporters.append(OpenTelemetryTraceExporter())
+            else:
+                logger.warning("opentelemetry-api is not installed; skipping otel")
+        else:
+            logger.warning(f"Ignoring unknown ARTL_TRACE_EXPORT value: {name}")
+
+    with _configure_lock:
+        for exporter in _active:
+            remove_trace_listener(exporter)
+        _active[:] = exporters
+        for exporter in exporters:
+            add_trace_listener(exporter)
+    return list(exporters)
@@ -0,0 +1,36 @@
+"""Shared pytest fixtures."""
+
+import pytest
+
+from artl_mcp import tools
+from artl_mcp.utils import citation_utils
+
+
+@pytest.fixture(autouse=True)
+def _clear_search_cache():
+    """Keep cached search pages and works from leaking between tests."""
+    tools._search_page_cache.clear()
+    citation_utils.openalex_work_cache.clear()
+    yield
+    tools._search_page_cache.clear()
+    citation_utils.openalex_work_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def _no_local_corpus(monkeypatch):
+    """Keep tests independent of locally configured corpus, mirror or export."""
+    monkeypatch.delenv("ARTL_LOCAL_CORPUS", raising=False)
+    monkeypatch.delenv("ARTL_OA_MIRROR", raising=False)
+    monkeypatch.delenv("ARTL_CHUNK_EXPORT", raising=False)
+    monkeypatch.delenv("ARTL_INCLUDE_TIMINGS", raising=False)
+    monkeypatch.delenv("ARTL_METRICS_PORT", raising=False)
+    monkeypatch.delenv("ARTL_METRICS_TEXTFILE", raising=False)
+    monkeypatch.delenv("ARTL_TRACE_EXPORT", raising=False)
+    monkeypatch.delenv("ARTL_HTTP_MODE", raising=False)
+    monkeypatch.delenv("ARTL_PROFILE", raising=False)
+    # Patched conversion stages only take effect in the test process
+    monkeypatch.setenv("ARTL_CPU_EXECUTOR", "inline")
+    monkeypatch.delenv("ARTL_CPU_WORKERS", raising=False)
+    monkeypatch.delenv("ARTL_CPU_QUEUE_DEPTH", raising=False)
+    monkeypatch.delenv("ARTL_TOOL_DEADLINE", raising=False)
+    monkeypatch.delenv("ARTL_HTTP_TIMEOUT", raising=False)
@@ -0,0 +1,93 @@
+"""Smoke tests for the offline benchmark suite in benchmarks/."""
+
+import io
+import json
+
+from click.testing import CliRunner
+
+from artl_mcp.tools import _convert_jats_xml_to_markdown, _process_with_pdfplumber
+from benchmarks.fixtures import (
+    load_fixtures,
+    make_jats_xml,
+    make_pdf,
+    recorded_fixtures,
+)
+from benchmarks.run import cli, compare_to_baseline, percentile, run_benchmarks
+
+
+class TestStatistics:
+    """Test percentile and baseline comparison."""
+
+    def test_percentile(self):
+        samples = [float(i) for i in range(1, 101)]
+
+        assert percentile(samples, 50) == 50.5
+        assert percentile(samples, 99) == 99.01
+        assert percentile([3.0], 95) == 3.0
+
+    def test_compare_flags_regressions(self):
+        baseline = {"results": {"a": {"p50_ms": 10, "peak_kib": 100}}}
+        slower = {"results": {"a": {"p50_ms": 20, "peak_kib": 100}, "new": {}}}
+        same = {"results": {"a": {"p50_ms": 11, "peak_kib": 110}}}
+
+        assert compare_to_baseline(slower, baseline) == [
+            {"case": "a", "p50_ratio": 2.0, "peak_ratio": 1.0, "regression": True}
+        ]
+        assert not compare_to_baseline(same, baseline)[0]["regression"]
+
+
+class TestFixtures:
+    """Test that synthetic fixtures exercise the real code paths."""
+
+    def test_synthetic_jats_converts(self):
+        markdown, _ = _convert_jats_xml_to_markdown(make_jats_xml(2))
+
+        assert "## Section 1" in markdown
+        assert "**Table:**" in markdown
+
+    def test_synthetic_pdf_has_text_and_tables(self):
+        result = _process_with_pdfplumber(io.BytesIO(make_pdf(2)))
+
+        assert result["page_count"] == 2
+        assert result["tables_extracted"] == 2
+
+    def test_recorded_fixtures(self, tmp_path):
+        (tmp_path / "article.xml").write_text(make_jats_xml(1))
+        (tmp_path / "page.json").write_text(json.dumps({"resultList": {}}))
+        (tmp_path / "notes.txt").write_text("ignored")
+
+        names = [f.name for f in recorded_fixtures(tmp_path)]
+
+        assert names == ["jats_article", "search_page"]
+        assert len(load_fixtures(tmp_path)) == 9 + 2
+
+
+class TestRunner:
+    """Test a quick run of the cheap cases."""
+
+    def test_quick_run(self):
+        results = run_benchmarks(selected="normalize_identifier", quick=True)
+
+        result = results["results"]["normalize_identifier[x700]"]
+        assert result["iterations"] == 1
+        assert result["p50_ms"] > 0
+        assert result["peak_kib"] >= 0
+
+    def test_cli_output_and_baseline(self, tmp_path):
+        output = tmp_path / "results.json"
+        runner = CliRunner()
+
+        first = runner.invoke(
+            cli, ["--filter", "jats_small", "--quick", "--output", str(output)]
+        )
+        assert first.exit_code == 0, first.output
+        assert "jats_to_markdown[jats_small]" in first.output
+
+        baseline = json.loads(output.read_text())
+        baseline["results"]["jats_to_markdown[jats_small]"]["p50_ms"] = 1e-6
+        output.write_text(json.dumps(baseline))
+        second = runner.invoke(
+            cli, ["--filter", "jats_small", "--quick", "--baseline", str(output)]
+        )
+        assert second.exit_code == 1
+        assert "REGRESSION" in second.output
@@ -0,0 +1,191 @@
+"""Tests for the TTL cache and cached Europe PMC search pages."""
+
+import time
+from unittest.mock import Mock, patch
+
+from artl_mcp.tools import search_europepmc_papers
+from artl_mcp.utils.cache import SQLiteCache, TTLCache, make_cache
+from artl_mcp.utils.config_manager import get_float_config
+
+
+def _page(ids, next_cursor, hit_count):
+    response = Mock()
+    response.status_code = 200
+    response.raise_for_status.return_value = None
+    response.json.return_value = {
+        "hitCount": hit_count,
+        "nextCursorMark": next_cursor,
+        "resultList": {"result": [{"id": i, "pmid": i} for i in ids]},
+    }
+    return response
+
+
+class TestTTLCache:
+    """Test the generic cache."""
+
+    def test_hit_miss_and_stats(self):
+        """Lookups are counted as hits or misses."""
+        cache = TTLCache(maxsize=2, ttl=60)
+        assert cache.get("a") is None
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    def test_lru_eviction(self):
+        """The least recently used entry is evicted first."""
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.stats()["evictions"] == 1
+
+    def test_expiry(self):
+        """Entries disappear after their TTL."""
+        cache = TTLCache(maxsize=2, ttl=0.05)
+        cache.set("a", 1)
+        time.sleep(0.1)
+
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_disabled_cache_stores_nothing(self):
+        """A TTL of zero disables caching."""
+        cache = TTLCache(ttl=0)
+        cache.set("a", 1)
+
+        assert cache.get("a") is None
+
+
+class TestCacheConfig:
+    """Test reading cache settings from the environment."""
+
+    def test_numeric_value(self, monkeypatch):
+        monkeypatch.setenv("ARTL_SEARCH_CACHE_TTL", "0")
+        assert get_float_config("ARTL_SEARCH_CACHE_TTL", 300) == 0
+
+    def test_invalid_value_falls_back(self, monkeypatch):
+        monkeypatch.setenv("ARTL_SEARCH_CACHE_TTL", "5m")
+        assert get_float_config("ARTL_SEARCH_CACHE_TTL", 300) == 300
+
+    def test_unset_uses_default(self, monkeypatch):
+        monkeypatch.delenv("ARTL_SEARCH_CACHE_TTL", raising=False)
+        assert get_float_config("ARTL_SEARCH_CACHE_TTL", 300) == 300
+
+
+class TestSQLiteCache:
+    """Test the cache shared between processes."""
+
+    def test_round_trip_and_stats(self, tmp_path):
+        cache = SQLiteCache(tmp_path / "c.sqlite", "ns", maxsize=4, ttl=60)
+        assert cache.get(("q", "lite")) is None
+        cache.set(("q", "lite"), {"results": [1, 2]})
+        assert cache.get(("q", "lite")) == {"results": [1, 2]}
+        assert len(cache) == 1
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["shared"]) == (1, 1, True)
+
+    def test_visible_to_other_connections(self, tmp_path):
+        """A second instance (as in another worker) sees the same entries."""
+        path = tmp_path / "c.sqlite"
+        SQLiteCache(path, "ns", ttl=60).set("k", "v")
+        assert SQLiteCache(path, "ns", ttl=60).get("k") == "v"
+        assert SQLiteCache(path, "other", ttl=60).get("k") is None
+
+    def test_expiry(self, tmp_path):
+        cache = SQLiteCache(tmp_path / "c.sqlite", "ns", ttl=0.05)
+        cache.set("k", "v")
+        time.sleep(0.1)
+        assert cache.get("k") is None
+
+    def test_eviction_and_clear(self, tmp_path):
+        cache = SQLiteCache(tmp_path / "c.sqlite", "ns", maxsize=2, ttl=60)
+        for key in "abc":
+            cache.set(key, key)
+        assert len(cache) == 2
+        assert cache.get("a") is None
+        assert cache.stats()["evictions"] == 1
+        assert cache.pop("c") == "c"
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_unserializable_value_is_skipped(self, tmp_path):
+        cache = SQLiteCache(tmp_path / "c.sqlite", "ns", ttl=60)
+        cache.set("k", object())
+        assert cache.get("k") is None
+
+    def test_make_cache(self, monkeypatch, tmp_path):
+        monkeypatch.delenv("ARTL_SHARED_CACHE", raising=False)
+        assert isinstance(make_cache("ns"), TTLCache)
+        monkeypatch.setenv("ARTL_SHARED_CACHE", str(tmp_path / "c.sqlite"))
+        assert isinstance(make_cache("ns"), SQLiteCache)
+
+
+class TestCachedSearch:
+    """Test search_europepmc_papers page caching."""
+
+    @patch("artl_mcp.tools.requests.get")
+    def test_repeat_query_is_served_from_cache(self, mock_get):
+        """A repeated query with extra whitespace makes no new request."""
+        mock_get.return_value = _page(["1", "2"], "c1", 50)
+
+        first = search_europepmc_papers("CRISPR  gene", max_results=2)
+        second = search_europepmc_papers(" CRISPR gene ", max_results=2)
+
+        assert mock_get.call_count == 1
+        assert first["cache"]["status"] == "miss"
+        assert second["cache"]["status"] == "hit"
+        assert second["pmids"] == ["1", "2"]
+
+    @patch("artl_mcp.tools.requests.get")
+    def test_smaller_request_is_sliced_from_cache(self, mock_get):
+        """Fewer results than cached are served without a request."""
+        mock_get.return_value = _page(["1", "2", "3"], "c1", 50)
+
+        search_europepmc_papers("q", max_results=3)
+        result = search_europepmc_papers("q", max_results=1)
+
+        assert mock_get.call_count == 1
+        assert result["pmids"] == ["1"]
+
+    @patch("artl_mcp.tools.requests.get")
+    def test_larger_request_extends_from_cursor(self, mock_get):
+        """More results continue from the cached cursor instead of restarting."""
+        mock_get.side_effect = [_page(["1", "2"], "c1", 50), _page(["3"], "c2", 50)]
+
+        search_europepmc_papers("q", max_results=2)
+        result = search_europepmc_papers("q", max_results=3)
+
+        assert result["cache"]["status"] == "extended"
+        assert result["pmids"] == ["1", "2", "3"]
+        second_call = mock_get.call_args_list[1].kwargs["params"]
+        assert second_call["cursorMark"] == "c1"
+        assert second_call["pageSize"] == "1"
+
+    @patch("artl_mcp.tools.requests.get")
+    def test_exhausted_results_are_not_refetched(self, mock_get):
+        """Once every hit is cached, larger requests need no new calls."""
+        mock_get.return_value = _page(["1", "2"], "c1", 2)
+
+        search_europepmc_papers("q", max_results=2)
+        result = search_europepmc_papers("q", max_results=10)
+
+        assert mock_get.call_count == 1
+        assert result["returned_count"] == 2
+
+    @patch("artl_mcp.tools.requests.get")
+    def test_result_types_are_cached_separately(self, mock_get):
+        """lite and core results do not share cache entries."""
+        mock_get.return_value = _page(["1"], "c1", 1)
+
+        search_europepmc_papers("q", result_type="lite")
+        search_europepmc_papers("q", result_type="core")
+
+        assert mock_get.call_count == 2
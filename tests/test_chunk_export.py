@@ -0,0 +1,111 @@
+"""Tests for chunk export next to saved Markdown."""
+
+import json
+from unittest.mock import Mock, patch
+
+from artl_mcp.tools import get_europepmc_full_text
+from artl_mcp.utils import chunk_export
+from artl_mcp.utils.chunk_export import (
+    build_chunk_records,
+    export_chunks,
+    write_chunk_records,
+)
+
+MARKDOWN = """# Nanometre-scale thermometry
+
+## Abstract
+
+We measure temperature inside living cells with diamond sensors.
+
+## Methods
+
+Nanodiamonds with nitrogen-vacancy centres were injected.
+"""
+
+IDS = {"pmid": "12345", "pmcid": "PMC1", "doi": "10.1000/x"}
+
+
+class TestBuildChunkRecords:
+    """Test chunk record construction."""
+
+    def test_records_carry_ids_and_offsets(self):
+        """Every record has identifiers and a span into the source."""
+        records = build_chunk_records(MARKDOWN, IDS, source="europepmc_xml")
+
+        assert len(records) == 2
+        for record in records:
+            span = MARKDOWN[record["char_start"] : record["char_end"]]
+            assert span == record["text"]
+            assert record["pmcid"] == "PMC1"
+            assert record["doi"] == "10.1000/x"
+            assert record["source"] == "europepmc_xml"
+            assert record["token_count"] > 0
+        assert records[1]["chunk_id"] == "PMC1#1"
+        assert records[1]["section_path"][-1] == "Methods"
+
+    def test_missing_identifiers_are_null(self):
+        """Identifiers not supplied are recorded as None."""
+        records = build_chunk_records(MARKDOWN, {"doi": "10.1000/x"})
+
+        assert records[0]["pmid"] is None
+        assert records[0]["chunk_id"] == "10.1000/x#0"
+
+
+class TestWriteChunkRecords:
+    """Test chunk file output."""
+
+    def test_ndjson_written_next_to_markdown(self, tmp_path):
+        """NDJSON file sits beside the Markdown with one record per line."""
+        md_path = tmp_path / "paper.md"
+        records = build_chunk_records(MARKDOWN, IDS)
+
+        out = write_chunk_records(records, md_path, "ndjson")
+
+        assert out == tmp_path / "paper.chunks.ndjson"
+        lines = out.read_text().splitlines()
+        assert [json.loads(line) for line in lines] == records
+
+    def test_parquet_falls_back_without_pyarrow(self, tmp_path, monkeypatch):
+        """Without pyarrow, parquet requests produce NDJSON."""
+        monkeypatch.setattr(chunk_export, "PARQUET_AVAILABLE", False)
+        records = build_chunk_records(MARKDOWN, IDS)
+
+        out = write_chunk_records(records, tmp_path / "paper.md", "parquet")
+
+        assert out.name == "paper.chunks.ndjson"
+
+
+class TestExportChunks:
+    """Test the ARTL_CHUNK_EXPORT switch."""
+
+    def test_disabled_by_default(self, tmp_path):
+        """Nothing is written unless ARTL_CHUNK_EXPORT is set."""
+        assert export_chunks(MARKDOWN, tmp_path / "paper.md", IDS) is None
+        assert list(tmp_path.iterdir()) == []
+
+    @patch("artl_mcp.tools.requests.get")
+    @patch("artl_mcp.tools.get_europepmc_paper_by_id")
+    def test_full_text_save_exports_chunks(
+        self, mock_paper, mock_get, tmp_path, monkeypatch
+    ):
+        """Saving full text also writes its chunks."""
+        monkeypatch.setenv("ARTL_CHUNK_EXPORT", "ndjson")
+        mock_paper.return_value = {"pmcid": "PMC1", "pmid": "12345"}
+        response = Mock()
+        response.status_code = 200
+        response.raise_for_status.return_value = None
+        response.text = (
+            "<article><front><article-meta><title-group><article-title>"
+            "Thermometry</article-title></title-group></article-meta></front>"
+            "<body><sec><title>Sensors</title><p>Nanodiamonds measured "
+            "temperature.</p></sec></body></article>"
+        )
+        mock_get.return_value = response
+
+        result = get_europepmc_full_text("PMC1", save_to=str(tmp_path / "paper.md"))
+
+        chunks_path = result["chunks_saved_to"]
+        assert chunks_path.endswith(".chunks.ndjson")
+        records = [json.loads(line) for line in open(chunks_path)]
+        assert records[0]["pmcid"] == "PMC1"
+        assert records[0]["source"] == "europepmc_xml"
@@ -0,0 +1,198 @@
+"""Tests for the citation graph crawler and store."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+
+from artl_mcp.tools import crawl_citation_graph as crawl_citation_graph_tool
+from artl_mcp.utils.citation_graph import (
+    CitationGraphStore,
+    crawl_citation_graph,
+    normalize_doi,
+)
+from artl_mcp.utils.citation_utils import OPENALEX_API_URL
+
+# A (W1) cites B and C; B and C both cite D; E cites A
+WORKS = {
+    "W1": {"doi": "10.1000/A", "refs": ["W2", "W3"], "cited_by": 50},
+    "W2": {"doi": "10.1000/B", "refs": ["W4"], "cited_by": 20},
+    "W3": {"doi": "10.1000/C", "refs": ["W4"], "cited_by": 10},
+    "W4": {"doi": "10.1000/D", "refs": [], "cited_by": 5},
+    "W5": {"doi": "10.1000/E", "refs": ["W1"], "cited_by": 1},
+}
+
+
+def _work(work_id):
+    work = WORKS[work_id]
+    return {
+        "id": f"https://openalex.org/{work_id}",
+        "doi": f"https://doi.org/{work['doi']}",
+        "title": f"Paper {work_id[1:]}",
+        "publication_year": 2020,
+        "cited_by_count": work["cited_by"],
+        "referenced_works": [f"https://openalex.org/{w}" for w in work["refs"]],
+    }
+
+
+def _response(payload, status=200):
+    response = Mock()
+    response.status_code = status
+    response.json.return_value = payload
+    if status >= 400:
+        response.raise_for_status.side_effect = requests.HTTPError(str(status))
+    else:
+        response.raise_for_status.return_value = None
+    return response
+
+
+def fake_openalex(url, params=None, headers=None, timeout=None):
+    """Serve the WORKS graph like the OpenAlex works endpoint."""
+    params = params or {}
+    if url.startswith(f"{OPENALEX_API_URL}/https://doi.org/"):
+        doi = url.rsplit("doi.org/", 1)[1].lower()
+        for work_id, work in WORKS.items():
+            if work["doi"].lower() == doi:
+                return _response(_work(work_id))
+        return _response({}, status=404)
+    kind, value = params["filter"].split(":", 1)
+    if kind == "openalex":
+        return _response({"results": [_work(w) for w in value.split("|")]})
+    citing = [w for w, work in WORKS.items() if value in work["refs"]]
+    return _response({"results": [_work(w) for w in citing]})
+
+
+@pytest.fixture
+def store(tmp_path):
+    with CitationGraphStore(tmp_path / "graph.sqlite") as graph_store:
+        yield graph_store
+
+
+@pytest.fixture(autouse=True)
+def _no_email():
+    with (
+        patch("artl_mcp.utils.citation_graph.get_email", return_value=None),
+        patch("artl_mcp.utils.citation_utils.get_email", return_value=None),
+    ):
+        yield
+
+
+class TestNormalizeDoi:
+    """Test DOI normalization used for node deduplication."""
+
+    def test_formats_collapse_to_one_key(self):
+        assert normalize_doi("https://doi.org/10.1000/ABC") == "10.1000/abc"
+        assert normalize_doi("doi:10.1000/abc") == "10.1000/abc"
+
+    def test_invalid_doi(self):
+        assert normalize_doi("not a doi") is None
+        assert normalize_doi(None) is None
+
+
+class TestCrawl:
+    """Test breadth-first expansion."""
+
+    @patch("artl_mcp.utils.citation_utils.requests.get", side_effect=fake_openalex)
+    def test_two_hop_references(self, mock_get, store):
+        """Depth 2 reaches D once, through both B and C."""
+        graph = crawl_citation_graph(["10.1000/A"], store, depth=2)
+
+        dois = sorted(node["doi"] for node in graph["nodes"])
+        assert dois == ["10.1000/a", "10.1000/b", "10.1000/c", "10.1000/d"]
+        edges = {(e["citing"], e["cited"]) for e in graph["edges"]}
+        assert edges == {
+            ("10.1000/a", "10.1000/b"),
+            ("10.1000/a", "10.1000/c"),
+            ("10.1000/b", "10.1000/d"),
+            ("10.1000/c", "10.1000/d"),
+        }
+        assert graph["stats"]["fetched"] == 3
+
+    @patch("artl_mcp.utils.citation_utils.requests.get", side_effect=fake_openalex)
+    def test_recrawl_is_incremental(self, mock_get, store):
+        """Expanded papers are not fetched again; deeper crawls fetch only new ones."""
+        crawl_citation_graph(["10.1000/A"], store, depth=2)
+        mock_get.reset_mock()
+
+        again = crawl_citation_graph(["doi:10.1000/a"], store, depth=2)
+        assert mock_get.call_count == 0
+        assert again["stats"] == {**again["stats"], "fetched": 0, "reused": 3}
+        assert len(again["nodes"]) == 4
+
+        deeper = crawl_citation_graph(["10.1000/A"], store, depth=3)
+        assert deeper["stats"]["fetched"] == 1  # only D
+
+    @patch("artl_mcp.utils.citation_utils.requests.get", side_effect=fake_openalex)
+    def test_citations_direction(self, mock_get, store):
+        """Following citations adds citing -> seed edges."""
+        graph = crawl_citation_graph(
+            ["10.1000/A"], store, depth=1, direction="citations"
+        )
+
+        assert {(e["citing"], e["cited"]) for e in graph["edges"]} == {
+            ("10.1000/e", "10.1000/a")
+        }
+
+    @patch("artl_mcp.utils.citation_utils.requests.get", side_effect=fake_openalex)
+    def test_max_nodes_bounds_the_crawl(self, mock_get, store):
+        graph = crawl_citation_graph(["10.1000/A"], store, depth=3, max_nodes=2)
+
+        assert len(graph["nodes"]) == 2
+
+    @patch("artl_mcp.utils.citation_utils.requests.get")
+    def test_crossref_fallback_for_references(self, mock_get, store):
+        """Papers unknown to OpenAlex take their references from CrossRef."""
+        mock_get.side_effect = [
+            _response({}, status=404),
+            _response(
+                {"message": {"reference": [{"DOI": "10.1000/Z", "year": "2001"}]}}
+            ),
+        ]
+
+        graph = crawl_citation_graph(["10.1000/Y"], store, depth=1)
+
+        assert graph["edges"] == [{"citing": "10.1000/y", "cited": "10.1000/z"}]
+        assert "api.crossref.org" in mock_get.call_args[0][0]
+
+    @patch("artl_mcp.utils.citation_utils.requests.get")
+    def test_crossref_fallback_leaves_citations_unexpanded(self, mock_get, store):
+        """A CrossRef fallback only counts as expanding references."""
+        mock_get.side_effect = [
+            _response({}, status=404),
+            _response(
+                {"message": {"reference": [{"DOI": "10.1000/Z", "year": "2001"}]}}
+            ),
+        ]
+
+        crawl_citation_graph(["10.1000/Y"], store, direction="both", depth=1)
+
+        assert store.is_expanded("10.1000/y", "references")
+        assert not store.is_expanded("10.1000/y", "citations")
+        assert not store.is_expanded("10.1000/y", "both")
+
+    @patch("artl_mcp.utils.citation_utils.requests.get")
+    def test_unreachable_seed_counts_as_failed(self, mock_get, store):
+        mock_get.side_effect = requests.ConnectionError("down")
+
+        graph = crawl_citation_graph(["10.1000/A"], store, depth=2)
+
+        assert graph["nodes"] == []
+        assert graph["stats"]["failed"] == 1
+
+
+class TestCrawlTool:
+    """Test the crawl_citation_graph tool."""
+
+    @patch("artl_mcp.utils.citation_utils.requests.get", side_effect=fake_openalex)
+    def test_tool_uses_configured_store(self, mock_get, tmp_path, monkeypatch):
+        db_path = tmp_path / "tool_graph.sqlite"
+        monkeypatch.setenv("ARTL_CITATION_GRAPH_DB", str(db_path))
+
+        result = crawl_citation_graph_tool("10.1000/A", depth=1)
+
+        assert len(result["data"]["nodes"]) == 3
+        assert result["saved_to"] is None
+        assert db_path.exists()
+
+    def test_invalid_direction(self):
+        assert crawl_citation_graph_tool("10.1000/A", direction="sideways") is None
@@ -574,3 +574,102 @@ class TestCommandFailures:
         # CLI should handle exceptions gracefully (exit code depends on implementation)
         # The important thing is it doesn't crash
         assert "API Error" in result.output or result.exit_code != 0
+
+
+class TestResolveFullTextCommand:
+    """Test the resolve-full-text command."""
+
+    @patch("artl_mcp.cli.resolve_full_text")
+    def test_resolve_full_text_cmd_sources(self, mock_resolve_full_text):
+        """Test that repeated --source options keep their order."""
+        mock_resolve_full_text.return_value = {"source": "bioc", "content": "text"}
+
+        runner = CliRunner()
+        result = runner.invoke(
+            cli,
+            [
+                "resolve-full-text",
+                "--identifier",
+                "PMC1234567",
+                "--source",
+                "bioc",
+                "--source",
+                "europepmc_xml",
+                "--deadline",
+                "5",
+            ],
+        )
+
+        assert result.exit_code == 0
+        mock_resolve_full_text.assert_called_once_with(
+            "PMC1234567", sources=["bioc", "europepmc_xml"], deadline=5.0
+        )
+        assert json.loads(result.output)["source"] == "bioc"
+
+
+class TestOutputFormats:
+    """Test the --format option on the command group."""
+
+    @patch("artl_mcp.cli.iter_europepmc_search")
+    def test_ndjson_streams_one_paper_per_line(self, mock_search):
+        """NDJSON mode writes each search hit as its own JSON line."""
+        mock_search.return_value = iter([{"pmid": "1"}, {"pmid": "2"}])
+
+        runner = CliRunner()
+        result = runner.invoke(
+            cli, ["--format", "ndjson", "search-europepmc-papers", "--keywords", "x"]
+        )
+
+        assert result.exit_code == 0
+        lines = result.output.strip().splitlines()
+        assert [json.loads(line) for line in lines] == [{"pmid": "1"}, {"pmid": "2"}]
+
+    @patch("artl_mcp.cli.get_europepmc_paper_by_id")
+    def test_ndjson_single_result_is_one_line(self, mock_get):
+        """Results without a record list are written as one compact line."""
+        mock_get.return_value = {"pmid": "1", "title": "Paper"}
+
+        runner = CliRunner()
+        result = runner.invoke(
+            cli,
+            ["--format", "ndjson", "get-europepmc-paper-by-id", "--identifier", "1"],
+        )
+
+        assert result.exit_code == 0
+        assert result.output.count("\n") == 1
+        assert json.loads(result.output) == {"pmid": "1", "title": "Paper"}
+
+    @patch("artl_mcp.cli.get_europepmc_paper_by_id")
+    def test_json_is_default(self, mock_get):
+        """Without --format the result is pretty-printed JSON."""
+        mock_get.return_value = {"pmid": "1"}
+
+        runner = CliRunner()
+        result = runner.invoke(cli, ["get-europepmc-paper-by-id", "--identifier", "1"])
+
+        assert result.exit_code == 0
+        assert json.loads(result.output) == {"pmid": "1"}
+        assert "\n  " in result.output
+
+    @patch("artl_mcp.cli.iter_europepmc_search")
+    def test_ndjson_search_failure(self, mock_search):
+        """A failing page request is reported as an error line."""
+        import requests
+
+        mock_search.side_effect = requests.exceptions.ConnectionError("down")
+
+        runner = CliRunner()
+        result = runner.invoke(
+            cli, ["--format", "ndjson", "search-europepmc-papers", "--keywords", "x"]
+        )
+
+        assert result.exit_code == 0
+        assert "error" in json.loads(result.output)
+
+    def test_ndjson_record_list_from_full_result(self):
+        """Record lists inside a full result are split into lines."""
+        from artl_mcp.cli import _iter_records
+
+        assert list(_iter_records({"papers": [1, 2], "pmids": ["a"]})) == [1, 2]
+        assert list(_iter_records({"message": {"items": [3]}})) == [3]
+        assert list(_iter_records({"title": "x"})) == [{"title": "x"}]
@@ -0,0 +1,218 @@
+"""Tests for streamed reference and citing work retrieval."""
+
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+
+from artl_mcp.tools import get_paper_citations
+from artl_mcp.utils.citation_utils import OPENALEX_API_URL, CitationUtils
+
+SEED_URL = f"{OPENALEX_API_URL}/https://doi.org/10.1000/seed"
+
+
+def _response(payload, status=200):
+    response = Mock()
+    response.status_code = status
+    response.json.return_value = payload
+    if status >= 400:
+        response.raise_for_status.side_effect = requests.HTTPError(str(status))
+    else:
+        response.raise_for_status.return_value = None
+    return response
+
+
+def paged_openalex(total, rows):
+    """Serve `total` works citing W1 in pages of `rows`, keyed by cursor."""
+
+    def fake_get(url, params=None, headers=None, timeout=None):
+        if url == SEED_URL:
+            return _response({"id": "https://openalex.org/W1"})
+        assert params["filter"] == "cites:W1"
+        start = 0 if params["cursor"] == "*" else int(params["cursor"])
+        count = max(0, min(rows, total - start))
+        return _response(
+            {
+                "meta": {"count": total, "next_cursor": str(start + count)},
+                "results": [
+                    {
+                        "id": f"https://openalex.org/W{100 + n}",
+                        "doi": f"https://doi.org/10.1000/c{n}",
+                        "title": f"Citing {n}",
+                        "authorships": [{"author": {"display_name": "A. Author"}}],
+                        "publication_date": "2020-01-01",
+                        "cited_by_count": total - n,
+                    }
+                    for n in range(start, start + count)
+                ],
+            }
+        )
+
+    return fake_get
+
+
+def _page_calls(mock_get):
+    return [c for c in mock_get.call_args_list if c.args[0] == OPENALEX_API_URL]
+
+
+@pytest.fixture(autouse=True)
+def _email():
+    with patch(
+        "artl_mcp.utils.citation_utils.get_email", return_value="me@example.org"
+    ):
+        yield
+
+
+class TestCitationStreaming:
+    """Test iter_citations_openalex."""
+
+    @pytest.mark.parametrize("prefetch", [True, False])
+    @patch("artl_mcp.utils.citation_utils.requests.get")
+    def test_walks_every_page(self, mock_get, prefetch):
+        mock_get.side_effect = paged_openalex(total=250, rows=100)
+
+        dois = [
+            c["doi"]
+            for c in CitationUtils.iter_citations_openalex(
+                "10.1000/seed", rows=100, prefetch=prefetch
+            )
+        ]
+
+        assert len(dois) == 250
+        assert len(set(dois)) == 250
+        cursors = [c.kwargs["params"]["cursor"] for c in _page_calls(mock_get)]
+        assert cursors == ["*", "100", "200"]
+
+    @patch("artl_mcp.utils.citation_utils.requests.get")
+    def test_citation_record_shape(self, mock_get):
+        mock_get.side_effect = paged_openalex(total=1, rows=100)
+
+        (citation,) = CitationUtils.iter_citations_openalex("10.1000/seed")
+
+        assert citation["doi"] == "10.1000/c0"
+        assert citation["authors"] == ["A. Author"]
+        assert citation["published_date"] == "2020-01-01"
+        assert citation["citation_count"] == 1
+
+    @patch("artl_mcp.utils.citation_utils.requests.get")
+    def test_polite_pool_mailto_param(self, mock_get):
+        mock_get.side_effect = paged_openalex(total=1, rows=100)
+
+        list(CitationUtils.iter_citations_openalex("10.1000/seed"))
+
+        for call in mock_get.call_args_list:
+            assert call.kwargs["params"]["mailto"] == "me@example.org"
+
+    @patch("artl_mcp.utils.citation_utils.requests.get")
+    def test_max_items_stops_paging(self, mock_get):
+        mock_get.side_effect = paged_openalex(total=1000, rows=100)
+
+        citations = list(
+            CitationUtils.iter_citations_openalex(
+                "10.1000/seed", max_items=150, rows=100
+            )
+        )
+
+        assert len(citations) == 150
+        assert len(_page_calls(mock_get)) == 2
+
+    @patch("artl_mcp.utils.citation_utils.requests.get")
+    def test_deadline_keeps_partial_results(self, mock_get):
+        fast = paged_openalex(total=1000, rows=100)
+
+        def slow_after_first(url, params=None, headers=None, timeout=None):
+            if params.get("cursor") not in (None, "*"):
+                time.sleep(0.5)
+            return fast(url, params=params)
+
+        mock_get.side_effect = slow_after_first
+
+        start = time.monotonic()
+        citations = list(
+            CitationUtils.iter_citations_openalex(
+                "10.1000/seed", deadline=0.2, rows=100
+            )
+        )
+
+        assert len(citations) == 100
+        assert time.monotonic() - start < 0.45
+
+    @patch("artl_mcp.utils.citation_utils.requests.get")
+    def test_list_wrapper_collects_pages(self, mock_get):
+        mock_get.side_effect = paged_openalex(total=250, rows=200)
+
+        citations = CitationUtils.get_citations_crossref("10.1000/seed", max_items=None)
+
+        assert len(citations) == 250
+        assert citations[0]["title"] == "Citing 0"
+
+    @patch("artl_mcp.utils.citation_utils.requests.get")
+    def test_no_citing_works_is_empty_list(self, mock_get):
+        mock_get.side_effect = paged_openalex(total=0, rows=200)
+
+        assert CitationUtils.get_citations_crossref("10.1000/seed") == []
+
+    @patch("artl_mcp.utils.citation_utils.requests.get")
+    def test_unknown_work_is_empty_list(self, mock_get):
+        mock_get.return_value = _response({}, status=404)
+
+        assert CitationUtils.get_citations_crossref("10.1000/seed") == []
+        assert mock_get.call_count == 1
+
+    @patch("artl_mcp.utils.citation_utils.requests.get")
+    def test_request_failure_is_none(self, mock_get):
+        mock_get.return_value = _response({}, status=503)
+
+        assert CitationUtils.get_citations_crossref("10.1000/seed") is None
+
+    @patch("artl_mcp.utils.citation_utils.requests.get")
+    def test_list_wrapper_returns_all_by_default(self, mock_get):
+        mock_get.side_effect = paged_openalex(total=450, rows=200)
+
+        assert len(CitationUtils.get_citations_crossref("10.1000/seed")) == 450
+
+    def test_invalid_doi(self):
+        assert list(CitationUtils.iter_citations_openalex("not a doi")) == []
+        assert CitationUtils.get_citations_crossref("not a doi") is None
+
+
+class TestPaperCitationsTool:
+    """Test the get_paper_citations tool."""
+
+    @patch("artl_mcp.utils.citation_utils.requests.get")
+    def test_cap_reports_truncation(self, mock_get):
+        mock_get.side_effect = paged_openalex(total=250, rows=200)
+
+        capped = get_paper_citations("10.1000/seed", max_items=100)
+        exact = get_paper_citations("10.1000/seed", max_items=250)
+        everything = get_paper_citations("10.1000/seed")
+
+        assert len(capped["data"]) == 100
+        assert capped["truncated"] is True
+        assert len(exact["data"]) == 250
+        assert exact["truncated"] is False
+        assert len(everything["data"]) == 250
+        assert everything["truncated"] is False
+
+
+class TestReferenceStreaming:
+    """Test iter_references_crossref."""
+
+    @patch("artl_mcp.utils.citation_utils.requests.get")
+    def test_complete_list_from_one_request(self, mock_get):
+        response = Mock()
+        response.raise_for_status.return_value = None
+        response.json.return_value = {
+            "message": {"reference": [{"DOI": f"10.1000/r{n}"} for n in range(300)]}
+        }
+        mock_get.return_value = response
+
+        refs = list(CitationUtils.iter_references_crossref("10.1000/seed"))
+        first = list(
+            CitationUtils.iter_references_crossref("10.1000/seed", max_items=5)
+        )
+
+        assert len(refs) == 300
+        assert [r["doi"] for r in first] == [f"10.1000/r{n}" for n in range(5)]
+        assert mock_get.call_args.kwargs["params"]["mailto"] == "me@example.org"
@@ -0,0 +1,290 @@
+"""Tests for per-call deadlines and cancellation."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+from fastmcp import Client, FastMCP
+
+from artl_mcp import main
+from artl_mcp.server import DeadlineMiddleware
+from artl_mcp.tools import get_europepmc_full_text
+from artl_mcp.utils import http
+from artl_mcp.utils.deadline import (
+    DEFAULT_HTTP_TIMEOUT,
+    Deadline,
+    DeadlineExceeded,
+    check_deadline,
+    clamp_timeout,
+    current_deadline,
+    deadline_scope,
+    remaining,
+    sleep,
+)
+from artl_mcp.utils.racing import race_by_preference
+from artl_mcp.utils.scheduler import CpuScheduler, get_cpu_scheduler
+
+
+class TestDeadline:
+    """Test deadline scopes and cancellation."""
+
+    def test_no_deadline_by_default(self):
+        assert current_deadline() is None
+        assert remaining() is None
+        check_deadline()
+
+    def test_nested_scope_never_outlives_parent(self):
+        with deadline_scope(1):
+            with deadline_scope(60):
+                assert remaining() <= 1
+            with deadline_scope(None):
+                assert 0 < remaining() <= 1
+        assert current_deadline() is None
+
+    def test_expired_scope_raises(self):
+        with deadline_scope(0), pytest.raises(DeadlineExceeded):
+            check_deadline()
+
+    def test_cancel_reaches_nested_scopes(self):
+        with deadline_scope() as outer, deadline_scope(60):
+            outer.cancel()
+            with pytest.raises(DeadlineExceeded, match="cancelled"):
+                check_deadline()
+
+    def test_deadline_exceeded_is_a_request_timeout(self):
+        assert issubclass(DeadlineExceeded, requests.exceptions.Timeout)
+
+    def test_sleep_wakes_on_cancel(self):
+        deadline = Deadline()
+        threading.Timer(0.1, deadline.cancel).start()
+        start = time.monotonic()
+        with pytest.raises(DeadlineExceeded):
+            deadline.sleep(5)
+        assert time.monotonic() - start < 1
+
+    def test_sleep_stops_at_deadline(self):
+        start = time.monotonic()
+        with deadline_scope(0.1), pytest.raises(DeadlineExceeded):
+            sleep(5)
+        assert time.monotonic() - start < 1
+
+
+class TestClampTimeout:
+    """Test the timeout given to each HTTP request."""
+
+    def test_default_timeout(self):
+        assert clamp_timeout(None) == DEFAULT_HTTP_TIMEOUT
+        assert clamp_timeout(60) == 60
+
+    def test_default_timeout_from_env(self, monkeypatch):
+        monkeypatch.setenv("ARTL_HTTP_TIMEOUT", "7.5")
+        assert clamp_timeout(None) == 7.5
+
+    def test_capped_at_time_left(self):
+        with deadline_scope(2):
+            assert clamp_timeout(60) <= 2
+            connect, read = clamp_timeout((1, None))
+            assert connect == 1
+            assert read <= 2
+
+    def test_out_of_time_raises(self):
+        with deadline_scope(0), pytest.raises(DeadlineExceeded):
+            clamp_timeout(10)
+
+
+class TestHttpDeadline:
+    """Test deadlines in the shared HTTP layer."""
+
+    @patch("requests.get")
+    def test_request_without_timeout_gets_default(self, mock_get):
+        mock_get.return_value = Mock(status_code=200, headers={})
+        http.get("https://example.org/a")
+        assert mock_get.call_args.kwargs["timeout"] == DEFAULT_HTTP_TIMEOUT
+
+    @patch("requests.get")
+    def test_timeout_capped_by_deadline(self, mock_get):
+        mock_get.return_value = Mock(status_code=200, headers={})
+        with deadline_scope(3):
+            http.get("https://example.org/a", timeout=60)
+        assert mock_get.call_args.kwargs["timeout"] <= 3
+
+    @patch("requests.get")
+    def test_no_request_after_deadline(self, mock_get):
+        with deadline_scope(0), pytest.raises(DeadlineExceeded):
+            http.get("https://example.org/a", timeout=60)
+        mock_get.assert_not_called()
+
+    @patch("requests.get")
+    def test_tool_returns_none_when_out_of_time(self, mock_get):
+        with deadline_scope(0):
+            assert get_europepmc_full_text("PMC3737249") is None
+        mock_get.assert_not_called()
+
+
+class TestRaceDeadline:
+    """Test deadline propagation into raced sources."""
+
+    def test_race_capped_by_caller_deadline(self):
+        def slow():
+            time.sleep(2)
+            return "late"
+
+        with deadline_scope(0.2):
+            race = race_by_preference({"slow": slow}, ["slow"], deadline=30)
+        assert race["deadline_exceeded"]
+        assert race["elapsed"] < 1
+
+    def test_losing_source_is_cancelled(self):
+        started = threading.Event()
+        stopped = threading.Event()
+
+        def winner():
+            started.wait(2)
+            return "A"
+
+        def loser():
+            started.set()
+            try:
+                sleep(5)
+            except DeadlineExceeded:
+                stopped.set()
+                raise
+
+        race = race_by_preference(
+            {"fast": winner, "slow": loser}, ["fast", "slow"], deadline=10
+        )
+        assert race["source"] == "fast"
+        assert stopped.wait(2)
+
+
+class TestSchedulerDeadline:
+    """Test deadlines while waiting for a CPU slot."""
+
+    def test_slot_wait_gives_up(self):
+        scheduler = CpuScheduler(workers=1, queue_depth=1, executor="inline")
+        release = threading.Event()
+        busy = threading.Thread(target=scheduler.run, args=(release.wait,))
+        busy.start()
+        time.sleep(0.05)
+        try:
+            start = time.monotonic()
+            with deadline_scope(0.2), pytest.raises(DeadlineExceeded):
+                scheduler.run(lambda: "never")
+            assert time.monotonic() - start < 1
+        finally:
+            release.set()
+            busy.join()
+        assert scheduler.run(lambda: "ok") == "ok"
+
+    def test_abandoned_process_stage_keeps_its_slot(self, monkeypatch):
+        """A worker still converting for a timed-out call stays counted."""
+        monkeypatch.setenv("ARTL_CPU_EXECUTOR", "process")
+        monkeypatch.setenv("ARTL_CPU_WORKERS", "1")
+        monkeypatch.setenv("ARTL_CPU_QUEUE_DEPTH", "1")
+        scheduler = get_cpu_scheduler()
+        try:
+            assert scheduler.run(pow, 2, 3) == 8  # starts the worker process
+            with deadline_scope(0.2), pytest.raises(DeadlineExceeded):
+                scheduler.run(time.sleep, 1.5)
+            assert scheduler.stats()["admitted"] == 1
+
+            # The only worker is still busy with the abandoned stage
+            with deadline_scope(0.2), pytest.raises(DeadlineExceeded):
+                scheduler.run(pow, 2, 4)
+
+            give_up = time.monotonic() + 5
+            while scheduler.stats()["admitted"] and time.monotonic() < give_up:
+                time.sleep(0.05)
+            assert scheduler.stats()["admitted"] == 0
+            assert scheduler.run(pow, 2, 4) == 16
+        finally:
+            scheduler.shutdown()
+
+    def test_process_stage_runs_under_the_callers_deadline(self, monkeypatch):
+        """Checkpoints inside a worker process see the time left."""
+        monkeypatch.setenv("ARTL_CPU_EXECUTOR", "process")
+        monkeypatch.setenv("ARTL_CPU_WORKERS", "1")
+        scheduler = get_cpu_scheduler()
+        try:
+            assert scheduler.run(remaining) is None
+            with deadline_scope(5):
+                assert 0 < scheduler.run(remaining) <= 5
+
+            start = time.monotonic()
+            with deadline_scope(0.3), pytest.raises(DeadlineExceeded):
+                scheduler.run(sleep, 3)
+            while scheduler.stats()["admitted"] and time.monotonic() - start < 5:
+                time.sleep(0.05)
+            # The worker stopped at its own checkpoint instead of sleeping on
+            assert time.monotonic() - start < 2
+        finally:
+            scheduler.shutdown()
+
+
+def _checkpoint_server(state):
+    mcp = FastMCP("deadline-test")
+    mcp.add_middleware(DeadlineMiddleware())
+
+    @mcp.tool
+    def work() -> str:
+        state["remaining"] = remaining()
+        start = time.monotonic()
+        try:
+            while time.monotonic() - start < 3:
+                check_deadline()
+                time.sleep(0.02)
+        except DeadlineExceeded:
+            state["stopped_after"] = time.monotonic() - start
+            raise
+        return "done"
+
+    return mcp
+
+
+class TestDeadlineMiddleware:
+    """Test deadlines and cancellation of MCP tool calls."""
+
+    def test_client_cancel_stops_tool(self):
+        state = {}
+
+        async def scenario():
+            async with Client(_checkpoint_server(state)) as client:
+                call = asyncio.create_task(client.call_tool("work", {}))
+                await asyncio.sleep(0.3)
+                call.cancel()
+                with pytest.raises(asyncio.CancelledError):
+                    await call
+                await asyncio.sleep(0.3)
+
+        asyncio.run(scenario())
+        assert state["stopped_after"] < 1
+
+    def test_default_tool_deadline(self, monkeypatch):
+        monkeypatch.setenv("ARTL_TOOL_DEADLINE", "0.2")
+        state = {}
+
+        async def scenario():
+            async with Client(_checkpoint_server(state)) as client:
+                return await client.call_tool("work", {}, raise_on_error=False)
+
+        result = asyncio.run(scenario())
+        assert result.is_error
+        assert state["remaining"] <= 0.2
+        assert state["stopped_after"] < 1
+
+    @patch("artl_mcp.main._get_europepmc_paper_by_id")
+    def test_tool_deadline_argument(self, mock_paper):
+        mock_paper.side_effect = lambda **kwargs: {"remaining": remaining()}
+
+        async def scenario():
+            async with Client(main.create_mcp()) as client:
+                return await client.call_tool(
+                    "get_europepmc_paper_by_id",
+                    {"identifier": "23851394", "deadline": 5},
+                )
+
+        result = asyncio.run(scenario())
+        assert 0 < result.structured_content["remaining"] <= 5
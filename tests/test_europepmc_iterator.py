@@ -0,0 +1,206 @@
+"""Tests for the streaming Europe PMC search iterator."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+
+from artl_mcp.tools import (
+    _search_europepmc_flexible,
+    iter_europepmc_search,
+    iter_europepmc_search_pages,
+    search_europepmc_papers,
+)
+
+
+def _page(ids, next_cursor, hit_count):
+    response = Mock()
+    response.status_code = 200
+    response.raise_for_status.return_value = None
+    response.json.return_value = {
+        "hitCount": hit_count,
+        "nextCursorMark": next_cursor,
+        "resultList": {"result": [{"id": i, "pmid": i} for i in ids]},
+    }
+    return response
+
+
+class TestIterEuropePMCSearch:
+    """Test page and record iteration."""
+
+    @pytest.mark.parametrize("prefetch", [True, False])
+    @patch("artl_mcp.tools.requests.get")
+    def test_walks_all_pages_with_cursor(self, mock_get, prefetch):
+        """Every page is requested with the previous page's cursor."""
+        mock_get.side_effect = [
+            _page(["1", "2"], "c1", 5),
+            _page(["3", "4"], "c2", 5),
+            _page(["5"], "c3", 5),
+        ]
+
+        records = list(iter_europepmc_search("q", page_size=2, prefetch=prefetch))
+
+        assert [r["id"] for r in records] == ["1", "2", "3", "4", "5"]
+        cursors = [c.kwargs["params"]["cursorMark"] for c in mock_get.call_args_list]
+        assert cursors == ["*", "c1", "c2"]
+
+    @patch("artl_mcp.tools.requests.get")
+    def test_max_results_trims_and_shrinks_last_request(self, mock_get):
+        """The last request asks only for what is still needed."""
+        mock_get.side_effect = [_page(["1", "2"], "c1", 100), _page(["3"], "c2", 100)]
+
+        records = list(iter_europepmc_search("q", page_size=2, max_results=3))
+
+        assert len(records) == 3
+        sizes = [c.kwargs["params"]["pageSize"] for c in mock_get.call_args_list]
+        assert sizes == ["2", "1"]
+
+    @patch("artl_mcp.tools.requests.get")
+    def test_idlist_result_type(self, mock_get):
+        """The idlist result type is passed through."""
+        mock_get.return_value = _page(["1"], "c1", 1)
+
+        records = list(iter_europepmc_search("q", result_type="idlist"))
+
+        assert records == [{"id": "1", "pmid": "1"}]
+        assert mock_get.call_args.kwargs["params"]["resultType"] == "idlist"
+
+    @patch("artl_mcp.tools.requests.get")
+    def test_stops_when_cursor_does_not_advance(self, mock_get):
+        """A repeated cursor ends the walk instead of looping forever."""
+        mock_get.side_effect = [_page(["1"], "c1", 10), _page(["2"], "c1", 10)]
+
+        pages = list(iter_europepmc_search_pages("q", page_size=1))
+
+        assert len(pages) == 2
+        assert mock_get.call_count == 2
+
+    @patch("artl_mcp.tools.requests.get")
+    def test_early_break_does_not_fetch_everything(self, mock_get):
+        """Stopping early leaves later pages unrequested."""
+        mock_get.side_effect = [_page([str(i)], f"c{i}", 100) for i in range(100)]
+
+        for record in iter_europepmc_search("q", page_size=1):
+            if record["id"] == "2":
+                break
+
+        # Pages 0-2 consumed plus at most one prefetched page
+        assert mock_get.call_count <= 4
+
+    @patch("artl_mcp.tools.requests.get")
+    def test_request_errors_propagate(self, mock_get):
+        """Failed page requests raise to the caller."""
+        mock_get.side_effect = requests.exceptions.ConnectionError("down")
+
+        with pytest.raises(requests.exceptions.RequestException):
+            list(iter_europepmc_search("q"))
+
+
+class TestPaginatedSearch:
+    """Test the search functions built on the iterator."""
+
+    @patch("artl_mcp.tools.requests.get")
+    def test_flexible_auto_paginate_lite(self, mock_get):
+        """Auto-pagination now works for result types other than core."""
+        mock_get.side_effect = [_page(["1", "2"], "c1", 3), _page(["3"], "c2", 3)]
+
+        data = _search_europepmc_flexible(
+            "q", page_size=2, result_type="lite", auto_paginate=True, max_results=10
+        )
+
+        assert data is not None
+        assert [r["id"] for r in data["resultList"]["result"]] == ["1", "2", "3"]
+        assert data["returnedCount"] == 3
+        assert data["nextCursorMark"] == "c2"
+
+    @patch("artl_mcp.tools.requests.get")
+    def test_flexible_single_page(self, mock_get):
+        """Without auto-pagination only one request is made."""
+        mock_get.return_value = _page(["1", "2"], "c1", 50)
+
+        data = _search_europepmc_flexible("q", page_size=2)
+
+        assert data is not None
+        assert data["hitCount"] == 50
+        assert mock_get.call_count == 1
+
+    @patch("artl_mcp.tools.requests.get")
+    def test_papers_search_paginates_beyond_one_page(self, mock_get):
+        """search_europepmc_papers pages when more than 1000 results are wanted."""
+        mock_get.side_effect = [
+            _page([str(i) for i in range(1000)], "c1", 5000),
+            _page([str(i) for i in range(1000, 1500)], "c2", 5000),
+        ]
+
+        result = search_europepmc_papers("q", max_results=1500)
+
+        assert result["returned_count"] == 1500
+        assert len(result["pmids"]) == 1500
+        sizes = [c.kwargs["params"]["pageSize"] for c in mock_get.call_args_list]
+        assert sizes == ["1000", "500"]
+
+
+class TestFieldProjection:
+    """Test the fields= projection on search results."""
+
+    @patch("artl_mcp.tools.requests.get")
+    def test_ids_preset_uses_idlist_and_trims(self, mock_get):
+        """The ids preset requests idlist upstream and keeps only identifiers."""
+        response = _page(["1"], "c1", 1)
+        response.json.return_value["resultList"]["result"][0]["title"] = "T"
+        mock_get.return_value = response
+
+        result = search_europepmc_papers("q", fields="ids")
+
+        assert mock_get.call_args.kwargs["params"]["resultType"] == "idlist"
+        assert result["papers"] == [{"id": "1", "pmid": "1"}]
+        assert result["fields"] == ["id", "source", "pmid", "pmcid", "doi"]
+
+    @patch("artl_mcp.tools.requests.get")
+    def test_abstract_preset_upgrades_to_core(self, mock_get):
+        """Abstract fields are only available in core mode."""
+        mock_get.return_value = _page(["1"], "c1", 1)
+
+        result = search_europepmc_papers("q", fields="abstract")
+
+        assert mock_get.call_args.kwargs["params"]["resultType"] == "core"
+        assert result["result_type"] == "core"
+
+    @patch("artl_mcp.tools.requests.get")
+    def test_custom_fields_and_no_id_lists(self, mock_get):
+        """Comma-separated fields work and the id lists can be dropped."""
+        response = _page(["1"], "c1", 1)
+        record = response.json.return_value["resultList"]["result"][0]
+        record.update(title="T", authorList={"author": []})
+        mock_get.return_value = response
+
+        result = search_europepmc_papers(
+            "q", fields="pmid, title", include_id_lists=False
+        )
+
+        assert mock_get.call_args.kwargs["params"]["resultType"] == "lite"
+        assert result["papers"] == [{"pmid": "1", "title": "T"}]
+        assert "pmids" not in result and "dois" not in result
+
+    def test_presets_mix_with_field_names(self):
+        """Presets expand inside field lists without duplicates."""
+        from artl_mcp.tools import _resolve_search_fields
+
+        assert _resolve_search_fields(["ids", "pmid", "title"]) == [
+            "id",
+            "source",
+            "pmid",
+            "pmcid",
+            "doi",
+            "title",
+        ]
+        assert _resolve_search_fields(None) is None
+
+    @patch("artl_mcp.tools.requests.get")
+    def test_iterator_projects_records(self, mock_get):
+        """The streaming iterator applies the same projection."""
+        mock_get.return_value = _page(["1"], "c1", 1)
+
+        records = list(iter_europepmc_search("q", fields=["pmid"]))
+
+        assert records == [{"pmid": "1"}]
@@ -0,0 +1,123 @@
+"""Tests for bulk full text harvesting."""
+
+import json
+from unittest.mock import patch
+
+from click.testing import CliRunner
+
+from artl_mcp.cli import cli
+from artl_mcp.harvest import harvest_one, read_identifiers, run_harvest
+from artl_mcp.utils.harvest_queue import HarvestQueue
+
+
+def _fake_resolve(identifier, sources=None, deadline=60.0, save_to=None):
+    if identifier == "PMC0000001":
+        return None
+    return {
+        "content": f"# {identifier}",
+        "source": "europepmc_xml",
+        "format": "markdown",
+        "content_length": len(identifier) + 2,
+        "saved_to": f"{save_to}.md" if save_to else None,
+    }
+
+
+class TestHarvestQueue:
+    """Test the SQLite work queue."""
+
+    def test_add_ignores_duplicates(self, tmp_path):
+        """Identifiers already queued are not added again."""
+        with HarvestQueue(tmp_path / "q.sqlite") as queue:
+            assert queue.add(["PMC1", "PMC2"]) == 2
+            assert queue.add(["PMC2", "PMC3"]) == 1
+            assert queue.counts() == {"pending": 3, "done": 0, "failed": 0}
+
+    def test_checkpoints_survive_reopen(self, tmp_path):
+        """Finished items stay finished after the queue is reopened."""
+        db = tmp_path / "q.sqlite"
+        with HarvestQueue(db) as queue:
+            queue.add(["PMC1", "PMC2", "PMC3"])
+            queue.mark("PMC1", "done", {"identifier": "PMC1"})
+            queue.mark("PMC2", "failed", {"identifier": "PMC2"})
+
+        with HarvestQueue(db) as queue:
+            assert list(queue.iter_pending()) == ["PMC3"]
+            assert list(queue.iter_pending(include_failed=True)) == ["PMC2", "PMC3"]
+            assert queue.get_record("PMC1") == {"identifier": "PMC1"}
+
+    def test_iter_pending_in_batches(self, tmp_path):
+        """Batched iteration visits every pending item exactly once."""
+        with HarvestQueue(tmp_path / "q.sqlite") as queue:
+            ids = [f"PMC{i}" for i in range(7)]
+            queue.add(ids)
+            seen = []
+            for identifier in queue.iter_pending(batch_size=3):
+                queue.mark(identifier, "done", {})
+                seen.append(identifier)
+            assert seen == ids
+
+
+class TestHarvestPipeline:
+    """Test the harvesting pipeline."""
+
+    def test_read_identifiers_skips_blanks_and_comments(self):
+        """Blank lines and comments are ignored."""
+        lines = ["PMC1\n", "\n", "# header\n", "  10.1234/x  \n"]
+        assert list(read_identifiers(lines)) == ["PMC1", "10.1234/x"]
+
+    def test_invalid_identifier_fails_without_fetching(self):
+        """Invalid identifiers are recorded as failures."""
+        with patch("artl_mcp.harvest.resolve_full_text") as mock_resolve:
+            record = harvest_one("not-an-identifier")
+
+        assert record["status"] == "failed"
+        mock_resolve.assert_not_called()
+
+    @patch("artl_mcp.harvest.resolve_full_text", side_effect=_fake_resolve)
+    def test_saves_to_output_dir(self, mock_resolve, tmp_path):
+        """Content is saved under a filename derived from the identifier."""
+        record = harvest_one("10.1234/abc", output_dir=tmp_path)
+
+        assert record["status"] == "done"
+        assert record["saved_to"] == str(tmp_path / "10.1234_abc.md")
+        assert "content" not in record
+
+    @patch("artl_mcp.harvest.resolve_full_text", side_effect=_fake_resolve)
+    def test_run_harvest_checkpoints_every_item(self, mock_resolve, tmp_path):
+        """Every item is marked done or failed in the queue."""
+        with HarvestQueue(tmp_path / "q.sqlite") as queue:
+            queue.add([f"PMC000000{i}" for i in range(1, 6)])
+            records = list(run_harvest(queue, workers=2))
+
+            assert len(records) == 5
+            assert queue.counts() == {"pending": 0, "done": 4, "failed": 1}
+            checkpoint = queue.get_record("PMC0000002")
+            assert "content" not in checkpoint
+            assert checkpoint["content_length"] == len("# PMC0000002")
+            yielded = next(r for r in records if r["identifier"] == "PMC0000002")
+            assert yielded["content"] == "# PMC0000002"
+
+
+class TestHarvestCommand:
+    """Test the harvest CLI command."""
+
+    @patch("artl_mcp.harvest.resolve_full_text", side_effect=_fake_resolve)
+    def test_resume_skips_finished_items(self, mock_resolve, tmp_path):
+        """A second run only processes identifiers added since the first."""
+        runner = CliRunner()
+        queue = str(tmp_path / "q.sqlite")
+
+        result = runner.invoke(
+            cli, ["harvest", "--queue", queue], input="PMC0000002\nPMC0000003\n"
+        )
+        assert result.exit_code == 0
+        records = [json.loads(line) for line in result.stdout.splitlines()]
+        assert {r["identifier"] for r in records} == {"PMC0000002", "PMC0000003"}
+
+        result = runner.invoke(
+            cli, ["harvest", "--queue", queue], input="PMC0000002\nPMC0000004\n"
+        )
+        assert result.exit_code == 0
+        records = [json.loads(line) for line in result.stdout.splitlines()]
+        assert [r["identifier"] for r in records] == ["PMC0000004"]
+        assert mock_resolve.call_count == 3
@@ -0,0 +1,210 @@
+"""Tests for the HTTP record/replay transport."""
+
+import datetime
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from artl_mcp.utils import http
+from artl_mcp.utils.http_replay import (
+    Cassette,
+    ReplaySettings,
+    get_replay_settings,
+    replay,
+    request_key,
+)
+
+
+def _response(body=b'{"ok": true}', status=200, url="https://example.org/a"):
+    response = requests.Response()
+    response.status_code = status
+    response.reason = "OK"
+    response.url = url
+    response.headers["Content-Type"] = "application/json; charset=utf-8"
+    response.headers["Set-Cookie"] = "session=secret"
+    response._content = body
+    response.elapsed = datetime.timedelta(milliseconds=80)
+    return response
+
+
+@pytest.fixture
+def cassette_env(monkeypatch, tmp_path):
+    path = tmp_path / "cassette.sqlite"
+    monkeypatch.setenv("ARTL_HTTP_CASSETTE", str(path))
+    monkeypatch.setenv("ARTL_HTTP_REPLAY_LATENCY", "0")
+    return path
+
+
+class TestRequestKey:
+    """Test request matching."""
+
+    def test_param_order_and_contact_params_ignored(self):
+        a = request_key(
+            "get", "https://Example.org/s?b=2", {"params": {"a": 1, "email": "x@y"}}
+        )
+        b = request_key("GET", "https://example.org/s", {"params": {"b": 2, "a": 1}})
+
+        assert a == b == "GET https://example.org/s?a=1&b=2"
+
+    def test_none_params_dropped(self):
+        assert request_key("get", "https://e.org/", {"params": {"a": None}}) == (
+            "GET https://e.org/"
+        )
+
+    def test_post_body_distinguishes_requests(self):
+        url = "https://api.semanticscholar.org/graph/v1/paper/batch"
+        one = request_key("post", url, {"json": {"ids": ["a"]}})
+        two = request_key("post", url, {"json": {"ids": ["b"]}})
+
+        assert one != two
+        assert one.startswith(f"POST {url} ")
+
+
+class TestRecordReplay:
+    """Test recording through the shared HTTP layer and replaying offline."""
+
+    @patch("requests.get")
+    def test_record_then_replay(self, mock_get, monkeypatch, cassette_env):
+        mock_get.return_value = _response()
+        monkeypatch.setenv("ARTL_HTTP_MODE", "record")
+        live = http.get("https://example.org/a", params={"q": "x"}, timeout=5)
+        assert live.json() == {"ok": True}
+        assert len(Cassette(cassette_env)) == 1
+
+        monkeypatch.setenv("ARTL_HTTP_MODE", "replay")
+        mock_get.side_effect = AssertionError("network used during replay")
+        replayed = http.get("https://example.org/a", params={"q": "x"}, timeout=5)
+
+        assert replayed.status_code == 200
+        assert replayed.json() == {"ok": True}
+        assert replayed.headers["Content-Type"].startswith("application/json")
+        assert "Set-Cookie" not in replayed.headers
+        assert replayed.encoding == "utf-8"
+
+    @patch("requests.get")
+    def test_streamed_body_replays(self, mock_get, monkeypatch, cassette_env):
+        mock_get.return_value = _response(body=b"%PDF-1.4 data" * 100)
+        monkeypatch.setenv("ARTL_HTTP_MODE", "record")
+        http.get("https://example.org/a.pdf", stream=True, timeout=5)
+
+        monkeypatch.setenv("ARTL_HTTP_MODE", "replay")
+        with http.get("https://example.org/a.pdf", stream=True) as response:
+            chunks = list(response.iter_content(chunk_size=256))
+
+        assert b"".join(chunks) == b"%PDF-1.4 data" * 100
+
+    def test_missing_recording_raises(self, monkeypatch, cassette_env):
+        monkeypatch.setenv("ARTL_HTTP_MODE", "replay")
+
+        with pytest.raises(requests.exceptions.ConnectionError):
+            http.get("https://example.org/never-recorded")
+
+    @patch("requests.get")
+    def test_repeats_replayed_in_order_then_cycled(
+        self, mock_get, monkeypatch, cassette_env
+    ):
+        monkeypatch.setenv("ARTL_HTTP_MODE", "record")
+        for body in (b"1", b"2"):
+            mock_get.return_value = _response(body=body)
+            http.get("https://example.org/page")
+
+        monkeypatch.setenv("ARTL_HTTP_MODE", "replay")
+        bodies = [http.get("https://example.org/page").content for _ in range(3)]
+
+        assert bodies == [b"1", b"2", b"1"]
+
+    @patch("requests.get")
+    def test_record_failure_does_not_fail_request(self, mock_get, monkeypatch):
+        mock_get.return_value = _response()
+        monkeypatch.setenv("ARTL_HTTP_MODE", "record")
+
+        with patch(
+            "artl_mcp.utils.http.get_cassette", side_effect=OSError("read-only")
+        ):
+            assert http.get("https://example.org/a").status_code == 200
+
+
+class TestReplayInjection:
+    """Test latency and error injection."""
+
+    def _cassette(self, tmp_path):
+        cassette = Cassette(tmp_path / "c.sqlite")
+        key = request_key("get", "https://example.org/a", {})
+        cassette.record(key, "get", _response(), elapsed_ms=250)
+        return cassette
+
+    @patch("artl_mcp.utils.deadline.time.sleep")
+    def test_recorded_latency_scaled(self, mock_sleep, tmp_path):
+        cassette = self._cassette(tmp_path)
+
+        response = replay(
+            cassette, "get", "https://example.org/a", {}, ReplaySettings(latency=2)
+        )
+
+        mock_sleep.assert_called_once_with(0.5)
+        assert response.elapsed == datetime.timedelta(milliseconds=250)
+
+    @patch("artl_mcp.utils.deadline.time.sleep")
+    def test_no_latency(self, mock_sleep, tmp_path):
+        replay(
+            self._cassette(tmp_path),
+            "get",
+            "https://example.org/a",
+            {},
+            ReplaySettings(latency=0),
+        )
+
+        mock_sleep.assert_not_called()
+
+    @patch("artl_mcp.utils.deadline.time.sleep")
+    def test_latency_beyond_timeout_raises(self, mock_sleep, tmp_path):
+        with pytest.raises(requests.exceptions.ReadTimeout):
+            replay(
+                self._cassette(tmp_path),
+                "get",
+                "https://example.org/a",
+                {"timeout": (5, 0.1)},
+                ReplaySettings(latency=1),
+            )
+
+        mock_sleep.assert_called_once_with(0.1)
+
+    def test_injected_status(self, tmp_path):
+        settings = ReplaySettings(latency=0, error_rate=1.0, error_status=503)
+
+        response = replay(
+            self._cassette(tmp_path), "get", "https://example.org/a", {}, settings
+        )
+
+        assert response.status_code == 503
+        with pytest.raises(requests.exceptions.HTTPError):
+            response.raise_for_status()
+
+    def test_injected_connection_error(self, tmp_path):
+        settings = ReplaySettings(latency=0, error_rate=1.0, error_status=None)
+
+        with pytest.raises(requests.exceptions.ConnectionError):
+            replay(
+                self._cassette(tmp_path), "get", "https://example.org/a", {}, settings
+            )
+
+    def test_seeded_error_rate_is_reproducible(self):
+        first = ReplaySettings(error_rate=0.3, seed=7)
+        second = ReplaySettings(error_rate=0.3, seed=7)
+
+        failures = [first.should_fail() for _ in range(200)]
+
+        assert failures == [second.should_fail() for _ in range(200)]
+        assert 30 < sum(failures) < 90
+
+    def test_settings_from_config(self, monkeypatch):
+        monkeypatch.setenv("ARTL_HTTP_ERROR_RATE", "0.25")
+        monkeypatch.setenv("ARTL_HTTP_ERROR_STATUS", "connection")
+        monkeypatch.setenv("ARTL_HTTP_REPLAY_SEED", "3")
+
+        settings = get_replay_settings()
+
+        assert settings.error_rate == 0.25
+        assert settings.error_status is None
+        assert get_replay_settings() is settings
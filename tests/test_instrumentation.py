@@ -0,0 +1,200 @@
+"""Tests for spans, counters and the metrics registry."""
+
+import datetime
+import threading
+from unittest.mock import Mock, patch
+
+from artl_mcp.tools import get_europepmc_full_text
+from artl_mcp.utils import http
+from artl_mcp.utils.instrumentation import (
+    MetricsRegistry,
+    bind_context,
+    collect_trace,
+    count,
+    current_trace,
+    instrumented,
+    merge_trace_record,
+    metrics,
+    span,
+    trace_record,
+)
+
+
+@instrumented("inner_tool")
+def inner_tool():
+    with span("parse"):
+        count("test.items", 3)
+    return {"ok": True}
+
+
+@instrumented("outer_tool")
+def outer_tool():
+    with span("resolve_id", identifier="PMC1"):
+        pass
+    inner_tool()
+    return {"value": 1}
+
+
+class TestTracing:
+    """Test per-call traces."""
+
+    def test_no_timings_by_default(self):
+        assert outer_tool() == {"value": 1}
+
+    def test_timings_block(self, monkeypatch):
+        monkeypatch.setenv("ARTL_INCLUDE_TIMINGS", "true")
+
+        timings = outer_tool()["_timings"]
+
+        assert timings["tool"] == "outer_tool"
+        assert set(timings["stages_ms"]) == {
+            "resolve_id",
+            "parse",
+            "tool.inner_tool",
+            "tool.outer_tool",
+        }
+        assert timings["counters"] == {"test.items": 3}
+        resolve = next(s for s in timings["spans"] if s["name"] == "resolve_id")
+        assert resolve["attrs"] == {"identifier": "PMC1"}
+
+    def test_nested_call_does_not_get_own_block(self, monkeypatch):
+        monkeypatch.setenv("ARTL_INCLUDE_TIMINGS", "true")
+        seen = {}
+
+        @instrumented("probe")
+        def probe():
+            seen["inner"] = inner_tool()
+            return {}
+
+        probe()
+        assert "_timings" not in seen["inner"]
+
+    def test_trace_follows_bound_threads(self):
+        traces = []
+
+        @instrumented("threaded")
+        def threaded():
+            worker = threading.Thread(
+                target=bind_context(lambda: traces.append(current_trace()))
+            )
+            worker.start()
+            worker.join()
+            return traces[0]
+
+        assert threaded().name == "threaded"
+        assert current_trace() is None
+
+    def test_registry_receives_spans_and_counters(self):
+        before = metrics.snapshot()
+        inner_tool()
+        after = metrics.snapshot()
+
+        assert after["timings"]["parse"]["count"] == (
+            before["timings"].get("parse", {}).get("count", 0) + 1
+        )
+        assert (
+            after["counters"]["test.items"] - before["counters"].get("test.items", 0)
+            == 3
+        )
+
+    def test_merge_trace_record(self):
+        with collect_trace("worker") as worker:
+            with span("pdf.pages"):
+                count("pdf.pages", 2)
+        record = trace_record(worker)
+
+        with collect_trace("caller") as caller:
+            with span("convert"):
+                merge_trace_record(record)
+
+        pages, convert = caller.spans
+        assert pages["name"] == "pdf.pages"
+        assert pages["parent_id"] == convert["span_id"]
+        assert caller.counters == {"pdf.pages": 2}
+        assert current_trace() is None
+
+
+class TestMetricsRegistry:
+    """Test histogram bookkeeping."""
+
+    def test_buckets_and_reset(self):
+        registry = MetricsRegistry()
+        registry.observe("http", 7)
+        registry.observe("http", 40000)
+        registry.increment("http.bytes", 10)
+
+        snapshot = registry.snapshot()
+        assert snapshot["timings"]["http"]["count"] == 2
+        assert snapshot["timings"]["http"]["buckets"][1] == 1  # <= 10 ms
+        assert snapshot["timings"]["http"]["max_ms"] == 40000
+        assert snapshot["counters"]["http.bytes"] == 10
+
+        registry.reset()
+        assert registry.snapshot() == {"counters": {}, "timings": {}}
+
+    def test_merge_series(self):
+        worker = MetricsRegistry()
+        worker.observe("pdf.pages", 7, labels={"method": "hybrid"})
+        worker.increment("http.bytes", 10)
+        registry = MetricsRegistry()
+        registry.observe("pdf.pages", 30, labels={"method": "hybrid"})
+
+        registry.merge(worker.series())
+
+        series = registry.series()
+        assert series["counters"] == [("http.bytes", {}, 10)]
+        ((name, labels, timing),) = series["timings"]
+        assert (name, labels) == ("pdf.pages", {"method": "hybrid"})
+        assert timing["count"] == 2
+        assert timing["max_ms"] == 30
+        assert timing["buckets"][1] == 1  # <= 10 ms
+
+
+class TestHttpSpans:
+    """Test the instrumented HTTP helpers."""
+
+    @patch("artl_mcp.utils.http.requests.get")
+    def test_http_span_attributes(self, mock_get, monkeypatch):
+        monkeypatch.setenv("ARTL_INCLUDE_TIMINGS", "true")
+        response = Mock(status_code=200, _content=b"x" * 2048)
+        response.elapsed = datetime.timedelta(milliseconds=120)
+        mock_get.return_value = response
+
+        @instrumented("fetch")
+        def fetch():
+            http.get("https://example.org/a", timeout=5)
+            return {}
+
+        timings = fetch()["_timings"]
+
+        mock_get.assert_called_once_with("https://example.org/a", timeout=5)
+        attrs = next(s for s in timings["spans"] if s["name"] == "http")["attrs"]
+        assert attrs == {
+            "method": "GET",
+            "host": "example.org",
+            "status": 200,
+            "ttfb_ms": 120.0,
+            "bytes": 2048,
+        }
+        assert timings["counters"] == {"http.requests": 1, "http.bytes": 2048}
+
+
+@patch("artl_mcp.tools.requests.get")
+@patch("artl_mcp.tools.get_europepmc_paper_by_id")
+def test_full_text_reports_stages(mock_paper, mock_get, monkeypatch):
+    """get_europepmc_full_text reports where its time went."""
+    monkeypatch.setenv("ARTL_INCLUDE_TIMINGS", "true")
+    mock_paper.return_value = {"pmcid": "PMC1"}
+    response = Mock(status_code=200)
+    response.text = (
+        "<article><front><article-meta><title-group><article-title>T"
+        "</article-title></title-group></article-meta></front>"
+        "<body><sec><title>S</title><p>Text.</p></sec></body></article>"
+    )
+    mock_get.return_value = response
+
+    result = get_europepmc_full_text("PMC1")
+
+    stages = result["_timings"]["stages_ms"]
+    for stage in ("resolve_id", "http", "parse", "convert", "index", "window"):
+        assert stage in stages
@@ -0,0 +1,182 @@
+"""Tests for the MCP load generator."""
+
+import asyncio
+import json
+
+import pytest
+from click.testing import CliRunner
+from fastmcp import FastMCP
+
+from artl_mcp.cli import cli
+from artl_mcp.loadgen import ToolCall, load_mix, percentile, run_load, summarize
+from artl_mcp.utils.http_replay import Cassette
+
+
+@pytest.fixture
+def server():
+    mcp = FastMCP("loadgen-test")
+
+    @mcp.tool
+    def search_europepmc_papers(keywords: str, max_results: int = 10) -> dict:
+        return {"papers": [{"title": keywords}] * max_results}
+
+    @mcp.tool
+    def get_europepmc_paper_by_id(identifier: str) -> dict | None:
+        return None if identifier == "missing" else {"id": identifier}
+
+    @mcp.tool
+    def get_europepmc_full_text(identifier: str) -> dict:
+        raise RuntimeError("upstream failure")
+
+    return mcp
+
+
+class TestHelpers:
+    """Test mix loading and statistics."""
+
+    def test_default_mix_covers_tools(self):
+        tools = {call.tool for call in load_mix()}
+        assert tools == {
+            "search_europepmc_papers",
+            "get_europepmc_paper_by_id",
+            "get_europepmc_full_text",
+            "get_europepmc_pdf_as_markdown",
+            "get_pmc_supplemental_material",
+        }
+
+    def test_load_mix_from_file(self, tmp_path):
+        path = tmp_path / "mix.json"
+        path.write_text(json.dumps([{"tool": "search_europepmc_papers", "weight": 2}]))
+        (call,) = load_mix(path)
+        assert call.weight == 2
+        assert call.arguments == [{}]
+
+    def test_percentile(self):
+        assert percentile([], 50) == 0.0
+        assert percentile([1.0, 2.0, 3.0, 4.0], 50) == 2.5
+        assert percentile([1.0, 2.0, 3.0, 4.0], 100) == 4.0
+
+    def test_summarize(self):
+        samples = [
+            ("a", 0.010, "ok"),
+            ("a", 0.030, "error"),
+            ("b", 0.020, "empty"),
+        ]
+        report = summarize(samples, elapsed=2.0, clients=2)
+        assert report["throughput_rps"] == 1.5
+        assert report["overall"]["requests"] == 3
+        assert report["overall"]["p50_ms"] == 20.0
+        assert report["tools"]["a"]["error_rate"] == 0.5
+        assert report["tools"]["b"]["empty"] == 1
+
+
+class TestRunLoad:
+    """Test driving an in-memory server."""
+
+    def test_request_budget_and_outcomes(self, server):
+        mix = [
+            ToolCall(tool="search_europepmc_papers", arguments=[{"keywords": "soil"}]),
+            ToolCall(
+                tool="get_europepmc_paper_by_id",
+                arguments=[{"identifier": "missing"}],
+            ),
+            ToolCall(tool="get_europepmc_full_text", arguments=[{"identifier": "x"}]),
+        ]
+        report = asyncio.run(run_load(server, clients=3, requests=30, mix=mix))
+
+        overall = report["overall"]
+        assert overall["requests"] == 30
+        assert overall["ok"] == report["tools"]["search_europepmc_papers"]["requests"]
+        assert (
+            overall["empty"] == report["tools"]["get_europepmc_paper_by_id"]["requests"]
+        )
+        assert (
+            overall["error"] == report["tools"]["get_europepmc_full_text"]["requests"]
+        )
+        assert report["tools"]["get_europepmc_full_text"]["error_rate"] == 1.0
+        assert report["clients"] == 3
+
+    def test_weights_respected(self, server):
+        mix = [
+            ToolCall(tool="search_europepmc_papers", arguments=[{"keywords": "soil"}]),
+            ToolCall(
+                tool="get_europepmc_paper_by_id",
+                weight=0,
+                arguments=[{"identifier": "x"}],
+            ),
+        ]
+        report = asyncio.run(run_load(server, clients=2, requests=10, mix=mix))
+        assert list(report["tools"]) == ["search_europepmc_papers"]
+
+    def test_seeded_selection_is_reproducible(self, server):
+        mix = [
+            ToolCall(tool="search_europepmc_papers", arguments=[{"keywords": "a"}]),
+            ToolCall(tool="get_europepmc_paper_by_id", arguments=[{"identifier": "b"}]),
+        ]
+        counts = [
+            {
+                tool: stats["requests"]
+                for tool, stats in asyncio.run(
+                    run_load(server, clients=1, requests=20, mix=mix, seed=7)
+                )["tools"].items()
+            }
+            for _ in range(2)
+        ]
+        assert counts[0] == counts[1]
+
+    def test_unknown_tool_counts_as_error(self, server):
+        mix = [ToolCall(tool="no_such_tool")]
+        report = asyncio.run(run_load(server, clients=1, requests=2, mix=mix))
+        assert report["overall"]["error"] == 2
+
+
+class TestLoadTestCommand:
+    """Test the artl-cli load-test command."""
+
+    def test_replay_against_empty_cassette(self, monkeypatch, tmp_path):
+        # Every request misses the cassette, so no call reaches the network
+        cassette = tmp_path / "cassette.sqlite"
+        monkeypatch.setenv("ARTL_HTTP_CASSETTE", str(cassette))
+        monkeypatch.setenv("ARTL_HTTP_REPLAY_LATENCY", "0")
+        Cassette(cassette).close()
+        mix = tmp_path / "mix.json"
+        mix.write_text(
+            json.dumps(
+                [
+                    {
+                        "tool": "get_europepmc_paper_by_id",
+                        "arguments": [{"identifier": "PMC3737249"}],
+                    }
+                ]
+            )
+        )
+
+        result = CliRunner().invoke(
+            cli,
+            [
+                "load-test",
+                "--clients",
+                "2",
+                "--requests",
+                "4",
+                "--mix",
+                str(mix),
+                "--replay",
+                str(cassette),
+            ],
+        )
+
+        assert result.exit_code == 0, result.output
+        report = json.loads(result.output)
+        assert report["overall"]["requests"] == 4
+        assert report["overall"]["empty"] == 4
+
+    def test_replay_and_record_are_exclusive(self, tmp_path):
+        cassette = tmp_path / "c.sqlite"
+        cassette.touch()
+        result = CliRunner().invoke(
+            cli,
+            ["load-test", "--replay", str(cassette), "--record", str(cassette)],
+        )
+        assert result.exit_code != 0
+        assert "mutually exclusive" in result.output
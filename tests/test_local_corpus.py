@@ -0,0 +1,117 @@
+"""Tests for the local full text search index."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from artl_mcp.tools import get_europepmc_paper_by_id, search_local_corpus
+from artl_mcp.utils.local_corpus import LocalCorpus, build_match_query
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    corpus = LocalCorpus(tmp_path / "corpus.sqlite")
+    yield corpus
+    corpus.close()
+
+
+@pytest.fixture
+def enabled_corpus(tmp_path, monkeypatch):
+    """Enable the configured corpus for the duration of a test."""
+    monkeypatch.setenv("ARTL_LOCAL_CORPUS", "true")
+    monkeypatch.setenv("ARTL_CORPUS_DB", str(tmp_path / "configured.sqlite"))
+
+
+class TestBuildMatchQuery:
+    """Test free text to FTS5 query conversion."""
+
+    def test_quotes_terms_and_keeps_operators(self):
+        """Punctuation is quoted and upper-case operators survive."""
+        assert build_match_query("CRISPR-Cas9 OR base edit*") == (
+            '"CRISPR-Cas9" OR "base" "edit"*'
+        )
+
+    def test_strips_dangling_operators(self):
+        """Operators without operands are dropped."""
+        assert build_match_query("AND gene OR") == '"gene"'
+        assert build_match_query("   ") == ""
+
+
+class TestLocalCorpus:
+    """Test indexing and ranking."""
+
+    def test_metadata_and_full_text_merge_into_one_document(self, corpus):
+        """A paper fetched by PMID and later by PMCID is one document."""
+        corpus.add(pmid="1", pmcid="PMC1", title="Rhizosphere study", abstract="Soil")
+        corpus.add(pmcid="PMC1", body="Deep sequencing of root microbiome")
+
+        assert corpus.count() == 1
+        hits = corpus.search("microbiome")
+        assert hits[0]["pmid"] == "1"
+        assert hits[0]["title"] == "Rhizosphere study"
+        assert "[microbiome]" in hits[0]["snippet"]
+
+        # Metadata is kept after the body update and vice versa
+        assert corpus.search("soil")[0]["key"] == "PMC1"
+
+    def test_title_matches_rank_above_body_matches(self, corpus):
+        """BM25 weights favour title hits."""
+        corpus.add(pmid="1", title="Unrelated", body="CRISPR is mentioned here once")
+        corpus.add(pmid="2", title="CRISPR screening", body="Something else")
+
+        hits = corpus.search("CRISPR")
+
+        assert [hit["pmid"] for hit in hits] == ["2", "1"]
+
+    def test_stemming_and_prefix(self, corpus):
+        """Porter stemming and prefix queries both match."""
+        corpus.add(doi="10.1/X", title="Editing genomes")
+
+        assert corpus.search("edited")[0]["doi"] == "10.1/x"
+        assert corpus.search("genom*")
+
+    def test_requires_an_identifier(self, corpus):
+        """Documents without identifiers are not indexed."""
+        assert corpus.add(title="Anonymous") is None
+        assert corpus.count() == 0
+
+
+class TestCorpusIntegration:
+    """Test ingestion side effects and the search tool."""
+
+    def test_search_reports_disabled_corpus(self):
+        """Without configuration the tool explains how to enable it."""
+        result = search_local_corpus("anything")
+
+        assert result["results"] == []
+        assert "ARTL_LOCAL_CORPUS" in result["error"]
+
+    @patch("artl_mcp.tools.requests.get")
+    def test_paper_lookup_is_indexed(self, mock_get, enabled_corpus):
+        """Fetched metadata becomes searchable without further requests."""
+        response = Mock()
+        response.raise_for_status.return_value = None
+        response.json.return_value = {
+            "hitCount": 1,
+            "resultList": {
+                "result": [
+                    {
+                        "pmid": "23851394",
+                        "pmcid": "PMC3737249",
+                        "doi": "10.1038/nature12373",
+                        "title": "Nanometre-scale thermometry in a living cell",
+                        "abstractText": "Diamond nitrogen-vacancy centres",
+                    }
+                ]
+            },
+        }
+        mock_get.return_value = response
+
+        get_europepmc_paper_by_id("PMC3737249")
+        mock_get.reset_mock()
+
+        result = search_local_corpus("thermometry")
+
+        mock_get.assert_not_called()
+        assert result["results"][0]["pmid"] == "23851394"
+        assert result["total_documents"] == 1
@@ -0,0 +1,161 @@
+"""Tests for the Prometheus/OpenMetrics exporter."""
+
+from unittest.mock import patch
+
+import requests
+
+from artl_mcp.main import _metered
+from artl_mcp.utils.instrumentation import MetricsRegistry, metrics
+from artl_mcp.utils.metrics_export import (
+    TextfileWriter,
+    render_metrics,
+    start_metrics_exporter,
+    start_metrics_server,
+    write_metrics_textfile,
+)
+
+
+def _registry():
+    registry = MetricsRegistry()
+    registry.increment("http.requests", 2, labels={"host": "example.org"})
+    registry.increment("http.requests", labels={"host": "api.crossref.org"})
+    registry.increment("cache.search.hit")
+    registry.observe("http", 40, labels={"host": "example.org"})
+    registry.observe("http", 700, labels={"host": "example.org"})
+    return registry
+
+
+class TestRender:
+    """Test the text exposition format."""
+
+    def test_counters(self):
+        text = render_metrics(_registry())
+
+        assert "# TYPE artl_http_requests_total counter" in text
+        assert 'artl_http_requests_total{host="example.org"} 2' in text
+        assert 'artl_http_requests_total{host="api.crossref.org"} 1' in text
+        assert "artl_cache_search_hit_total 1" in text
+        assert "# EOF" not in text
+
+    def test_histogram_buckets_are_cumulative(self):
+        text = render_metrics(_registry())
+        labels = 'host="example.org",span="http"'
+
+        assert (
+            'artl_span_duration_seconds_bucket{host="example.org",le="0.05",'
+            'span="http"} 1' in text
+        )
+        assert (
+            'artl_span_duration_seconds_bucket{host="example.org",le="1",'
+            'span="http"} 2' in text
+        )
+        assert (
+            'artl_span_duration_seconds_bucket{host="example.org",le="+Inf",'
+            'span="http"} 2' in text
+        )
+        assert f"artl_span_duration_seconds_sum{{{labels}}} 0.74" in text
+        assert f"artl_span_duration_seconds_count{{{labels}}} 2" in text
+
+    def test_openmetrics(self):
+        text = render_metrics(_registry(), openmetrics=True)
+
+        assert "# TYPE artl_http_requests counter" in text
+        assert "# UNIT artl_span_duration_seconds seconds" in text
+        assert text.endswith("# EOF\n")
+
+    def test_label_values_escaped(self):
+        registry = MetricsRegistry()
+        registry.increment("odd", labels={"q": 'a"b\\c'})
+
+        assert 'artl_odd_total{q="a\\"b\\\\c"} 1' in render_metrics(registry)
+
+    def test_snapshot_sums_labelled_series(self):
+        snapshot = _registry().snapshot()
+
+        assert snapshot["counters"]["http.requests"] == 3
+        assert snapshot["timings"]["http"]["count"] == 2
+
+
+class TestExporters:
+    """Test the side-port endpoint and the textfile dump."""
+
+    def test_metrics_endpoint(self):
+        server = start_metrics_server(0, registry=_registry())
+        try:
+            url = f"http://127.0.0.1:{server.server_port}/metrics"
+            response = requests.get(url, timeout=5)
+            assert response.status_code == 200
+            assert response.headers["Content-Type"].startswith("text/plain")
+            assert 'artl_http_requests_total{host="example.org"} 2' in response.text
+
+            response = requests.get(
+                url, headers={"Accept": "application/openmetrics-text"}, timeout=5
+            )
+            assert response.text.endswith("# EOF\n")
+
+            missing = requests.get(url.replace("/metrics", "/other"), timeout=5)
+            assert missing.status_code == 404
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def test_textfile(self, tmp_path):
+        path = write_metrics_textfile(tmp_path / "artl.prom", _registry())
+
+        assert "artl_cache_search_hit_total 1" in path.read_text()
+        assert [p.name for p in tmp_path.iterdir()] == ["artl.prom"]
+
+    def test_textfile_writer_dumps_on_stop(self, tmp_path):
+        writer = TextfileWriter(tmp_path / "artl.prom", 3600, _registry()).start()
+        writer.stop()
+
+        assert (tmp_path / "artl.prom").exists()
+
+    def test_exporter_disabled_by_default(self):
+        assert start_metrics_exporter() == {"server": None, "textfile": None}
+
+    def test_exporter_from_config(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("ARTL_METRICS_PORT", "0")
+        monkeypatch.setenv("ARTL_METRICS_TEXTFILE", str(tmp_path / "artl.prom"))
+        with patch("artl_mcp.utils.metrics_export.atexit.register"):
+            started = start_metrics_exporter()
+        try:
+            assert started["server"].server_port > 0
+            assert started["textfile"].path == tmp_path / "artl.prom"
+        finally:
+            started["server"].shutdown()
+            started["server"].server_close()
+            started["textfile"].stop()
+
+
+class TestMeteredTools:
+    """Test the tool-call wrapper used by create_mcp()."""
+
+    def test_counts_outcomes(self):
+        metrics.reset()
+
+        def lookup(value):
+            """Docstring is kept."""
+            if value == "boom":
+                raise ValueError(value)
+            return None if value == "missing" else {"value": value}
+
+        tool = _metered(lookup)
+        assert tool.__name__ == "lookup"
+        assert tool.__doc__ == "Docstring is kept."
+        assert tool("x") == {"value": "x"}
+        assert tool("missing") is None
+        try:
+            tool("boom")
+        except ValueError:
+            pass
+
+        text = render_metrics()
+        for outcome in ("ok", "empty", "error"):
+            assert (
+                f'artl_mcp_tool_calls_total{{outcome="{outcome}",tool="lookup"}} 1'
+                in text
+            )
+        assert 'artl_span_duration_seconds_count{span="mcp.tool",tool="lookup"} 3' in (
+            text
+        )
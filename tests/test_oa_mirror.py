@@ -0,0 +1,191 @@
+"""Tests for the offline Open Access mirror."""
+
+import gzip
+import io
+import json
+import tarfile
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+
+from artl_mcp.cli import cli
+from artl_mcp.tools import get_europepmc_full_text, search_local_corpus
+from artl_mcp.utils.oa_mirror import OAMirror, convert_xml_document, ingest_archive
+
+
+def _article_xml(pmc_number, pmid, doi, title, id_type="pmc"):
+    return f"""<article>
+  <front>
+    <article-meta>
+      <article-id pub-id-type="{id_type}">{pmc_number}</article-id>
+      <article-id pub-id-type="pmid">{pmid}</article-id>
+      <article-id pub-id-type="doi">{doi}</article-id>
+      <title-group><article-title>{title}</article-title></title-group>
+      <abstract><p>Abstract of {title}.</p></abstract>
+    </article-meta>
+  </front>
+  <body><sec><title>Introduction</title><p>Body of {title}.</p></sec></body>
+</article>"""
+
+
+@pytest.fixture
+def fixture_archive(tmp_path):
+    """A small OA package: two loose articles and one gzipped bundle of two."""
+    archive = tmp_path / "oa_fixture.tar.gz"
+    bundle = (
+        "<articles>"
+        + _article_xml("PMC0000003", "3", "10.1000/C", "Gamma", id_type="pmcid")
+        + _article_xml("PMC0000004", "4", "10.1000/D", "Delta", id_type="pmcid")
+        + "</articles>"
+    )
+    members = {
+        "PMC0000001/a.nxml": _article_xml("1", "1", "10.1000/A", "Alpha").encode(),
+        "PMC0000002/b.nxml": _article_xml("2", "2", "10.1000/B", "Beta").encode(),
+        "bundle.xml.gz": gzip.compress(bundle.encode()),
+        "README.txt": b"not xml",
+    }
+    with tarfile.open(archive, "w:gz") as tar:
+        for name, data in members.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+    return archive
+
+
+class TestConvertXmlDocument:
+    """Test per-document conversion."""
+
+    def test_single_article(self):
+        """Identifiers are normalized and content is converted."""
+        articles = convert_xml_document(
+            _article_xml("123", "9", "10.1000/X", "Title").encode()
+        )
+
+        assert len(articles) == 1
+        assert articles[0]["pmcid"] == "PMC123"
+        assert articles[0]["doi"] == "10.1000/x"
+        assert "Body of Title" in articles[0]["markdown"]
+
+    def test_article_without_pmcid_is_skipped(self):
+        """Articles the mirror cannot key are dropped."""
+        xml = "<article><front><article-meta/></front></article>"
+        assert convert_xml_document(xml.encode()) == []
+
+
+class TestIngestArchive:
+    """Test archive ingestion into the mirror."""
+
+    @pytest.mark.parametrize("workers", [0, 2])
+    def test_ingests_every_article(self, fixture_archive, tmp_path, workers):
+        """Loose articles and bundles are converted, other files ignored."""
+        with OAMirror(tmp_path / "mirror.sqlite") as mirror:
+            stats = ingest_archive(fixture_archive, mirror, workers=workers)
+
+            assert stats["documents"] == 3
+            assert stats["articles"] == 4
+            assert stats["failed"] == 0
+            assert mirror.count() == 4
+
+            article = mirror.get("pmid", "3")
+            assert article["pmcid"] == "PMC0000003"
+            assert article["archive"] == "oa_fixture.tar.gz"
+            assert "Body of Gamma" in article["markdown"]
+            assert mirror.get("doi", "10.1000/D")["title"] == "Delta"
+
+    def test_reingest_replaces_instead_of_duplicating(self, fixture_archive, tmp_path):
+        """Ingesting the same archive twice keeps one copy per article."""
+        with OAMirror(tmp_path / "mirror.sqlite") as mirror:
+            ingest_archive(fixture_archive, mirror, workers=0)
+            ingest_archive(fixture_archive, mirror, workers=0)
+
+            assert mirror.count() == 4
+
+    def test_cli_command(self, fixture_archive, tmp_path):
+        """The CLI reports per-archive statistics."""
+        runner = CliRunner()
+        result = runner.invoke(
+            cli,
+            [
+                "ingest-oa-archive",
+                "--archive",
+                str(fixture_archive),
+                "--mirror",
+                str(tmp_path / "mirror.sqlite"),
+                "--workers",
+                "0",
+            ],
+        )
+
+        assert result.exit_code == 0
+        output = json.loads(result.output)
+        assert output["total_articles"] == 4
+
+
+class TestMirrorMode:
+    """Test get_europepmc_full_text serving from the mirror."""
+
+    @patch("artl_mcp.tools.requests.get")
+    def test_full_text_served_offline(
+        self, mock_get, fixture_archive, tmp_path, monkeypatch
+    ):
+        """A mirrored article needs no network access."""
+        db = tmp_path / "mirror.sqlite"
+        with OAMirror(db) as mirror:
+            ingest_archive(fixture_archive, mirror, workers=0)
+        monkeypatch.setenv("ARTL_OA_MIRROR", str(db))
+
+        result = get_europepmc_full_text("10.1000/B")
+
+        mock_get.assert_not_called()
+        assert result is not None
+        assert "Body of Beta" in result["content"]
+        assert result["metadata"]["pmcid"] == "PMC2"
+        assert result["source_info"]["xml_source"] == "local_mirror"
+
+    @patch("artl_mcp.tools.requests.get")
+    def test_mirror_hits_indexed_with_mirror_source(
+        self, mock_get, fixture_archive, tmp_path, monkeypatch
+    ):
+        """The local corpus records that the text came from the mirror."""
+        db = tmp_path / "mirror.sqlite"
+        with OAMirror(db) as mirror:
+            ingest_archive(fixture_archive, mirror, workers=0)
+        monkeypatch.setenv("ARTL_OA_MIRROR", str(db))
+        monkeypatch.setenv("ARTL_LOCAL_CORPUS", "true")
+        monkeypatch.setenv("ARTL_CORPUS_DB", str(tmp_path / "corpus.sqlite"))
+
+        get_europepmc_full_text("10.1000/B")
+        hits = search_local_corpus("Beta")
+
+        assert hits["results"][0]["full_text_source"] == "local_mirror"
+
+    @patch("artl_mcp.tools.requests.get")
+    def test_mirror_chunk_export_provenance(
+        self, mock_get, fixture_archive, tmp_path, monkeypatch
+    ):
+        """Chunks exported from mirror hits name the mirror as their source."""
+        db = tmp_path / "mirror.sqlite"
+        with OAMirror(db) as mirror:
+            ingest_archive(fixture_archive, mirror, workers=0)
+        monkeypatch.setenv("ARTL_OA_MIRROR", str(db))
+        monkeypatch.setenv("ARTL_CHUNK_EXPORT", "ndjson")
+
+        result = get_europepmc_full_text("10.1000/B", save_to=str(tmp_path / "b.md"))
+
+        with open(result["chunks_saved_to"]) as f:
+            records = [json.loads(line) for line in f]
+        assert {record["source"] for record in records} == {"local_mirror"}
+
+    @patch("artl_mcp.tools.get_europepmc_paper_by_id", return_value=None)
+    def test_missing_article_falls_back_to_api(
+        self, mock_paper, fixture_archive, tmp_path, monkeypatch
+    ):
+        """Articles not in the mirror go through the live lookup."""
+        db = tmp_path / "mirror.sqlite"
+        with OAMirror(db) as mirror:
+            ingest_archive(fixture_archive, mirror, workers=0)
+        monkeypatch.setenv("ARTL_OA_MIRROR", str(db))
+
+        assert get_europepmc_full_text("PMC9999999") is None
+        mock_paper.assert_called_once_with("PMC9999999")
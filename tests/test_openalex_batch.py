@@ -0,0 +1,115 @@
+"""Tests for batched OpenAlex work lookups."""
+
+from unittest.mock import Mock, patch
+
+from artl_mcp.utils.citation_utils import CitationUtils, openalex_work_cache
+
+
+def _work(n):
+    return {
+        "id": f"https://openalex.org/W{n}",
+        "doi": f"https://doi.org/10.1000/ref{n}",
+        "title": f"Reference {n}",
+        "publication_year": 2000 + n % 20,
+    }
+
+
+def fake_list_endpoint(url, params=None, headers=None, timeout=None):
+    """Answer filter=doi:a|b or filter=openalex:W1|W2 queries."""
+    kind, values = params["filter"].split(":", 1)
+    works = []
+    for value in values.split("|"):
+        n = int(value.rsplit("ref", 1)[1] if kind == "doi" else value[1:])
+        if n < 1000:  # Higher numbers are unknown to OpenAlex
+            works.append(_work(n))
+    response = Mock()
+    response.raise_for_status.return_value = None
+    response.json.return_value = {"meta": {"next_cursor": None}, "results": works}
+    return response
+
+
+@patch("artl_mcp.utils.citation_utils.get_email", return_value=None)
+@patch("artl_mcp.utils.citation_utils.requests.get", side_effect=fake_list_endpoint)
+class TestBatchLookup:
+    """Test get_works_openalex_batch."""
+
+    def test_sixty_dois_take_two_requests(self, mock_get, _email):
+        dois = [f"10.1000/REF{n}" for n in range(60)]
+
+        works = CitationUtils.get_works_openalex_batch(dois)
+
+        assert mock_get.call_count == 2
+        assert works["10.1000/REF7"]["title"] == "Reference 7"
+        first_filter = mock_get.call_args_list[0].kwargs["params"]["filter"]
+        assert first_filter.startswith("doi:") and first_filter.count("|") == 49
+
+    def test_select_projection(self, mock_get, _email):
+        CitationUtils.get_works_openalex_batch(["W1"], select=["title"])
+
+        params = mock_get.call_args.kwargs["params"]
+        assert params["select"] == "id,doi,title"
+        assert params["filter"] == "openalex:W1"
+        assert params["cursor"] == "*"
+
+    def test_mixed_ids_and_unknowns(self, mock_get, _email):
+        works = CitationUtils.get_works_openalex_batch(
+            ["https://openalex.org/W3", "doi:10.1000/ref4", "10.1000/ref5000", "junk"]
+        )
+
+        assert works["https://openalex.org/W3"]["title"] == "Reference 3"
+        assert works["doi:10.1000/ref4"]["title"] == "Reference 4"
+        assert works["10.1000/ref5000"] is None
+        assert works["junk"] is None
+        assert mock_get.call_count == 2  # one per identifier kind
+
+    def test_results_are_cached_under_doi_and_id(self, mock_get, _email):
+        CitationUtils.get_works_openalex_batch(["10.1000/ref1", "10.1000/ref2"])
+        mock_get.reset_mock()
+
+        works = CitationUtils.get_works_openalex_batch(["W1", "10.1000/ref2"])
+
+        assert mock_get.call_count == 0
+        assert works["W1"]["doi"] == "https://doi.org/10.1000/ref1"
+        assert openalex_work_cache.stats()["hits"] >= 2
+
+    def test_cursor_paging(self, mock_get, _email):
+        pages = [
+            {"meta": {"next_cursor": "abc"}, "results": [_work(1)]},
+            {"meta": {"next_cursor": None}, "results": [_work(2)]},
+        ]
+        mock_get.side_effect = [
+            Mock(raise_for_status=Mock(), json=Mock(return_value=page))
+            for page in pages
+        ]
+
+        works = CitationUtils.get_works_openalex_batch(["W1", "W2"])
+
+        assert works["W2"]["title"] == "Reference 2"
+        assert mock_get.call_args_list[1].kwargs["params"]["cursor"] == "abc"
+
+
+@patch("artl_mcp.utils.citation_utils.get_email", return_value=None)
+@patch("artl_mcp.utils.citation_utils.requests.get")
+def test_citation_network_resolves_all_references(mock_get, _email):
+    """resolve_references returns every reference, not just the first 20."""
+    seed = Mock(raise_for_status=Mock())
+    seed.json.return_value = {
+        "title": "Seed",
+        "referenced_works": [f"https://openalex.org/W{n}" for n in range(60)],
+    }
+    mock_get.side_effect = [seed] + [
+        fake_list_endpoint(None, params)
+        for params in (
+            {"filter": "openalex:" + "|".join(f"W{n}" for n in range(50))},
+            {"filter": "openalex:" + "|".join(f"W{n}" for n in range(50, 60))},
+        )
+    ]
+
+    network = CitationUtils.get_citation_network_openalex(
+        "10.1000/seed", resolve_references=True
+    )
+
+    assert len(network["referenced_works"]) == 20
+    assert len(network["referenced_works_resolved"]) == 60
+    assert network["referenced_works_resolved"][59]["title"] == "Reference 59"
+    assert mock_get.call_count == 3
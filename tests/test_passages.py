@@ -0,0 +1,140 @@
+"""Tests for chunking and in-document passage retrieval."""
+
+from unittest.mock import Mock, patch
+
+from artl_mcp.tools import get_europepmc_full_text
+from artl_mcp.utils.passages import (
+    BM25Index,
+    chunk_markdown,
+    get_passage_index,
+    rank_passages,
+)
+
+RESULTS = "Temperature gradients were observed across the cell. " * 60
+
+MARKDOWN = f"""# Nanometre-scale thermometry
+
+## Abstract
+
+We measure temperature inside living cells with diamond sensors.
+
+## Methods
+
+### Cell culture
+
+Human embryonic fibroblasts were cultured at 37 degrees.
+
+### Sensor preparation
+
+Nanodiamonds with nitrogen-vacancy centres were injected.
+
+## Results
+
+{RESULTS}"""
+
+
+class TestChunkMarkdown:
+    """Test structure-aware chunking."""
+
+    def test_spans_match_source_text(self):
+        """Every chunk's offsets point at its exact text."""
+        chunks = chunk_markdown(MARKDOWN, max_chars=400)
+
+        assert chunks
+        for chunk in chunks:
+            assert MARKDOWN[chunk.start : chunk.end] == chunk.text
+            assert len(chunk.text) <= 400
+
+    def test_chunks_carry_section_paths(self):
+        """Nested headings become the chunk's section path."""
+        chunks = chunk_markdown(MARKDOWN)
+        paths = [chunk.section_path for chunk in chunks]
+
+        assert [
+            "Nanometre-scale thermometry",
+            "Methods",
+            "Cell culture",
+        ] in paths
+        assert all("#" not in chunk.text for chunk in chunks)
+
+    def test_chunks_never_cross_sections(self):
+        """Paragraphs from different sections are not merged."""
+        chunks = chunk_markdown(MARKDOWN, max_chars=5000)
+        methods = [c for c in chunks if "Methods" in c.section_path]
+
+        assert len(methods) == 2
+
+    def test_empty_document(self):
+        """No chunks for an empty document."""
+        assert chunk_markdown("") == []
+
+
+class TestRanking:
+    """Test BM25 passage ranking."""
+
+    def test_most_relevant_passage_first(self):
+        """The passage answering the question ranks first."""
+        index = BM25Index(chunk_markdown(MARKDOWN))
+        hits = index.search("how were the nanodiamonds prepared?", top_k=3)
+
+        assert hits[0][0].section_path[-1] == "Sensor preparation"
+
+    def test_irrelevant_query_returns_nothing(self):
+        """Only chunks with matching terms are returned."""
+        index = BM25Index(chunk_markdown(MARKDOWN))
+
+        assert index.search("zebrafish") == []
+
+    def test_index_is_cached_per_document(self):
+        """The second lookup for the same document reuses the index."""
+        document = MARKDOWN + "\n\nUnique cache test paragraph."
+        first, first_cached = get_passage_index(document)
+        second, second_cached = get_passage_index(document)
+
+        assert not first_cached
+        assert second_cached
+        assert first is second
+
+    def test_rank_passages_shape(self):
+        """Passages include offsets, section paths and scores."""
+        result = rank_passages(MARKDOWN, "fibroblasts cultured", top_k=1)
+
+        passage = result["passages"][0]
+        assert passage["section_path"][-1] == "Cell culture"
+        assert MARKDOWN[passage["start"] : passage["end"]] == passage["text"]
+        assert result["chunks_total"] > 1
+
+
+class TestFullTextQuery:
+    """Test get_europepmc_full_text(query=...)."""
+
+    @patch("artl_mcp.tools.requests.get")
+    @patch("artl_mcp.tools.get_europepmc_paper_by_id")
+    def test_query_returns_only_relevant_passages(self, mock_paper, mock_get):
+        """With a query, content shrinks to the top passages."""
+        mock_paper.return_value = {"pmcid": "PMC1", "title": "Thermometry"}
+        body = "".join(
+            f"<sec><title>Section {i}</title><p>Filler paragraph {i}.</p></sec>"
+            for i in range(50)
+        )
+        response = Mock()
+        response.status_code = 200
+        response.raise_for_status.return_value = None
+        response.text = (
+            "<article><front><article-meta><title-group><article-title>"
+            "Thermometry</article-title></title-group></article-meta></front>"
+            f"<body>{body}<sec><title>Sensors</title><p>Nanodiamonds measured "
+            "temperature.</p></sec></body></article>"
+        )
+        mock_get.return_value = response
+
+        full = get_europepmc_full_text("PMC1")
+        focused = get_europepmc_full_text("PMC1", query="nanodiamonds", top_k=1)
+
+        assert focused["passages"][0]["section_path"][-1] == "Sensors"
+        assert "Nanodiamonds" in focused["content"]
+        assert len(focused["content"]) < len(full["content"]) / 10
+        assert focused["retrieval"]["top_k"] == 1
+        assert "text" not in focused["passages"][0]
+        assert focused["windowed"] is False
+        assert focused["content_length"] == full["content_length"]
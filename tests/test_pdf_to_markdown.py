@@ -356,6 +356,105 @@ class TestErrorHandling:
         assert result is None
 
 
+class TestSpeculativeDownload:
+    """Test the pipelined metadata and PDF download."""
+
+    @staticmethod
+    def _pdf_response():
+        response = Mock()
+        response.status_code = 200
+        response.content = b"%PDF-1.4 speculative"
+        return response
+
+    @staticmethod
+    def _processed():
+        return {"content": "# Paper\n\nBody", "method": "hybrid"}
+
+    @patch("artl_mcp.tools.get_europepmc_paper_by_id")
+    @patch("artl_mcp.tools.requests.get")
+    @patch("artl_mcp.tools._process_pdf_in_memory")
+    def test_speculative_download_reused_for_pmcid(
+        self, mock_process_pdf, mock_requests_get, mock_get_paper
+    ):
+        """The render URL fetched during metadata lookup is not fetched twice."""
+        render_url = "https://europepmc.org/articles/PMC1234567?pdf=render"
+        mock_get_paper.return_value = {
+            "pmcid": "PMC1234567",
+            "inPMC": "Y",
+            "fullTextUrlList": {
+                "fullTextUrl": [{"url": render_url, "documentStyle": "pdf"}]
+            },
+        }
+        mock_requests_get.return_value = self._pdf_response()
+        mock_process_pdf.return_value = self._processed()
+
+        result = get_europepmc_pdf_as_markdown("PMC1234567")
+
+        assert result is not None
+        assert result["processing"]["speculative_download"] == "used"
+        assert result["pdf_info"]["pdf_url"] == render_url
+        mock_requests_get.assert_called_once()
+        assert mock_requests_get.call_args[0][0] == render_url
+        timings = result["processing"]["stage_timings"]
+        assert set(timings) == {
+            "metadata",
+            "pdf_download",
+            "conversion",
+            "save",
+            "total",
+        }
+
+    @patch("artl_mcp.tools.get_europepmc_paper_by_id")
+    @patch("artl_mcp.tools.requests.head")
+    @patch("artl_mcp.tools.requests.get")
+    @patch("artl_mcp.tools._process_pdf_in_memory")
+    def test_fallback_endpoint_skips_head_probe(
+        self, mock_process_pdf, mock_requests_get, mock_requests_head, mock_get_paper
+    ):
+        """The Europe PMC /pdf fallback is confirmed by the GET, not a HEAD."""
+        mock_get_paper.return_value = {"pmcid": "PMC1234567", "inPMC": "Y"}
+        mock_requests_get.return_value = self._pdf_response()
+        mock_process_pdf.return_value = self._processed()
+
+        result = get_europepmc_pdf_as_markdown("10.1234/test.2023")
+
+        assert result is not None
+        assert result["processing"]["speculative_download"] == "not_attempted"
+        assert result["pdf_info"]["pdf_url"] == (
+            "https://www.ebi.ac.uk/europepmc/webservices/rest/PMC1234567/pdf"
+        )
+        mock_requests_head.assert_not_called()
+        mock_requests_get.assert_called_once()
+
+    @patch("artl_mcp.tools.get_europepmc_paper_by_id")
+    @patch("artl_mcp.tools.requests.get")
+    @patch("artl_mcp.tools._process_pdf_in_memory")
+    def test_speculative_download_cancelled_for_other_source(
+        self, mock_process_pdf, mock_requests_get, mock_get_paper
+    ):
+        """A publisher PDF listed in the metadata wins over the speculation."""
+        mock_get_paper.return_value = {
+            "pmcid": "PMC1234567",
+            "inPMC": "Y",
+            "fullTextUrlList": {
+                "fullTextUrl": [
+                    {
+                        "url": "https://publisher.example/paper.pdf",
+                        "documentStyle": "pdf",
+                    }
+                ]
+            },
+        }
+        mock_requests_get.return_value = self._pdf_response()
+        mock_process_pdf.return_value = self._processed()
+
+        result = get_europepmc_pdf_as_markdown("PMC1234567")
+
+        assert result is not None
+        assert result["processing"]["speculative_download"] == "cancelled"
+        assert result["pdf_info"]["pdf_url"] == "https://publisher.example/paper.pdf"
+
+
 # Integration-style test (would require actual network access)
 @pytest.mark.external_api
 class TestRealPDFProcessing:
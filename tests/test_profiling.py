@@ -0,0 +1,187 @@
+"""Tests for opt-in conversion profiling."""
+
+import io
+import json
+import pstats
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+from click.testing import CliRunner
+
+from artl_mcp.cli import cli
+from artl_mcp.tools import get_europepmc_full_text, get_europepmc_pdf_as_markdown
+from artl_mcp.utils.profiling import (
+    find_profiles,
+    profiled,
+    profiling_enabled,
+    summarize_profiles,
+)
+from artl_mcp.utils.scheduler import get_cpu_scheduler
+
+
+def _busy(n=2000):
+    return sum(i * i for i in range(n))
+
+
+def _minimal_pdf(text):
+    """One-page PDF with a line of Helvetica text."""
+    stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET".encode()
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+        b"/Resources << /Font << /F1 5 0 R >> >> /Contents 4 0 R >>",
+        b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    out = io.BytesIO()
+    out.write(b"%PDF-1.4\n")
+    offsets = []
+    for i, body in enumerate(objects, 1):
+        offsets.append(out.tell())
+        out.write(b"%d 0 obj\n" % i + body + b"\nendobj\n")
+    xref = out.tell()
+    out.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1))
+    for offset in offsets:
+        out.write(b"%010d 00000 n \n" % offset)
+    out.write(b"trailer\n<< /Size %d /Root 1 0 R >>\n" % (len(objects) + 1))
+    out.write(b"startxref\n%d\n%%%%EOF\n" % xref)
+    return out.getvalue()
+
+
+@pytest.fixture
+def profile_dir(monkeypatch, tmp_path):
+    monkeypatch.setenv("ARTL_PROFILE_DIR", str(tmp_path))
+    return tmp_path
+
+
+class TestProfiled:
+    """Test the profiling context manager."""
+
+    def test_disabled_by_default(self, profile_dir):
+        assert not profiling_enabled()
+        with profiled("PMC1", "xml") as info:
+            _busy()
+        assert info == {}
+        assert find_profiles() == []
+
+    def test_env_var_enables(self, profile_dir, monkeypatch):
+        monkeypatch.setenv("ARTL_PROFILE", "true")
+        with profiled("10.1038/nature12373", "pdf") as info:
+            _busy()
+        (path,) = find_profiles()
+        assert info == {"profile": str(path)}
+        # Identifier is sanitized into the filename
+        assert path.name.startswith("10.1038_nature12373_pdf_")
+        assert path.suffix == ".prof"
+
+    def test_parameter_enables(self, profile_dir):
+        with profiled("PMC1", "xml", enabled=True) as info:
+            _busy()
+        assert "profile" in info
+
+    def test_profile_written_when_block_raises(self, profile_dir):
+        with pytest.raises(RuntimeError), profiled("PMC1", "xml", enabled=True):
+            raise RuntimeError("conversion failed")
+        assert len(find_profiles()) == 1
+
+
+class TestSummarize:
+    """Test aggregation across profiles."""
+
+    def test_aggregates_profiles(self, profile_dir):
+        for identifier in ("PMC1", "PMC2"):
+            with profiled(identifier, "xml", enabled=True):
+                _busy()
+
+        summary = summarize_profiles(find_profiles(), limit=50, sort="tottime")
+
+        assert summary["profiles"] == 2
+        busy = next(f for f in summary["functions"] if "(_busy)" in f["function"])
+        assert busy["calls"] == 2
+        assert busy["profiles"] == 2
+        tottimes = [f["tottime_s"] for f in summary["functions"]]
+        assert tottimes == sorted(tottimes, reverse=True)
+
+    def test_match_filters_profiles(self, profile_dir):
+        for identifier in ("PMC1", "PMC2"):
+            with profiled(identifier, "xml", enabled=True):
+                _busy()
+        assert len(find_profiles(match="PMC2")) == 1
+
+    def test_empty_and_invalid_sort(self, profile_dir):
+        assert summarize_profiles([])["functions"] == []
+        with pytest.raises(ValueError):
+            summarize_profiles([], sort="wallclock")
+
+    def test_cli_summary(self, profile_dir):
+        with profiled("PMC1", "xml", enabled=True):
+            _busy()
+
+        result = CliRunner().invoke(
+            cli, ["profile-summary", "--dir", str(profile_dir), "--limit", "3"]
+        )
+
+        assert result.exit_code == 0, result.output
+        summary = json.loads(result.output)
+        assert summary["profiles"] == 1
+        assert len(summary["functions"]) == 3
+        assert len(summary["files"]) == 1
+
+
+@patch("artl_mcp.tools.requests.get")
+@patch("artl_mcp.tools.get_europepmc_paper_by_id")
+def test_full_text_profile_parameter(mock_paper, mock_get, profile_dir):
+    """profile=True profiles the XML conversion and reports the file."""
+    mock_paper.return_value = {"pmcid": "PMC1"}
+    response = Mock(status_code=200)
+    response.text = (
+        "<article><front><article-meta><title-group><article-title>T"
+        "</article-title></title-group></article-meta></front>"
+        "<body><sec><title>S</title><p>Text.</p></sec></body></article>"
+    )
+    mock_get.return_value = response
+
+    result = get_europepmc_full_text("PMC1", profile=True)
+
+    (path,) = find_profiles()
+    assert result["source_info"]["profile"] == str(path)
+    assert path.name.startswith("PMC1_xml_")
+
+
+@patch("artl_mcp.tools.requests.get")
+@patch("artl_mcp.tools.get_europepmc_paper_by_id")
+def test_pdf_profile_in_worker_process(mock_paper, mock_get, profile_dir, monkeypatch):
+    """With the process executor the profile and spans come from the worker."""
+    monkeypatch.setenv("ARTL_CPU_EXECUTOR", "process")
+    monkeypatch.setenv("ARTL_CPU_WORKERS", "1")
+    monkeypatch.setenv("ARTL_INCLUDE_TIMINGS", "true")
+    mock_paper.return_value = {
+        "pmcid": "PMC1",
+        "fullTextUrlList": {
+            "fullTextUrl": [
+                {"url": "https://example.org/1.pdf", "documentStyle": "pdf"}
+            ]
+        },
+    }
+    mock_get.return_value = Mock(
+        status_code=200, content=_minimal_pdf("Thermometry in living cells")
+    )
+
+    try:
+        result = get_europepmc_pdf_as_markdown(
+            "PMC1", processing_method="pdfplumber", profile=True
+        )
+    finally:
+        get_cpu_scheduler().shutdown()
+
+    assert "Thermometry in living cells" in result["content"]
+    path = Path(result["processing"]["profile"])
+    assert path.parent == profile_dir
+    functions = {func[2] for func in pstats.Stats(str(path)).stats}
+    assert "_process_with_pdfplumber" in functions
+    spans = result["_timings"]["spans"]
+    convert = next(s for s in spans if s["name"] == "convert")
+    assert convert["attrs"]["profile"] == str(path)
+    assert "pdf.pdfplumber" in {s["name"] for s in spans}
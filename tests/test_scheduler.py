@@ -0,0 +1,173 @@
+"""Tests for CPU admission control."""
+
+import threading
+import time
+
+import pytest
+
+from artl_mcp.tools import get_europepmc_pdf_as_markdown
+from artl_mcp.utils.scheduler import (
+    CpuScheduler,
+    SchedulerBusy,
+    cpu_heavy,
+    get_cpu_scheduler,
+    is_cpu_heavy,
+    run_cpu,
+)
+
+
+@pytest.fixture
+def small_scheduler(monkeypatch):
+    monkeypatch.setenv("ARTL_CPU_WORKERS", "1")
+    monkeypatch.setenv("ARTL_CPU_QUEUE_DEPTH", "0")
+    return get_cpu_scheduler()
+
+
+class TestCpuScheduler:
+    """Test admission and execution."""
+
+    def test_admission_capacity(self):
+        scheduler = CpuScheduler(workers=2, queue_depth=1, executor="inline")
+        for _ in range(3):
+            scheduler.admit()
+        with pytest.raises(SchedulerBusy) as exc:
+            scheduler.admit()
+        assert 1 <= exc.value.retry_after <= 300
+        scheduler.release()
+        scheduler.admit()
+        assert scheduler.stats()["admitted"] == 3
+
+    def test_run_bounds_concurrency(self):
+        scheduler = CpuScheduler(workers=2, queue_depth=4, executor="inline")
+        state = {"running": 0, "peak": 0}
+        lock = threading.Lock()
+
+        def stage():
+            with lock:
+                state["running"] += 1
+                state["peak"] = max(state["peak"], state["running"])
+            time.sleep(0.05)
+            with lock:
+                state["running"] -= 1
+
+        threads = [
+            threading.Thread(target=scheduler.run, args=(stage,)) for _ in range(6)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert state["peak"] == 2
+
+    def test_process_executor(self):
+        scheduler = CpuScheduler(workers=1, executor="process")
+        try:
+            assert scheduler.run(pow, 2, 10) == 1024
+        finally:
+            scheduler.shutdown()
+
+    def test_unknown_executor_falls_back_to_inline(self):
+        assert CpuScheduler(executor="gpu").executor == "inline"
+
+    def test_process_executor_by_default(self, monkeypatch):
+        monkeypatch.delenv("ARTL_CPU_EXECUTOR")
+        assert get_cpu_scheduler().executor == "process"
+
+    def test_run_rejects_when_full(self):
+        scheduler = CpuScheduler(workers=1, queue_depth=0, executor="inline")
+        scheduler.admit()
+        with pytest.raises(SchedulerBusy):
+            scheduler.run(lambda: "never")
+        scheduler.release()
+        assert scheduler.run(lambda: "ok") == "ok"
+        assert scheduler.stats()["admitted"] == 0
+
+    def test_scheduler_follows_configuration(self, monkeypatch):
+        monkeypatch.setenv("ARTL_CPU_WORKERS", "3")
+        first = get_cpu_scheduler()
+        assert first is get_cpu_scheduler()
+        assert (first.workers, first.queue_depth) == (3, 6)
+        monkeypatch.setenv("ARTL_CPU_QUEUE_DEPTH", "1")
+        assert get_cpu_scheduler().queue_depth == 1
+
+
+class TestCpuHeavy:
+    """Test the tool decorator."""
+
+    def test_pdf_tool_is_classified(self):
+        assert is_cpu_heavy("get_europepmc_pdf_as_markdown")
+        assert not is_cpu_heavy("get_europepmc_paper_by_id")
+
+    def test_busy_response_when_full(self, small_scheduler):
+        @cpu_heavy
+        def convert():
+            return {"content": run_cpu(str.upper, "x")}
+
+        assert convert() == {"content": "X"}
+        small_scheduler.admit()
+        try:
+            result = convert()
+        finally:
+            small_scheduler.release()
+        assert result["status"] == "busy"
+        assert result["retry_after"] >= 1
+        assert small_scheduler.stats()["admitted"] == 0
+
+    def test_slot_released_on_error(self, small_scheduler):
+        def boom():
+            raise RuntimeError("boom")
+
+        @cpu_heavy
+        def convert():
+            return run_cpu(boom)
+
+        with pytest.raises(RuntimeError):
+            convert()
+        assert small_scheduler.stats()["admitted"] == 0
+
+    def test_pdf_tool_rejects_without_network(self, small_scheduler, monkeypatch):
+        """A rejected call returns before any lookup or download."""
+        monkeypatch.setattr(
+            "artl_mcp.tools.get_europepmc_paper_by_id",
+            lambda *a, **k: pytest.fail("should not look up metadata"),
+        )
+        small_scheduler.admit()
+        try:
+            result = get_europepmc_pdf_as_markdown("PMC3737249")
+        finally:
+            small_scheduler.release()
+        assert result["status"] == "busy"
+
+    def test_downloads_do_not_hold_cpu_places(self, small_scheduler):
+        """Calls before their CPU stage leave the places to calls converting."""
+        downloading = threading.Event()
+        release = threading.Event()
+
+        @cpu_heavy
+        def convert(wait):
+            if wait:
+                downloading.set()
+                release.wait(5)
+            return run_cpu(str.upper, "x")
+
+        slow = threading.Thread(target=convert, args=(True,))
+        slow.start()
+        try:
+            assert downloading.wait(5)
+            assert convert(False) == "X"
+        finally:
+            release.set()
+            slow.join()
+
+    def test_busy_when_cpu_stage_not_admitted(self, small_scheduler):
+        """A call that finds the queue full at its CPU stage is answered busy."""
+
+        @cpu_heavy
+        def convert():
+            small_scheduler.admit()
+            try:
+                return run_cpu(str.upper, "x")
+            finally:
+                small_scheduler.release()
+
+        assert convert()["status"] == "busy"
@@ -0,0 +1,145 @@
+"""Tests for Semantic Scholar batch lookups and rate limiting."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from artl_mcp.utils import citation_utils
+from artl_mcp.utils.citation_utils import CitationUtils
+from artl_mcp.utils.rate_limit import RateLimiter, retry_after_seconds
+
+
+def _paper(doi):
+    n = int(doi.rsplit("p", 1)[1])
+    return {
+        "externalIds": {"DOI": doi},
+        "title": f"Paper {n}",
+        "authors": [{"name": "A. Author"}],
+        "year": 2020,
+        "citationCount": n,
+        "referenceCount": 3,
+        "influentialCitationCount": 1,
+        "tldr": {"text": f"Summary {n}"},
+    }
+
+
+def _response(payload, status=200, headers=None):
+    response = Mock()
+    response.status_code = status
+    response.headers = headers or {}
+    response.json.return_value = payload
+    response.raise_for_status.return_value = None
+    return response
+
+
+def fake_batch(url, params=None, json=None, headers=None, timeout=None):
+    """Answer /paper/batch: positional results, null for unknown papers."""
+    return _response(
+        [
+            _paper(i.removeprefix("DOI:")) if not i.endswith("p999") else None
+            for i in json["ids"]
+        ]
+    )
+
+
+@pytest.fixture(autouse=True)
+def _no_spacing(monkeypatch):
+    monkeypatch.setattr(citation_utils, "_semantic_scholar_limiter", RateLimiter(0))
+
+
+class TestSemanticScholarBatch:
+    """Test get_semantic_scholar_batch."""
+
+    @patch("artl_mcp.utils.citation_utils.requests.post", side_effect=fake_batch)
+    def test_three_hundred_papers_in_one_request(self, mock_post):
+        dois = [f"10.1000/p{n}" for n in range(300)]
+
+        info = CitationUtils.get_semantic_scholar_batch(dois)
+
+        assert mock_post.call_count == 1
+        assert mock_post.call_args.kwargs["json"]["ids"][0] == "DOI:10.1000/p0"
+        assert "citationCount" in mock_post.call_args.kwargs["params"]["fields"]
+        assert info["10.1000/p42"]["citation_count"] == 42
+        assert info["10.1000/p42"]["tldr"] == "Summary 42"
+
+    @patch("artl_mcp.utils.citation_utils.requests.post", side_effect=fake_batch)
+    def test_chunks_of_five_hundred(self, mock_post):
+        CitationUtils.get_semantic_scholar_batch([f"10.1000/p{n}" for n in range(501)])
+
+        assert [len(c.kwargs["json"]["ids"]) for c in mock_post.call_args_list] == [
+            500,
+            1,
+        ]
+
+    @patch("artl_mcp.utils.citation_utils.requests.post", side_effect=fake_batch)
+    def test_unknown_and_invalid_dois(self, mock_post):
+        info = CitationUtils.get_semantic_scholar_batch(["10.1000/p999", "nope"])
+
+        assert info == {"10.1000/p999": None, "nope": None}
+        assert mock_post.call_args.kwargs["json"]["ids"] == ["DOI:10.1000/p999"]
+
+    @patch("artl_mcp.utils.citation_utils.time.sleep")
+    @patch("artl_mcp.utils.citation_utils.requests.post")
+    def test_retry_after_on_429(self, mock_post, mock_sleep):
+        mock_post.side_effect = [
+            _response(None, status=429, headers={"Retry-After": "3"}),
+            fake_batch(None, json={"ids": ["DOI:10.1000/p1"]}),
+        ]
+
+        info = CitationUtils.get_semantic_scholar_batch(["10.1000/p1"])
+
+        mock_sleep.assert_called_once_with(3.0)
+        assert info["10.1000/p1"]["title"] == "Paper 1"
+
+    @patch("artl_mcp.utils.citation_utils.requests.post", side_effect=fake_batch)
+    def test_api_key_header(self, mock_post, monkeypatch):
+        monkeypatch.setenv("ARTL_S2_API_KEY", "secret")
+
+        CitationUtils.get_semantic_scholar_batch(["10.1000/p1"])
+
+        assert mock_post.call_args.kwargs["headers"]["x-api-key"] == "secret"
+
+    @patch("artl_mcp.utils.citation_utils.requests.post", side_effect=fake_batch)
+    def test_enrich_fills_only_missing_fields(self, mock_post):
+        papers = [
+            {"doi": "10.1000/p5", "title": "Kept", "citation_count": 0},
+            {"doi": None, "title": "No DOI"},
+        ]
+
+        CitationUtils.enrich_with_semantic_scholar(papers)
+
+        assert papers[0]["title"] == "Kept"
+        assert papers[0]["citation_count"] == 5
+        assert papers[0]["tldr"] == "Summary 5"
+        assert "tldr" not in papers[1]
+
+
+@patch("artl_mcp.utils.citation_utils.requests.post", side_effect=fake_batch)
+def test_find_related_papers_enriches_in_one_request(mock_post):
+    citation_info = {
+        "crossref_citations": [{"doi": f"10.1000/p{n}"} for n in range(1, 6)],
+        "crossref_references": [{"doi": f"10.1000/p{n}"} for n in range(6, 11)],
+    }
+    with patch.object(
+        CitationUtils, "get_comprehensive_citation_info", return_value=citation_info
+    ):
+        related = CitationUtils.find_related_papers("10.1000/seed", max_results=10)
+
+    assert mock_post.call_count == 1
+    assert all(paper["tldr"] for paper in related)
+    assert related[0]["citation_count"] == 1
+
+
+class TestRateLimiter:
+    """Test request spacing helpers."""
+
+    def test_spacing(self):
+        limiter = RateLimiter(0.05)
+
+        assert limiter.wait() == 0
+        assert limiter.wait() > 0.03
+
+    def test_retry_after_parsing(self):
+        assert retry_after_seconds(Mock(headers={"Retry-After": "2"}), 9) == 2
+        assert retry_after_seconds(Mock(headers={}), 9) == 9
+        assert retry_after_seconds(Mock(headers={"Retry-After": "soon"}), 9) == 9
@@ -0,0 +1,259 @@
+"""Tests for HTTP serving, concurrency limits and graceful shutdown."""
+
+import asyncio
+import json
+import socket
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+import uvicorn
+from click.testing import CliRunner
+from fastmcp import Client, FastMCP
+
+from artl_mcp import main
+from artl_mcp.server import ConcurrencyLimitMiddleware, create_http_app, serve
+from artl_mcp.utils.deadline import DeadlineExceeded, check_deadline
+
+
+def _slow_server(limiter, delay=0.2):
+    mcp = FastMCP("server-test")
+    mcp.add_middleware(limiter)
+    state = {"running": 0, "peak": 0}
+
+    @mcp.tool
+    async def slow() -> str:
+        state["running"] += 1
+        state["peak"] = max(state["peak"], state["running"])
+        await asyncio.sleep(delay)
+        state["running"] -= 1
+        return "done"
+
+    return mcp, state
+
+
+async def _call_many(server, n):
+    async def call():
+        async with Client(server) as client:
+            return await client.call_tool("slow", {}, raise_on_error=False)
+
+    return await asyncio.gather(*(call() for _ in range(n)))
+
+
+class TestConcurrencyLimit:
+    """Test the per-worker tool call limit."""
+
+    def test_limit_queues_excess_calls(self):
+        server, state = _slow_server(ConcurrencyLimitMiddleware(2))
+        results = asyncio.run(_call_many(server, 5))
+        assert all(r.data == "done" for r in results)
+        assert state["peak"] == 2
+
+    def test_no_limit(self):
+        server, state = _slow_server(ConcurrencyLimitMiddleware(None))
+        asyncio.run(_call_many(server, 4))
+        assert state["peak"] == 4
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class _ServerThread:
+    """Run an app under a real uvicorn server in a background thread."""
+
+    def __init__(self, app, timeout_graceful_shutdown=None):
+        self.port = _free_port()
+        self.server = uvicorn.Server(
+            uvicorn.Config(
+                app,
+                host="127.0.0.1",
+                port=self.port,
+                log_level="warning",
+                timeout_graceful_shutdown=timeout_graceful_shutdown,
+            )
+        )
+        self.thread = threading.Thread(target=self.server.run, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        deadline = time.monotonic() + 10
+        while not self.server.started and time.monotonic() < deadline:
+            time.sleep(0.05)
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.port}/mcp"
+
+    def stop(self):
+        """Ask uvicorn to shut down, as its SIGTERM handler does."""
+        self.server.should_exit = True
+
+    def join(self):
+        self.thread.join(timeout=10)
+
+
+async def _call_paper(url):
+    async with Client(url) as client:
+        return await client.call_tool(
+            "get_europepmc_paper_by_id", {"identifier": "23851394"}
+        )
+
+
+class TestHttpApp:
+    """Test the streamable HTTP app end to end."""
+
+    def test_rejects_unknown_transport(self):
+        with pytest.raises(ValueError):
+            create_http_app(transport="websocket")
+
+    @patch("artl_mcp.main._get_europepmc_paper_by_id")
+    def test_tool_call_over_http(self, mock_paper):
+        mock_paper.return_value = {"pmid": "23851394", "title": "T"}
+        app = create_http_app(max_concurrency=2)
+
+        with _ServerThread(app) as running:
+            result = asyncio.run(_call_paper(running.url))
+
+        assert json.loads(result.content[0].text)["title"] == "T"
+
+
+class TestGracefulShutdown:
+    """Test shutdown ordering under a real uvicorn server."""
+
+    @patch("artl_mcp.main._get_europepmc_paper_by_id")
+    def test_in_flight_call_finishes_and_new_connections_refused(self, mock_paper):
+        started = threading.Event()
+
+        def slow_paper(**kwargs):
+            started.set()
+            time.sleep(0.6)
+            return {"pmid": "23851394", "title": "T"}
+
+        mock_paper.side_effect = slow_paper
+        running = _ServerThread(create_http_app(), timeout_graceful_shutdown=5)
+        results = []
+
+        async def call():
+            async with Client(running.url) as client:
+                # Listed up front; the client would otherwise list tools after
+                # the call, when the server is already gone
+                await client.list_tools()
+                results.append(
+                    await client.call_tool(
+                        "get_europepmc_paper_by_id", {"identifier": "23851394"}
+                    )
+                )
+
+        async def scenario():
+            task = asyncio.create_task(call())
+            assert await asyncio.to_thread(started.wait, 5)
+            running.stop()
+            await asyncio.sleep(0.2)
+            with pytest.raises(ConnectionRefusedError):
+                socket.create_connection(("127.0.0.1", running.port), timeout=1)
+            await task
+
+        with running:
+            asyncio.run(scenario())
+            running.join()
+
+        assert json.loads(results[0].content[0].text)["title"] == "T"
+        assert not running.thread.is_alive()
+
+    @patch("artl_mcp.main._get_europepmc_paper_by_id")
+    def test_overdue_call_cancelled_after_grace_period(self, mock_paper):
+        state = {}
+        started = threading.Event()
+
+        def stuck_paper(**kwargs):
+            started.set()
+            start = time.monotonic()
+            try:
+                while time.monotonic() - start < 10:
+                    check_deadline()
+                    time.sleep(0.02)
+            except DeadlineExceeded:
+                state["stopped_after"] = time.monotonic() - start
+                raise
+            return {}
+
+        mock_paper.side_effect = stuck_paper
+        running = _ServerThread(create_http_app(), timeout_graceful_shutdown=1)
+
+        async def scenario():
+            call = asyncio.create_task(_call_paper(running.url))
+            assert await asyncio.to_thread(started.wait, 5)
+            start = time.monotonic()
+            running.stop()
+            await asyncio.to_thread(running.join)
+            call.cancel()
+            await asyncio.gather(call, return_exceptions=True)
+            return time.monotonic() - start
+
+        with running:
+            shutdown_took = asyncio.run(scenario())
+
+        assert shutdown_took < 3
+        time.sleep(0.2)
+        assert state["stopped_after"] < 3
+
+
+class TestServeCommand:
+    """Test server options on the artl-mcp command."""
+
+    def test_sse_with_workers_rejected(self):
+        result = CliRunner().invoke(main.cli, ["--transport", "sse", "--workers", "2"])
+        assert result.exit_code != 0
+        assert "--transport http" in result.output
+
+    @patch("artl_mcp.server.serve")
+    def test_http_transport_calls_serve(self, mock_serve):
+        result = CliRunner().invoke(
+            main.cli,
+            ["--transport", "http", "--workers", "3", "--max-concurrency", "8"],
+        )
+        assert result.exit_code == 0, result.output
+        mock_serve.assert_called_once_with(
+            transport="http",
+            host="127.0.0.1",
+            port=8000,
+            workers=3,
+            max_concurrency=8,
+            shutdown_timeout=30.0,
+        )
+
+
+class TestServe:
+    """Test serve() configuration checks."""
+
+    @patch("uvicorn.run")
+    def test_metrics_with_workers_warns(self, mock_run, monkeypatch, caplog):
+        monkeypatch.setenv("ARTL_METRICS_PORT", "9464")
+        monkeypatch.setenv("ARTL_SHARED_CACHE", "")
+        for key in ("ARTL_SERVER_TRANSPORT", "ARTL_SERVER_WORKERS"):
+            monkeypatch.delenv(key, raising=False)
+
+        with caplog.at_level("WARNING", logger="artl_mcp.server"):
+            serve(workers=2)
+
+        assert "Metrics export is disabled with 2 workers" in caplog.text
+        mock_run.assert_called_once()
+
+    @patch("uvicorn.run")
+    def test_single_worker_does_not_warn(self, mock_run, monkeypatch, caplog):
+        monkeypatch.setenv("ARTL_METRICS_PORT", "9464")
+        for key in ("ARTL_SERVER_TRANSPORT", "ARTL_SERVER_WORKERS"):
+            monkeypatch.delenv(key, raising=False)
+
+        with caplog.at_level("WARNING", logger="artl_mcp.server"):
+            serve(workers=1)
+
+        assert "Metrics export" not in caplog.text
@@ -0,0 +1,184 @@
+"""Tests for concurrent full text source racing."""
+
+import threading
+import time
+from unittest.mock import patch
+
+from artl_mcp.tools import resolve_full_text
+from artl_mcp.utils.racing import race_by_preference
+
+
+def _sleep_then(seconds, value):
+    def fetch():
+        time.sleep(seconds)
+        return value
+
+    return fetch
+
+
+class TestRaceByPreference:
+    """Test the generic racing engine."""
+
+    def test_preferred_source_wins_even_when_slower(self):
+        """A slower preferred source beats a faster, less preferred one."""
+        race = race_by_preference(
+            {"best": _sleep_then(0.1, "A"), "worse": _sleep_then(0.0, "B")},
+            preference=["best", "worse"],
+            deadline=5,
+        )
+
+        assert race["source"] == "best"
+        assert race["result"] == "A"
+        assert race["statuses"] == {"best": "won", "worse": "outranked"}
+
+    def test_falls_through_failed_and_empty_sources(self):
+        """Failing or empty preferred sources hand the win to the next one."""
+
+        def boom():
+            raise RuntimeError("upstream down")
+
+        race = race_by_preference(
+            {"a": boom, "b": _sleep_then(0.0, ""), "c": _sleep_then(0.0, "C")},
+            preference=["a", "b", "c"],
+            deadline=5,
+        )
+
+        assert race["source"] == "c"
+        assert race["statuses"] == {"a": "failed", "b": "empty", "c": "won"}
+
+    def test_returns_early_without_waiting_for_slow_losers(self):
+        """Once the best source answers, slower sources are cancelled."""
+        release = threading.Event()
+
+        def blocked():
+            release.wait(5)
+            return "late"
+
+        start = time.monotonic()
+        race = race_by_preference(
+            {"fast": _sleep_then(0.0, "F"), "slow": blocked},
+            preference=["fast", "slow"],
+            deadline=5,
+        )
+        release.set()
+
+        assert race["source"] == "fast"
+        assert race["statuses"]["slow"] == "cancelled"
+        assert time.monotonic() - start < 1
+
+    def test_deadline_returns_best_result_so_far(self):
+        """At the deadline the best finished result is returned."""
+        release = threading.Event()
+
+        def blocked():
+            release.wait(5)
+            return "never used"
+
+        race = race_by_preference(
+            {"best": blocked, "fallback": _sleep_then(0.0, "F")},
+            preference=["best", "fallback"],
+            deadline=0.2,
+        )
+        release.set()
+
+        assert race["source"] == "fallback"
+        assert race["deadline_exceeded"] is True
+        assert race["statuses"]["best"] == "timeout"
+
+    def test_durations_not_changed_by_late_sources(self):
+        """Sources finishing after the race do not touch the returned result."""
+        release = threading.Event()
+
+        def blocked():
+            release.wait(5)
+            return "late"
+
+        race = race_by_preference(
+            {"best": blocked, "fallback": _sleep_then(0.0, "F")},
+            preference=["best", "fallback"],
+            deadline=0.2,
+        )
+        release.set()
+        time.sleep(0.1)
+
+        assert list(race["durations"]) == ["fallback"]
+
+    def test_no_usable_results(self):
+        """No winner when every source comes back empty."""
+        race = race_by_preference(
+            {"a": _sleep_then(0.0, None)}, preference=["a"], deadline=1
+        )
+
+        assert race["source"] is None
+        assert race["result"] is None
+
+
+class TestResolveFullText:
+    """Test the resolve_full_text tool."""
+
+    @patch("artl_mcp.tools.get_email_manager")
+    @patch("artl_mcp.tools._full_text_from_europepmc_pdf")
+    @patch("artl_mcp.tools._full_text_from_bioc")
+    @patch("artl_mcp.tools._full_text_from_europepmc_xml")
+    def test_xml_preferred_over_bioc(
+        self, mock_xml, mock_bioc, mock_pdf, mock_email_manager
+    ):
+        """JATS XML wins over BioC when both return text."""
+        mock_email_manager.return_value.get_email.return_value = None
+        slow_xml = _sleep_then(0.05, {"content": "# Paper", "format": "markdown"})
+        mock_xml.side_effect = lambda identifier: slow_xml()
+        mock_bioc.return_value = {"content": "plain text", "format": "text"}
+        mock_pdf.return_value = None
+
+        result = resolve_full_text("PMC1234567")
+
+        assert result is not None
+        assert result["source"] == "europepmc_xml"
+        assert result["content"] == "# Paper"
+        assert result["sources"]["unpaywall_pdf"] == "skipped"
+        assert result["sources"]["bioc"] == "outranked"
+
+    @patch("artl_mcp.tools.get_email_manager")
+    @patch("artl_mcp.tools._full_text_from_bioc")
+    @patch("artl_mcp.tools._full_text_from_europepmc_xml")
+    def test_custom_preference_order(self, mock_xml, mock_bioc, mock_email_manager):
+        """Only the requested sources are raced, in the requested order."""
+        mock_email_manager.return_value.get_email.return_value = None
+        mock_xml.return_value = {"content": "# Paper", "format": "markdown"}
+        mock_bioc.return_value = {"content": "plain text", "format": "text"}
+
+        result = resolve_full_text("23851394", sources=["bioc", "europepmc_xml"])
+
+        assert result is not None
+        assert result["source"] == "bioc"
+        assert list(result["sources"]) == ["bioc", "europepmc_xml"]
+
+    @patch("artl_mcp.tools.get_email_manager")
+    @patch("artl_mcp.tools.get_europepmc_pdf_as_markdown")
+    @patch("artl_mcp.tools._full_text_from_europepmc_xml")
+    def test_busy_pdf_source_falls_through(
+        self, mock_xml, mock_pdf, mock_email_manager
+    ):
+        """A PDF source turned away by admission control is reported as busy."""
+        mock_email_manager.return_value.get_email.return_value = None
+        mock_xml.return_value = {"content": "# Paper", "format": "markdown"}
+        mock_pdf.return_value = {"status": "busy", "retry_after": 5, "message": ""}
+
+        result = resolve_full_text(
+            "PMC1234567", sources=["europepmc_pdf", "europepmc_xml"]
+        )
+        assert result["source"] == "europepmc_xml"
+        assert result["sources"]["europepmc_pdf"] == "busy"
+
+    @patch("artl_mcp.tools.get_email_manager")
+    @patch("artl_mcp.tools._full_text_from_europepmc_xml")
+    def test_no_source_has_text(self, mock_xml, mock_email_manager):
+        """None is returned when no source yields text."""
+        mock_email_manager.return_value.get_email.return_value = None
+        mock_xml.return_value = None
+
+        assert resolve_full_text("PMC1234567", sources=["europepmc_xml"]) is None
+
+    def test_invalid_identifier(self):
+        """Invalid identifiers are rejected without any requests."""
+        assert resolve_full_text("not-an-identifier") is None
@@ -0,0 +1,171 @@
+"""Tests for trace export."""
+
+import io
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+
+from artl_mcp.utils import http
+from artl_mcp.utils.instrumentation import (
+    add_trace_listener,
+    instrumented,
+    remove_trace_listener,
+    span,
+)
+from artl_mcp.utils.tracing import (
+    OTEL_AVAILABLE,
+    ConsoleTraceExporter,
+    FileTraceExporter,
+    configure_tracing,
+    format_trace_tree,
+    trace_to_spans,
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset_tracing():
+    yield
+    configure_tracing("")
+
+
+@instrumented("lookup")
+def lookup(fail=False):
+    with span("resolve_id", identifier="PMC1"):
+        http.get("https://example.org/a", timeout=5)
+    with span("convert"):
+        with span("parse"):
+            if fail:
+                raise ValueError("bad xml")
+    return {"ok": True}
+
+
+@pytest.fixture
+def traces():
+    """Collect finished traces."""
+    collected = []
+    add_trace_listener(collected.append)
+    yield collected
+    remove_trace_listener(collected.append)
+
+
+@patch("artl_mcp.utils.http.requests.get")
+class TestSpanTree:
+    """Test span ids and parents."""
+
+    def test_parent_links(self, mock_get, traces):
+        mock_get.return_value = Mock(status_code=200, _content=b"x")
+        lookup()
+
+        spans = {s["name"]: s for s in trace_to_spans(traces[0])}
+        assert spans["tool.lookup"]["parent_span_id"] is None
+        assert spans["resolve_id"]["parent_span_id"] == spans["tool.lookup"]["span_id"]
+        assert spans["http"]["parent_span_id"] == spans["resolve_id"]["span_id"]
+        assert spans["parse"]["parent_span_id"] == spans["convert"]["span_id"]
+        assert len({s["trace_id"] for s in spans.values()}) == 1
+        assert (
+            spans["http"]["start_time_unix_nano"] <= spans["http"]["end_time_unix_nano"]
+        )
+
+    def test_timings_block_has_no_ids(self, mock_get, monkeypatch):
+        mock_get.return_value = Mock(status_code=200, _content=b"x")
+        monkeypatch.setenv("ARTL_INCLUDE_TIMINGS", "true")
+
+        spans = lookup()["_timings"]["spans"]
+
+        assert all("span_id" not in s and "parent_id" not in s for s in spans)
+
+    def test_errors_marked(self, mock_get, tmp_path):
+        mock_get.return_value = Mock(status_code=200, _content=b"x")
+        exporter = FileTraceExporter(tmp_path / "traces.jsonl")
+        add_trace_listener(exporter)
+        try:
+            with pytest.raises(ValueError):
+                lookup(fail=True)
+        finally:
+            remove_trace_listener(exporter)
+
+        rows = [json.loads(line) for line in exporter.path.read_text().splitlines()]
+        status = {row["name"]: row["status"] for row in rows}
+        assert status["parse"] == "ERROR"
+        assert status["tool.lookup"] == "ERROR"
+        assert status["http"] == "OK"
+
+
+@patch("artl_mcp.utils.http.requests.get")
+class TestExporters:
+    """Test console, file and configuration handling."""
+
+    def test_disabled_by_default(self, mock_get):
+        assert configure_tracing() == []
+
+    def test_console_tree(self, mock_get, traces):
+        mock_get.return_value = Mock(status_code=200, _content=b"x")
+        lookup()
+
+        tree = format_trace_tree(traces[0])
+        lines = tree.splitlines()
+        assert lines[0].endswith(" lookup")
+        assert lines[1].startswith("  tool.lookup +")
+        assert lines[2].startswith("    resolve_id +")
+        assert "identifier=PMC1" in lines[2]
+        assert lines[3].startswith("      http +")
+        assert "host=example.org" in lines[3]
+
+        stream = io.StringIO()
+        ConsoleTraceExporter(stream)(traces[0])
+        assert stream.getvalue() == tree + "\n"
+
+    def test_file_exporter_from_config(self, mock_get, monkeypatch, tmp_path):
+        mock_get.return_value = Mock(status_code=200, _content=b"x")
+        monkeypatch.setenv("ARTL_TRACE_EXPORT", "file")
+        monkeypatch.setenv("ARTL_TRACE_FILE", str(tmp_path / "t.jsonl"))
+        exporters = configure_tracing()
+        assert len(exporters) == 1
+
+        lookup()
+        lookup()
+
+        rows = [
+            json.loads(line) for line in (tmp_path / "t.jsonl").read_text().splitlines()
+        ]
+        assert len({row["trace_id"] for row in rows}) == 2
+        assert {"name", "span_id", "parent_span_id", "attributes"} <= set(rows[0])
+
+    def test_reconfigure_replaces_exporters(self, mock_get, tmp_path):
+        mock_get.return_value = Mock(status_code=200, _content=b"x")
+        with patch("artl_mcp.utils.tracing.get_config_value") as mock_config:
+            mock_config.return_value = str(tmp_path / "t.jsonl")
+            configure_tracing("file")
+            configure_tracing("file")
+        lookup()
+
+        rows = (tmp_path / "t.jsonl").read_text().splitlines()
+        assert len(rows) == 5
+
+    def test_unknown_exporter_ignored(self, mock_get):
+        assert configure_tracing("zipkin") == []
+
+    def test_exporter_failure_does_not_break_call(self, mock_get):
+        mock_get.return_value = Mock(status_code=200, _content=b"x")
+        broken = Mock(side_effect=OSError("disk full"))
+        add_trace_listener(broken)
+        try:
+            assert lookup() == {"ok": True}
+        finally:
+            remove_trace_listener(broken)
+        broken.assert_called_once()
+
+    @pytest.mark.skipif(not OTEL_AVAILABLE, reason="opentelemetry-api not installed")
+    def test_otel_exporter_replays_spans(self, mock_get):
+        mock_get.return_value = Mock(status_code=200, _content=b"x")
+        exporters = configure_tracing("otel")
+        tracer = Mock()
+        exporters[0].tracer = tracer
+
+        lookup()
+
+        names = [c.args[0] for c in tracer.start_span.call_args_list]
+        assert names[0] == "tool.lookup"
+        assert set(names) == {"tool.lookup", "resolve_id", "http", "convert", "parse"}
+        assert tracer.start_span.return_value.end.call_count == 5